@@ -0,0 +1,153 @@
+"""
+Benchmark: Compact (truncated + quantized) vs full-precision vector search
+
+Uses stored section embeddings as query vectors (no OpenAI calls) and compares
+the top-k of the full 3072-d index against:
+- compact first pass only (truncated, int8-quantized index)
+- compact first pass + full-precision rescoring, for several candidate multipliers
+
+Reports recall@k against the full-precision result and median/p95 latency.
+
+Usage:
+    python scripts/benchmark_compact_embeddings.py [--queries 50] [--k 10]
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import Dict, List, Tuple
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.embeddings import get_search_dimension, truncate_embedding
+from src.utils.neo4j_client import Neo4jClient
+
+console = Console()
+
+FULL_QUERY = """
+CALL db.index.vector.queryNodes('section_embeddings', $k, $embedding)
+YIELD node, score
+RETURN node.id AS id
+"""
+
+COMPACT_QUERY = """
+CALL db.index.vector.queryNodes('section_embeddings_small', $k, $embedding_small)
+YIELD node, score
+RETURN node.id AS id
+"""
+
+RESCORED_QUERY = """
+CALL db.index.vector.queryNodes('section_embeddings_small', $candidates, $embedding_small)
+YIELD node
+WITH node, vector.similarity.cosine(node.content_embedding, $embedding) AS score
+ORDER BY score DESC
+LIMIT $k
+RETURN node.id AS id
+"""
+
+
+def timed_ids(client: Neo4jClient, cypher: str, **params) -> Tuple[List[str], float]:
+    """Run a query and return result IDs with latency in ms."""
+    start = time.perf_counter()
+    rows = client.execute(cypher, **params)
+    return [row["id"] for row in rows], (time.perf_counter() - start) * 1000
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Benchmark compact vs full-precision vector search")
+    parser.add_argument("--queries", type=int, default=50, help="Number of query vectors")
+    parser.add_argument("--k", type=int, default=10, help="Top-k")
+    parser.add_argument("--dimension", type=int, default=get_search_dimension() or 256, help="Compact dimension")
+    parser.add_argument("--multipliers", type=str, default="1,2,4,8", help="Rescoring candidate multipliers")
+    args = parser.parse_args()
+
+    multipliers = [int(m) for m in args.multipliers.split(",")]
+
+    console.print(Panel.fit(
+        "[bold cyan]Compact Embedding Benchmark[/bold cyan]\n"
+        f"{args.dimension}-d quantized first pass vs 3072-d full precision (k={args.k})",
+        border_style="cyan"
+    ))
+
+    client = Neo4jClient()
+
+    try:
+        query_rows = client.execute(
+            "MATCH (s:Section) WHERE s.content_embedding IS NOT NULL "
+            "RETURN s.content_embedding AS embedding ORDER BY rand() LIMIT $n",
+            n=args.queries
+        )
+        if not query_rows:
+            console.print("[red]No section embeddings found[/red]")
+            sys.exit(1)
+
+        methods = ["Full precision", "Compact only"] + [f"Compact + rescore x{m}" for m in multipliers]
+        latencies: Dict[str, List[float]] = {method: [] for method in methods}
+        recalls: Dict[str, List[float]] = {method: [] for method in methods}
+
+        for row in query_rows:
+            embedding = row["embedding"]
+            embedding_small = truncate_embedding(embedding, args.dimension)
+
+            truth, latency = timed_ids(client, FULL_QUERY, k=args.k, embedding=embedding)
+            latencies["Full precision"].append(latency)
+            recalls["Full precision"].append(1.0)
+            truth_set = set(truth)
+
+            ids, latency = timed_ids(client, COMPACT_QUERY, k=args.k, embedding_small=embedding_small)
+            latencies["Compact only"].append(latency)
+            recalls["Compact only"].append(len(truth_set & set(ids)) / max(len(truth_set), 1))
+
+            for multiplier in multipliers:
+                method = f"Compact + rescore x{multiplier}"
+                ids, latency = timed_ids(
+                    client, RESCORED_QUERY,
+                    k=args.k, candidates=args.k * multiplier,
+                    embedding=embedding, embedding_small=embedding_small
+                )
+                latencies[method].append(latency)
+                recalls[method].append(len(truth_set & set(ids)) / max(len(truth_set), 1))
+
+        table = Table(title=f"Recall@{args.k} vs latency over {len(query_rows)} queries", header_style="bold cyan")
+        table.add_column("Method", style="cyan")
+        table.add_column(f"Recall@{args.k}", justify="right", style="green")
+        table.add_column("Median (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+
+        for method in methods:
+            table.add_row(
+                method,
+                f"{statistics.mean(recalls[method]):.3f}",
+                f"{statistics.median(latencies[method]):.2f}",
+                f"{percentile(latencies[method], 95):.2f}"
+            )
+
+        console.print(table)
+
+        # Index vector payload per node (float32 in the index; int8 when quantized)
+        console.print(
+            f"Index payload per node: full {3072 * 4 / 1024:.1f} KB (float32) vs "
+            f"compact {args.dimension / 1024:.2f} KB (int8)"
+        )
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
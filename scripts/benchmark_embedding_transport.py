@@ -0,0 +1,187 @@
+"""
+Benchmark: float32 array vs list[float] embedding transport
+
+Parses all PDD and DDD sections, gives each a seeded synthetic 3072-d
+embedding (no OpenAI calls) and compares carrying the vectors as Python
+float lists against float32 arrays:
+- resident memory of all section embeddings (tracemalloc)
+- driver-boundary conversion (to_driver_value, as done by Neo4jClient)
+- Bolt PackStream encoding of the converted parameters (if available)
+- checkpoint save/load (np.save) and pickle size/time
+
+Usage:
+    python scripts/benchmark_embedding_transport.py [--runs 5] [--dimensions 3072]
+"""
+
+import io
+import sys
+import time
+import pickle
+import argparse
+import statistics
+import tracemalloc
+from pathlib import Path
+from typing import Callable, List
+import numpy as np
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ingestion.design_doc_parser import DesignDocParser
+from src.utils.embeddings import EMBEDDING_DTYPE, as_embedding_matrix, to_driver_value
+
+console = Console()
+
+DOCUMENTS = {
+    "PDD": project_root / "Documents" / "PDD" / "MOSAR-WP2-D2.4-SA_1.1.0-Preliminary-Design-Document.md",
+    "DDD": project_root / "Documents" / "DDD" / "MOSAR-WP3-D3.6-SA_1.2.0-Detailed-Design-Document.md"
+}
+
+
+def median_ms(action: Callable[[], object], runs: int) -> float:
+    """Median wall time of an action in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def traced_bytes(build: Callable[[], object]) -> int:
+    """Bytes allocated (and still held) while building an object."""
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return current
+
+
+def pack(value) -> int:
+    """
+    Encode a parameter with the driver's PackStream packer.
+
+    Returns:
+        Encoded size in bytes, or -1 when the packer is unavailable
+    """
+    try:
+        from neo4j._codec.packstream.v1 import Packer, PackableBuffer
+    except ImportError:
+        return -1
+
+    buffer = PackableBuffer()
+    Packer(buffer).pack(value)
+    return len(buffer.data)
+
+
+def npy_round_trip(matrix: np.ndarray) -> int:
+    """Save and reload a checkpoint batch in memory; returns its size."""
+    stream = io.BytesIO()
+    np.save(stream, matrix)
+    size = stream.tell()
+    stream.seek(0)
+    np.load(stream)
+    return size
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Benchmark float32 array vs list[float] embedding transport")
+    parser.add_argument("--runs", type=int, default=5, help="Timed runs per measurement")
+    parser.add_argument("--dimensions", type=int, default=3072, help="Embedding dimension")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]Embedding Transport Benchmark[/bold cyan]\n"
+        "float32 arrays vs Python float lists for all design sections",
+        border_style="cyan"
+    ))
+
+    missing = [str(path) for path in DOCUMENTS.values() if not path.exists()]
+    if missing:
+        console.print(f"[red]Document files not found: {', '.join(missing)}[/red]")
+        sys.exit(1)
+
+    sections = []
+    for doc_type, path in DOCUMENTS.items():
+        sections.extend(DesignDocParser(doc_type=doc_type).parse(path))
+
+    count = len(sections)
+    rng = np.random.default_rng(42)
+    matrix = rng.standard_normal((count, args.dimensions)).astype(EMBEDDING_DTYPE)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+
+    lists: List[List[float]] = matrix.tolist()
+    arrays = as_embedding_matrix(lists)
+
+    # Loader parameters as sent by load_design_sections
+    list_params = {"sections": [{"id": s["id"], "content_embedding": e} for s, e in zip(sections, lists)]}
+    array_params = {"sections": [{"id": s["id"], "content_embedding": e} for s, e in zip(sections, arrays)]}
+
+    results = {"list[float]": {}, "float32 array": {}}
+
+    results["list[float]"]["memory"] = traced_bytes(lambda: matrix.tolist())
+    results["float32 array"]["memory"] = traced_bytes(lambda: matrix.copy())
+
+    results["list[float]"]["convert"] = median_ms(lambda: to_driver_value(list_params), args.runs)
+    results["float32 array"]["convert"] = median_ms(lambda: to_driver_value(array_params), args.runs)
+
+    converted = to_driver_value(array_params)
+    packed_size = pack(converted)
+    if packed_size >= 0:
+        results["list[float]"]["pack"] = median_ms(lambda: pack(to_driver_value(list_params)), args.runs)
+        results["float32 array"]["pack"] = median_ms(lambda: pack(to_driver_value(array_params)), args.runs)
+
+    results["list[float]"]["checkpoint"] = median_ms(lambda: npy_round_trip(np.asarray(lists)), args.runs)
+    results["float32 array"]["checkpoint"] = median_ms(lambda: npy_round_trip(arrays), args.runs)
+    results["list[float]"]["checkpoint_bytes"] = npy_round_trip(np.asarray(lists))
+    results["float32 array"]["checkpoint_bytes"] = npy_round_trip(arrays)
+
+    for name, value in [("list[float]", lists), ("float32 array", arrays)]:
+        results[name]["pickle"] = median_ms(lambda: pickle.loads(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)), args.runs)
+        results[name]["pickle_bytes"] = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+    table = Table(
+        title=f"{count} sections x {args.dimensions} dimensions ({args.runs} runs, median)",
+        header_style="bold cyan"
+    )
+    table.add_column("Measurement", style="cyan")
+    table.add_column("Float lists", justify="right")
+    table.add_column("float32 array", justify="right", style="green")
+    table.add_column("Ratio", justify="right")
+
+    def add_row(label: str, key: str, unit: str, scale: float = 1.0):
+        old, new = results["list[float]"][key], results["float32 array"][key]
+        ratio = f"{old / new:.2f}x" if new else "-"
+        table.add_row(label, f"{old / scale:,.1f} {unit}", f"{new / scale:,.1f} {unit}", ratio)
+
+    mb = 1024 * 1024
+    add_row("Resident embeddings", "memory", "MB", mb)
+    add_row("Driver conversion", "convert", "ms")
+    if packed_size >= 0:
+        add_row("Conversion + PackStream", "pack", "ms")
+    add_row("Checkpoint save + load", "checkpoint", "ms")
+    add_row("Checkpoint size", "checkpoint_bytes", "MB", mb)
+    add_row("Pickle round trip", "pickle", "ms")
+    add_row("Pickle size", "pickle_bytes", "MB", mb)
+
+    console.print(table)
+    if packed_size >= 0:
+        console.print(f"Bolt payload for all sections: {packed_size / mb:,.1f} MB (same for both; floats are sent as 64-bit)")
+    else:
+        console.print("[yellow]PackStream packer not available; skipped Bolt encoding[/yellow]")
+
+    if not np.array_equal(as_embedding_matrix(to_driver_value(array_params)["sections"][0]["content_embedding"]), arrays[0]):
+        console.print("[red][ERROR] Driver conversion changed embedding values[/red]")
+        sys.exit(1)
+
+    console.print("[OK] Driver conversion preserves float32 values", style="green")
+
+
+if __name__ == "__main__":
+    main()
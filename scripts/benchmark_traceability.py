@@ -0,0 +1,140 @@
+"""
+Benchmark: Live vs Materialized Requirement Traceability
+
+Compares the multi-hop get_requirement_traceability query against the
+single indexed lookup of the precomputed traceability document
+(written by MOSARGraphLoader.materialize_traceability()), and checks
+that both return the same content.
+
+Usage:
+    python scripts/benchmark_traceability.py [--limit 50] [--repeat 5]
+"""
+
+import sys
+import json
+import time
+import argparse
+import statistics
+from pathlib import Path
+from typing import Any, Dict, List
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.query.cypher_templates import CypherTemplates
+from src.utils.neo4j_client import Neo4jClient
+
+console = Console()
+
+
+def normalize(value: Any) -> Any:
+    """Make results order-insensitive (collect() order is not guaranteed)."""
+    if isinstance(value, dict):
+        return {k: normalize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return sorted((normalize(v) for v in value), key=lambda v: json.dumps(v, sort_keys=True, default=str))
+    return value
+
+
+def time_query(client: Neo4jClient, cypher: str, repeat: int) -> List[float]:
+    """Run a query `repeat` times and return latencies in ms."""
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        client.execute(cypher)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Benchmark live vs materialized traceability")
+    parser.add_argument("--limit", type=int, default=50, help="Number of requirements to benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per requirement and method")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]Traceability Benchmark[/bold cyan]\n"
+        "Live multi-hop query vs materialized document lookup",
+        border_style="cyan"
+    ))
+
+    client = Neo4jClient()
+    templates = CypherTemplates()
+
+    try:
+        rows = client.execute(
+            "MATCH (r:Requirement) WHERE r.traceability_doc IS NOT NULL "
+            "RETURN r.id AS id ORDER BY id LIMIT $limit",
+            limit=args.limit
+        )
+        req_ids = [row["id"] for row in rows]
+
+        if not req_ids:
+            console.print("[red]No materialized traceability documents found. Run scripts/load_documents.py first.[/red]")
+            sys.exit(1)
+
+        live_latencies: List[float] = []
+        materialized_latencies: List[float] = []
+        mismatches: List[str] = []
+
+        for req_id in req_ids:
+            live_query = templates.get_requirement_traceability(req_id)
+            materialized_query = templates.get_materialized_traceability(req_id)
+
+            # Warm-up run (plan cache) doubles as the equivalence check
+            live_result = client.execute(live_query)
+            materialized_result = client.execute(materialized_query)
+            materialized_doc = json.loads(materialized_result[0]["traceability_doc"])
+
+            if normalize(live_result[0]) != normalize(materialized_doc):
+                mismatches.append(req_id)
+
+            live_latencies.extend(time_query(client, live_query, args.repeat))
+            materialized_latencies.extend(time_query(client, materialized_query, args.repeat))
+
+        table = Table(title=f"Latency over {len(req_ids)} requirements x {args.repeat} runs", header_style="bold cyan")
+        table.add_column("Method", style="cyan")
+        table.add_column("Median (ms)", justify="right")
+        table.add_column("p95 (ms)", justify="right")
+        table.add_column("Mean (ms)", justify="right")
+
+        results: Dict[str, List[float]] = {
+            "Live multi-hop": live_latencies,
+            "Materialized lookup": materialized_latencies
+        }
+        for name, latencies in results.items():
+            table.add_row(
+                name,
+                f"{statistics.median(latencies):.2f}",
+                f"{percentile(latencies, 95):.2f}",
+                f"{statistics.mean(latencies):.2f}"
+            )
+
+        console.print(table)
+
+        speedup = statistics.median(live_latencies) / max(statistics.median(materialized_latencies), 1e-6)
+        console.print(f"Median speedup: [bold green]{speedup:.1f}x[/bold green]")
+
+        if mismatches:
+            console.print(f"[yellow]⚠ {len(mismatches)} stale documents (re-run materialization): {mismatches[:10]}[/yellow]")
+        else:
+            console.print("[OK] Materialized documents match live results", style="green")
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Bulk Import - Build a fresh MOSAR graph with neo4j-admin
+
+Instead of MERGE-ing every node and relationship through the driver
+(scripts/load_documents.py), this script:
+1. Parses and embeds the documents and exports node/relationship CSV files
+   (src/ingestion/bulk_export.py)
+2. Runs `neo4j-admin database import full` into a new (overwritten) database
+3. Once Neo4j is running again, creates constraints and indexes from
+   schema.cypher, materializes traceability documents and rebuilds the
+   graph statistics
+
+neo4j-admin imports offline: stop the Neo4j server (or database) before the
+import step and start it afterwards; the finalize step waits for it. When
+Neo4j runs elsewhere (e.g. in a container), use --print-command, run the
+printed command there (--csv-dir gives the path the CSV files have for the
+importer), then run this script again with --skip-export --skip-import.
+
+Parsing and embedding are checkpointed like load_documents.py, so --resume
+reuses finished embedding batches.
+
+Usage:
+    python scripts/bulk_import.py [--out-dir DIR] [--database neo4j] [--neo4j-admin PATH]
+                                  [--print-command] [--csv-dir PATH]
+                                  [--skip-export] [--skip-import] [--skip-finalize]
+                                  [--wait SECONDS] [--parse-workers N] [--resume]
+
+Environment Variables Required:
+    - OPENAI_API_KEY (export)
+    - NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD (finalize)
+"""
+
+import sys
+import time
+import shlex
+import logging
+import argparse
+import subprocess
+from pathlib import Path
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ingestion.parallel_parser import ParallelDocumentParser
+from src.ingestion.embedder import DocumentEmbedder
+from src.ingestion.checkpoint import LoadCheckpoint
+from src.ingestion.bulk_export import BulkExporter
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+console = Console()
+
+DOCUMENTS = {
+    "SRD": project_root / "Documents" / "SRD" / "System Requirements Document_MOSAR.md",
+    "PDD": project_root / "Documents" / "PDD" / "MOSAR-WP2-D2.4-SA_1.1.0-Preliminary-Design-Document.md",
+    "DDD": project_root / "Documents" / "DDD" / "MOSAR-WP3-D3.6-SA_1.2.0-Detailed-Design-Document.md",
+    "Demo": project_root / "Documents" / "Demo" / "MOSAR-WP3-D3.5-DLR_1.1.0-Demonstration-Procedures.md"
+}
+
+
+def export_documents(exporter: BulkExporter, work_dir: Path, parse_workers: int, resume: bool) -> dict:
+    """
+    Parse, embed and export all documents as import CSV files.
+
+    Args:
+        exporter: Exporter writing to the CSV directory
+        work_dir: Checkpoint directory for parsed documents and embeddings
+        parse_workers: Parser worker processes (None = PARSE_WORKERS)
+        resume: Reuse the checkpoint in work_dir
+
+    Returns:
+        Rows written per label / relationship type
+    """
+    missing = [str(path) for path in DOCUMENTS.values() if not path.exists()]
+    if missing:
+        raise FileNotFoundError(f"Missing document files: {', '.join(missing)}")
+
+    checkpoint = LoadCheckpoint(work_dir, sources=DOCUMENTS, resume=resume)
+
+    parsed = {}
+    to_parse = {}
+    for doc_type, path in DOCUMENTS.items():
+        if checkpoint.is_done(f"parse:{doc_type}"):
+            parsed[doc_type] = checkpoint.load_parsed(doc_type)
+        else:
+            to_parse[doc_type] = path
+
+    if to_parse:
+        with console.status(f"[bold green]Parsing {len(to_parse)} documents..."):
+            results = ParallelDocumentParser(max_workers=parse_workers).parse_all(to_parse)
+
+        for doc_type, result in results.items():
+            checkpoint.save_parsed(doc_type, result["items"])
+            checkpoint.mark_done(
+                f"parse:{doc_type}",
+                chunks=result["chunks"],
+                parse_s=result["parse_s"],
+                wall_s=result["wall_s"]
+            )
+            parsed[doc_type] = result["items"]
+
+    console.print(f"[OK] Parsed {sum(len(items) for items in parsed.values())} items", style="green")
+
+    embedder = DocumentEmbedder(checkpoint=checkpoint)
+    with console.status("[bold green]Generating embeddings..."):
+        embedder.embed_requirements(parsed["SRD"])
+        embedder.embed_sections(parsed["PDD"] + parsed["DDD"])
+
+    console.print(
+        f"[OK] Embedded {len(parsed['SRD'])} requirements and "
+        f"{len(parsed['PDD']) + len(parsed['DDD'])} sections",
+        style="green"
+    )
+
+    with console.status("[bold green]Writing CSV files..."):
+        counts = exporter.export(
+            parsed["SRD"],
+            {"PDD": parsed["PDD"], "DDD": parsed["DDD"]},
+            parsed["Demo"]
+        )
+
+    table = Table(title=f"Exported to {exporter.out_dir}", show_header=True, header_style="bold cyan")
+    table.add_column("Label / Type", style="cyan")
+    table.add_column("Rows", justify="right", style="green")
+    for name, count in counts.items():
+        table.add_row(name, str(count))
+    console.print(table)
+
+    return counts
+
+
+def wait_for_neo4j(timeout: float):
+    """
+    Wait until Neo4j accepts connections.
+
+    Args:
+        timeout: Seconds to wait
+
+    Returns:
+        Connected Neo4jClient
+
+    Raises:
+        TimeoutError: If Neo4j is not reachable in time
+    """
+    from src.utils.neo4j_client import Neo4jClient
+
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Neo4jClient()
+        except Exception as e:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Neo4j not reachable after {timeout:.0f}s: {e}")
+            time.sleep(2)
+
+
+def finalize(wait: float):
+    """
+    Create schema, traceability documents and statistics on the imported graph.
+
+    Args:
+        wait: Seconds to wait for Neo4j to come up
+    """
+    from src.neo4j_schema.create_schema import create_schema
+    from src.ingestion.neo4j_loader import MOSARGraphLoader
+
+    with console.status(f"[bold green]Waiting for Neo4j (up to {wait:.0f}s)..."):
+        wait_for_neo4j(wait).close()
+    console.print("[OK] Neo4j connection successful", style="green")
+
+    with console.status("[bold green]Creating constraints and indexes..."):
+        if not create_schema():
+            raise RuntimeError("Schema creation failed (see log)")
+    console.print("[OK] Constraints and indexes created from schema.cypher", style="green")
+
+    loader = MOSARGraphLoader()
+    try:
+        with console.status("[bold green]Computing traceability documents..."):
+            docs = loader.materialize_traceability()
+        console.print(f"[OK] Materialized {docs} traceability documents", style="green")
+
+        with console.status("[bold green]Recounting statistics..."):
+            loader.statistics.rebuild()
+        console.print("[OK] Graph statistics rebuilt", style="green")
+    finally:
+        loader.close()
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Build a fresh MOSAR graph with neo4j-admin bulk import")
+    parser.add_argument("--out-dir", type=Path, default=project_root / ".bulk_import",
+                        help="Export directory (CSV files in csv/, checkpoint in work/)")
+    parser.add_argument("--database", default="neo4j", help="Database to (over)write")
+    parser.add_argument("--neo4j-admin", default="neo4j-admin", help="neo4j-admin executable")
+    parser.add_argument("--csv-dir", type=Path, default=None,
+                        help="Path of the CSV directory as seen by neo4j-admin (default: local path)")
+    parser.add_argument("--print-command", action="store_true",
+                        help="Print the import command instead of running it (stops before finalize)")
+    parser.add_argument("--skip-export", action="store_true", help="Reuse previously exported CSV files")
+    parser.add_argument("--skip-import", action="store_true", help="Do not run neo4j-admin")
+    parser.add_argument("--skip-finalize", action="store_true",
+                        help="Skip schema, traceability and statistics after the import")
+    parser.add_argument("--wait", type=float, default=300,
+                        help="Seconds to wait for Neo4j before finalizing (default: 300)")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Worker processes for parsing (default: PARSE_WORKERS or 1)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Reuse parsed documents and embedding batches from the export checkpoint")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]MOSAR GraphRAG Bulk Import[/bold cyan]\n"
+        "CSV export, neo4j-admin import, schema and traceability",
+        border_style="cyan"
+    ))
+
+    exporter = BulkExporter(args.out_dir / "csv")
+    start_time = time.time()
+
+    try:
+        if not args.skip_export:
+            console.print("\n[bold cyan]Step 1: Exporting CSV files[/bold cyan]")
+            export_documents(exporter, args.out_dir / "work", args.parse_workers, args.resume)
+            console.print(f"[OK] Export finished in {time.time() - start_time:.1f}s", style="green")
+
+        command = exporter.import_command(
+            database=args.database,
+            neo4j_admin=args.neo4j_admin,
+            csv_dir=args.csv_dir
+        )
+
+        if args.print_command:
+            console.print("\n[bold yellow]Run with Neo4j stopped:[/bold yellow]")
+            console.print(" \\\n    ".join(shlex.quote(part) for part in command), soft_wrap=True)
+            console.print("\nThen start Neo4j and finalize with:")
+            console.print("   [cyan]python scripts/bulk_import.py --skip-export --skip-import[/cyan]")
+            sys.exit(0)
+
+        if not args.skip_import:
+            console.print("\n[bold cyan]Step 2: Importing with neo4j-admin[/bold cyan]")
+            console.print(f"[yellow]⚠ Database '{args.database}' will be overwritten; Neo4j must be stopped[/yellow]")
+            import_start = time.time()
+            subprocess.run(command, check=True)
+            console.print(f"[OK] Import finished in {time.time() - import_start:.1f}s", style="green")
+
+        if not args.skip_finalize:
+            console.print("\n[bold cyan]Step 3: Schema, traceability and statistics[/bold cyan]")
+            if not args.skip_import:
+                console.print("[yellow]Start Neo4j now; waiting for it to accept connections...[/yellow]")
+            finalize(args.wait)
+
+        console.print(f"\n[bold green][OK] Bulk import completed in {time.time() - start_time:.1f}s[/bold green]")
+        sys.exit(0)
+
+    except Exception as e:
+        console.print(f"\n[bold red][ERROR] Fatal error: {e}[/bold red]")
+        logger.exception("Fatal error during bulk import")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parents[1]))
 
 from src.utils.neo4j_client import Neo4jClient
+from src.utils.graph_statistics import GraphStatistics
 
 
 def main():
@@ -22,12 +23,15 @@ def main():
     relates_to = client.count_relationships('RELATES_TO')
     mentions = client.count_relationships('MENTIONS')
     total_entity_rels = relates_to + mentions
+    coverage = GraphStatistics(client).get_summary()
 
     print("Criteria:")
     print("-" * 70)
     print(f"1. Requirements loaded: {reqs} / 227 target")
     print(f"2. Test cases loaded: {tcs}")
     print(f"   VERIFIES relationships: {verifies}")
+    print(f"   Verification coverage: {coverage['verified_requirements']}/{coverage['total_requirements']} "
+          f"({coverage['coverage_percentage']:.1f}%)")
     print(f"3. Sections embedded: {secs} / 500+ target")
     print(f"4. Entity relationships: {total_entity_rels}")
     print(f"   - RELATES_TO: {relates_to}")
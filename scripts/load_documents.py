@@ -7,7 +7,25 @@ Loads all MOSAR documents into Neo4j in the correct order:
 3. Demonstration Procedures (Test Cases)
 
 Usage:
-    python scripts/load_documents.py [--skip-srd] [--skip-design] [--skip-demo]
+    python scripts/load_documents.py [--skip-srd] [--skip-design] [--skip-demo] [--warm-cache]
+                                     [--parse-workers N] [--incremental] [--resume]
+                                     [--stream] [--batch-size N]
+                                     [--chunk-size N] [--chunk-overlap N]
+
+With --incremental, parsed items are diffed against the graph by content
+hash: only inserted/updated items are embedded and written, and nodes that
+disappeared from the documents are deleted. Design documents loaded with
+scripts/load_design_docs.py are stored as TextChunker chunks; pass the same
+--chunk-size 240 --chunk-overlap 50 so they are diffed chunk by chunk.
+
+Progress is checkpointed to a work directory (LOAD_WORK_DIR, default
+.load_work/): parsed documents, embedding batches and completed write
+stages. After a failure, --resume skips completed stages and reuses
+embedding batches instead of paying for them again.
+
+With --stream, parsing, embedding and Neo4j writes overlap: batches flow
+through bounded parse -> chunk -> embed -> load queues, and each batch's
+embeddings are released once written. Per-stage throughput is reported.
 
 Environment Variables Required:
     - NEO4J_URI
@@ -16,6 +34,7 @@ Environment Variables Required:
     - OPENAI_API_KEY
 """
 
+import os
 import sys
 import logging
 import time
@@ -30,11 +49,13 @@ import argparse
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.ingestion.srd_parser import SRDParser
-from src.ingestion.design_doc_parser import DesignDocParser
-from src.ingestion.demo_procedure_parser import DemoProcedureParser
+from src.ingestion.parallel_parser import ParallelDocumentParser
 from src.ingestion.embedder import DocumentEmbedder
 from src.ingestion.neo4j_loader import MOSARGraphLoader
+from src.ingestion.incremental import IncrementalLoader
+from src.ingestion.checkpoint import LoadCheckpoint
+from src.ingestion.streaming_pipeline import StreamingIngestionPipeline
+from src.ingestion.text_chunker import TextChunker
 from src.utils.neo4j_client import Neo4jClient
 
 # Setup logging
@@ -52,14 +73,24 @@ console = Console()
 class DocumentLoadManager:
     """Manages the complete document loading pipeline."""
 
-    def __init__(self):
-        """Initialize parsers and loaders."""
-        self.srd_parser = SRDParser()
-        self.design_parser = DesignDocParser()
-        self.demo_parser = DemoProcedureParser()
-        self.embedder = DocumentEmbedder()
-        self.loader = MOSARGraphLoader()
-
+    def __init__(
+        self,
+        parse_workers: int = None,
+        incremental: bool = False,
+        resume: bool = False,
+        work_dir: Path = None,
+        chunker: TextChunker = None
+    ):
+        """
+        Initialize parsers and loaders.
+
+        Args:
+            parse_workers: Parser worker processes (default: PARSE_WORKERS)
+            incremental: Write only the diff against the graph
+            resume: Continue from the checkpoint in work_dir
+            work_dir: Checkpoint directory (default: LOAD_WORK_DIR or .load_work/)
+            chunker: TextChunker the design documents are stored with (incremental loads)
+        """
         # Document paths
         self.docs_dir = project_root / "Documents"
         self.srd_path = self.docs_dir / "SRD" / "System Requirements Document_MOSAR.md"
@@ -67,12 +98,31 @@ class DocumentLoadManager:
         self.ddd_path = self.docs_dir / "DDD" / "MOSAR-WP3-D3.6-SA_1.2.0-Detailed-Design-Document.md"
         self.demo_path = self.docs_dir / "Demo" / "MOSAR-WP3-D3.5-DLR_1.1.0-Demonstration-Procedures.md"
 
+        self.checkpoint = LoadCheckpoint(
+            work_dir or Path(os.getenv("LOAD_WORK_DIR", str(project_root / ".load_work"))),
+            sources={
+                "SRD": self.srd_path,
+                "PDD": self.pdd_path,
+                "DDD": self.ddd_path,
+                "Demo": self.demo_path
+            },
+            resume=resume
+        )
+
+        self.parser = ParallelDocumentParser(max_workers=parse_workers)
+        self.parsed = {}
+        self.embedder = DocumentEmbedder(checkpoint=self.checkpoint)
+        self.loader = MOSARGraphLoader()
+        self.incremental = IncrementalLoader(self.loader, self.embedder, chunker=chunker) if incremental else None
+        self.deltas = {}
+
         # Statistics
         self.stats = {
             "requirements": 0,
             "sections": 0,
             "test_cases": 0,
             "embeddings": 0,
+            "traceability_docs": 0,
             "errors": 0
         }
 
@@ -105,6 +155,71 @@ class DocumentLoadManager:
 
         console.print("\n[bold green][OK] Environment verification complete[/bold green]\n")
 
+    def parse_documents(self, doc_types):
+        """
+        Parse the selected documents up front (concurrently when workers > 1).
+
+        Args:
+            doc_types: Document types to parse ("SRD", "PDD", "DDD", "Demo")
+        """
+        paths = {
+            "SRD": self.srd_path,
+            "PDD": self.pdd_path,
+            "DDD": self.ddd_path,
+            "Demo": self.demo_path
+        }
+        if not doc_types:
+            return
+
+        console.print("\n[bold cyan]Parsing Documents...[/bold cyan]")
+        start = time.perf_counter()
+
+        # Parsed output of a resumed load is read back from the checkpoint
+        for doc_type in doc_types:
+            if self.checkpoint.is_done(f"parse:{doc_type}"):
+                self.parsed[doc_type] = {
+                    **self.checkpoint.stage_details(f"parse:{doc_type}"),
+                    "items": self.checkpoint.load_parsed(doc_type)
+                }
+
+        to_parse = [doc_type for doc_type in doc_types if doc_type not in self.parsed]
+        if to_parse:
+            with console.status(f"[bold green]Parsing {len(to_parse)} documents ({self.parser.max_workers} workers)..."):
+                results = self.parser.parse_all({doc_type: paths[doc_type] for doc_type in to_parse})
+
+            for doc_type, result in results.items():
+                self.checkpoint.save_parsed(doc_type, result["items"])
+                self.checkpoint.mark_done(
+                    f"parse:{doc_type}",
+                    chunks=result["chunks"],
+                    parse_s=result["parse_s"],
+                    wall_s=result["wall_s"]
+                )
+                self.parsed[doc_type] = result
+
+        self.parsed = {doc_type: self.parsed[doc_type] for doc_type in doc_types}
+
+        table = Table(title="Parse Timings", show_header=True, header_style="bold cyan")
+        table.add_column("Document", style="cyan")
+        table.add_column("Items", justify="right", style="green")
+        table.add_column("Chunks", justify="right")
+        table.add_column("Parse (s)", justify="right")
+        table.add_column("Done at (s)", justify="right", style="yellow")
+        table.add_column("Source")
+
+        for doc_type, result in self.parsed.items():
+            table.add_row(
+                doc_type,
+                str(len(result["items"])),
+                str(result["chunks"]),
+                f"{result['parse_s']:.2f}",
+                f"{result['wall_s']:.2f}",
+                "parsed" if doc_type in to_parse else "checkpoint"
+            )
+
+        console.print(table)
+        console.print(f"[OK] Parsed {len(self.parsed)} documents in {time.perf_counter() - start:.2f}s", style="green")
+
     def load_srd(self):
         """Load System Requirements Document."""
         console.print("\n" + "="*60, style="cyan")
@@ -112,11 +227,18 @@ class DocumentLoadManager:
         console.print("="*60, style="cyan")
 
         try:
-            with console.status("[bold green]Parsing SRD..."):
-                requirements = self.srd_parser.parse(self.srd_path)
-                self.stats["requirements"] = len(requirements)
+            requirements = self.parsed["SRD"]["items"]
+            self.stats["requirements"] = len(requirements)
 
-            console.print(f"[OK] Parsed {len(requirements)} requirements", style="green")
+            if self._skip_completed("write:SRD", "Requirements"):
+                return
+
+            if self.incremental:
+                with console.status("[bold green]Applying requirement changes..."):
+                    delta = self.incremental.sync_requirements(requirements)
+                self._record_delta("Requirements", delta)
+                self.checkpoint.mark_done("write:SRD", delta=delta)
+                return
 
             with console.status("[bold green]Generating embeddings..."):
                 requirements_with_embeddings = self.embedder.embed_requirements(requirements)
@@ -127,6 +249,7 @@ class DocumentLoadManager:
             with console.status("[bold green]Loading to Neo4j..."):
                 self.loader.load_requirements(requirements_with_embeddings)
 
+            self.checkpoint.mark_done("write:SRD", count=len(requirements))
             console.print(f"[OK] Loaded {len(requirements)} requirements to Neo4j", style="green")
 
         except Exception as e:
@@ -141,39 +264,39 @@ class DocumentLoadManager:
         console.print("="*60, style="cyan")
 
         try:
-            # Parse PDD
-            with console.status("[bold green]Parsing PDD..."):
-                pdd_parser = DesignDocParser(doc_type="PDD")
-                pdd_sections = pdd_parser.parse(self.pdd_path)
-                console.print(f"[OK] Parsed {len(pdd_sections)} PDD sections", style="green")
-
-            # Parse DDD
-            with console.status("[bold green]Parsing DDD..."):
-                ddd_parser = DesignDocParser(doc_type="DDD")
-                ddd_sections = ddd_parser.parse(self.ddd_path)
-                console.print(f"[OK] Parsed {len(ddd_sections)} DDD sections", style="green")
-
-            all_sections = pdd_sections + ddd_sections
-            self.stats["sections"] = len(all_sections)
+            sections_by_doc = {doc_type: self.parsed[doc_type]["items"] for doc_type in ("PDD", "DDD")}
+            self.stats["sections"] = sum(len(sections) for sections in sections_by_doc.values())
+
+            pending = [
+                doc_type for doc_type in sections_by_doc
+                if not self._skip_completed(f"write:{doc_type}", f"{doc_type} Sections")
+            ]
+            if not pending:
+                return
+
+            if self.incremental:
+                for doc_type in pending:
+                    with console.status(f"[bold green]Applying {doc_type} changes..."):
+                        delta = self.incremental.sync_sections(sections_by_doc[doc_type], doc_type=doc_type)
+                    self._record_delta(f"{doc_type} Sections", delta)
+                    self.checkpoint.mark_done(f"write:{doc_type}", delta=delta)
+                return
+
+            pending_sections = [sec for doc_type in pending for sec in sections_by_doc[doc_type]]
 
             # Generate embeddings
             with console.status("[bold green]Generating embeddings..."):
-                sections_with_embeddings = self.embedder.embed_sections(all_sections)
-                self.stats["embeddings"] += len(sections_with_embeddings)
-
-            console.print(f"[OK] Generated {len(sections_with_embeddings)} section embeddings", style="green")
+                self.embedder.embed_sections(pending_sections)
+                self.stats["embeddings"] += len(pending_sections)
 
-            # Load PDD sections
-            with console.status("[bold green]Loading PDD to Neo4j..."):
-                pdd_sections_with_emb = [s for s in sections_with_embeddings if s.get("doc_type") == "PDD"]
-                self.loader.load_design_sections(pdd_sections_with_emb, doc_type="PDD")
+            console.print(f"[OK] Generated {len(pending_sections)} section embeddings", style="green")
 
-            # Load DDD sections
-            with console.status("[bold green]Loading DDD to Neo4j..."):
-                ddd_sections_with_emb = [s for s in sections_with_embeddings if s.get("doc_type") == "DDD"]
-                self.loader.load_design_sections(ddd_sections_with_emb, doc_type="DDD")
+            for doc_type in pending:
+                with console.status(f"[bold green]Loading {doc_type} to Neo4j..."):
+                    self.loader.load_design_sections(sections_by_doc[doc_type], doc_type=doc_type)
 
-            console.print(f"[OK] Loaded {len(all_sections)} design sections to Neo4j", style="green")
+                self.checkpoint.mark_done(f"write:{doc_type}", count=len(sections_by_doc[doc_type]))
+                console.print(f"[OK] Loaded {len(sections_by_doc[doc_type])} {doc_type} sections to Neo4j", style="green")
 
         except Exception as e:
             console.print(f"[ERROR] Design documents loading failed: {e}", style="red")
@@ -187,15 +310,24 @@ class DocumentLoadManager:
         console.print("="*60, style="cyan")
 
         try:
-            with console.status("[bold green]Parsing Demo Procedures..."):
-                test_cases = self.demo_parser.parse(self.demo_path)
-                self.stats["test_cases"] = len(test_cases)
+            test_cases = self.parsed["Demo"]["items"]
+            self.stats["test_cases"] = len(test_cases)
 
-            console.print(f"[OK] Parsed {len(test_cases)} test cases", style="green")
+            if self._skip_completed("write:Demo", "Test Cases"):
+                return
+
+            if self.incremental:
+                with console.status("[bold green]Applying test case changes..."):
+                    delta = self.incremental.sync_test_cases(test_cases)
+                self._record_delta("Test Cases", delta)
+                self.checkpoint.mark_done("write:Demo", delta=delta)
+                return
 
             with console.status("[bold green]Loading to Neo4j..."):
                 self.loader.load_test_cases(test_cases)
 
+            self.checkpoint.mark_done("write:Demo", count=len(test_cases))
+
             console.print(f"[OK] Loaded {len(test_cases)} test cases to Neo4j", style="green")
 
         except Exception as e:
@@ -203,6 +335,168 @@ class DocumentLoadManager:
             self.stats["errors"] += 1
             raise
 
+    def load_streaming(self, doc_types, batch_size: int = 50):
+        """
+        Parse, embed and write documents as overlapping pipeline stages.
+
+        Args:
+            doc_types: Document types in load order ("SRD", "PDD", "DDD", "Demo")
+            batch_size: Items per pipeline batch
+        """
+        console.print("\n" + "="*60, style="cyan")
+        console.print("[bold cyan]Streaming Load (parse -> chunk -> embed -> load)[/bold cyan]")
+        console.print("="*60, style="cyan")
+
+        names = {"SRD": "Requirements", "PDD": "PDD Sections", "DDD": "DDD Sections", "Demo": "Test Cases"}
+        stat_keys = {"SRD": "requirements", "PDD": "sections", "DDD": "sections", "Demo": "test_cases"}
+        pending = [
+            doc_type for doc_type in doc_types
+            if not self._skip_completed(f"write:{doc_type}", names[doc_type])
+        ]
+        if not pending:
+            return
+
+        def on_document_loaded(doc_type: str, count: int):
+            self.checkpoint.mark_done(f"write:{doc_type}", count=count)
+            self.stats[stat_keys[doc_type]] += count
+            if doc_type != "Demo":
+                self.stats["embeddings"] += count
+            console.print(f"[OK] Loaded {count} {names[doc_type].lower()} to Neo4j", style="green")
+
+        pipeline = StreamingIngestionPipeline(
+            self.embedder,
+            self.loader,
+            batch_size=batch_size,
+            on_document_loaded=on_document_loaded
+        )
+
+        try:
+            result = pipeline.run([
+                (doc_type, lambda doc_type=doc_type: self._parse_document(doc_type))
+                for doc_type in pending
+            ])
+        except Exception as e:
+            console.print(f"[ERROR] Streaming load failed: {e}", style="red")
+            self.stats["errors"] += 1
+            raise
+
+        table = Table(title=f"Pipeline Stages ({result['wall_s']:.1f}s wall)", show_header=True, header_style="bold cyan")
+        table.add_column("Stage", style="cyan")
+        table.add_column("Items", justify="right", style="green")
+        table.add_column("Batches", justify="right")
+        table.add_column("Busy (s)", justify="right")
+        table.add_column("Items/s", justify="right", style="yellow")
+        table.add_column("Waiting (s)", justify="right")
+        table.add_column("Blocked (s)", justify="right")
+        table.add_column("Peak Queue", justify="right")
+
+        for stage, metrics in result["stages"].items():
+            rate = metrics["items"] / metrics["busy_s"] if metrics["busy_s"] > 0 else 0.0
+            table.add_row(
+                stage,
+                str(metrics["items"]),
+                str(metrics["batches"]),
+                f"{metrics['busy_s']:.2f}",
+                f"{rate:.1f}",
+                f"{metrics['wait_s']:.2f}",
+                f"{metrics['blocked_s']:.2f}",
+                str(metrics["peak_queue"])
+            )
+
+        console.print(table)
+
+    def _parse_document(self, doc_type: str):
+        """
+        Parse one document (or read it from the checkpoint) for the streaming load.
+
+        Args:
+            doc_type: Document type
+
+        Returns:
+            Parsed items
+        """
+        if self.checkpoint.is_done(f"parse:{doc_type}"):
+            return self.checkpoint.load_parsed(doc_type)
+
+        paths = {
+            "SRD": self.srd_path,
+            "PDD": self.pdd_path,
+            "DDD": self.ddd_path,
+            "Demo": self.demo_path
+        }
+        result = self.parser.parse_all({doc_type: paths[doc_type]})[doc_type]
+        self.checkpoint.save_parsed(doc_type, result["items"])
+        self.checkpoint.mark_done(
+            f"parse:{doc_type}",
+            chunks=result["chunks"],
+            parse_s=result["parse_s"],
+            wall_s=result["wall_s"]
+        )
+        return result["items"]
+
+    def _skip_completed(self, stage: str, name: str) -> bool:
+        """
+        Check whether a resumed load already completed a stage.
+
+        Args:
+            stage: Checkpoint stage name
+            name: Item kind for messages and the delta table
+
+        Returns:
+            True if the stage should be skipped
+        """
+        if not self.checkpoint.is_done(stage):
+            return False
+
+        delta = self.checkpoint.stage_details(stage).get("delta")
+        if delta:
+            self.deltas[name] = delta
+        console.print(f"[SKIP] {name} already written (checkpoint)", style="yellow")
+        return True
+
+    def _record_delta(self, name: str, delta: dict):
+        """
+        Record and print an incremental load delta.
+
+        Args:
+            name: Item kind (e.g. "PDD Sections")
+            delta: Counts from IncrementalLoader
+        """
+        self.deltas[name] = delta
+        if name != "Test Cases":
+            # Only inserted/updated requirements and sections are embedded
+            self.stats["embeddings"] += delta["inserted"] + delta["updated"]
+
+        console.print(
+            f"[OK] {name}: {delta['inserted']} inserted, {delta['updated']} updated, "
+            f"{delta['deleted']} deleted, {delta['unchanged']} unchanged",
+            style="green"
+        )
+
+    def materialize_traceability(self):
+        """Precompute per-requirement traceability documents (after all loads)."""
+        console.print("\n" + "="*60, style="cyan")
+        console.print("[bold cyan]Step 4: Materializing Requirement Traceability[/bold cyan]")
+        console.print("="*60, style="cyan")
+
+        try:
+            if self.checkpoint.is_done("traceability"):
+                self.stats["traceability_docs"] = self.checkpoint.stage_details("traceability")["count"]
+                console.print("[SKIP] Traceability already materialized (checkpoint)", style="yellow")
+                return
+
+            with console.status("[bold green]Computing traceability documents..."):
+                self.stats["traceability_docs"] = self.loader.materialize_traceability()
+
+            self.checkpoint.mark_done("traceability", count=self.stats["traceability_docs"])
+
+            console.print(f"[OK] Materialized {self.stats['traceability_docs']} traceability documents", style="green")
+
+        except Exception as e:
+            console.print(f"[ERROR] Traceability materialization failed: {e}", style="red")
+            self.stats["errors"] += 1
+            raise
+
     def print_summary(self, elapsed_time: float):
         """Print loading summary."""
         console.print("\n" + "="*60, style="green")
@@ -217,11 +511,29 @@ class DocumentLoadManager:
         table.add_row("Design Sections", str(self.stats["sections"]))
         table.add_row("Test Cases", str(self.stats["test_cases"]))
         table.add_row("Embeddings Generated", str(self.stats["embeddings"]))
+        table.add_row("Traceability Docs", str(self.stats["traceability_docs"]))
         table.add_row("Errors", str(self.stats["errors"]), style="red" if self.stats["errors"] > 0 else "green")
         table.add_row("Total Time", f"{elapsed_time:.1f}s", style="yellow")
 
         console.print(table)
 
+        if self.deltas:
+            delta_table = Table(title="Incremental Delta", show_header=True, header_style="bold cyan")
+            delta_table.add_column("Items", style="cyan")
+            for column in ("Inserted", "Updated", "Deleted", "Unchanged"):
+                delta_table.add_column(column, justify="right")
+
+            for name, delta in self.deltas.items():
+                delta_table.add_row(
+                    name,
+                    str(delta["inserted"]),
+                    str(delta["updated"]),
+                    str(delta["deleted"]),
+                    str(delta["unchanged"])
+                )
+
+            console.print(delta_table)
+
         # Next steps
         console.print("\n[bold yellow]Next Steps:[/bold yellow]")
         console.print("1. Verify data loaded correctly:")
@@ -238,8 +550,31 @@ def main():
     parser.add_argument("--skip-srd", action="store_true", help="Skip SRD loading")
     parser.add_argument("--skip-design", action="store_true", help="Skip design documents loading")
     parser.add_argument("--skip-demo", action="store_true", help="Skip demo procedures loading")
+    parser.add_argument("--warm-cache", action="store_true", help="Warm the query cache after loading")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Worker processes for parsing (default: PARSE_WORKERS or 1)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only write changes against the graph (by content hash) and delete stale nodes")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume an interrupted load from its checkpoint (skips completed stages)")
+    parser.add_argument("--work-dir", type=Path, default=None,
+                        help="Checkpoint directory (default: LOAD_WORK_DIR or .load_work/)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Overlap parsing, embedding and writes in a bounded-queue pipeline")
+    parser.add_argument("--batch-size", type=int, default=50,
+                        help="Items per pipeline batch with --stream (default: 50)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="With --incremental: chunk size the design documents were loaded with "
+                             "(scripts/load_design_docs.py uses 240)")
+    parser.add_argument("--chunk-overlap", type=int, default=50,
+                        help="With --incremental: chunk overlap the design documents were loaded with (default: 50)")
     args = parser.parse_args()
 
+    if args.stream and args.incremental:
+        parser.error("--stream and --incremental cannot be combined")
+    if args.chunk_size and not args.incremental:
+        parser.error("--chunk-size only applies to --incremental loads")
+
     # Print header
     console.print(Panel.fit(
         "[bold cyan]MOSAR GraphRAG Document Loader[/bold cyan]\n"
@@ -247,7 +582,13 @@ def main():
         border_style="cyan"
     ))
 
-    manager = DocumentLoadManager()
+    manager = DocumentLoadManager(
+        parse_workers=args.parse_workers,
+        incremental=args.incremental,
+        resume=args.resume,
+        work_dir=args.work_dir,
+        chunker=TextChunker(chunk_size=args.chunk_size, overlap=args.chunk_overlap) if args.chunk_size else None
+    )
 
     try:
         # Verify environment
@@ -255,27 +596,53 @@ def main():
 
         start_time = time.time()
 
-        # Load documents in order
+        doc_types = []
         if not args.skip_srd:
-            manager.load_srd()
-        else:
-            console.print("\n[yellow]⚠ Skipping SRD loading[/yellow]")
-
+            doc_types.append("SRD")
         if not args.skip_design:
-            manager.load_design_docs()
-        else:
-            console.print("\n[yellow]⚠ Skipping Design Documents loading[/yellow]")
-
+            doc_types.extend(["PDD", "DDD"])
         if not args.skip_demo:
-            manager.load_demo_procedures()
+            doc_types.append("Demo")
+
+        if args.stream:
+            # Documents are parsed inside the pipeline, one at a time
+            manager.load_streaming(doc_types, batch_size=args.batch_size)
         else:
-            console.print("\n[yellow]⚠ Skipping Demo Procedures loading[/yellow]")
+            # Parse everything first so documents are parsed concurrently
+            manager.parse_documents(doc_types)
+
+            # Load documents in order
+            if not args.skip_srd:
+                manager.load_srd()
+            else:
+                console.print("\n[yellow]⚠ Skipping SRD loading[/yellow]")
+
+            if not args.skip_design:
+                manager.load_design_docs()
+            else:
+                console.print("\n[yellow]⚠ Skipping Design Documents loading[/yellow]")
+
+            if not args.skip_demo:
+                manager.load_demo_procedures()
+            else:
+                console.print("\n[yellow]⚠ Skipping Demo Procedures loading[/yellow]")
+
+        # Traceability documents depend on requirements, components and test cases
+        manager.materialize_traceability()
 
         elapsed_time = time.time() - start_time
 
         # Print summary
         manager.print_summary(elapsed_time)
 
+        if args.warm_cache:
+            # Imported here so plain loads don't pull in the GraphRAG nodes
+            from scripts.warm_cache import run_warmup
+
+            console.print("\n[bold cyan]Warming query cache...[/bold cyan]")
+            if not run_warmup():
+                manager.stats["errors"] += 1
+
         if manager.stats["errors"] > 0:
             console.print("\n[yellow]⚠ Loading completed with errors[/yellow]")
             sys.exit(1)
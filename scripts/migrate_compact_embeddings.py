@@ -0,0 +1,122 @@
+"""
+Migrate existing nodes to compact search embeddings
+
+Adds Matryoshka-truncated, normalized copies of the full 3072-d embeddings
+(Section.content_embedding_small, Requirement.statement_embedding_small) and
+creates the int8-quantized vector indexes used for first-pass search
+(dropping and recreating them if they exist with another dimension).
+No OpenAI calls are made; the full vectors are kept for rescoring.
+
+Usage:
+    python scripts/migrate_compact_embeddings.py [--dimension 256] [--batch-size 200]
+
+Then enable compact search with EMBEDDING_SEARCH_DIMENSION=<dimension>.
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.embeddings import COMPACT_EMBEDDING_PROPERTIES, get_search_dimension, truncate_embeddings
+from src.utils.neo4j_client import Neo4jClient
+from src.neo4j_schema.create_schema import ensure_compact_indexes
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+console = Console()
+
+
+def migrate_label(client: Neo4jClient, label: str, dimension: int, batch_size: int) -> int:
+    """
+    Write compact embeddings for all nodes of a label that lack them.
+
+    Args:
+        client: Neo4jClient instance
+        label: Node label (Section or Requirement)
+        dimension: Compact dimension
+        batch_size: Nodes per batch
+
+    Returns:
+        Number of nodes migrated
+    """
+    properties = COMPACT_EMBEDDING_PROPERTIES[label]
+    full, compact = properties["full"], properties["compact"]
+
+    read_query = f"""
+    MATCH (n:{label})
+    WHERE n.{full} IS NOT NULL
+      AND (n.{compact} IS NULL OR size(n.{compact}) <> $dimension)
+    RETURN n.id AS id, n.{full} AS embedding
+    LIMIT $batch_size
+    """
+    write_query = f"""
+    UNWIND $rows AS row
+    MATCH (n:{label} {{id: row.id}})
+    SET n.{compact} = row.embedding
+    """
+
+    migrated = 0
+    while True:
+        rows = client.execute(read_query, dimension=dimension, batch_size=batch_size)
+        if not rows:
+            break
+
+        compact_embeddings = truncate_embeddings([row["embedding"] for row in rows], dimension)
+        client.execute(write_query, rows=[
+            {"id": row["id"], "embedding": embedding}
+            for row, embedding in zip(rows, compact_embeddings)
+        ])
+
+        migrated += len(rows)
+        console.print(f"  {label}: {migrated} nodes migrated")
+
+    return migrated
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Add compact search embeddings to existing nodes")
+    parser.add_argument("--dimension", type=int, default=get_search_dimension() or 256, help="Compact dimension")
+    parser.add_argument("--batch-size", type=int, default=200, help="Nodes per write batch")
+    args = parser.parse_args()
+
+    client = Neo4jClient()
+
+    try:
+        table = Table(title=f"Compact Embedding Migration ({args.dimension}-d)", header_style="bold cyan")
+        table.add_column("Label", style="cyan")
+        table.add_column("Migrated", justify="right", style="green")
+        table.add_column("Index", style="yellow")
+
+        for label, properties in COMPACT_EMBEDDING_PROPERTIES.items():
+            migrated = migrate_label(client, label, args.dimension, args.batch_size)
+            table.add_row(label, str(migrated), properties["index"])
+
+        # Recreates indexes left at another dimension by an earlier run or schema.cypher
+        ensure_compact_indexes(client, args.dimension)
+
+        console.print(table)
+        console.print(f"[OK] Set [cyan]EMBEDDING_SEARCH_DIMENSION={args.dimension}[/cyan] to enable compact search", style="green")
+
+    except Exception as e:
+        console.print(f"[bold red][ERROR] Migration failed: {e}[/bold red]")
+        sys.exit(1)
+
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
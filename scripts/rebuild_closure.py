@@ -0,0 +1,53 @@
+"""
+Rebuild the DERIVES_FROM transitive closure
+
+The loader maintains DERIVES_FROM_CLOSURE incrementally as requirements are
+loaded. Use this script to backfill graphs loaded before the closure existed,
+or after editing DERIVES_FROM relationships by hand.
+
+Usage:
+    python scripts/rebuild_closure.py
+"""
+
+import sys
+import logging
+from pathlib import Path
+from rich.console import Console
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.ingestion.neo4j_loader import MOSARGraphLoader
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+console = Console()
+
+
+def main():
+    """Main execution function."""
+    loader = MOSARGraphLoader()
+
+    try:
+        with console.status("[bold green]Rebuilding DERIVES_FROM closure..."):
+            pair_count = loader.rebuild_derivation_closure()
+
+        console.print(f"[OK] Wrote {pair_count} DERIVES_FROM_CLOSURE relationships", style="green")
+        console.print("Enable closure templates with [cyan]USE_DERIVES_FROM_CLOSURE=true[/cyan]")
+
+    except Exception as e:
+        console.print(f"[bold red][ERROR] Closure rebuild failed: {e}[/bold red]")
+        sys.exit(1)
+
+    finally:
+        loader.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Rebuild graph coverage statistics
+
+The loader maintains the GraphStatistics node incrementally. Use this script
+to backfill graphs loaded before statistics existed, or after editing
+Requirement/VERIFIES data by hand.
+
+Usage:
+    python scripts/rebuild_statistics.py
+"""
+
+import sys
+import logging
+from pathlib import Path
+from rich.console import Console
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.graph_statistics import GraphStatistics
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+console = Console()
+
+
+def main():
+    """Main execution function."""
+    statistics = GraphStatistics()
+
+    try:
+        with console.status("[bold green]Recounting requirements..."):
+            statistics.rebuild()
+            summary = statistics.get_summary()
+
+        table = Table(title="Verification Coverage by Type", header_style="bold cyan")
+        table.add_column("Type", style="cyan")
+        table.add_column("Verified", justify="right", style="green")
+        table.add_column("Total", justify="right")
+        table.add_column("Coverage", justify="right", style="yellow")
+
+        for row in summary["by_type"]:
+            table.add_row(row["name"], str(row["verified"]), str(row["total"]), f"{row['coverage_percentage']:.1f}%")
+
+        console.print(table)
+        console.print(
+            f"[OK] Overall coverage {summary['coverage_percentage']:.1f}% "
+            f"({summary['verified_requirements']}/{summary['total_requirements']}), "
+            f"graph_version {summary['graph_version']}",
+            style="green"
+        )
+
+    except Exception as e:
+        console.print(f"[bold red][ERROR] Statistics rebuild failed: {e}[/bold red]")
+        sys.exit(1)
+
+    finally:
+        statistics.close()
+
+
+if __name__ == "__main__":
+    main()
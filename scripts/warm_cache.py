@@ -0,0 +1,160 @@
+"""
+Cache Warm-up for MOSAR GraphRAG
+
+Executes every Cypher template for every entity ID in the graph and stores
+the results in the query cache, so first-time PURE_CYPHER queries are hits.
+The warmed cache is saved to CACHE_PERSIST_PATH and loaded by the app on
+first use.
+
+Usage:
+    python scripts/warm_cache.py [--workers 8] [--vector] [--answers] [--questions-file FILE]
+
+Environment Variables:
+    - NEO4J_URI, NEO4J_USER, NEO4J_PASSWORD
+    - CACHE_PERSIST_PATH (snapshot location)
+    - CACHE_MAX_SIZE, CACHE_TTL_SECONDS (size the cache for the full query space)
+    - OPENAI_API_KEY (only with --vector / --answers)
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+from typing import Optional, List
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.cache_warmup import CacheWarmer
+
+# Setup logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+console = Console()
+
+# Canonical questions used for answer warm-up when no file is given
+DEFAULT_QUESTIONS = [
+    "What is the test coverage of the requirements?",
+    "Which requirements are not verified by any test case?",
+    "List all spacecraft modules.",
+    "List all demonstration scenarios.",
+    "Which organizations are involved in MOSAR?",
+]
+
+
+def run_warmup(
+    max_workers: int = 8,
+    warm_answers: bool = False,
+    questions: Optional[List[str]] = None,
+    warm_vector: bool = False
+) -> bool:
+    """
+    Warm the query cache and print a coverage report.
+
+    Args:
+        max_workers: Maximum concurrent Neo4j queries
+        warm_answers: Also run canonical questions through the workflow
+        questions: Questions for answer/vector warm-up (default: DEFAULT_QUESTIONS)
+        warm_vector: Also warm vector search results (batched)
+
+    Returns:
+        True if all template queries succeeded
+    """
+    warmer = CacheWarmer(max_workers=max_workers)
+
+    try:
+        with console.status("[bold green]Warming template queries..."):
+            report = warmer.warm_templates()
+
+        table = Table(title="Cache Warm-up Coverage", show_header=True, header_style="bold cyan")
+        table.add_column("Entity Type", style="cyan")
+        table.add_column("Entities", justify="right")
+        table.add_column("Warmed", justify="right", style="green")
+        table.add_column("Coverage", justify="right", style="yellow")
+
+        for entity_type, coverage in report["coverage"].items():
+            table.add_row(
+                entity_type,
+                str(coverage["entities"]),
+                str(coverage["warmed"]),
+                f"{coverage['coverage_percentage']:.1f}%"
+            )
+
+        console.print(table)
+        console.print(
+            f"Template queries: {report['cached']}/{report['queries']} cached, "
+            f"{report['empty']} empty, {report['failed']} failed, {report['skipped']} skipped "
+            f"([yellow]{report['duration_s']}s[/yellow])"
+        )
+
+        if warm_vector:
+            with console.status(f"[bold green]Warming vector results for {len(questions or DEFAULT_QUESTIONS)} questions..."):
+                vector_report = warmer.warm_vector_results(questions or DEFAULT_QUESTIONS)
+            console.print(
+                f"Vector results: {vector_report['cached']}/{vector_report['questions']} cached "
+                f"([yellow]{vector_report['duration_s']}s[/yellow], "
+                f"{vector_report['questions_per_s']} questions/s)"
+            )
+
+        if warm_answers:
+            questions = questions or DEFAULT_QUESTIONS
+            with console.status(f"[bold green]Warming {len(questions)} answers..."):
+                answer_report = warmer.warm_answers(questions)
+            console.print(
+                f"Answers: {answer_report['answered']}/{answer_report['questions']} cached "
+                f"([yellow]{answer_report['duration_s']}s[/yellow])"
+            )
+
+        saved_path = warmer.save()
+        if saved_path:
+            console.print(f"[OK] Cache snapshot saved to {saved_path}", style="green")
+        else:
+            console.print("[yellow]⚠ CACHE_PERSIST_PATH not set; snapshot not saved[/yellow]")
+
+        warmer.cache.print_stats()
+        return report["failed"] == 0
+
+    finally:
+        warmer.close()
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Warm the MOSAR GraphRAG query cache")
+    parser.add_argument("--workers", type=int, default=8, help="Maximum concurrent Neo4j queries")
+    parser.add_argument("--answers", action="store_true", help="Also warm answers for canonical questions (uses LLM)")
+    parser.add_argument("--vector", action="store_true", help="Also warm vector search results for the questions (batched)")
+    parser.add_argument("--questions-file", type=str, help="File with one question per line for --vector / --answers")
+    args = parser.parse_args()
+
+    console.print(Panel.fit(
+        "[bold cyan]MOSAR GraphRAG Cache Warm-up[/bold cyan]\n"
+        "Pre-computes template query results for all entities",
+        border_style="cyan"
+    ))
+
+    questions = None
+    if args.questions_file:
+        with open(args.questions_file, 'r', encoding='utf-8') as f:
+            questions = [line.strip() for line in f if line.strip()]
+
+    try:
+        success = run_warmup(args.workers, args.answers, questions, warm_vector=args.vector)
+        sys.exit(0 if success else 1)
+    except Exception as e:
+        console.print(f"\n[bold red][ERROR] Cache warm-up failed: {e}[/bold red]")
+        logger.exception("Fatal error during cache warm-up")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
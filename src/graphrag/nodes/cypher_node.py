@@ -9,12 +9,18 @@ Supports:
 
 import logging
 import os
-from typing import Dict, List, Any, Optional
+import re
+import json
+from typing import Dict, List, Any, Optional, Tuple
 
 from src.graphrag.state import GraphRAGState
 from src.utils.neo4j_client import Neo4jClient
 from src.query.cypher_templates import CypherTemplates
 from src.query.text2cypher import Text2CypherGenerator
+from src.query.graph_snapshot import get_graph_snapshot
+from src.query.router import detect_statistics_template
+from src.utils.cache import get_default_query_cache
+from src.utils.graph_statistics import STATISTICS_QUERY, GraphStatistics
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +132,180 @@ def _extract_entity_id(entity_data: Any, id_field: str = "id") -> Optional[str]:
         return None
 
 
+def _execute_template_query(cypher_query: str) -> List[Dict[str, Any]]:
+    """
+    Execute a template query, serving repeats from the Cypher cache.
+
+    Template queries are deterministic for a given graph load, so results
+    are cached by query text.
+
+    Args:
+        cypher_query: Cypher query string
+
+    Returns:
+        Query results
+    """
+    cache = get_default_query_cache()
+    results = cache.get_cypher_results(cypher_query) if cache else None
+
+    if results is None:
+        neo4j_client = Neo4jClient()
+        results = neo4j_client.execute(cypher_query)
+        neo4j_client.close()
+
+        if cache is not None:
+            cache.set_cypher_results(cypher_query, None, results)
+
+    return results
+
+
+def _read_materialized_traceability(templates: CypherTemplates, req_id: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Read the precomputed traceability document for a requirement.
+
+    Args:
+        templates: CypherTemplates instance
+        req_id: Requirement ID
+
+    Returns:
+        Results in the same shape as get_requirement_traceability,
+        or None if no document has been materialized
+    """
+    cypher_query = templates.get_materialized_traceability(req_id)
+    cache = get_default_query_cache()
+    rows = cache.get_cypher_results(cypher_query) if cache else None
+
+    if rows is None:
+        neo4j_client = Neo4jClient()
+        rows = neo4j_client.execute(cypher_query)
+        neo4j_client.close()
+
+        # Only cache found documents: a missing one may be materialized by the next load
+        if cache is not None and rows and rows[0].get("traceability_doc"):
+            cache.set_cypher_results(cypher_query, None, rows)
+
+    if not rows or not rows[0].get("traceability_doc"):
+        logger.info(f"No materialized traceability for {req_id}, using live query")
+        return None
+
+    return [json.loads(rows[0]["traceability_doc"])]
+
+
+# Requirement type named in a statistics question ("unverified SafR requirements")
+REQUIREMENT_TYPE_PATTERN = re.compile(r'(?<![A-Za-z])(FuncR|SafR|PerfR|IntR|ConfR|DesR)(?![A-Za-z_])', re.IGNORECASE)
+
+# Columns of get_test_coverage()
+COVERAGE_COLUMNS = [
+    "total_requirements", "verified_requirements", "unverified_requirements",
+    "total_test_cases", "coverage_percentage"
+]
+
+
+def _extract_requirement_type(user_question: str) -> Optional[str]:
+    """Requirement type mentioned in the question, in its canonical spelling."""
+    match = REQUIREMENT_TYPE_PATTERN.search(user_question)
+    if not match:
+        return None
+    canonical = {t.lower(): t for t in ("FuncR", "SafR", "PerfR", "IntR", "ConfR", "DesR")}
+    return canonical[match.group(1).lower()]
+
+
+def _read_materialized_statistics(
+    templates: CypherTemplates,
+    template_method: str,
+    req_type: Optional[str] = None
+) -> Optional[Tuple[List[Dict[str, Any]], str]]:
+    """
+    Answer a coverage/summary template from the GraphStatistics node.
+
+    get_database_stats is answered from the node counts, which cover the
+    labels in COUNTED_LABELS rather than every label in the database.
+
+    Args:
+        templates: CypherTemplates instance
+        template_method: get_test_coverage, get_requirements_by_type,
+            get_database_stats or get_unverified_requirements
+        req_type: Optional requirement type filter (unverified listing)
+
+    Returns:
+        Tuple of (results in the same shape as the template, last Cypher
+        query executed), or None if statistics have not been materialized
+    """
+    neo4j_client = Neo4jClient()
+    try:
+        summary = GraphStatistics(neo4j_client).get_summary()
+
+        if not summary["graph_version"]:
+            logger.info(f"No materialized statistics for {template_method}, using live query")
+            return None
+
+        if template_method == "get_test_coverage":
+            return [{column: summary[column] for column in COVERAGE_COLUMNS}], STATISTICS_QUERY
+
+        if template_method == "get_requirements_by_type":
+            results = [{"requirement_type": row["name"], "count": row["total"]} for row in summary["by_type"]]
+            return results, STATISTICS_QUERY
+
+        if template_method == "get_database_stats":
+            counts = sorted(summary["node_counts"].items(), key=lambda item: item[1], reverse=True)
+            results = [{"node_type": label, "node_count": count} for label, count in counts if count]
+            return results, STATISTICS_QUERY
+
+        # Unverified listing: skip the query when the counters say there is nothing to list
+        if req_type:
+            bucket = next((row for row in summary["by_type"] if row["name"] == req_type), None)
+            unverified = bucket["total"] - bucket["verified"] if bucket else 0
+        else:
+            unverified = summary["unverified_requirements"]
+
+        if unverified == 0:
+            return [], STATISTICS_QUERY
+
+        cypher_query = templates.get_unverified_requirements_materialized(req_type)
+        return neo4j_client.execute(cypher_query), cypher_query
+    finally:
+        neo4j_client.close()
+
+
+def _run_statistics_template(state: GraphRAGState, templates: CypherTemplates, template_method: str) -> GraphRAGState:
+    """
+    Execute a coverage/summary template that needs no entity.
+
+    Served from the GraphStatistics node when it exists, otherwise by the
+    template's live query.
+
+    Args:
+        state: Current GraphRAGState
+        templates: CypherTemplates instance
+        template_method: Template selected by detect_statistics_template()
+
+    Returns:
+        Updated state with 'cypher_query' and 'graph_results'
+    """
+    req_type = _extract_requirement_type(state.get("user_question", ""))
+    template_args = (req_type,) if template_method == "get_unverified_requirements" else ()
+
+    materialized = _read_materialized_statistics(templates, template_method, req_type)
+    if materialized is not None:
+        results, cypher_query = materialized
+        logger.info(f"✓ Served {template_method} from materialized statistics")
+    else:
+        cypher_query = getattr(templates, template_method)(*template_args)
+        results = _execute_template_query(cypher_query)
+
+    logger.info(f"✓ Statistics template returned {len(results)} results")
+
+    state["cypher_query"] = cypher_query
+    state["graph_results"] = results
+    state["query_generation_method"] = f"template:{template_method}"
+    state["template_entity"] = {
+        "type": "Statistics",
+        "id": req_type,
+        "template": template_method
+    }
+    return state
+
+
 def run_template_cypher(state: GraphRAGState) -> GraphRAGState:
     """
     LangGraph Node: Execute predefined Cypher template (Path A).
@@ -141,7 +321,12 @@ def run_template_cypher(state: GraphRAGState) -> GraphRAGState:
     matched_entities = state.get("matched_entities", {})
     user_question = state.get("user_question", "")
 
-    if not matched_entities:
+    # Coverage/summary questions are answered from materialized statistics
+    statistics_template = None
+    if os.getenv("USE_MATERIALIZED_STATISTICS", "false").lower() == "true":
+        statistics_template = detect_statistics_template(user_question)
+
+    if not matched_entities and statistics_template is None:
         logger.warning("No matched entities for template Cypher")
         state["graph_results"] = []
         return state
@@ -169,6 +354,13 @@ def run_template_cypher(state: GraphRAGState) -> GraphRAGState:
         if is_decomposition_query:
             logger.info(f"✓ Decomposition keywords detected in question: {user_question}")
 
+        # Closure-based templates replace variable-length DERIVES_FROM expansion
+        use_closure = os.getenv("USE_DERIVES_FROM_CLOSURE", "false").lower() == "true"
+        impact_keywords = [
+            'impact', 'affected', 'affect', '영향', 'change analysis', '변경 분석'
+        ]
+        is_impact_query = use_closure and any(keyword in question_lower for keyword in impact_keywords)
+
         # Sort entity types by priority (lowest number = highest priority)
         sorted_types = sorted(
             ENTITY_TYPE_CONFIG.keys(),
@@ -185,9 +377,15 @@ def run_template_cypher(state: GraphRAGState) -> GraphRAGState:
                 entity_id = _extract_entity_id(entity_data, config["id_field"])
 
                 if entity_id:
-                    # Special case: Use decomposition template for Requirement if keywords detected
-                    if entity_type == "Requirement" and is_decomposition_query:
-                        template_method_name = "get_requirement_decomposition_tree"
+                    # Special case: Use impact/decomposition template for Requirement if keywords detected
+                    if entity_type == "Requirement" and is_impact_query:
+                        template_method_name = "get_requirement_impact"
+                        logger.info(f"✓ Detected impact query, using closure template")
+                    elif entity_type == "Requirement" and is_decomposition_query:
+                        template_method_name = (
+                            "get_requirement_decomposition_closure" if use_closure
+                            else "get_requirement_decomposition_tree"
+                        )
                         logger.info(f"✓ Detected decomposition query, using specialized template")
                     else:
                         # Get template method from config
@@ -210,6 +408,9 @@ def run_template_cypher(state: GraphRAGState) -> GraphRAGState:
                     )
                     break
 
+        if cypher_query is None and statistics_template is not None:
+            return _run_statistics_template(state, templates, statistics_template)
+
         if cypher_query is None:
             logger.warning(
                 f"No suitable template found for matched entities: {list(matched_entities.keys())}"
@@ -221,10 +422,27 @@ def run_template_cypher(state: GraphRAGState) -> GraphRAGState:
             state["query_generation_method"] = "template_not_found"
             return state
 
-        # Execute query
-        neo4j_client = Neo4jClient()
-        results = neo4j_client.execute(cypher_query)
-        neo4j_client.close()
+        # Execute query (precomputed traceability documents replace the multi-hop expansion)
+        results = None
+        use_materialized = os.getenv("USE_MATERIALIZED_TRACEABILITY", "false").lower() == "true"
+
+        if use_materialized and selected_template_method == "get_requirement_traceability":
+            results = _read_materialized_traceability(templates, selected_entity_id)
+            if results is not None:
+                cypher_query = templates.get_materialized_traceability(selected_entity_id)
+                selected_template_method = "get_materialized_traceability"
+
+        # In-memory snapshot answers supported template shapes without a Neo4j round-trip
+        if results is None and os.getenv("USE_GRAPH_SNAPSHOT", "false").lower() == "true":
+            try:
+                results = get_graph_snapshot().execute(selected_template_method, selected_entity_id)
+                if results is not None:
+                    logger.info(f"✓ Served {selected_template_method} from graph snapshot")
+            except Exception as e:
+                logger.warning(f"Graph snapshot unavailable, using Neo4j: {e}")
+
+        if results is None:
+            results = _execute_template_query(cypher_query)
 
         logger.info(f"✓ Template Cypher returned {len(results)} results")
 
@@ -13,6 +13,7 @@ from typing import Dict, List, Any
 from openai import OpenAI
 
 from src.graphrag.state import GraphRAGState
+from src.query.section_content import hydrate_sections
 from src.utils.entity_resolver import EntityResolver
 
 logger = logging.getLogger(__name__)
@@ -44,7 +45,8 @@ def extract_entities_from_context(state: GraphRAGState) -> GraphRAGState:
 
     logger.info(f"Extracting entities from {len(top_k_sections)} sections...")
 
-    # Combine section content
+    # Combine section content (loads content if vector search returned it lazily)
+    hydrate_sections(top_k_sections, limit=5)
     combined_context = "\n\n".join([
         f"[Section: {sec['title']}]\n{sec['content']}"
         for sec in top_k_sections[:5]  # Use top 5 for context window
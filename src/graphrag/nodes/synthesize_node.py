@@ -13,9 +13,15 @@ from openai import OpenAI
 
 from src.graphrag.state import GraphRAGState
 from src.query.router import QueryPath
+from src.query.section_content import hydrate_sections
+from src.utils.cache import get_default_query_cache
 
 logger = logging.getLogger(__name__)
 
+# Synthesis model settings (also part of the completion cache key)
+SYNTHESIS_MODEL = "gpt-4o"
+SYNTHESIS_TEMPERATURE = 0.3  # Slightly creative but mostly factual
+
 
 def synthesize_response(state: GraphRAGState) -> GraphRAGState:
     """
@@ -50,10 +56,53 @@ def synthesize_response(state: GraphRAGState) -> GraphRAGState:
     # Update state
     state["final_answer"] = response["answer"]
     state["citations"] = response["citations"]
+    state["cache_hit"] = response.get("cache_hit", False)
 
     return state
 
 
+def _generate_answer(system_prompt: str, prompt: str) -> Dict[str, Any]:
+    """
+    Call GPT-4o for synthesis, serving byte-identical prompts from cache.
+
+    Args:
+        system_prompt: System message
+        prompt: User message with question and context
+
+    Returns:
+        Dict with 'answer' and 'cache_hit'
+    """
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt}
+    ]
+
+    cache = get_default_query_cache()
+    if cache is not None:
+        cached_answer = cache.get_completion(SYNTHESIS_MODEL, SYNTHESIS_TEMPERATURE, messages)
+        if cached_answer is not None:
+            return {"answer": cached_answer, "cache_hit": True}
+
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+
+    response = client.chat.completions.create(
+        model=SYNTHESIS_MODEL,
+        messages=messages,
+        temperature=SYNTHESIS_TEMPERATURE,
+        max_tokens=2000
+    )
+
+    if response and response.choices and len(response.choices) > 0:
+        answer = response.choices[0].message.content.strip()
+        if cache is not None:
+            cache.set_completion(SYNTHESIS_MODEL, SYNTHESIS_TEMPERATURE, messages, answer)
+    else:
+        logger.error("GPT-4 response is empty or invalid")
+        answer = "Error: Empty response from GPT-4"
+
+    return {"answer": answer, "cache_hit": False}
+
+
 def _synthesize_from_graph(state: GraphRAGState, language: str) -> Dict[str, Any]:
     """
     Synthesize response from graph query results.
@@ -139,6 +188,7 @@ def _synthesize_from_graph(state: GraphRAGState, language: str) -> Dict[str, Any
     # Build context from vector results (supplementary)
     vector_context = ""
     if top_k_sections:
+        hydrate_sections(top_k_sections, limit=3)
         vector_context = "\n\n".join([
             f"[{sec['document']} - {sec['title']}]\n{sec['content'][:500]}"
             for sec in top_k_sections[:3]
@@ -249,32 +299,17 @@ def _synthesize_from_graph(state: GraphRAGState, language: str) -> Dict[str, Any
 
     prompt += "\nProvide a comprehensive answer:\n"
 
-    # Call GPT-4
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
+    # Call GPT-4 (or replay a cached completion for an identical prompt)
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,  # Slightly creative but mostly factual
-            max_tokens=2000
-        )
-
-        if response and response.choices and len(response.choices) > 0:
-            answer = response.choices[0].message.content.strip()
-        else:
-            logger.error("GPT-4 response is empty or invalid")
-            answer = "Error: Empty response from GPT-4"
+        generated = _generate_answer(system_prompt, prompt)
 
         # Extract citations
         citations = _extract_citations(graph_results, top_k_sections)
 
         return {
-            "answer": answer,
-            "citations": citations
+            "answer": generated["answer"],
+            "citations": citations,
+            "cache_hit": generated["cache_hit"]
         }
 
     except Exception as e:
@@ -305,7 +340,8 @@ def _synthesize_from_vectors(state: GraphRAGState, language: str) -> Dict[str, A
             "citations": []
         }
 
-    # Build context
+    # Build context (loads content if vector search returned it lazily)
+    hydrate_sections(top_k_sections, limit=5)
     context = "\n\n---\n\n".join([
         f"**Source**: {sec['document']} - {sec['title']}\n\n{sec['content']}"
         for sec in top_k_sections[:5]
@@ -330,30 +366,15 @@ def _synthesize_from_vectors(state: GraphRAGState, language: str) -> Dict[str, A
 Provide a comprehensive answer:
 """
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3,
-            max_tokens=2000
-        )
-
-        if response and response.choices and len(response.choices) > 0:
-            answer = response.choices[0].message.content.strip()
-        else:
-            logger.error("GPT-4 response is empty or invalid")
-            answer = "Error: Empty response from GPT-4"
+        generated = _generate_answer(system_prompt, prompt)
 
         citations = _extract_citations([], top_k_sections)
 
         return {
-            "answer": answer,
-            "citations": citations
+            "answer": generated["answer"],
+            "citations": citations,
+            "cache_hit": generated["cache_hit"]
         }
 
     except Exception as e:
@@ -504,7 +525,14 @@ def _extract_citations(graph_results: List[Dict], sections: List[Dict]) -> List[
     # Citations from sections
     if sections:
         for sec in sections[:5]:
-            if sec and isinstance(sec, dict):
+            if sec and isinstance(sec, dict) and sec.get("requirement_id"):
+                # Requirement hits from the requirement vector index
+                citations.append({
+                    "type": "requirement",
+                    "id": sec["requirement_id"],
+                    "source": "SRD"
+                })
+            elif sec and isinstance(sec, dict):
                 citations.append({
                     "type": "document_section",
                     "source": f"{sec.get('document', 'Unknown')} - {sec.get('title', 'Unknown')}",
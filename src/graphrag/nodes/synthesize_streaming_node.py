@@ -22,6 +22,8 @@ from typing import Dict, List, Any, Optional, Generator
 from openai import OpenAI
 
 from src.graphrag.state import GraphRAGState
+from src.query.section_content import hydrate_sections
+from src.utils.cache import get_default_query_cache, replay_completion
 
 logger = logging.getLogger(__name__)
 
@@ -193,32 +195,54 @@ def stream_synthesis(
         yield {"citations": []}
         return
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     model = os.getenv("LLM_MODEL", "gpt-4o")
+    temperature = 0.3
 
     # Build prompt (pass query_path for context-aware system prompt)
     system_prompt = _build_system_prompt(language, query_path)
     user_prompt = _build_user_prompt(user_question, context, query_path)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt}
+    ]
+
+    # Identical prompt seen before: replay the cached completion as a stream
+    cache = get_default_query_cache()
+    cached_answer = cache.get_completion(model, temperature, messages) if cache else None
+
+    if cached_answer is not None:
+        logger.info(f"Replaying cached synthesis ({len(cached_answer)} chars)")
+        yield from replay_completion(cached_answer)
+
+        citations = _extract_citations(context)
+        if citations:
+            yield {"citations": citations}
+        return
+
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     try:
         # Stream from OpenAI
         stream = client.chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
+            messages=messages,
+            temperature=temperature,
             max_tokens=2000,
             stream=True  # Enable streaming
         )
 
         # Yield chunks as they arrive
+        streamed_parts = []
         for chunk in stream:
             if chunk.choices[0].delta.content is not None:
                 content = chunk.choices[0].delta.content
+                streamed_parts.append(content)
                 yield content
 
+        # Cache the complete answer for replay of identical prompts
+        if cache is not None and streamed_parts:
+            cache.set_completion(model, temperature, messages, "".join(streamed_parts))
+
         # Yield citations as metadata (after streaming completes)
         citations = _extract_citations(context)
         if citations:
@@ -239,6 +263,9 @@ def _gather_context(state: GraphRAGState) -> Dict[str, Any]:
     Returns:
         Context dict
     """
+    # Prompts use the top sections' content; load it if retrieval was lazy
+    hydrate_sections(state.get("top_k_sections") or [], limit=5)
+
     return {
         "vector_results": state.get("top_k_sections", []),
         "graph_results": state.get("graph_results", []),
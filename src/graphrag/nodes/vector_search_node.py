@@ -2,43 +2,697 @@
 Vector Search Node - Semantic similarity search using Neo4j vector index
 
 Retrieves top-k most relevant document sections based on embedding similarity.
+With RETRIEVAL_MODE=hybrid, the fulltext (BM25) index is queried concurrently
+and both rankings are fused with reciprocal rank fusion. With
+USE_RESULT_DIVERSIFICATION=true, chunks of the same section are collapsed and
+the final k are picked with maximal marginal relevance.
 """
 
 import logging
-from typing import List, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 import os
-from openai import OpenAI
+import numpy as np
 
 from src.graphrag.state import GraphRAGState
 from src.utils.neo4j_client import Neo4jClient
+from src.utils.cache import get_default_query_cache
+from src.query.retrieval import (
+    escape_lucene,
+    reciprocal_rank_fusion,
+    merge_normalized_scores,
+    adaptive_cutoff,
+    collapse_chunks,
+    maximal_marginal_relevance
+)
+from src.query.scope import detect_scope, normalize_scope
+from src.query.section_content import is_lazy_content_enabled, hydrate_sections
+from src.utils.embedding_service import get_embedding_service
+from src.utils.embeddings import Embedding, as_embedding, get_search_dimension, truncate_embedding
 
 logger = logging.getLogger(__name__)
 
 
-def get_embedding(text: str, model: str = "text-embedding-3-large") -> List[float]:
+def get_embedding(text: str) -> Embedding:
     """
-    Generate OpenAI embedding for text.
+    Generate the query embedding for text.
+
+    Uses the shared embedding service, so the model and dimension match the
+    ingestion-time embeddings (EMBEDDING_MODEL / EMBEDDING_DIMENSION) and
+    concurrent queries are coalesced into one API call.
 
     Args:
         text: Input text
-        model: OpenAI embedding model
 
     Returns:
-        3072-dimensional embedding vector
+        float32 embedding (zero vector on failure)
+    """
+    return get_embedding_service().embed_query(text)
+
+
+def get_embeddings(texts: List[str]) -> List[Embedding]:
+    """
+    Generate query embeddings for many texts in one API call.
+
+    Args:
+        texts: Input texts
+
+    Returns:
+        Embedding vectors, in input order (zero vectors on failure)
+    """
+    return get_embedding_service().embed_queries(texts)
+
+
+VECTOR_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes('section_embeddings', $k, $embedding)
+YIELD node, score
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY score DESC
+LIMIT $k
+"""
+
+# Compact mode: first pass on the truncated, int8-quantized index, then rescore
+# candidates against the full-precision vectors
+COMPACT_VECTOR_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes('section_embeddings_small', $candidates, $embedding_small)
+YIELD node
+WITH node, vector.similarity.cosine(node.content_embedding, $embedding) AS score
+ORDER BY score DESC
+LIMIT $k
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY score DESC
+"""
+
+FULLTEXT_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes('section_fulltext', $search_text, {limit: $k})
+YIELD node, score
+WHERE ($doc_ids IS NULL OR node.doc_id IN $doc_ids)
+  AND ($chapters IS NULL OR node.chapter IN $chapters)
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY score DESC
+LIMIT $k
+"""
+
+# Scoped search: the (doc_id, chapter) filter selects the candidate sections via
+# the section_doc_chapter index and only those are scored (exact cosine)
+DOC_SCOPED_VECTOR_SEARCH_QUERY = """
+MATCH (node:Section)
+WHERE node.doc_id IN $doc_ids AND node.chapter IS NOT NULL
+  AND node.content_embedding IS NOT NULL
+WITH node, vector.similarity.cosine(node.content_embedding, $embedding) AS score
+ORDER BY score DESC
+LIMIT $k
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY score DESC
+"""
+
+CHAPTER_SCOPED_VECTOR_SEARCH_QUERY = """
+MATCH (node:Section)
+WHERE node.doc_id IN $doc_ids AND node.chapter IN $chapters
+  AND node.content_embedding IS NOT NULL
+WITH node, vector.similarity.cosine(node.content_embedding, $embedding) AS score
+ORDER BY score DESC
+LIMIT $k
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY score DESC
+"""
+
+# Batch variants: one round trip for many questions, rows tagged with query_index
+BATCH_VECTOR_SEARCH_QUERY = """
+UNWIND $queries AS query
+CALL {
+    WITH query
+    CALL db.index.vector.queryNodes('section_embeddings', $k, query.embedding)
+    YIELD node, score
+    RETURN node, score
+}
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    query.index AS query_index,
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY query_index, score DESC
+"""
+
+COMPACT_BATCH_VECTOR_SEARCH_QUERY = """
+UNWIND $queries AS query
+CALL {
+    WITH query
+    CALL db.index.vector.queryNodes('section_embeddings_small', $candidates, query.embedding_small)
+    YIELD node
+    WITH node, vector.similarity.cosine(node.content_embedding, query.embedding) AS score
+    ORDER BY score DESC
+    LIMIT $k
+    RETURN node, score
+}
+MATCH (doc:Document)-[:HAS_SECTION]->(node)
+RETURN
+    query.index AS query_index,
+    node.id AS section_id,
+    node.title AS title,
+    CASE WHEN $include_content THEN node.content END AS content,
+    doc.title AS document,
+    doc.type AS doc_type,
+    node.parent_section_id AS parent_section_id,
+    node.chunk_index AS chunk_index,
+    node.content_hash AS content_hash,
+    score
+ORDER BY query_index, score DESC
+"""
+
+# Requirement statements (statement_embedding, see DocumentEmbedder.embed_requirements)
+REQUIREMENT_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes('requirement_embeddings', $k, $embedding)
+YIELD node, score
+RETURN
+    node.id AS requirement_id,
+    node.title AS title,
+    node.statement AS statement,
+    node.type AS requirement_type,
+    score
+ORDER BY score DESC
+"""
+
+COMPACT_REQUIREMENT_SEARCH_QUERY = """
+CALL db.index.vector.queryNodes('requirement_embeddings_small', $candidates, $embedding_small)
+YIELD node
+WITH node, vector.similarity.cosine(node.statement_embedding, $embedding) AS score
+ORDER BY score DESC
+LIMIT $k
+RETURN
+    node.id AS requirement_id,
+    node.title AS title,
+    node.statement AS statement,
+    node.type AS requirement_type,
+    score
+ORDER BY score DESC
+"""
+
+# Embeddings of candidate sections for MMR (compact vectors when available)
+SECTION_EMBEDDINGS_QUERY = """
+UNWIND $section_ids AS section_id
+MATCH (s:Section {id: section_id})
+RETURN
+    s.id AS section_id,
+    CASE WHEN $compact THEN s.content_embedding_small ELSE s.content_embedding END AS embedding
+"""
+
+
+def _adaptive_k_enabled() -> bool:
+    """Check whether top-k is chosen from the score distribution (USE_ADAPTIVE_K)."""
+    return os.getenv("USE_ADAPTIVE_K", "false").lower() == "true"
+
+
+def _include_content() -> bool:
+    """Section text is omitted in lazy mode and while over-fetching for adaptive k."""
+    return not (is_lazy_content_enabled() or _adaptive_k_enabled())
+
+
+def _format_sections(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Format section records for state."""
+    sections = []
+    for rec in results:
+        section = {
+            "section_id": rec["section_id"],
+            "title": rec["title"],
+            "content": rec["content"],
+            "document": rec["document"],
+            "doc_type": rec["doc_type"],
+            "score": float(rec["score"])
+        }
+        # Keys the hydration cache, so a rewritten section is never served stale
+        if rec.get("content_hash"):
+            section["content_hash"] = rec["content_hash"]
+        # Chunk nodes (TextChunker) link back to their original section
+        if rec.get("parent_section_id"):
+            section["parent_section_id"] = rec["parent_section_id"]
+            section["chunk_index"] = rec.get("chunk_index")
+        sections.append(section)
+    return sections
+
+
+def _format_requirements(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Format requirement records in the section shape used by downstream nodes."""
+    return [
+        {
+            "section_id": rec["requirement_id"],
+            "requirement_id": rec["requirement_id"],
+            "title": f"{rec['requirement_id']}: {rec['title']}" if rec.get("title") else rec["requirement_id"],
+            "content": rec["statement"] or "",
+            "document": "SRD",
+            "doc_type": "requirement",
+            "requirement_type": rec.get("requirement_type"),
+            "score": float(rec["score"])
+        }
+        for rec in results
+    ]
+
+
+def _diversify_sections(
+    neo4j_client: Neo4jClient,
+    candidates: List[Dict[str, Any]],
+    k: int
+) -> Dict[str, Any]:
+    """
+    Collapse chunks by parent section and select k results with MMR.
+
+    Embeddings are only fetched (one UNWIND query) when more than k
+    sections remain after collapsing; a collapsed section is represented by
+    the mean of its chunk embeddings.
+
+    Args:
+        neo4j_client: Neo4jClient
+        candidates: Over-fetched results ordered best first
+        k: Number of sections to return
+
+    Returns:
+        Dict with 'sections' and 'metadata' (counts, content size, timing)
+    """
+    start_time = time.time()
+    lambda_mult = float(os.getenv("MMR_LAMBDA", "0.7"))
+    collapsed = collapse_chunks(candidates)
+
+    if len(collapsed) > k:
+        rows = neo4j_client.execute(
+            SECTION_EMBEDDINGS_QUERY,
+            section_ids=[c["section_id"] for c in candidates],
+            compact=bool(get_search_dimension())
+        )
+        embedding_by_id = {
+            row["section_id"]: as_embedding(row["embedding"]) for row in rows if row["embedding"]
+        }
+
+        embeddings = []
+        for section in collapsed:
+            vectors = [
+                embedding_by_id[chunk_id]
+                for chunk_id in section.get("chunk_ids", [section["section_id"]])
+                if chunk_id in embedding_by_id
+            ]
+            embeddings.append(np.mean(vectors, axis=0) if vectors else None)
+
+        selected = maximal_marginal_relevance(
+            [section["score"] for section in collapsed],
+            embeddings,
+            k,
+            lambda_mult=lambda_mult
+        )
+        sections = [collapsed[i] for i in selected]
+    else:
+        sections = collapsed
+
+    metadata = {
+        "lambda": lambda_mult,
+        "candidates": len(candidates),
+        "collapsed": len(collapsed),
+        "selected": len(sections),
+        "content_chars": {
+            "undiversified": sum(len(c["content"] or "") for c in candidates[:k]),
+            "diversified": sum(len(s["content"] or "") for s in sections)
+        },
+        "time_ms": round((time.time() - start_time) * 1000, 2)
+    }
+
+    return {"sections": sections, "metadata": metadata}
+
+
+def _timed_vector_search(
+    neo4j_client: Neo4jClient,
+    question: str,
+    k: int,
+    query_embedding: Optional[Embedding] = None,
+    scope: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Embed the question (unless given) and query the vector index (may run in a worker thread)."""
+    start_time = time.time()
+    if query_embedding is None:
+        query_embedding = get_embedding(question)
+    search_dimension = get_search_dimension()
+
+    if scope:
+        results = neo4j_client.execute(
+            CHAPTER_SCOPED_VECTOR_SEARCH_QUERY if scope["chapters"] else DOC_SCOPED_VECTOR_SEARCH_QUERY,
+            k=k,
+            embedding=query_embedding,
+            doc_ids=scope["doc_ids"],
+            chapters=scope["chapters"],
+            include_content=_include_content()
+        )
+    elif search_dimension:
+        results = neo4j_client.execute(
+            COMPACT_VECTOR_SEARCH_QUERY,
+            k=k,
+            candidates=k * int(os.getenv("EMBEDDING_RESCORE_MULTIPLIER", "4")),
+            embedding=query_embedding,
+            embedding_small=truncate_embedding(query_embedding, search_dimension),
+            include_content=_include_content()
+        )
+    else:
+        results = neo4j_client.execute(
+            VECTOR_SEARCH_QUERY,
+            k=k,
+            embedding=query_embedding,
+            include_content=_include_content()
+        )
+
+    return {"results": results, "time_ms": (time.time() - start_time) * 1000}
+
+
+def _timed_fulltext_search(
+    neo4j_client: Neo4jClient,
+    question: str,
+    k: int,
+    scope: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Query the section fulltext index, filtered to the scope if given (runs in a worker thread)."""
+    start_time = time.time()
+    results = neo4j_client.execute(
+        FULLTEXT_SEARCH_QUERY,
+        k=k,
+        search_text=escape_lucene(question),
+        doc_ids=scope["doc_ids"] if scope else None,
+        chapters=scope["chapters"] if scope else None,
+        include_content=_include_content()
+    )
+    return {"results": results, "time_ms": (time.time() - start_time) * 1000}
+
+
+def _timed_requirement_search(neo4j_client: Neo4jClient, query_embedding: Embedding, k: int) -> Dict[str, Any]:
+    """Query the requirement statement index (runs in a worker thread)."""
+    start_time = time.time()
+    search_dimension = get_search_dimension()
+
+    if search_dimension:
+        results = neo4j_client.execute(
+            COMPACT_REQUIREMENT_SEARCH_QUERY,
+            k=k,
+            candidates=k * int(os.getenv("EMBEDDING_RESCORE_MULTIPLIER", "4")),
+            embedding=query_embedding,
+            embedding_small=truncate_embedding(query_embedding, search_dimension)
+        )
+    else:
+        results = neo4j_client.execute(REQUIREMENT_SEARCH_QUERY, k=k, embedding=query_embedding)
+
+    return {"results": results, "time_ms": (time.time() - start_time) * 1000}
+
+
+def batch_vector_search(
+    questions: List[str],
+    k: int = 10,
+    batch_size: int = 64,
+    neo4j_client: Optional[Neo4jClient] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Vector search for many questions at once.
+
+    Each batch costs one embeddings API call and one Neo4j round trip
+    (UNWIND over the query embeddings), instead of one of each per question.
+    Honors EMBEDDING_SEARCH_DIMENSION like the single-question path.
+
+    Args:
+        questions: User questions
+        k: Top-k sections per question
+        batch_size: Questions per embeddings call / Neo4j query
+        neo4j_client: Shared Neo4jClient (default: a new client, closed on return)
+
+    Returns:
+        Top-k sections per question, in question order
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    owns_client = neo4j_client is None
+    neo4j_client = neo4j_client or Neo4jClient()
+    search_dimension = get_search_dimension()
+    results: List[List[Dict[str, Any]]] = []
 
     try:
-        response = client.embeddings.create(
-            input=text,
-            model=model
+        for start in range(0, len(questions), batch_size):
+            batch = questions[start:start + batch_size]
+            embeddings = get_embeddings(batch)
+
+            queries = []
+            for index, embedding in enumerate(embeddings):
+                query = {"index": index, "embedding": embedding}
+                if search_dimension:
+                    query["embedding_small"] = truncate_embedding(embedding, search_dimension)
+                queries.append(query)
+
+            if search_dimension:
+                rows = neo4j_client.execute(
+                    COMPACT_BATCH_VECTOR_SEARCH_QUERY,
+                    queries=queries,
+                    k=k,
+                    candidates=k * int(os.getenv("EMBEDDING_RESCORE_MULTIPLIER", "4")),
+                    include_content=not is_lazy_content_enabled()
+                )
+            else:
+                rows = neo4j_client.execute(
+                    BATCH_VECTOR_SEARCH_QUERY,
+                    queries=queries,
+                    k=k,
+                    include_content=not is_lazy_content_enabled()
+                )
+
+            rows_by_query: Dict[int, List[Dict[str, Any]]] = {index: [] for index in range(len(batch))}
+            for row in rows:
+                rows_by_query[row["query_index"]].append(row)
+
+            results.extend(_format_sections(rows_by_query[index][:k]) for index in range(len(batch)))
+
+            logger.info(f"  ✓ Batch vector search: {start + len(batch)}/{len(questions)} questions")
+
+    finally:
+        if owns_client:
+            neo4j_client.close()
+
+    return results
+
+
+def _run_hybrid_search(
+    neo4j_client: Neo4jClient,
+    question: str,
+    k: int,
+    query_embedding: Optional[Embedding] = None,
+    scope: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run vector and fulltext retrieval concurrently and fuse with RRF.
+
+    Args:
+        neo4j_client: Shared Neo4jClient (driver is thread-safe)
+        question: User question
+        k: Number of fused sections to return
+        query_embedding: Precomputed question embedding (optional)
+        scope: Document/chapter filter (optional)
+
+    Returns:
+        Dict with 'sections' and 'metadata' (weights, timings, counts)
+    """
+    # Over-fetch per retriever so fusion has candidates that only one retriever found
+    candidates = k * int(os.getenv("HYBRID_CANDIDATE_MULTIPLIER", "2"))
+    weights = {
+        "vector": float(os.getenv("HYBRID_VECTOR_WEIGHT", "1.0")),
+        "fulltext": float(os.getenv("HYBRID_FULLTEXT_WEIGHT", "1.0"))
+    }
+    rrf_k = int(os.getenv("HYBRID_RRF_K", "60"))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        vector_future = executor.submit(
+            _timed_vector_search, neo4j_client, question, candidates, query_embedding, scope
         )
-        return response.data[0].embedding
+        fulltext_future = executor.submit(_timed_fulltext_search, neo4j_client, question, candidates, scope)
+        vector = vector_future.result()
+
+        # Fulltext failures (e.g. missing index) degrade to vector-only
+        try:
+            fulltext = fulltext_future.result()
+        except Exception as e:
+            logger.warning(f"Fulltext search failed, using vector results only: {e}")
+            fulltext = {"results": [], "time_ms": 0.0, "error": str(e)}
+
+    fusion_start = time.time()
+    sections = reciprocal_rank_fusion(
+        {
+            "vector": _format_sections(vector["results"]),
+            "fulltext": _format_sections(fulltext["results"])
+        },
+        weights=weights,
+        k=rrf_k,
+        limit=k
+    )
 
-    except Exception as e:
-        logger.error(f"Failed to generate embedding: {e}")
-        # Return zero vector as fallback
-        return [0.0] * 3072
+    metadata = {
+        "mode": "hybrid",
+        "search_dimension": get_search_dimension() or None,
+        "weights": weights,
+        "rrf_k": rrf_k,
+        "candidates_per_retriever": candidates,
+        "result_counts": {
+            "vector": len(vector["results"]),
+            "fulltext": len(fulltext["results"]),
+            "fused": len(sections)
+        },
+        "timings_ms": {
+            "vector": round(vector["time_ms"], 1),
+            "fulltext": round(fulltext["time_ms"], 1),
+            "fusion": round((time.time() - fusion_start) * 1000, 2)
+        }
+    }
+    if "error" in fulltext:
+        metadata["fulltext_error"] = fulltext["error"]
+
+    return {"sections": sections, "metadata": metadata}
+
+
+def _search_sections(
+    neo4j_client: Neo4jClient,
+    question: str,
+    k: int,
+    retrieval_mode: str,
+    use_vector_cache: bool,
+    query_embedding: Optional[Embedding] = None,
+    scope: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Run one section retrieval in the configured mode (see _retrieve_sections)."""
+    if retrieval_mode == "hybrid":
+        hybrid = _run_hybrid_search(neo4j_client, question, k, query_embedding, scope)
+
+        logger.info(
+            f"Hybrid search returned {len(hybrid['sections'])} sections "
+            f"(vector={hybrid['metadata']['result_counts']['vector']}, "
+            f"fulltext={hybrid['metadata']['result_counts']['fulltext']})"
+        )
+        return hybrid
+
+    # Plain top-k results can be served from the (warmed) vector cache
+    cache = get_default_query_cache() if use_vector_cache and not scope else None
+    cached = cache.get_vector_results(question) if cache else None
+
+    if cached is not None:
+        sections = cached
+        vector = {"time_ms": 0.0}
+    else:
+        vector = _timed_vector_search(neo4j_client, question, k, query_embedding, scope)
+        sections = _format_sections(vector["results"])
+        if cache is not None and sections:
+            cache.set_vector_results(question, sections)
+
+    logger.info(f"Vector search returned {len(sections)} sections")
+
+    return {
+        "sections": sections,
+        "metadata": {
+            "mode": "vector",
+            "search_dimension": get_search_dimension() or None,
+            "cache_hit": cached is not None,
+            "result_counts": {"vector": len(sections)},
+            "timings_ms": {"vector": round(vector["time_ms"], 1)}
+        }
+    }
+
+
+def _retrieve_sections(
+    neo4j_client: Neo4jClient,
+    question: str,
+    k: int,
+    retrieval_mode: str,
+    use_vector_cache: bool,
+    query_embedding: Optional[Embedding] = None,
+    scope: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Retrieve sections with the configured retrieval mode.
+
+    A scope that matches no sections falls back to unscoped retrieval.
+
+    Args:
+        neo4j_client: Shared Neo4jClient
+        question: User question
+        k: Number of sections to retrieve
+        retrieval_mode: 'vector' or 'hybrid'
+        use_vector_cache: Serve/store plain vector results via the query cache
+        query_embedding: Precomputed question embedding (optional)
+        scope: Document/chapter filter (optional)
+
+    Returns:
+        Dict with 'sections' and 'metadata'
+    """
+    if not scope:
+        return _search_sections(neo4j_client, question, k, retrieval_mode, use_vector_cache, query_embedding)
+
+    # Embed once so an empty scope can be re-searched without another API call
+    if query_embedding is None:
+        query_embedding = get_embedding(question)
+    retrieved = _search_sections(
+        neo4j_client, question, k, retrieval_mode, use_vector_cache, query_embedding, scope
+    )
+    scope_fallback = not retrieved["sections"]
+
+    if scope_fallback:
+        logger.info(f"No sections in scope {scope}, searching all documents")
+        retrieved = _search_sections(
+            neo4j_client, question, k, retrieval_mode, use_vector_cache, query_embedding
+        )
+
+    retrieved["metadata"]["scope"] = scope
+    retrieved["metadata"]["scope_fallback"] = scope_fallback
+    return retrieved
 
 
 def run_vector_search(state: GraphRAGState) -> GraphRAGState:
@@ -46,60 +700,146 @@ def run_vector_search(state: GraphRAGState) -> GraphRAGState:
     LangGraph Node: Perform vector similarity search on document sections.
 
     Uses Neo4j vector index 'section_embeddings' to find top-k relevant sections.
+    With RETRIEVAL_MODE=hybrid, also queries 'section_fulltext' concurrently and
+    fuses both rankings (reciprocal rank fusion). With
+    USE_RESULT_DIVERSIFICATION=true, over-fetched candidates are collapsed per
+    parent section and reduced to k with maximal marginal relevance.
+    With USE_VECTOR_CACHE=true, plain vector results are served from and stored
+    in the query cache (see CacheWarmer.warm_vector_results).
+    With USE_REQUIREMENT_RETRIEVAL=true, 'requirement_embeddings' is queried
+    concurrently and requirements are merged with sections by normalized score.
+    A document/chapter scope (state 'retrieval_scope', or detected from the
+    question with USE_SCOPED_RETRIEVAL=true) restricts retrieval to the
+    matching sections. With USE_LAZY_CONTENT=true, sections are returned
+    without 'content'; consumers call hydrate_sections for the ones they use.
+    With USE_ADAPTIVE_K=true, up to ADAPTIVE_K_MAX candidates are fetched as
+    IDs + scores and cut at score gaps / a relative threshold.
 
     Args:
         state: Current GraphRAGState
 
     Returns:
-        Updated state with 'top_k_sections' populated
+        Updated state with 'top_k_sections' and 'retrieval_metadata' populated
     """
     user_question = state["user_question"]
     k = 10  # Top-k sections to retrieve
+    adaptive = _adaptive_k_enabled()
+    if adaptive:
+        # Over-fetch up to the upper bound (without content), cut after retrieval
+        k = int(os.getenv("ADAPTIVE_K_MAX", "20"))
+    retrieval_mode = os.getenv("RETRIEVAL_MODE", "vector").lower()
+    diversify = os.getenv("USE_RESULT_DIVERSIFICATION", "false").lower() == "true"
+    use_vector_cache = os.getenv("USE_VECTOR_CACHE", "false").lower() == "true" and not diversify
+    include_requirements = os.getenv("USE_REQUIREMENT_RETRIEVAL", "false").lower() == "true"
+
+    # Explicit scope (e.g. from the UI) wins over scope detected in the question
+    scope = state.get("retrieval_scope")
+    if scope:
+        scope = {**normalize_scope(scope), "source": "explicit"}
+    elif os.getenv("USE_SCOPED_RETRIEVAL", "false").lower() == "true":
+        scope = detect_scope(user_question)
+        if scope:
+            scope["source"] = "detected"
+
+    # SRD requirements are only excluded when a design document was named
+    include_requirements = include_requirements and not (scope and scope["documents_named"])
+
+    # Over-fetch so collapsing chunks and MMR still leave k distinct sections
+    fetch_k = k * int(os.getenv("DIVERSIFICATION_CANDIDATE_MULTIPLIER", "3")) if diversify else k
+
+    logger.info(f"Running {retrieval_mode} search for: {user_question[:100]}...")
 
-    logger.info(f"Running vector search for: {user_question[:100]}...")
-
-    # Generate query embedding
-    query_embedding = get_embedding(user_question)
-
-    # Neo4j vector search query
-    cypher = """
-    CALL db.index.vector.queryNodes('section_embeddings', $k, $embedding)
-    YIELD node, score
-    MATCH (doc:Document)-[:HAS_SECTION]->(node)
-    RETURN
-        node.id AS section_id,
-        node.title AS title,
-        node.content AS content,
-        doc.title AS document,
-        doc.type AS doc_type,
-        score
-    ORDER BY score DESC
-    LIMIT $k
-    """
-
-    # Execute query
     neo4j_client = Neo4jClient()
     try:
-        results = neo4j_client.execute(
-            cypher,
-            k=k,
-            embedding=query_embedding
-        )
-
-        logger.info(f"Vector search returned {len(results)} sections")
-
-        # Format results
-        top_k_sections = [
-            {
-                "section_id": rec["section_id"],
-                "title": rec["title"],
-                "content": rec["content"],
-                "document": rec["document"],
-                "doc_type": rec["doc_type"],
-                "score": float(rec["score"])
+        if include_requirements:
+            # Embed once; section and requirement indexes are queried concurrently
+            query_embedding = get_embedding(user_question)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                section_future = executor.submit(
+                    _retrieve_sections, neo4j_client, user_question, fetch_k,
+                    retrieval_mode, use_vector_cache, query_embedding, scope
+                )
+                requirement_future = executor.submit(
+                    _timed_requirement_search, neo4j_client, query_embedding, k
+                )
+                retrieved = section_future.result()
+
+                # Requirement index failures degrade to section-only retrieval
+                try:
+                    requirement = requirement_future.result()
+                except Exception as e:
+                    logger.warning(f"Requirement search failed, using sections only: {e}")
+                    requirement = {"results": [], "time_ms": 0.0, "error": str(e)}
+        else:
+            retrieved = _retrieve_sections(
+                neo4j_client, user_question, fetch_k, retrieval_mode, use_vector_cache, scope=scope
+            )
+
+        top_k_sections = retrieved["sections"]
+        state["retrieval_metadata"] = retrieved["metadata"]
+
+        if diversify:
+            diversified = _diversify_sections(neo4j_client, top_k_sections, k)
+            top_k_sections = diversified["sections"]
+            state["retrieval_metadata"]["diversification"] = diversified["metadata"]
+
+            logger.info(
+                f"Diversified {diversified['metadata']['candidates']} candidates into "
+                f"{len(top_k_sections)} sections"
+            )
+
+        # Results kept after merging requirements (not narrowed by the adaptive cut)
+        merge_limit = k
+
+        if adaptive:
+            min_k = int(os.getenv("ADAPTIVE_K_MIN", "3"))
+            kept, cut_reason = adaptive_cutoff(
+                [section["score"] for section in top_k_sections],
+                min_k=min_k,
+                max_k=k,
+                relative_threshold=float(os.getenv("ADAPTIVE_K_RELATIVE_THRESHOLD", "0.9")),
+                max_gap=float(os.getenv("ADAPTIVE_K_MAX_GAP", "0.05"))
+            )
+            chosen_k = len(kept)
+            state["retrieval_metadata"]["adaptive_k"] = {
+                "k": chosen_k,
+                "candidates": len(top_k_sections),
+                "min_k": min_k,
+                "max_k": k,
+                "cut_reason": cut_reason
+            }
+            # Keep the highest-scoring sections in their current (e.g. MMR) order
+            kept = set(kept)
+            top_k_sections = [section for i, section in enumerate(top_k_sections) if i in kept]
+
+            # Only the kept sections are loaded (unless content stays lazy)
+            if not is_lazy_content_enabled():
+                hydrate_sections(top_k_sections, client=neo4j_client)
+
+            logger.info(f"Adaptive top-k: kept {chosen_k} sections ({cut_reason})")
+
+        if include_requirements:
+            requirement_weight = float(os.getenv("REQUIREMENT_RETRIEVAL_WEIGHT", "1.0"))
+            top_k_sections = merge_normalized_scores(
+                {"section": top_k_sections, "requirement": _format_requirements(requirement["results"])},
+                weights={"requirement": requirement_weight},
+                limit=merge_limit
+            )
+
+            state["retrieval_metadata"]["requirements"] = {
+                "weight": requirement_weight,
+                "retrieved": len(requirement["results"]),
+                "selected": sum(1 for s in top_k_sections if s["retrieval_source"] == "requirement"),
+                "time_ms": round(requirement["time_ms"], 1)
             }
-            for rec in results
-        ]
+            if "error" in requirement:
+                state["retrieval_metadata"]["requirements"]["error"] = requirement["error"]
+
+            logger.info(
+                f"Merged {state['retrieval_metadata']['requirements']['selected']} requirements "
+                f"into top {len(top_k_sections)} results"
+            )
 
         # Log top results
         for i, section in enumerate(top_k_sections[:3]):
@@ -30,6 +30,8 @@ class GraphRAGState(TypedDict):
     # Vector Search Results (Path B, C)
     top_k_sections: Optional[List[Dict[str, Any]]]  # Top-k sections from vector search
     # Each dict: {section_id, title, content, score}
+    retrieval_metadata: Optional[Dict[str, Any]]  # Retrieval mode, fusion weights, per-retriever timings
+    retrieval_scope: Optional[Dict[str, Any]]  # Explicit {doc_ids, chapters} filter for retrieval
 
     # NER Results (Path B)
     extracted_entities: Optional[Dict[str, List[str]]]  # Entities from NER
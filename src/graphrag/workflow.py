@@ -20,6 +20,7 @@ from langgraph.graph import StateGraph, END
 
 from src.graphrag.state import GraphRAGState
 from src.query.router import QueryRouter, QueryPath
+from src.query.section_content import hydrate_sections
 from src.graphrag.nodes import (
     run_vector_search,
     extract_entities_from_context,
@@ -232,7 +233,13 @@ class GraphRAGWorkflow:
 
         return "ko" if korean_ratio > 0.3 else "en"
 
-    def query(self, user_question: str, session_id: str = None, user_id: str = None) -> Dict[str, Any]:
+    def query(
+        self,
+        user_question: str,
+        session_id: str = None,
+        user_id: str = None,
+        retrieval_scope: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Execute GraphRAG query.
 
@@ -240,6 +247,7 @@ class GraphRAGWorkflow:
             user_question: User's natural language question
             session_id: Optional session identifier for tracking
             user_id: Optional user identifier
+            retrieval_scope: Optional {doc_ids, chapters} filter for document retrieval
 
         Returns:
             Result dict with answer, citations, metadata
@@ -258,6 +266,8 @@ class GraphRAGWorkflow:
             routing_confidence=0.0,
             matched_entities={},
             top_k_sections=None,
+            retrieval_metadata=None,
+            retrieval_scope=retrieval_scope,
             extracted_entities=None,
             cypher_query=None,
             graph_results=None,
@@ -296,7 +306,9 @@ class GraphRAGWorkflow:
                     "template_selection_error": final_state.get("template_selection_error"),
                     "fallback_reason": final_state.get("fallback_reason"),
                     "template_entity": final_state.get("template_entity"),
-                    "graph_results": final_state.get("graph_results", [])
+                    "graph_results": final_state.get("graph_results", []),
+                    "cache_hit": final_state.get("cache_hit", False),
+                    "retrieval_metadata": final_state.get("retrieval_metadata")
                 }
             }
 
@@ -316,7 +328,8 @@ class GraphRAGWorkflow:
         self,
         user_question: str,
         session_id: Optional[str] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        retrieval_scope: Optional[Dict[str, Any]] = None
     ) -> Generator[Dict[str, Any], None, None]:
         """
         Execute GraphRAG query with streaming response.
@@ -325,6 +338,7 @@ class GraphRAGWorkflow:
             user_question: User's natural language question
             session_id: Optional session identifier
             user_id: Optional user identifier
+            retrieval_scope: Optional {doc_ids, chapters} filter for document retrieval
 
         Yields:
             Dicts with:
@@ -353,7 +367,8 @@ class GraphRAGWorkflow:
                 "language": language,
                 "query_path": query_path,
                 "routing_confidence": routing_info["confidence"],
-                "matched_entities": routing_info["matched_entities"]
+                "matched_entities": routing_info["matched_entities"],
+                "retrieval_scope": retrieval_scope
             }
 
             # Run vector search if needed
@@ -415,7 +430,8 @@ class GraphRAGWorkflow:
             # Step 3: Stream synthesis
             yield {"type": "status", "message": "Generating answer..."}
 
-            # Gather context for streaming
+            # Gather context for streaming (prompts use the top sections' content)
+            hydrate_sections(state.get("top_k_sections") or [], limit=5)
             context = {
                 "vector_results": state.get("top_k_sections", []),
                 "graph_results": state.get("graph_results", []),
@@ -452,6 +468,7 @@ class GraphRAGWorkflow:
                     "fallback_reason": state.get("fallback_reason"),
                     "template_entity": state.get("template_entity"),
                     "graph_results": state.get("graph_results", []),
+                    "retrieval_metadata": state.get("retrieval_metadata"),
                     "processing_time_ms": processing_time_ms,
                     "language": language
                 }
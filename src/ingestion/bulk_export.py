@@ -0,0 +1,401 @@
+"""
+Bulk Export - CSV files for neo4j-admin offline import
+
+A fresh graph built through MOSARGraphLoader costs thousands of MERGE
+statements. For a new database, the parsed and embedded documents can
+instead be written once as node and relationship CSV files and imported
+offline with:
+
+    neo4j-admin database import full <database> --nodes=... --relationships=...
+
+The export produces the same nodes, properties and relationships as the
+loader (Requirement, Section, Document, TestCase, Component, Scenario,
+Protocol; DERIVES_FROM, DERIVES_FROM_CLOSURE, RELATES_TO, VALIDATED_BY,
+USES_PROTOCOL, HAS_SECTION, MENTIONS, VERIFIES). Constraints, indexes,
+traceability documents and graph statistics are created after the import
+against the running database (scripts/bulk_import.py).
+
+Usage:
+    exporter = BulkExporter(Path(".bulk_import/csv"))
+    counts = exporter.export(requirements, {"PDD": pdd_sections, "DDD": ddd_sections}, test_cases)
+    command = exporter.import_command(database="neo4j")
+"""
+
+import json
+import logging
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+from src.utils.entity_resolver import EntityResolver
+from src.ingestion.derivation_closure import DerivationClosure
+from src.ingestion.incremental import stamp_content_hashes
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "import_manifest.json"
+ARRAY_DELIMITER = ";"
+
+DOCUMENT_TITLES = {
+    "PDD": "Preliminary Design Document",
+    "DDD": "Detailed Design Document"
+}
+
+# Node properties as written by MOSARGraphLoader: (property, import type)
+NODE_PROPERTIES = {
+    "Requirement": [
+        ("title", "string"), ("statement", "string"), ("type", "string"),
+        ("subsystem", "string"), ("level", "string"), ("verification", "string"),
+        ("covers", "string"), ("comment", "string"),
+        ("statement_embedding", "double[]"), ("statement_embedding_small", "double[]"),
+        ("content_hash", "string")
+    ],
+    "Section": [
+        ("doc_id", "string"), ("number", "string"), ("title", "string"),
+        ("level", "long"), ("content", "string"), ("chapter", "string"),
+        ("content_embedding", "double[]"), ("content_embedding_small", "double[]"),
+        ("parent_section_id", "string"), ("chunk_index", "long"),
+        ("char_start", "long"), ("char_end", "long"), ("token_count", "long"),
+        ("content_hash", "string")
+    ],
+    "TestCase": [
+        ("name", "string"), ("type", "string"), ("objective", "string"),
+        ("procedure", "string"), ("status", "string"), ("content_hash", "string")
+    ],
+    "Document": [
+        ("title", "string"), ("type", "string"), ("version", "string")
+    ]
+}
+
+# Entity nodes created by resolution carry only an id
+ENTITY_LABELS = ["Component", "Scenario", "Protocol"]
+
+# Resolved entity type -> relationship type, by source label
+ENTITY_RELATIONSHIPS = {
+    "Requirement": {"Component": "RELATES_TO", "Scenario": "VALIDATED_BY", "Protocol": "USES_PROTOCOL"},
+    "Section": {"Component": "MENTIONS", "Protocol": "MENTIONS"}
+}
+
+# Same matching as the loader's Cypher for the COVERS field
+_COVERS_PART_PATTERN = re.compile(r'.*[A-Z][a-z]+R_[A-Z]\d+.*')
+_REQUIREMENT_ID_PATTERN = re.compile(r'[A-Z][a-z]+R_[A-Z]\d+')
+
+
+def covered_parent_ids(covers: Optional[str]) -> List[str]:
+    """
+    Parent requirement IDs named in a COVERS field.
+
+    Args:
+        covers: COVERS field text (comma-separated)
+
+    Returns:
+        Parent IDs in field order (first ID per comma-separated part)
+    """
+    parents = []
+    if not covers:
+        return parents
+
+    for part in covers.split(','):
+        part = part.strip()
+        if not _COVERS_PART_PATTERN.fullmatch(part):
+            continue
+        for token in part.split(' '):
+            if _REQUIREMENT_ID_PATTERN.fullmatch(token):
+                parents.append(token)
+                break
+
+    return parents
+
+
+def format_value(value: Any, value_type: str) -> str:
+    """
+    Format one CSV field for neo4j-admin.
+
+    Strings are always quoted, so an empty string stays an empty string;
+    missing values are left unquoted and empty, which the importer reads
+    as "no property".
+
+    Args:
+        value: Property value
+        value_type: Import type ("string", "long", "double[]", ...)
+
+    Returns:
+        CSV field text
+    """
+    if value is None:
+        return ""
+    if value_type.endswith("[]"):
+        return ARRAY_DELIMITER.join(repr(float(v)) for v in value)
+    if value_type == "string":
+        return '"' + str(value).replace('"', '""') + '"'
+    return str(value)
+
+
+def _last_by_id(items: List[Dict]) -> Dict[str, Dict]:
+    """Items by ID; like MERGE + SET, the last duplicate's properties win."""
+    return {item["id"]: item for item in items}
+
+
+class BulkExporter:
+    """Write parsed and embedded documents as neo4j-admin import CSV files."""
+
+    def __init__(self, out_dir: Path, entity_resolver: Optional[EntityResolver] = None):
+        """
+        Initialize exporter.
+
+        Args:
+            out_dir: Directory for CSV files and the import manifest
+            entity_resolver: Entity resolver (default: EntityResolver())
+        """
+        self.out_dir = Path(out_dir)
+        self.entity_resolver = entity_resolver or EntityResolver()
+        self.manifest: Dict[str, List[Dict[str, str]]] = {"nodes": [], "relationships": []}
+
+    def export(
+        self,
+        requirements: List[Dict],
+        sections_by_doc: Dict[str, List[Dict]],
+        test_cases: List[Dict]
+    ) -> Dict[str, int]:
+        """
+        Write all node and relationship files plus the import manifest.
+
+        Args:
+            requirements: Embedded requirements (SRDParser + DocumentEmbedder)
+            sections_by_doc: "PDD"/"DDD" -> embedded sections
+            test_cases: Parsed test cases
+
+        Returns:
+            Rows written per label / relationship type
+        """
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        for stale in self.out_dir.glob("*.csv"):
+            stale.unlink()
+        self.manifest = {"nodes": [], "relationships": []}
+
+        updated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        counts: Dict[str, int] = {}
+        entities: Dict[str, set] = {label: set() for label in ENTITY_LABELS}
+
+        # Requirements and their relationships
+        stamp_content_hashes(requirements, "Requirement")
+        req_nodes = _last_by_id(requirements)
+        counts["Requirement"] = self._write_nodes("Requirement", req_nodes.values(), updated_at)
+
+        derives_from = {}
+        for req in requirements:
+            for parent_id in covered_parent_ids(req.get("covers")):
+                if parent_id in req_nodes:
+                    derives_from[(req["id"], parent_id)] = None
+        counts["DERIVES_FROM"] = self._write_relationships(
+            "DERIVES_FROM", "Requirement", "Requirement", list(derives_from)
+        )
+
+        closure = DerivationClosure.from_edges(list(derives_from)).pairs()
+        counts["DERIVES_FROM_CLOSURE"] = self._write_relationships(
+            "DERIVES_FROM_CLOSURE", "Requirement", "Requirement",
+            [(d, a) for d, a, _ in closure],
+            properties=[("depth", "long", [depth for _, _, depth in closure])]
+        )
+
+        req_links = self._resolve_links(
+            "Requirement", requirements,
+            lambda req: f"{req.get('title', '')} {req.get('statement', '')} {req.get('comment', '')}",
+            entities
+        )
+
+        # Design documents
+        all_sections = []
+        documents = []
+        has_section = []
+        for doc_type, sections in sections_by_doc.items():
+            stamp_content_hashes(sections, "Section")
+            doc_id = f"{doc_type}-MOSAR-v1.0"
+            documents.append({
+                "id": doc_id,
+                "title": DOCUMENT_TITLES.get(doc_type, doc_type),
+                "type": doc_type,
+                "version": "1.0"
+            })
+            has_section.extend((doc_id, sec["id"]) for sec in sections)
+            all_sections.extend(sections)
+
+        counts["Document"] = self._write_nodes("Document", documents, updated_at)
+        counts["Section"] = self._write_nodes("Section", _last_by_id(all_sections).values(), updated_at)
+        counts["HAS_SECTION"] = self._write_relationships(
+            "HAS_SECTION", "Document", "Section", list(dict.fromkeys(has_section))
+        )
+
+        section_links = self._resolve_links(
+            "Section", all_sections,
+            lambda sec: f"{sec.get('title', '')} {sec.get('content', '')}",
+            entities
+        )
+
+        # Test cases
+        stamp_content_hashes(test_cases, "TestCase")
+        counts["TestCase"] = self._write_nodes("TestCase", _last_by_id(test_cases).values(), updated_at)
+        verifies = [
+            (tc["id"], req_id)
+            for tc in test_cases
+            for req_id in tc.get("covered_requirements", [])
+            if req_id in req_nodes
+        ]
+        counts["VERIFIES"] = self._write_relationships(
+            "VERIFIES", "TestCase", "Requirement", list(dict.fromkeys(verifies))
+        )
+
+        # Entity nodes, then the relationships into them
+        for label in ENTITY_LABELS:
+            counts[label] = self._write_nodes(label, [{"id": entity_id} for entity_id in sorted(entities[label])])
+
+        for (source_label, rel_type, target_label), pairs in {**req_links, **section_links}.items():
+            written = self._write_relationships(rel_type, source_label, target_label, pairs)
+            counts[rel_type] = counts.get(rel_type, 0) + written
+
+        manifest_path = self.out_dir / MANIFEST_NAME
+        manifest_path.write_text(json.dumps(self.manifest, indent=2), encoding="utf-8")
+
+        logger.info(f"✓ Exported {sum(counts.values())} rows to {self.out_dir}")
+        return counts
+
+    def _resolve_links(
+        self,
+        source_label: str,
+        items: List[Dict],
+        text_of,
+        entities: Dict[str, set]
+    ) -> Dict[Tuple[str, str, str], List[Tuple[str, str]]]:
+        """
+        Resolve dictionary entities in item texts.
+
+        Args:
+            source_label: "Requirement" or "Section"
+            items: Items to resolve
+            text_of: Item -> text used for resolution (as in the loader)
+            entities: Entity label -> IDs seen so far (updated in place)
+
+        Returns:
+            (source label, relationship type, target label) -> unique (source, target) pairs
+        """
+        rel_types = ENTITY_RELATIONSHIPS[source_label]
+        links: Dict[Tuple[str, str, str], Dict[Tuple[str, str], None]] = {}
+
+        for item in items:
+            for entity_type, entity_list in self.entity_resolver.resolve(text_of(item)).items():
+                if entity_type not in rel_types:
+                    continue
+                key = (source_label, rel_types[entity_type], entity_type)
+                for entity in entity_list:
+                    entities[entity_type].add(entity["id"])
+                    links.setdefault(key, {})[(item["id"], entity["id"])] = None
+
+        return {key: list(pairs) for key, pairs in links.items()}
+
+    def _write_nodes(self, label: str, items, updated_at: Optional[str] = None) -> int:
+        """
+        Write one label's node file.
+
+        Args:
+            label: Node label (also the ID space)
+            items: Node dicts with 'id' and the label's properties
+            updated_at: Timestamp for `updated_at` (None = no column)
+
+        Returns:
+            Number of rows written
+        """
+        properties = NODE_PROPERTIES.get(label, [])
+        header = [f"id:ID({label})"] + [f"{name}:{value_type}" for name, value_type in properties]
+        if updated_at:
+            header.append("updated_at:datetime")
+
+        path = self.out_dir / f"nodes_{label.lower()}.csv"
+        count = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(",".join(header) + "\n")
+            for item in items:
+                fields = [format_value(item["id"], "string")]
+                fields.extend(format_value(item.get(name), value_type) for name, value_type in properties)
+                if updated_at:
+                    fields.append(updated_at)
+                f.write(",".join(fields) + "\n")
+                count += 1
+
+        self.manifest["nodes"].append({"label": label, "file": path.name})
+        logger.info(f"  ✓ {label}: {count} nodes")
+        return count
+
+    def _write_relationships(
+        self,
+        rel_type: str,
+        start_label: str,
+        end_label: str,
+        pairs: List[Tuple[str, str]],
+        properties: Optional[List[Tuple[str, str, List[Any]]]] = None
+    ) -> int:
+        """
+        Write one relationship file.
+
+        Args:
+            rel_type: Relationship type
+            start_label: ID space of start nodes
+            end_label: ID space of end nodes
+            pairs: (start_id, end_id) pairs
+            properties: (name, import type, values aligned with pairs)
+
+        Returns:
+            Number of rows written
+        """
+        properties = properties or []
+        header = [f":START_ID({start_label})", f":END_ID({end_label})"]
+        header.extend(f"{name}:{value_type}" for name, value_type, _ in properties)
+
+        path = self.out_dir / f"rels_{rel_type.lower()}_{start_label.lower()}_{end_label.lower()}.csv"
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(",".join(header) + "\n")
+            for i, (start_id, end_id) in enumerate(pairs):
+                fields = [format_value(start_id, "string"), format_value(end_id, "string")]
+                fields.extend(format_value(values[i], value_type) for _, value_type, values in properties)
+                f.write(",".join(fields) + "\n")
+
+        self.manifest["relationships"].append({"type": rel_type, "file": path.name})
+        logger.info(f"  ✓ {rel_type} ({start_label} -> {end_label}): {len(pairs)} relationships")
+        return len(pairs)
+
+    def import_command(
+        self,
+        database: str = "neo4j",
+        neo4j_admin: str = "neo4j-admin",
+        csv_dir: Optional[Path] = None
+    ) -> List[str]:
+        """
+        Build the neo4j-admin (5.x) full import command for the exported files.
+
+        Args:
+            database: Target database (overwritten)
+            neo4j_admin: neo4j-admin executable
+            csv_dir: Directory the files are read from (default: out_dir; set
+                     it when the importer sees the files at another path,
+                     e.g. inside a container)
+
+        Returns:
+            Command as an argument list
+        """
+        manifest = self.manifest
+        if not manifest["nodes"]:
+            manifest = json.loads((self.out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+
+        base = Path(csv_dir) if csv_dir else self.out_dir.resolve()
+        command = [
+            neo4j_admin, "database", "import", "full", database,
+            "--overwrite-destination=true",
+            "--multiline-fields=true",
+            f"--array-delimiter={ARRAY_DELIMITER}",
+        ]
+        command.extend(f"--nodes={entry['label']}={(base / entry['file']).as_posix()}" for entry in manifest["nodes"])
+        command.extend(
+            f"--relationships={entry['type']}={(base / entry['file']).as_posix()}"
+            for entry in manifest["relationships"]
+        )
+        return command
@@ -0,0 +1,223 @@
+"""
+Load Checkpoints - Resumable document loading
+
+The load pipeline records its progress in a work directory:
+
+    <work_dir>/
+        manifest.json          sources, completed stages, embedding batches
+        parsed/<doc>.json      parsed items per document
+        embeddings/<key>.npy   embedding batches, keyed by model + texts
+
+The manifest is bound to the SHA-256 of every source document. A resumed
+run with unchanged documents skips completed stages (parse, per-document
+writes, traceability) and reads finished embedding batches from disk, so
+no API call is paid twice. If a document changed, the checkpoint is
+discarded and the load starts over. Discarding removes only the entries
+above; other files in the work directory are left alone.
+
+Files are written to a temporary name and renamed, so an interrupted run
+never leaves a half-written checkpoint behind. Manifest updates are
+serialized by a lock, so pipeline stages may record progress concurrently.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from src.utils.embeddings import EMBEDDING_DTYPE
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Entries of the work directory owned by the checkpoint (the only ones it deletes)
+CHECKPOINT_FILES = ("manifest.json", "manifest.json.tmp")
+CHECKPOINT_DIRS = ("parsed", "embeddings")
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def embedding_batch_key(signature: str, texts: List[str]) -> str:
+    """
+    Key an embedding batch by embedding settings and exact input texts.
+
+    Args:
+        signature: Model/dimension signature
+        texts: Batch texts in order
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256(signature.encode("utf-8"))
+    for text in texts:
+        digest.update(b"\x00")
+        digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _now() -> str:
+    """UTC timestamp for the manifest."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write a file via a temporary name and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class LoadCheckpoint:
+    """Stage and embedding-batch checkpoints for one load of a set of documents."""
+
+    def __init__(self, work_dir: Path, sources: Dict[str, Path], resume: bool = False):
+        """
+        Open or start a checkpoint.
+
+        Args:
+            work_dir: Checkpoint directory
+            sources: Document name -> source file (fingerprinted)
+            resume: Reuse an existing checkpoint for the same sources
+                    (False = discard it and start over)
+        """
+        self.work_dir = Path(work_dir)
+        self._lock = threading.RLock()
+        self.manifest_path = self.work_dir / "manifest.json"
+        fingerprints = {name: file_sha256(path) for name, path in sources.items() if Path(path).exists()}
+
+        manifest = self._read_manifest() if resume else None
+        if manifest and manifest.get("sources") != fingerprints:
+            logger.warning("Source documents changed since the checkpoint; starting a fresh load")
+            manifest = None
+
+        if manifest:
+            self.resumed = True
+            self.manifest = manifest
+            logger.info(f"✓ Resuming load from {self.work_dir} ({len(self.completed_stages())} stages done)")
+        else:
+            self.resumed = False
+            self._clear()
+            self.manifest = {
+                "version": MANIFEST_VERSION,
+                "created_at": _now(),
+                "sources": fingerprints,
+                "stages": {},
+                "embedding_batches": {}
+            }
+            self._write_manifest()
+
+    def _clear(self):
+        """Delete the checkpoint's own files from the work directory."""
+        for name in CHECKPOINT_FILES:
+            (self.work_dir / name).unlink(missing_ok=True)
+        for name in CHECKPOINT_DIRS:
+            if (self.work_dir / name).is_dir():
+                shutil.rmtree(self.work_dir / name)
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        """Read the manifest if present and readable."""
+        if not self.manifest_path.exists():
+            return None
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable checkpoint manifest ({e}); starting a fresh load")
+            return None
+        return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+    def _write_manifest(self):
+        """Persist the manifest."""
+        with self._lock:
+            self.manifest["updated_at"] = _now()
+            _atomic_write_bytes(
+                self.manifest_path,
+                json.dumps(self.manifest, indent=2, ensure_ascii=False).encode("utf-8")
+            )
+
+    def completed_stages(self) -> List[str]:
+        """Names of completed stages, in completion order."""
+        return list(self.manifest["stages"])
+
+    def is_done(self, stage: str) -> bool:
+        """Check whether a stage completed in this or a resumed run."""
+        return stage in self.manifest["stages"]
+
+    def mark_done(self, stage: str, **details):
+        """
+        Record a completed stage.
+
+        Args:
+            stage: Stage name (e.g. "write:PDD")
+            **details: JSON-serializable details stored with the stage
+        """
+        with self._lock:
+            self.manifest["stages"][stage] = {"completed_at": _now(), **details}
+            self._write_manifest()
+
+    def stage_details(self, stage: str) -> Dict[str, Any]:
+        """Details recorded with a completed stage."""
+        return self.manifest["stages"].get(stage, {})
+
+    def save_parsed(self, doc: str, items: List[Dict[str, Any]]):
+        """Store a document's parsed items."""
+        _atomic_write_bytes(
+            self.work_dir / "parsed" / f"{doc}.json",
+            json.dumps(items, ensure_ascii=False).encode("utf-8")
+        )
+
+    def load_parsed(self, doc: str) -> List[Dict[str, Any]]:
+        """Read a document's parsed items."""
+        return json.loads((self.work_dir / "parsed" / f"{doc}.json").read_text(encoding="utf-8"))
+
+    def load_embeddings(self, key: str) -> Optional[np.ndarray]:
+        """
+        Read a finished embedding batch.
+
+        Args:
+            key: Batch key (embedding_batch_key)
+
+        Returns:
+            float32 embedding matrix, or None if the batch was not checkpointed
+        """
+        if key not in self.manifest["embedding_batches"]:
+            return None
+
+        path = self.work_dir / "embeddings" / f"{key}.npy"
+        if not path.exists():
+            return None
+        return np.load(path).astype(EMBEDDING_DTYPE, copy=False)
+
+    def save_embeddings(self, key: str, embeddings: np.ndarray):
+        """
+        Store an embedding batch (float32, like the embeddings in memory).
+
+        Args:
+            key: Batch key (embedding_batch_key)
+            embeddings: Batch embeddings
+        """
+        path = self.work_dir / "embeddings" / f"{key}.npy"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp.npy")
+        np.save(tmp_path, np.asarray(embeddings, dtype=EMBEDDING_DTYPE))
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.manifest["embedding_batches"][key] = {"count": len(embeddings), "completed_at": _now()}
+            self._write_manifest()
@@ -4,6 +4,8 @@ from typing import List, Dict
 from pathlib import Path
 import logging
 
+from src.ingestion.parse_cache import get_parse_cache, source_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,9 +31,28 @@ class DemoProcedureParser:
         """
         logger.info(f"Parsing Demo Procedures file: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        data = Path(file_path).read_bytes()
+        self.test_cases = get_parse_cache().get_or_compute(
+            "DemoProcedureParser",
+            self.cache_identity() + data,
+            lambda: self.parse_content(data.decode('utf-8'))
+        )
+        return self.test_cases
+
+    def cache_identity(self) -> bytes:
+        """Parser source hash, prefixed to the input for parse cache keys."""
+        return f"DemoProcedureParser:{source_fingerprint(__name__)}\x00".encode('utf-8')
+
+    def parse_content(self, content: str) -> List[Dict]:
+        """
+        Extract test cases from Demonstration Procedures markdown text.
+
+        Args:
+            content: Whole document markdown
 
+        Returns:
+            List of test case dicts (see parse)
+        """
         # Parse Component Tests (CT-X-Y)
         self._parse_component_tests(content)
 
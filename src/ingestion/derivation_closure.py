@@ -0,0 +1,103 @@
+"""Transitive closure of DERIVES_FROM for O(result) decomposition lookups."""
+from typing import List, Dict, Tuple, Iterable
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DerivationClosure:
+    """
+    Ancestor/descendant sets with shortest depth for the DERIVES_FROM hierarchy.
+
+    Maintained incrementally: adding an edge child -> parent connects every
+    descendant of child (including child) to every ancestor of parent
+    (including parent). Only pairs that are new or got shorter are returned,
+    so callers can write just the delta to Neo4j.
+    """
+
+    def __init__(self):
+        """Initialize empty closure."""
+        # ancestors[d][a] = depth of shortest DERIVES_FROM path d -> ... -> a
+        self.ancestors: Dict[str, Dict[str, int]] = {}
+        self.descendants: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[str, str, int]]) -> "DerivationClosure":
+        """
+        Restore a closure from stored (descendant, ancestor, depth) pairs.
+
+        Args:
+            pairs: Closure pairs, e.g. read from DERIVES_FROM_CLOSURE relationships
+
+        Returns:
+            DerivationClosure instance
+        """
+        closure = cls()
+        for descendant, ancestor, depth in pairs:
+            closure._set(descendant, ancestor, depth)
+        return closure
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[str, str]]) -> "DerivationClosure":
+        """
+        Build a closure from direct (child, parent) DERIVES_FROM edges.
+
+        Args:
+            edges: Direct edges
+
+        Returns:
+            DerivationClosure instance
+        """
+        closure = cls()
+        for child, parent in edges:
+            closure.add_edge(child, parent)
+        return closure
+
+    def _set(self, descendant: str, ancestor: str, depth: int):
+        """Record a closure pair in both directions."""
+        self.ancestors.setdefault(descendant, {})[ancestor] = depth
+        self.descendants.setdefault(ancestor, {})[descendant] = depth
+
+    def add_edge(self, child: str, parent: str) -> List[Tuple[str, str, int]]:
+        """
+        Add a direct DERIVES_FROM edge and update the closure.
+
+        Args:
+            child: Deriving (lower-level) requirement ID
+            parent: Derived-from (higher-level) requirement ID
+
+        Returns:
+            List of (descendant, ancestor, depth) pairs that were added or shortened
+        """
+        lower = [(child, 0)] + list(self.descendants.get(child, {}).items())
+        upper = [(parent, 0)] + list(self.ancestors.get(parent, {}).items())
+
+        changed = []
+        for descendant, down_depth in lower:
+            for ancestor, up_depth in upper:
+                if descendant == ancestor:
+                    # Cycle in COVERS data; a requirement is not its own ancestor
+                    continue
+
+                depth = down_depth + 1 + up_depth
+                if depth < self.ancestors.get(descendant, {}).get(ancestor, depth + 1):
+                    self._set(descendant, ancestor, depth)
+                    changed.append((descendant, ancestor, depth))
+
+        return changed
+
+    def get_ancestors(self, req_id: str) -> Dict[str, int]:
+        """Get all ancestors of a requirement with their depth."""
+        return dict(self.ancestors.get(req_id, {}))
+
+    def get_descendants(self, req_id: str) -> Dict[str, int]:
+        """Get all descendants of a requirement with their depth."""
+        return dict(self.descendants.get(req_id, {}))
+
+    def pairs(self) -> List[Tuple[str, str, int]]:
+        """Get all (descendant, ancestor, depth) pairs."""
+        return [
+            (descendant, ancestor, depth)
+            for descendant, ancestors in self.ancestors.items()
+            for ancestor, depth in ancestors.items()
+        ]
@@ -4,6 +4,8 @@ from typing import List, Dict
 from pathlib import Path
 import logging
 
+from src.ingestion.parse_cache import get_parse_cache, source_fingerprint
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,9 +38,32 @@ class DesignDocParser:
         """
         logger.info(f"Parsing {self.doc_type} file: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        data = Path(file_path).read_bytes()
+        self.sections = get_parse_cache().get_or_compute(
+            "DesignDocParser",
+            self.cache_identity() + data,
+            lambda: self.parse_content(data.decode('utf-8'))
+        )
+        return self.sections
+
+    def cache_identity(self) -> bytes:
+        """Parser source hash and options, prefixed to the input for parse cache keys."""
+        return f"DesignDocParser:{source_fingerprint(__name__)}:doc_type={self.doc_type}\x00".encode('utf-8')
+
+    def parse_content(self, content: str) -> List[Dict]:
+        """
+        Extract sections from design document markdown text.
 
+        Pages (separated by '{') are parsed independently, so text split at
+        separators parses to the same sections piecewise (up to the final
+        de-duplication by ID).
+
+        Args:
+            content: Design document markdown (whole document or a run of pages)
+
+        Returns:
+            List of section dicts (see parse)
+        """
         # Find all sections with headers
         # Pattern: ## Section Title or ### Subsection Title
         # Also match numbered sections: 2.1, 3.2.1, etc.
@@ -1,10 +1,15 @@
 """Document embedding using OpenAI API."""
 from typing import List, Dict
-from openai import OpenAI
 import os
+import time
 from dotenv import load_dotenv
 import logging
-import time
+
+import numpy as np
+
+from src.utils.embedding_service import get_embedding_service
+from src.utils.embeddings import Embedding, as_embedding_matrix, get_search_dimension, truncate_embeddings
+from src.ingestion.checkpoint import embedding_batch_key
 
 load_dotenv()
 
@@ -14,17 +19,26 @@ logger = logging.getLogger(__name__)
 class DocumentEmbedder:
     """Generate embeddings for semantic search."""
 
-    def __init__(self):
-        """Initialize OpenAI client."""
+    def __init__(self, checkpoint=None):
+        """
+        Initialize embedder on the shared embedding service (same model/dimension as queries).
+
+        Args:
+            checkpoint: LoadCheckpoint to store/reuse embedding batches (optional)
+        """
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key or api_key.startswith("sk-your"):
             raise ValueError("OPENAI_API_KEY not configured in .env file")
 
-        self.client = OpenAI(api_key=api_key)
-        self.model = os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
-        self.dimensions = int(os.getenv("EMBEDDING_DIMENSION", "3072"))
+        self.service = get_embedding_service()
+        self.model = self.service.model
+        self.dimensions = self.service.dimensions
+        self.search_dimensions = get_search_dimension()
+        self.checkpoint = checkpoint
 
         logger.info(f"Initialized embedder with model: {self.model}, dimensions: {self.dimensions}")
+        if self.search_dimensions:
+            logger.info(f"  Compact search embeddings enabled: {self.search_dimensions} dimensions")
 
     def embed_requirements(self, requirements: List[Dict]) -> List[Dict]:
         """
@@ -34,7 +48,8 @@ class DocumentEmbedder:
             requirements: List of requirement dicts from SRDParser
 
         Returns:
-            Same list with 'statement_embedding' field added
+            Same list with 'statement_embedding' field added as a float32 array
+            (and 'statement_embedding_small' in compact mode)
         """
         logger.info(f"Generating embeddings for {len(requirements)} requirements...")
 
@@ -52,6 +67,10 @@ class DocumentEmbedder:
         for req, embedding in zip(requirements, embeddings):
             req['statement_embedding'] = embedding
 
+        if self.search_dimensions:
+            for req, small in zip(requirements, truncate_embeddings(embeddings, self.search_dimensions)):
+                req['statement_embedding_small'] = small
+
         logger.info(f"✓ Generated {len(embeddings)} embeddings")
         return requirements
 
@@ -63,7 +82,8 @@ class DocumentEmbedder:
             sections: List of section dicts from PDDParser/DDDParser
 
         Returns:
-            Same list with 'content_embedding' field added
+            Same list with 'content_embedding' field added as a float32 array
+            (and 'content_embedding_small' in compact mode)
         """
         logger.info(f"Generating embeddings for {len(sections)} sections...")
 
@@ -84,6 +104,10 @@ class DocumentEmbedder:
         for sec, embedding in zip(sections, embeddings):
             sec['content_embedding'] = embedding
 
+        if self.search_dimensions:
+            for sec, small in zip(sections, truncate_embeddings(embeddings, self.search_dimensions)):
+                sec['content_embedding_small'] = small
+
         logger.info(f"✓ Generated {len(embeddings)} embeddings")
         return sections
 
@@ -91,51 +115,55 @@ class DocumentEmbedder:
         self,
         texts: List[str],
         batch_size: int = 100
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         """
         Batch embed texts with OpenAI API.
 
+        With a checkpoint, finished batches are read back instead of being
+        embedded again, and a failed batch raises (so it is retried on
+        resume) instead of storing zero vectors.
+
         Args:
             texts: List of text strings
             batch_size: Max texts per API call
 
         Returns:
-            List of embedding vectors
+            float32 matrix, one row per text
         """
-        all_embeddings = []
-        total_batches = (len(texts) + batch_size - 1) // batch_size
+        if self.checkpoint is None:
+            return self.service.embed_documents(texts, batch_size=batch_size)
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i+batch_size]
-            batch_num = (i // batch_size) + 1
-
-            try:
-                logger.info(f"  Processing batch {batch_num}/{total_batches} ({len(batch)} texts)")
+        signature = f"{self.model}:{self.dimensions}"
+        embeddings: List[np.ndarray] = []
+        reused = 0
+        called = False
 
-                response = self.client.embeddings.create(
-                    model=self.model,
-                    input=batch,
-                    dimensions=self.dimensions
-                )
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
+            key = embedding_batch_key(signature, batch)
 
-                batch_embeddings = [item.embedding for item in response.data]
-                all_embeddings.extend(batch_embeddings)
+            cached = self.checkpoint.load_embeddings(key)
+            if cached is not None:
+                embeddings.append(cached)
+                reused += 1
+                continue
 
-                logger.info(f"  ✓ Batch {batch_num}/{total_batches} complete")
+            if called:
+                time.sleep(0.5)  # Rate limiting between API calls
+            batch_embeddings = self.service.embed_documents(batch, batch_size=batch_size, fail_fast=True)
+            called = True
 
-                # Rate limiting: sleep briefly between batches
-                if batch_num < total_batches:
-                    time.sleep(0.5)
+            self.checkpoint.save_embeddings(key, batch_embeddings)
+            embeddings.append(batch_embeddings)
 
-            except Exception as e:
-                logger.error(f"  ✗ Batch {batch_num}/{total_batches} failed: {e}")
-                # Fallback: zero vectors
-                logger.warning(f"  Using zero vectors for batch {batch_num}")
-                all_embeddings.extend([[0.0] * self.dimensions] * len(batch))
+        if reused:
+            logger.info(f"  ✓ Reused {reused} checkpointed embedding batches")
 
-        return all_embeddings
+        if not embeddings:
+            return as_embedding_matrix([])
+        return np.concatenate(embeddings)
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> Embedding:
         """
         Embed a single text string.
 
@@ -145,16 +173,7 @@ class DocumentEmbedder:
         Returns:
             Embedding vector
         """
-        try:
-            response = self.client.embeddings.create(
-                model=self.model,
-                input=[text],
-                dimensions=self.dimensions
-            )
-            return response.data[0].embedding
-        except Exception as e:
-            logger.error(f"Failed to embed text: {e}")
-            return [0.0] * self.dimensions
+        return self.service.embed_queries([text])[0]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,349 @@
+"""
+Incremental Ingestion - Write only what changed since the last load
+
+Every Requirement, Section and TestCase node stores a `content_hash` of its
+parsed fields (for embedded nodes, salted with the embedding settings, so a
+model or dimension change re-embeds everything). An incremental load reads
+the stored hashes, diffs them against the newly parsed documents and:
+- embeds and writes only inserted/updated items,
+- drops the content-derived relationships of updated items before they are
+  re-created (DERIVES_FROM, entity links, MENTIONS, VERIFIES),
+- DETACH DELETEs nodes that disappeared from the documents.
+
+Design sections are diffed in the shape they are stored in: pass the
+TextChunker the graph was loaded with, so `_chunk_N` nodes are compared
+with chunks rather than replaced by whole sections. Without a chunker,
+a document whose graph already holds chunk nodes is refused.
+
+Usage:
+    sync = IncrementalLoader(loader, embedder, chunker=TextChunker(240, 50))
+    delta = sync.sync_sections(sections, doc_type="PDD")
+    # {'inserted': 2, 'updated': 5, 'deleted': 1, 'unchanged': 128}
+"""
+
+import hashlib
+import json
+import logging
+from typing import Dict, List, Optional, Any
+
+from src.utils.embeddings import get_search_dimension
+from src.utils.embedding_service import get_embedding_service
+
+logger = logging.getLogger(__name__)
+
+# Parsed fields that define a node's content, by label
+HASH_FIELDS = {
+    "Requirement": [
+        "title", "statement", "level", "covers", "comment",
+        "verification", "responsible", "type", "subsystem"
+    ],
+    "Section": [
+        "doc_id", "number", "title", "level", "content", "chapter",
+        "parent_section_id", "chunk_index", "char_start", "char_end"
+    ],
+    "TestCase": [
+        "name", "type", "objective", "procedure", "status", "covered_requirements"
+    ]
+}
+
+# Labels whose nodes carry embeddings
+EMBEDDED_LABELS = {"Requirement", "Section"}
+
+# Outgoing relationships the loader derives from a node's content
+CONTENT_RELATIONSHIPS = {
+    "Requirement": ["DERIVES_FROM", "RELATES_TO", "VALIDATED_BY", "USES_PROTOCOL"],
+    "Section": ["MENTIONS"],
+    "TestCase": ["VERIFIES"]
+}
+
+
+def embedding_signature() -> str:
+    """Embedding settings that embedded node hashes depend on."""
+    service = get_embedding_service()
+    return f"{service.model}:{service.dimensions}:{get_search_dimension()}"
+
+
+def content_hash(item: Dict[str, Any], label: str, salt: str = "") -> str:
+    """
+    Hash the content fields of a parsed item.
+
+    Args:
+        item: Parsed requirement, section or test case
+        label: Node label ("Requirement", "Section" or "TestCase")
+        salt: Extra input (embedding settings for embedded labels)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    payload = json.dumps(
+        {field: item.get(field) for field in HASH_FIELDS[label]},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(f"{salt}\n{payload}".encode("utf-8")).hexdigest()
+
+
+def stamp_content_hashes(items: List[Dict[str, Any]], label: str) -> List[Dict[str, Any]]:
+    """
+    Set `content_hash` on items that do not have one yet.
+
+    Args:
+        items: Parsed items (updated in place)
+        label: Node label
+
+    Returns:
+        The same list
+    """
+    salt = embedding_signature() if label in EMBEDDED_LABELS else ""
+
+    for item in items:
+        if not item.get("content_hash"):
+            item["content_hash"] = content_hash(item, label, salt)
+
+    return items
+
+
+def compute_delta(items: List[Dict[str, Any]], existing: Dict[str, Optional[str]]) -> Dict[str, List]:
+    """
+    Diff parsed items against stored hashes.
+
+    Nodes stored without a hash (loaded before hashing existed) count as updated.
+
+    Args:
+        items: Parsed items with `content_hash`
+        existing: Stored node ID -> content_hash
+
+    Returns:
+        Dict with 'inserts' and 'updates' (items), 'unchanged' and 'deletes' (IDs)
+    """
+    inserts, updates, unchanged = [], [], []
+    parsed_ids = set()
+
+    for item in items:
+        parsed_ids.add(item["id"])
+        if item["id"] not in existing:
+            inserts.append(item)
+        elif existing[item["id"]] != item["content_hash"]:
+            updates.append(item)
+        else:
+            unchanged.append(item["id"])
+
+    return {
+        "inserts": inserts,
+        "updates": updates,
+        "unchanged": unchanged,
+        "deletes": sorted(set(existing) - parsed_ids)
+    }
+
+
+def _summarize(delta: Dict[str, List]) -> Dict[str, int]:
+    """Delta counts for reporting."""
+    return {
+        "inserted": len(delta["inserts"]),
+        "updated": len(delta["updates"]),
+        "deleted": len(delta["deletes"]),
+        "unchanged": len(delta["unchanged"])
+    }
+
+
+class IncrementalLoader:
+    """Apply parsed documents to the graph as a diff against stored content hashes."""
+
+    def __init__(self, loader, embedder, chunker=None):
+        """
+        Initialize incremental loader.
+
+        Args:
+            loader: MOSARGraphLoader used for writes
+            embedder: DocumentEmbedder used for changed items
+            chunker: TextChunker the design documents were loaded with
+                     (None = sections are stored unchunked)
+        """
+        self.loader = loader
+        self.embedder = embedder
+        self.chunker = chunker
+        self.client = loader.client
+
+    def _existing_hashes(self, label: str, doc_id: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """Stored node ID -> content_hash (Sections filtered by document)."""
+        rows = self.client.execute(
+            f"""
+            MATCH (n:{label})
+            WHERE $doc_id IS NULL OR n.doc_id = $doc_id
+            RETURN n.id AS id, n.content_hash AS content_hash
+            """,
+            doc_id=doc_id
+        )
+        return {row["id"]: row["content_hash"] for row in rows}
+
+    def _has_chunk_nodes(self, doc_id: str) -> bool:
+        """Check whether a document's sections are stored as TextChunker chunks."""
+        rows = self.client.execute(
+            """
+            MATCH (s:Section {doc_id: $doc_id})
+            WHERE s.parent_section_id IS NOT NULL
+            RETURN count(s) > 0 AS chunked
+            """,
+            doc_id=doc_id
+        )
+        return bool(rows and rows[0]["chunked"])
+
+    def _drop_content_relationships(self, label: str, ids: List[str]):
+        """Delete the outgoing relationships the loader will re-create for updated nodes."""
+        if not ids:
+            return
+
+        rel_types = "|".join(CONTENT_RELATIONSHIPS[label])
+        self.client.execute(
+            f"""
+            UNWIND $ids AS id
+            MATCH (n:{label} {{id: id}})-[rel:{rel_types}]->()
+            DELETE rel
+            """,
+            ids=ids
+        )
+
+    def _delete_nodes(self, label: str, ids: List[str]):
+        """DETACH DELETE stale nodes."""
+        if not ids:
+            return
+
+        self.client.execute(
+            f"""
+            UNWIND $ids AS id
+            MATCH (n:{label} {{id: id}})
+            DETACH DELETE n
+            """,
+            ids=ids
+        )
+        logger.info(f"  ✓ Deleted {len(ids)} stale {label} nodes")
+
+    def sync_requirements(self, requirements: List[Dict]) -> Dict[str, int]:
+        """
+        Apply parsed requirements incrementally.
+
+        DERIVES_FROM edges can disappear (updated COVERS, deleted parents), so
+        the derivation closure is rebuilt whenever anything changed.
+
+        Args:
+            requirements: Parsed requirements (without embeddings)
+
+        Returns:
+            Delta counts ('inserted', 'updated', 'deleted', 'unchanged')
+        """
+        stamp_content_hashes(requirements, "Requirement")
+        delta = compute_delta(requirements, self._existing_hashes("Requirement"))
+        changed = delta["inserts"] + delta["updates"]
+
+        # Documents mentioning updated/deleted requirements, found before their edges go
+        stale_traceability = self.loader.traceability_neighborhood(
+            delta["deletes"] + [req["id"] for req in delta["updates"]]
+        )
+
+        if delta["deletes"]:
+            self.loader.statistics.remove_requirements(delta["deletes"])
+            self._delete_nodes("Requirement", delta["deletes"])
+
+        self._drop_content_relationships("Requirement", [req["id"] for req in delta["updates"]])
+
+        if changed:
+            self.loader.load_requirements(self.embedder.embed_requirements(changed))
+
+        if delta["inserts"]:
+            # Unchanged requirements may cover a newly inserted parent
+            self.loader.create_covers_relationships(requirements)
+
+        if changed or delta["deletes"]:
+            self.loader.rebuild_derivation_closure()
+            self.loader.statistics.refresh_counts()
+            self.loader.refresh_traceability(stale_traceability)
+
+        summary = _summarize(delta)
+        logger.info(f"✓ Requirements delta: {summary}")
+        return summary
+
+    def sync_sections(self, sections: List[Dict], doc_type: str) -> Dict[str, int]:
+        """
+        Apply one design document's parsed sections incrementally.
+
+        Sections are chunked with the configured chunker before diffing.
+
+        Args:
+            sections: Parsed sections of the document (without embeddings)
+            doc_type: "PDD" or "DDD"
+
+        Returns:
+            Delta counts ('inserted', 'updated', 'deleted', 'unchanged')
+
+        Raises:
+            ValueError: If the graph holds chunk nodes for the document but no
+                        chunker is configured
+        """
+        if self.chunker is not None:
+            sections = self.chunker.chunk_sections(sections)
+        elif self._has_chunk_nodes(doc_type):
+            raise ValueError(
+                f"{doc_type} sections are stored as TextChunker chunks; pass the chunker "
+                f"they were loaded with (load_documents.py --chunk-size/--chunk-overlap)"
+            )
+
+        stamp_content_hashes(sections, "Section")
+        delta = compute_delta(sections, self._existing_hashes("Section", doc_id=doc_type))
+        changed = delta["inserts"] + delta["updates"]
+
+        self._delete_nodes("Section", delta["deletes"])
+        self._drop_content_relationships("Section", [sec["id"] for sec in delta["updates"]])
+
+        if changed:
+            self.loader.load_design_sections(self.embedder.embed_sections(changed), doc_type=doc_type)
+        elif delta["deletes"]:
+            self.loader.statistics.refresh_counts()
+
+        summary = _summarize(delta)
+        logger.info(f"✓ {doc_type} sections delta: {summary}")
+        return summary
+
+    def sync_test_cases(self, test_cases: List[Dict]) -> Dict[str, int]:
+        """
+        Apply parsed test cases incrementally.
+
+        Requirements that lose VERIFIES relationships (updated or deleted test
+        cases) are recounted in the coverage statistics.
+
+        Args:
+            test_cases: Parsed test cases
+
+        Returns:
+            Delta counts ('inserted', 'updated', 'deleted', 'unchanged')
+        """
+        stamp_content_hashes(test_cases, "TestCase")
+        delta = compute_delta(test_cases, self._existing_hashes("TestCase"))
+        changed = delta["inserts"] + delta["updates"]
+        touched = [tc["id"] for tc in delta["updates"]] + delta["deletes"]
+
+        previously_verified = []
+        if touched:
+            rows = self.client.execute(
+                """
+                UNWIND $ids AS id
+                MATCH (:TestCase {id: id})-[:VERIFIES]->(r:Requirement)
+                RETURN DISTINCT r.id AS req_id
+                """,
+                ids=touched
+            )
+            previously_verified = [row["req_id"] for row in rows]
+
+        self._delete_nodes("TestCase", delta["deletes"])
+        self._drop_content_relationships("TestCase", [tc["id"] for tc in delta["updates"]])
+
+        if changed:
+            self.loader.load_test_cases(changed)
+
+        if previously_verified:
+            self.loader.statistics.update_requirements(previously_verified)
+            self.loader.refresh_traceability(previously_verified)
+
+        summary = _summarize(delta)
+        logger.info(f"✓ Test cases delta: {summary}")
+        return summary
@@ -1,7 +1,8 @@
 """Load parsed documents into Neo4j."""
 import sys
+import json
 from pathlib import Path
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional, Tuple
 import logging
 
 # Add parent directory to path
@@ -9,6 +10,10 @@ sys.path.insert(0, str(Path(__file__).parents[2]))
 
 from src.utils.neo4j_client import Neo4jClient
 from src.utils.entity_resolver import EntityResolver
+from src.query.cypher_templates import CypherTemplates
+from src.ingestion.derivation_closure import DerivationClosure
+from src.utils.graph_statistics import GraphStatistics
+from src.ingestion.incremental import stamp_content_hashes
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +25,7 @@ class MOSARGraphLoader:
         """Initialize Neo4j client and entity resolver."""
         self.client = Neo4jClient()
         self.entity_resolver = EntityResolver()
+        self.statistics = GraphStatistics(self.client)
         logger.info("Initialized MOSARGraphLoader")
 
     def load_requirements(self, requirements: List[Dict]):
@@ -31,6 +37,7 @@ class MOSARGraphLoader:
         - Organization nodes
         - ASSIGNED_TO relationships
         - DERIVES_FROM relationships (from COVERS field)
+        - DERIVES_FROM_CLOSURE relationships (transitive closure with depth)
         - Entity relationships (from Entity Dictionary)
 
         Args:
@@ -38,6 +45,9 @@ class MOSARGraphLoader:
         """
         logger.info(f"Loading {len(requirements)} requirements to Neo4j...")
 
+        # Content hashes let later incremental loads skip unchanged requirements
+        stamp_content_hashes(requirements, "Requirement")
+
         # Create Requirement nodes
         cypher = """
         UNWIND $requirements AS req
@@ -53,30 +63,41 @@ class MOSARGraphLoader:
             r.covers = req.covers,
             r.comment = req.comment,
             r.statement_embedding = req.statement_embedding,
+            r.statement_embedding_small = req.statement_embedding_small,
+            r.content_hash = req.content_hash,
             r.updated_at = datetime()
 
         RETURN count(r) AS created_count
         """
 
-        result = self.client.execute(cypher, requirements=requirements)
-        created_count = result[0]['created_count'] if result else 0
+        # Size-bounded transactions: each requirement carries its embeddings
+        result = self.client.execute_write_batches(cypher, "requirements", requirements)
+        created_count = sum(row['created_count'] for row in result)
 
         logger.info(f"  ✓ Created/updated {created_count} requirement nodes")
 
         # Create DERIVES_FROM relationships from COVERS field
-        self._create_covers_relationships(requirements)
+        edges = self.create_covers_relationships(requirements)
+        self.update_derivation_closure(edges)
 
         # Create entity relationships using Entity Dictionary
         self._create_entity_relationships(requirements)
 
+        # Keep coverage statistics and materialized traceability current
+        self.statistics.update_requirements(req['id'] for req in requirements)
+        self.refresh_traceability(req['id'] for req in requirements)
+
         logger.info(f"✅ Loaded {len(requirements)} requirements to Neo4j")
 
-    def _create_covers_relationships(self, requirements: List[Dict]):
+    def create_covers_relationships(self, requirements: List[Dict]) -> List[Tuple[str, str]]:
         """
         Create DERIVES_FROM relationships from COVERS field.
 
         Args:
             requirements: List of requirement dicts
+
+        Returns:
+            List of (child_id, parent_id) edges
         """
         logger.info("  Creating DERIVES_FROM relationships from COVERS field...")
 
@@ -110,13 +131,102 @@ class MOSARGraphLoader:
         MATCH (parent:Requirement {id: parent_id})
         MERGE (child)-[:DERIVES_FROM]->(parent)
 
-        RETURN count(*) AS rel_count
+        RETURN child.id AS child_id, parent.id AS parent_id
         """
 
-        result = self.client.execute(cypher, requirements=requirements)
-        rel_count = result[0]['rel_count'] if result else 0
+        # Only IDs and COVERS text; the requirements may still carry their embeddings
+        links = [{"id": req["id"], "covers": req.get("covers")} for req in requirements]
+        result = self.client.execute(cypher, requirements=links)
+        edges = [(row['child_id'], row['parent_id']) for row in result]
+
+        logger.info(f"  ✓ Created {len(edges)} DERIVES_FROM relationships")
+        return edges
+
+    def update_derivation_closure(self, edges: List[Tuple[str, str]]):
+        """
+        Incrementally maintain DERIVES_FROM_CLOSURE for new DERIVES_FROM edges.
+
+        Only the stored pairs the new edges can extend are read back: the
+        descendants of the new children and the ancestors of the new parents.
+        The edges are applied in memory and only new or shortened
+        (descendant, ancestor, depth) pairs are written; the write keeps the
+        shorter depth when a pair outside the read-back set already exists.
+
+        Args:
+            edges: (child_id, parent_id) edges from create_covers_relationships
+        """
+        if not edges:
+            return
+
+        rows = self.client.execute(
+            """
+            MATCH (d:Requirement)-[c:DERIVES_FROM_CLOSURE]->(a:Requirement)
+            WHERE a.id IN $children
+            RETURN d.id AS descendant, a.id AS ancestor, c.depth AS depth
+            UNION
+            MATCH (d:Requirement)-[c:DERIVES_FROM_CLOSURE]->(a:Requirement)
+            WHERE d.id IN $parents
+            RETURN d.id AS descendant, a.id AS ancestor, c.depth AS depth
+            """,
+            children=sorted({child for child, _ in edges}),
+            parents=sorted({parent for _, parent in edges})
+        )
+        closure = DerivationClosure.from_pairs(
+            (row['descendant'], row['ancestor'], row['depth']) for row in rows
+        )
+
+        changed = {}
+        for child, parent in edges:
+            for descendant, ancestor, depth in closure.add_edge(child, parent):
+                changed[(descendant, ancestor)] = depth
+
+        self._write_closure_pairs([(d, a, depth) for (d, a), depth in changed.items()])
+        logger.info(f"  ✓ Updated {len(changed)} DERIVES_FROM_CLOSURE relationships")
+
+    def _write_closure_pairs(self, pairs: List[Tuple[str, str, int]], batch_size: int = 1000):
+        """
+        Write (descendant, ancestor, depth) closure pairs.
+
+        Args:
+            pairs: Closure pairs
+            batch_size: Pairs per transaction
+        """
+        cypher = """
+        UNWIND $pairs AS pair
+        MATCH (d:Requirement {id: pair.descendant})
+        MATCH (a:Requirement {id: pair.ancestor})
+        MERGE (d)-[c:DERIVES_FROM_CLOSURE]->(a)
+        SET c.depth = CASE WHEN c.depth IS NULL OR pair.depth < c.depth THEN pair.depth ELSE c.depth END
+        """
 
-        logger.info(f"  ✓ Created {rel_count} DERIVES_FROM relationships")
+        for i in range(0, len(pairs), batch_size):
+            batch = [
+                {"descendant": d, "ancestor": a, "depth": depth}
+                for d, a, depth in pairs[i:i + batch_size]
+            ]
+            self.client.execute(cypher, pairs=batch)
+
+    def rebuild_derivation_closure(self) -> int:
+        """
+        Rebuild DERIVES_FROM_CLOSURE from scratch (backfill for existing graphs).
+
+        Returns:
+            Number of closure relationships written
+        """
+        logger.info("Rebuilding DERIVES_FROM closure...")
+
+        rows = self.client.execute("""
+        MATCH (child:Requirement)-[:DERIVES_FROM]->(parent:Requirement)
+        RETURN child.id AS child_id, parent.id AS parent_id
+        """)
+        closure = DerivationClosure.from_edges((row['child_id'], row['parent_id']) for row in rows)
+
+        self.client.execute("MATCH ()-[c:DERIVES_FROM_CLOSURE]->() DELETE c")
+        pairs = closure.pairs()
+        self._write_closure_pairs(pairs)
+
+        logger.info(f"  ✓ Wrote {len(pairs)} DERIVES_FROM_CLOSURE relationships from {len(rows)} edges")
+        return len(pairs)
 
     def _create_entity_relationships(self, requirements: List[Dict]):
         """
@@ -191,6 +301,8 @@ class MOSARGraphLoader:
         """
         logger.info(f"Loading {len(test_cases)} test cases to Neo4j...")
 
+        stamp_content_hashes(test_cases, "TestCase")
+
         # Create TestCase nodes
         cypher = """
         UNWIND $test_cases AS tc
@@ -202,19 +314,25 @@ class MOSARGraphLoader:
             t.objective = tc.objective,
             t.procedure = tc.procedure,
             t.status = tc.status,
+            t.content_hash = tc.content_hash,
             t.updated_at = datetime()
 
         RETURN count(t) AS created_count
         """
 
-        result = self.client.execute(cypher, test_cases=test_cases)
-        created_count = result[0]['created_count'] if result else 0
+        result = self.client.execute_write_batches(cypher, "test_cases", test_cases)
+        created_count = sum(row['created_count'] for row in result)
 
         logger.info(f"  ✓ Created/updated {created_count} test case nodes")
 
         # Create VERIFIES relationships
         self._create_verifies_relationships(test_cases)
 
+        # Requirements gaining VERIFIES change coverage statistics and traceability
+        verified_ids = [req_id for tc in test_cases for req_id in tc.get('covered_requirements', [])]
+        self.statistics.update_requirements(verified_ids)
+        self.refresh_traceability(verified_ids)
+
         logger.info(f"✅ Loaded {len(test_cases)} test cases to Neo4j")
 
     def _create_verifies_relationships(self, test_cases: List[Dict]):
@@ -264,6 +382,8 @@ class MOSARGraphLoader:
         """
         logger.info(f"Loading {len(sections)} {doc_type} sections to Neo4j...")
 
+        stamp_content_hashes(sections, "Section")
+
         # Create Document node first
         doc_id = f"{doc_type}-MOSAR-v1.0"
         doc_title = "Preliminary Design Document" if doc_type == "PDD" else "Detailed Design Document"
@@ -290,6 +410,13 @@ class MOSARGraphLoader:
             s.content = sec.content,
             s.chapter = sec.chapter,
             s.content_embedding = sec.content_embedding,
+            s.content_embedding_small = sec.content_embedding_small,
+            s.parent_section_id = sec.parent_section_id,
+            s.chunk_index = sec.chunk_index,
+            s.char_start = sec.char_start,
+            s.char_end = sec.char_end,
+            s.token_count = sec.token_count,
+            s.content_hash = sec.content_hash,
             s.updated_at = datetime()
 
         // Link to Document
@@ -300,14 +427,17 @@ class MOSARGraphLoader:
         RETURN count(s) AS created_count
         """
 
-        result = self.client.execute(section_cypher, sections=sections, doc_id=doc_id)
-        created_count = result[0]['created_count'] if result else 0
+        # Size-bounded transactions: each section carries its content and embeddings
+        result = self.client.execute_write_batches(section_cypher, "sections", sections, doc_id=doc_id)
+        created_count = sum(row['created_count'] for row in result)
 
         logger.info(f"  ✓ Created/updated {created_count} section nodes")
 
         # Create entity relationships for sections
         self._create_section_entity_relationships(sections)
 
+        self.statistics.refresh_counts()
+
         logger.info(f"✅ Loaded {len(sections)} {doc_type} sections to Neo4j")
 
     def _create_section_entity_relationships(self, sections: List[Dict]):
@@ -363,6 +493,109 @@ class MOSARGraphLoader:
         """
         self.client.execute(cypher, section_id=section_id, protocol_id=protocol_id)
 
+    def materialize_traceability(self, batch_size: int = 100, req_ids: Optional[List[str]] = None) -> int:
+        """
+        Precompute one traceability document per Requirement.
+
+        Runs the get_requirement_traceability projection for all requirements
+        in batches and stores each row as a JSON string in the
+        `traceability_doc` property, so PURE_CYPHER traceability queries become
+        a single indexed lookup. Must run after requirements, DERIVES_FROM,
+        RELATES_TO and VERIFIES relationships are loaded.
+
+        Args:
+            batch_size: Requirements per batch
+            req_ids: Only these requirements (default: all)
+
+        Returns:
+            Number of documents written
+        """
+        logger.info("Materializing requirement traceability documents...")
+
+        if req_ids is None:
+            id_rows = self.client.execute("MATCH (r:Requirement) RETURN r.id AS id ORDER BY id")
+            req_ids = [row["id"] for row in id_rows]
+
+        traceability_query = CypherTemplates.get_requirement_traceability_batch()
+        write_query = """
+        UNWIND $docs AS doc
+        MATCH (r:Requirement {id: doc.id})
+        SET r.traceability_doc = doc.json,
+            r.traceability_updated_at = datetime()
+        RETURN count(r) AS written_count
+        """
+
+        written = 0
+        for i in range(0, len(req_ids), batch_size):
+            rows = self.client.execute(traceability_query, req_ids=req_ids[i:i + batch_size])
+            docs = [
+                {"id": row["requirement_id"], "json": json.dumps(row, ensure_ascii=False)}
+                for row in rows
+            ]
+
+            result = self.client.execute(write_query, docs=docs)
+            written += result[0]['written_count'] if result else 0
+
+        logger.info(f"  ✓ Materialized {written} traceability documents")
+        return written
+
+    def traceability_neighborhood(self, req_ids: Iterable[str]) -> List[str]:
+        """
+        Requirements whose materialized document may mention the given ones.
+
+        A traceability document lists parents and children up to two
+        DERIVES_FROM hops, so it changes when the requirement itself or any
+        requirement within two hops changes. Only requirements that already
+        have a document are returned.
+
+        Args:
+            req_ids: Touched requirement IDs
+
+        Returns:
+            Sorted IDs of requirements with a traceability_doc to refresh
+        """
+        req_ids = sorted(set(req_ids))
+        if not req_ids:
+            return []
+
+        rows = self.client.execute(
+            """
+            UNWIND $req_ids AS req_id
+            MATCH (r:Requirement {id: req_id})
+            OPTIONAL MATCH (r)-[:DERIVES_FROM*1..2]->(ancestor:Requirement)
+            OPTIONAL MATCH (r)<-[:DERIVES_FROM*1..2]-(descendant:Requirement)
+            WITH [r] + collect(DISTINCT ancestor) + collect(DISTINCT descendant) AS related
+            UNWIND related AS req
+            WITH DISTINCT req
+            WHERE req.traceability_doc IS NOT NULL
+            RETURN req.id AS id
+            ORDER BY id
+            """,
+            req_ids=req_ids
+        )
+        return [row["id"] for row in rows]
+
+    def refresh_traceability(self, req_ids: Iterable[str]) -> int:
+        """
+        Re-materialize the traceability documents affected by touched requirements.
+
+        Called by the load methods, so every writer (load_documents.py,
+        load_srd.py, load_demo_procedures.py, incremental sync) keeps existing
+        documents in step with new DERIVES_FROM and VERIFIES relationships.
+        Nothing is written while traceability has never been materialized.
+
+        Args:
+            req_ids: Touched requirement IDs
+
+        Returns:
+            Number of documents written
+        """
+        stale_ids = self.traceability_neighborhood(req_ids)
+        if not stale_ids:
+            return 0
+
+        return self.materialize_traceability(req_ids=stale_ids)
+
     def get_statistics(self) -> Dict:
         """
         Get loading statistics from Neo4j.
@@ -382,7 +615,7 @@ class MOSARGraphLoader:
             stats["nodes"][label] = count
 
         # Count relationships by type
-        rel_types = ["DERIVES_FROM", "RELATES_TO", "VALIDATED_BY", "USES_PROTOCOL", "VERIFIES", "HAS_SECTION", "MENTIONS"]
+        rel_types = ["DERIVES_FROM", "DERIVES_FROM_CLOSURE", "RELATES_TO", "VALIDATED_BY", "USES_PROTOCOL", "VERIFIES", "HAS_SECTION", "MENTIONS"]
         for rel_type in rel_types:
             count = self.client.count_relationships(rel_type)
             stats["relationships"][rel_type] = count
@@ -0,0 +1,223 @@
+"""
+Parallel Document Parsing - Parse MOSAR documents in a process pool
+
+Parsing is CPU-bound regex work, so documents are parsed in worker
+processes rather than threads. Large documents are additionally split into
+runs of pages (at '{' page separators, the unit the SRD and design parsers
+already work in) so one document can use several workers.
+
+Results are merged in document and chunk order, so the output is identical
+to parsing each document sequentially. At the current document sizes
+(~300 KB each, ~0.1s to parse all four) process start-up outweighs the
+parse time, so the default is still one in-process worker (PARSE_WORKERS).
+
+Documents whose content and parser version are unchanged since an earlier
+run are read from the parse cache (src/ingestion/parse_cache.py) and not
+parsed at all.
+
+Usage:
+    parser = ParallelDocumentParser(max_workers=4)
+    results = parser.parse_all({"SRD": srd_path, "PDD": pdd_path, "DDD": ddd_path, "Demo": demo_path})
+    requirements = results["SRD"]["items"]
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+from src.ingestion.srd_parser import SRDParser
+from src.ingestion.design_doc_parser import DesignDocParser
+from src.ingestion.demo_procedure_parser import DemoProcedureParser
+from src.ingestion.parse_cache import get_parse_cache
+
+logger = logging.getLogger(__name__)
+
+PAGE_SEPARATOR = "{"
+
+# Documents whose parsers work page by page (and can be split)
+SPLITTABLE_DOCUMENTS = {"SRD", "PDD", "DDD"}
+
+# Parse cache namespace per document type (shared with the parsers' parse())
+PARSER_NAMES = {"SRD": "SRDParser", "PDD": "DesignDocParser", "DDD": "DesignDocParser", "Demo": "DemoProcedureParser"}
+
+
+def split_at_pages(content: str, parts: int) -> List[str]:
+    """
+    Split text into contiguous, similarly sized chunks at page separators.
+
+    Each chunk after the first starts with a separator, so concatenating
+    the chunks gives back the original text.
+
+    Args:
+        content: Document text
+        parts: Desired number of chunks
+
+    Returns:
+        List of at most `parts` chunks (one chunk if there are no separators)
+    """
+    if parts <= 1:
+        return [content]
+
+    target = len(content) / parts
+    chunks = []
+    start = 0
+
+    while len(chunks) < parts - 1:
+        # Search at least one character ahead, so a separator at `start` cannot stall the loop
+        cut = content.find(PAGE_SEPARATOR, start + max(1, int(target)))
+        if cut == -1:
+            break
+        chunks.append(content[start:cut])
+        start = cut
+
+    chunks.append(content[start:])
+    return chunks
+
+
+def _make_parser(doc_type: str):
+    """Parser instance for a document type."""
+    if doc_type == "SRD":
+        return SRDParser()
+    if doc_type == "Demo":
+        return DemoProcedureParser()
+    return DesignDocParser(doc_type=doc_type)
+
+
+def _parse_chunk(doc_type: str, text: str) -> Tuple[List[Dict], float]:
+    """
+    Parse one chunk in a worker process.
+
+    Args:
+        doc_type: "SRD", "PDD", "DDD" or "Demo"
+        text: Document text (whole document or a run of pages)
+
+    Returns:
+        Tuple of (parsed items, parse time in seconds)
+    """
+    start = time.perf_counter()
+    items = _make_parser(doc_type).parse_content(text)
+    return items, time.perf_counter() - start
+
+
+def _merge_chunks(doc_type: str, chunk_items: List[List[Dict]]) -> List[Dict]:
+    """
+    Merge chunk results in chunk order.
+
+    Design documents keep the first section per ID across the whole
+    document, like DesignDocParser does within one parse.
+
+    Args:
+        doc_type: Document type
+        chunk_items: Parsed items per chunk, in chunk order
+
+    Returns:
+        Merged item list
+    """
+    merged = [item for items in chunk_items for item in items]
+
+    if doc_type in ("PDD", "DDD"):
+        seen = set()
+        unique = []
+        for item in merged:
+            if item["id"] not in seen:
+                seen.add(item["id"])
+                unique.append(item)
+        merged = unique
+
+    return merged
+
+
+class ParallelDocumentParser:
+    """Parse several documents concurrently in a process pool."""
+
+    def __init__(self, max_workers: Optional[int] = None, split_parts: Optional[int] = None):
+        """
+        Initialize parser.
+
+        Args:
+            max_workers: Worker processes (default: PARSE_WORKERS, default 1;
+                         1 = parse sequentially in this process)
+            split_parts: Chunks per splittable document (default: max_workers)
+        """
+        self.max_workers = max_workers or int(os.getenv("PARSE_WORKERS", "1"))
+        self.split_parts = split_parts or self.max_workers
+
+    def parse_all(self, documents: Dict[str, Path]) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse documents, splitting the large page-based ones into chunks.
+
+        Args:
+            documents: Document type ("SRD", "PDD", "DDD", "Demo") -> file path
+
+        Returns:
+            Document type -> {
+                'items': parsed requirements/sections/test cases,
+                'chunks': number of chunks parsed (0 = read from the parse cache),
+                'parse_s': summed worker parse time (seconds),
+                'wall_s': time until the document's last chunk finished
+            }
+        """
+        cache = get_parse_cache()
+        cache_keys: Dict[str, str] = {}
+        cached: Dict[str, List[Dict]] = {}
+        jobs: List[Tuple[str, str]] = []
+
+        for doc_type, path in documents.items():
+            data = Path(path).read_bytes()
+
+            if cache.enabled:
+                cache_keys[doc_type] = cache.key(_make_parser(doc_type).cache_identity() + data)
+                items = cache.get(PARSER_NAMES[doc_type], cache_keys[doc_type])
+                if items is not None:
+                    cached[doc_type] = items
+                    continue
+
+            parts = self.split_parts if doc_type in SPLITTABLE_DOCUMENTS else 1
+            jobs.extend((doc_type, chunk) for chunk in split_at_pages(data.decode("utf-8"), parts))
+
+        start = time.perf_counter()
+        outputs: Dict[str, List[Tuple[List[Dict], float]]] = {
+            doc_type: [] for doc_type in documents if doc_type not in cached
+        }
+        finished: Dict[str, float] = {}
+
+        if self.max_workers == 1:
+            for doc_type, text in jobs:
+                outputs[doc_type].append(_parse_chunk(doc_type, text))
+                finished[doc_type] = time.perf_counter() - start
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [(doc_type, executor.submit(_parse_chunk, doc_type, text)) for doc_type, text in jobs]
+                # Collected in submission order, so merging is deterministic
+                for doc_type, future in futures:
+                    outputs[doc_type].append(future.result())
+                    finished[doc_type] = time.perf_counter() - start
+
+        results = {}
+        for doc_type in documents:
+            if doc_type in cached:
+                cache.hits += 1
+                results[doc_type] = {"items": cached[doc_type], "chunks": 0, "parse_s": 0.0, "wall_s": 0.0}
+                logger.info(f"✓ Read {len(cached[doc_type])} {doc_type} items from the parse cache")
+                continue
+
+            chunk_outputs = outputs[doc_type]
+            items = _merge_chunks(doc_type, [items for items, _ in chunk_outputs])
+            if doc_type in cache_keys:
+                cache.misses += 1
+                cache.put(PARSER_NAMES[doc_type], cache_keys[doc_type], items)
+            results[doc_type] = {
+                "items": items,
+                "chunks": len(chunk_outputs),
+                "parse_s": sum(seconds for _, seconds in chunk_outputs),
+                "wall_s": finished.get(doc_type, 0.0)
+            }
+            logger.info(
+                f"✓ Parsed {len(items)} items from {doc_type} "
+                f"({len(chunk_outputs)} chunks, {results[doc_type]['wall_s']:.2f}s)"
+            )
+
+        return results
@@ -0,0 +1,244 @@
+"""
+Parse Cache - Reuse parser and chunker output across runs
+
+Parsing all four documents is repeated on every load, although the source
+markdown rarely changes. Parser and chunker outputs are stored on disk as
+zlib-compressed pickles, keyed by a SHA-256 of
+
+    <producer identity incl. source_fingerprint() and options> + <input bytes>
+
+so a changed document, a changed parser option or an edit to the parser
+(or chunker) module is a miss and parses again - no manual version bump.
+
+    .parse_cache/
+        SRDParser/<key>.pkl.z
+        TextChunker/<key>.pkl.z
+
+Every hit returns a freshly unpickled copy, so callers may mutate the
+items (the embedder adds vectors to them).
+
+Old keys are never looked up again once a document or producer changes, so
+each namespace keeps at most `max_entries` files: a hit refreshes the
+entry's mtime and a write deletes the least recently used entries beyond
+the cap. Entries are not pruned per producer identity, because one identity
+legitimately owns several live entries (PDD and DDD share DesignDocParser;
+the streaming pipeline chunks one batch of sections at a time).
+
+Usage:
+    cache = get_parse_cache()
+    requirements = cache.get_or_compute("SRDParser", identity + data, lambda: parser.parse_content(text))
+"""
+
+import hashlib
+import importlib
+import logging
+import os
+import pickle
+import threading
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored format changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path(__file__).parents[2] / ".parse_cache"
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(module_name: str) -> str:
+    """
+    Short SHA-256 of a module's source file, for producer identities.
+
+    Computed once per process (the source does not change while running).
+
+    Args:
+        module_name: Dotted module name (e.g. "src.ingestion.srd_parser")
+
+    Returns:
+        First 16 hex digits of the digest
+    """
+    module = importlib.import_module(module_name)
+    return hashlib.sha256(Path(module.__file__).read_bytes()).hexdigest()[:16]
+
+
+class ParseCache:
+    """On-disk cache of parser/chunker results keyed by input content."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, enabled: bool = True, max_entries: int = 256):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Cache directory (default: .parse_cache/ in the project root)
+            enabled: False = always compute, never read or write
+            max_entries: Entries kept per namespace, least recently used
+                         deleted first (0 = unlimited)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.pruned = 0
+
+    def key(self, material: bytes) -> str:
+        """
+        Cache key for an input.
+
+        Args:
+            material: Parser identity and input bytes
+
+        Returns:
+            Hex digest
+        """
+        digest = hashlib.sha256(f"parse-cache-v{CACHE_FORMAT_VERSION}\x00".encode("utf-8"))
+        digest.update(material)
+        return digest.hexdigest()
+
+    def _path(self, namespace: str, key: str) -> Path:
+        """File holding one cached result."""
+        return self.cache_dir / namespace / f"{key}.pkl.z"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Read a cached result.
+
+        Args:
+            namespace: Producer name (e.g. "SRDParser")
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss or unreadable entry
+        """
+        path = self._path(namespace, key)
+        if not path.exists():
+            return None
+
+        try:
+            value = pickle.loads(zlib.decompress(path.read_bytes()))
+        except Exception as e:
+            logger.warning(f"Discarding unreadable parse cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used for pruning
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def put(self, namespace: str, key: str, value: Any):
+        """
+        Store a result (written to a temporary name and renamed).
+
+        Args:
+            namespace: Producer name
+            key: Cache key
+            value: Picklable result
+        """
+        path = self._path(namespace, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), 6))
+        os.replace(tmp_path, path)
+
+        self._prune(path)
+
+    def _prune(self, keep: Path):
+        """
+        Delete the least recently used entries of keep's namespace beyond max_entries.
+
+        Args:
+            keep: Entry just written (never deleted)
+        """
+        if self.max_entries <= 0:
+            return
+
+        entries = [path for path in keep.parent.glob("*.pkl.z") if path != keep]
+        excess = len(entries) + 1 - self.max_entries
+        if excess <= 0:
+            return
+
+        def last_used(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        for path in sorted(entries, key=last_used)[:excess]:
+            path.unlink(missing_ok=True)
+
+        self.pruned += excess
+        logger.info(f"✓ Pruned {excess} parse cache entries from {keep.parent.name}")
+
+    def get_or_compute(self, namespace: str, material: bytes, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached result for an input, computing and storing it on a miss.
+
+        Args:
+            namespace: Producer name
+            material: Producer identity and input bytes
+            compute: Produces the result on a miss
+
+        Returns:
+            Cached or computed result
+        """
+        if not self.enabled:
+            return compute()
+
+        key = self.key(material)
+        cached = self.get(namespace, key)
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"Parse cache hit: {namespace}/{key[:12]}")
+            return cached
+
+        self.misses += 1
+        value = compute()
+        self.put(namespace, key, value)
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "enabled": self.enabled,
+            "cache_dir": str(self.cache_dir),
+            "hits": self.hits,
+            "misses": self.misses,
+            "pruned": self.pruned
+        }
+
+
+# Global instance (singleton)
+_parse_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """
+    Get the process-wide parse cache (singleton).
+
+    Environment Variables:
+        PARSE_CACHE_ENABLED: Cache parser/chunker output (default: true)
+        PARSE_CACHE_DIR: Cache directory (default: .parse_cache)
+        PARSE_CACHE_MAX_ENTRIES: Entries kept per producer namespace (default: 256)
+
+    Returns:
+        ParseCache instance
+    """
+    global _parse_cache
+
+    if _parse_cache is None:
+        cache_dir = os.getenv("PARSE_CACHE_DIR")
+        _parse_cache = ParseCache(
+            cache_dir=Path(cache_dir) if cache_dir else None,
+            enabled=os.getenv("PARSE_CACHE_ENABLED", "true").lower() == "true",
+            max_entries=int(os.getenv("PARSE_CACHE_MAX_ENTRIES", "256"))
+        )
+
+    return _parse_cache
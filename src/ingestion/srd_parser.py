@@ -4,14 +4,38 @@ from typing import List, Dict, Optional
 from pathlib import Path
 import logging
 
+from src.ingestion.parse_cache import get_parse_cache, source_fingerprint
+
 logger = logging.getLogger(__name__)
 
+# Requirement header row: | FuncR_S101 | Title | Level |
+REQUIREMENT_PATTERN = re.compile(
+    r'\|\s*([A-Z][a-z]+R_[A-Z]\d+)\s*\|(.+?)\|(.*?)\|',
+    re.MULTILINE
+)
+
+# Field rows inside a requirement block, and the field names that end each field's text
+FIELD_NAMES = ("STATEMENT", "COVERS", "VERIFICATION", "COMMENT")
+FIELD_STOPS = {
+    "STATEMENT": ("COVERS", "VERIFICATION", "COMMENT"),
+    "COVERS": ("COMMENT", "VERIFICATION"),
+    "VERIFICATION": ("COVERS", "COMMENT"),
+    "COMMENT": ()
+}
+
 
 class SRDParser:
     """Parse System Requirements Document (table format)."""
 
-    def __init__(self):
-        """Initialize parser."""
+    def __init__(self, single_pass: bool = True):
+        """
+        Initialize parser.
+
+        Args:
+            single_pass: Extract fields with the single-pass cell tokenizer
+                         (False = the original per-field regex passes)
+        """
+        self.single_pass = single_pass
         self.requirements = []
 
     def parse(self, file_path: Path) -> List[Dict]:
@@ -31,19 +55,36 @@ class SRDParser:
         """
         logger.info(f"Parsing SRD file: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        data = Path(file_path).read_bytes()
+        self.requirements = get_parse_cache().get_or_compute(
+            "SRDParser",
+            self.cache_identity() + data,
+            lambda: self.parse_content(data.decode('utf-8'))
+        )
+        return self.requirements
+
+    def cache_identity(self) -> bytes:
+        """Parser source hash and options, prefixed to the input for parse cache keys."""
+        return f"SRDParser:{source_fingerprint(__name__)}:single_pass={self.single_pass}\x00".encode('utf-8')
+
+    def parse_content(self, content: str) -> List[Dict]:
+        """
+        Extract requirements from SRD markdown text.
+
+        Requirement blocks never extend past a page separator ('{'), so text
+        split at separators parses to the same requirements piecewise.
+
+        Args:
+            content: SRD markdown (whole document or a run of pages)
 
+        Returns:
+            List of requirement dicts (see parse)
+        """
         # Find all requirement IDs in the document
         # Pattern: FuncR_S101, PerfR_A201, SafR_B301, etc.
-        req_pattern = re.compile(
-            r'\|\s*([A-Z][a-z]+R_[A-Z]\d+)\s*\|(.+?)\|(.*?)\|',
-            re.MULTILINE
-        )
+        matches = list(REQUIREMENT_PATTERN.finditer(content))
 
-        matches = req_pattern.finditer(content)
-
-        for match in matches:
+        for index, match in enumerate(matches):
             req_id = match.group(1).strip()
             title = match.group(2).strip()
             level = match.group(3).strip()
@@ -53,7 +94,7 @@ class SRDParser:
 
             # Find the end of this requirement block
             # Look for the next requirement ID or a page separator
-            next_req_match = req_pattern.search(content, match.end())
+            next_req_match = matches[index + 1] if index + 1 < len(matches) else None
             page_separator = content.find('{', match.end())
 
             if next_req_match and page_separator != -1:
@@ -105,6 +146,120 @@ class SRDParser:
             "responsible": ""
         }
 
+        if self.single_pass:
+            req.update(self._tokenize_fields(block))
+        else:
+            req.update(self._search_fields(block))
+
+        # Infer type and subsystem from ID
+        # Format: TypeR_SubsystemNumber (e.g., FuncR_S101)
+        if '_' in req_id:
+            req_type, rest = req_id.split('_', 1)
+            req['type'] = req_type  # e.g., "FuncR"
+
+            # Extract subsystem letter
+            subsystem_match = re.match(r'([A-Z])', rest)
+            if subsystem_match:
+                req['subsystem'] = subsystem_match.group(1)  # e.g., "S", "A", "B"
+            else:
+                req['subsystem'] = ""
+        else:
+            req['type'] = ""
+            req['subsystem'] = ""
+
+        # Only return if we have a statement (core requirement)
+        if req['statement']:
+            return req
+        else:
+            logger.warning(f"Skipping {req_id}: No statement found")
+            return None
+
+    def _tokenize_fields(self, block: str) -> Dict[str, str]:
+        """
+        Extract STATEMENT/COVERS/VERIFICATION/COMMENT in one scan of the block.
+
+        The block is split into cells at '|' and scanned once. A field starts
+        after the first `| NAME |` header cell for its name and runs until the
+        first pipe that either ends its line (only whitespace after it) or
+        precedes one of the field's stop names (FIELD_STOPS); COMMENT runs to
+        the end of its line. Field texts are the covered cells concatenated,
+        with <br> and whitespace collapsed to single spaces - the same values
+        as `_search_fields`. The scan stops once every field name present in
+        the block has been read.
+
+        Args:
+            block: Text block containing the requirement details
+
+        Returns:
+            Dict of field name (lowercase) -> cleaned text, for fields found
+        """
+        cells = block.split('|')
+        last = len(cells) - 1
+        present = [name for name in FIELD_NAMES if name in block]
+
+        active: Dict[str, List[str]] = {}
+        finished: Dict[str, List[str]] = {}
+        pending = None  # Header cell seen; the field starts after the next pipe
+
+        def append(name: str, cell: str):
+            if name == "COMMENT" and '\n' in cell:
+                active[name].append(cell.split('\n', 1)[0])
+                finished[name] = active.pop(name)
+            else:
+                active[name].append(cell)
+
+        for k in range(1, last + 1):
+            if not active and not pending and len(finished) == len(present):
+                break
+
+            # Pipe k is followed by cells[k]
+            cell = cells[k]
+
+            if active:
+                first_line, newline, _ = cell.partition('\n')
+                line_final = bool(newline or k == last) and (not first_line or first_line.isspace())
+                head = cell.lstrip()
+
+                for name in list(active):
+                    if name != "COMMENT" and (line_final or head.startswith(FIELD_STOPS[name])):
+                        finished[name] = active.pop(name)
+                    else:
+                        append(name, cell)
+
+            if pending:
+                active[pending] = []
+                append(pending, cell)
+                pending = None
+
+            if k < last:
+                name = cell.strip()
+                if name in FIELD_STOPS and name not in active and name not in finished:
+                    pending = name
+
+        # COMMENT may also end at the end of the block; other fields need a closing pipe
+        if "COMMENT" in active:
+            finished["COMMENT"] = active.pop("COMMENT")
+
+        return {
+            name.lower(): ' '.join(''.join(pieces).replace('<br>', ' ').split())
+            for name, pieces in finished.items()
+        }
+
+    def _search_fields(self, block: str) -> Dict[str, str]:
+        """
+        Extract STATEMENT/COVERS/VERIFICATION/COMMENT with one regex search per field.
+
+        Original implementation, kept as the reference for the single-pass
+        tokenizer (see scripts/benchmark_srd_parser.py).
+
+        Args:
+            block: Text block containing the requirement details
+
+        Returns:
+            Dict of field name (lowercase) -> cleaned text, for fields found
+        """
+        req = {}
+
         # Extract STATEMENT field
         statement_match = re.search(
             r'\|\s*STATEMENT\s*\|(.*?)(?=\|\s*(?:COVERS|VERIFICATION|COMMENT|$))',
@@ -158,28 +313,7 @@ class SRDParser:
             comment = re.sub(r'\s+', ' ', comment)
             req['comment'] = comment.strip()
 
-        # Infer type and subsystem from ID
-        # Format: TypeR_SubsystemNumber (e.g., FuncR_S101)
-        if '_' in req_id:
-            req_type, rest = req_id.split('_', 1)
-            req['type'] = req_type  # e.g., "FuncR"
-
-            # Extract subsystem letter
-            subsystem_match = re.match(r'([A-Z])', rest)
-            if subsystem_match:
-                req['subsystem'] = subsystem_match.group(1)  # e.g., "S", "A", "B"
-            else:
-                req['subsystem'] = ""
-        else:
-            req['type'] = ""
-            req['subsystem'] = ""
-
-        # Only return if we have a statement (core requirement)
-        if req['statement']:
-            return req
-        else:
-            logger.warning(f"Skipping {req_id}: No statement found")
-            return None
+        return req
 
     def get_statistics(self) -> Dict:
         """
@@ -0,0 +1,272 @@
+"""
+Streaming Ingestion - Overlap parsing, chunking, embedding and Neo4j writes
+
+The phased load (parse everything, embed everything, write everything)
+leaves Neo4j idle while OpenAI embeds and vice versa, and holds every
+3072-d vector of a document in memory at once. This pipeline runs the four
+stages in their own threads, connected by bounded queues of item batches:
+
+    parse -> chunk -> embed -> load
+
+Each stage handles a batch as soon as it arrives. A full queue blocks the
+stage feeding it (backpressure), so at most `queue_size` batches wait
+between two stages and embeddings are dropped from the items once written.
+Stages are single-threaded and queues are FIFO, so documents are written
+in the order given (requirements before the test cases that VERIFY them).
+
+Per-stage metrics: items, batches, busy time, time waiting for input,
+time blocked on a full output queue, and peak output queue depth.
+
+Usage:
+    pipeline = StreamingIngestionPipeline(embedder, loader, batch_size=50)
+    metrics = pipeline.run([("SRD", parse_srd), ("PDD", parse_pdd), ("Demo", parse_demo)])
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("parse", "chunk", "embed", "load")
+
+# Embedding fields dropped from items after they are written
+EMBEDDING_FIELDS = (
+    "statement_embedding", "statement_embedding_small",
+    "content_embedding", "content_embedding_small"
+)
+
+# Queue item: (doc_type, items, last batch of the document)
+Batch = Tuple[str, List[Dict], bool]
+
+_END = object()
+
+
+class _AbortedError(Exception):
+    """Raised inside a stage when another stage failed."""
+
+
+def _empty_metrics() -> Dict[str, Any]:
+    """Counters for one stage."""
+    return {
+        "items": 0,
+        "batches": 0,
+        "busy_s": 0.0,
+        "wait_s": 0.0,
+        "blocked_s": 0.0,
+        "peak_queue": 0
+    }
+
+
+class StreamingIngestionPipeline:
+    """Load documents through bounded parse/chunk/embed/load stage queues."""
+
+    def __init__(
+        self,
+        embedder,
+        loader,
+        batch_size: int = 50,
+        queue_size: int = 2,
+        chunker=None,
+        on_document_loaded: Optional[Callable[[str, int], None]] = None
+    ):
+        """
+        Initialize pipeline.
+
+        Args:
+            embedder: DocumentEmbedder for requirements and sections
+            loader: MOSARGraphLoader for writes
+            batch_size: Items per batch flowing through the stages
+            queue_size: Max batches waiting between two stages
+            chunker: TextChunker applied to design sections (None = no chunking)
+            on_document_loaded: Called with (doc_type, item count) after a
+                                document's last batch is written
+        """
+        self.embedder = embedder
+        self.loader = loader
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.chunker = chunker
+        self.on_document_loaded = on_document_loaded
+
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+        self._abort = threading.Event()
+        self._errors: List[BaseException] = []
+
+    def run(self, documents: List[Tuple[str, Callable[[], List[Dict]]]]) -> Dict[str, Any]:
+        """
+        Stream documents through all stages and wait for the last write.
+
+        Args:
+            documents: (doc_type, parse function) in load order; doc_type is
+                       "SRD", "PDD", "DDD" or "Demo"
+
+        Returns:
+            Dict with 'stages' (metrics per stage) and 'wall_s'
+
+        Raises:
+            The first exception raised by any stage
+        """
+        self.metrics = {stage: _empty_metrics() for stage in STAGES}
+        self._abort.clear()
+        self._errors = []
+        self._loaded: Dict[str, int] = {}
+        self._requirements: List[Dict] = []
+
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in STAGES[1:]]
+        threads = [
+            threading.Thread(target=self._guard, args=("parse", self._parse_stage, documents, queues[0])),
+            threading.Thread(target=self._guard, args=("chunk", self._run_stage, "chunk", queues[0], queues[1], self._chunk)),
+            threading.Thread(target=self._guard, args=("embed", self._run_stage, "embed", queues[1], queues[2], self._embed)),
+            threading.Thread(target=self._guard, args=("load", self._run_stage, "load", queues[2], None, self._load)),
+        ]
+
+        start = time.perf_counter()
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join()
+        wall_s = time.perf_counter() - start
+
+        if self._errors:
+            raise self._errors[0]
+
+        logger.info(f"✓ Streamed {len(documents)} documents in {wall_s:.2f}s")
+        return {"stages": self.metrics, "wall_s": wall_s}
+
+    def _guard(self, name: str, target: Callable, *args):
+        """Run a stage; on failure record the error and stop the other stages."""
+        try:
+            target(*args)
+        except _AbortedError:
+            pass
+        except BaseException as e:
+            logger.error(f"✗ {name} stage failed: {e}")
+            self._errors.append(e)
+            self._abort.set()
+
+    def _put(self, out: queue.Queue, item, stage: str):
+        """Put with backpressure; gives up when the pipeline is aborted."""
+        metrics = self.metrics[stage]
+        start = time.perf_counter()
+        while True:
+            if self._abort.is_set():
+                raise _AbortedError()
+            try:
+                out.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        metrics["blocked_s"] += time.perf_counter() - start
+        metrics["peak_queue"] = max(metrics["peak_queue"], out.qsize())
+
+    def _get(self, inbox: queue.Queue, stage: str):
+        """Get the next batch; gives up when the pipeline is aborted."""
+        start = time.perf_counter()
+        while True:
+            if self._abort.is_set():
+                raise _AbortedError()
+            try:
+                item = inbox.get(timeout=0.1)
+                break
+            except queue.Empty:
+                continue
+        self.metrics[stage]["wait_s"] += time.perf_counter() - start
+        return item
+
+    def _parse_stage(self, documents: List[Tuple[str, Callable[[], List[Dict]]]], out: queue.Queue):
+        """Parse documents one at a time and emit their items in batches."""
+        metrics = self.metrics["parse"]
+
+        for doc_type, parse in documents:
+            start = time.perf_counter()
+            items = parse()
+            metrics["busy_s"] += time.perf_counter() - start
+            metrics["items"] += len(items)
+
+            if not items:
+                metrics["batches"] += 1
+                self._put(out, (doc_type, [], True), "parse")
+                continue
+
+            for i in range(0, len(items), self.batch_size):
+                batch = items[i:i + self.batch_size]
+                metrics["batches"] += 1
+                self._put(out, (doc_type, batch, i + self.batch_size >= len(items)), "parse")
+
+        self._put(out, _END, "parse")
+
+    def _run_stage(
+        self,
+        stage: str,
+        inbox: queue.Queue,
+        out: Optional[queue.Queue],
+        process: Callable[[Batch], Batch]
+    ):
+        """Apply `process` to each batch from inbox and pass the result on."""
+        metrics = self.metrics[stage]
+
+        while True:
+            batch = self._get(inbox, stage)
+            if batch is _END:
+                if out is not None:
+                    self._put(out, _END, stage)
+                return
+
+            start = time.perf_counter()
+            result = process(batch)
+            metrics["busy_s"] += time.perf_counter() - start
+            metrics["items"] += len(result[1])
+            metrics["batches"] += 1
+
+            if out is not None:
+                self._put(out, result, stage)
+
+    def _chunk(self, batch: Batch) -> Batch:
+        """Split long design sections (when a chunker is configured)."""
+        doc_type, items, last = batch
+        if self.chunker is not None and doc_type in ("PDD", "DDD") and items:
+            items = self.chunker.chunk_sections(items)
+        return doc_type, items, last
+
+    def _embed(self, batch: Batch) -> Batch:
+        """Embed requirements and sections; test cases pass through."""
+        doc_type, items, last = batch
+        if items:
+            if doc_type == "SRD":
+                self.embedder.embed_requirements(items)
+            elif doc_type in ("PDD", "DDD"):
+                self.embedder.embed_sections(items)
+        return batch
+
+    def _load(self, batch: Batch) -> Batch:
+        """Write a batch to Neo4j and release its embeddings."""
+        doc_type, items, last = batch
+
+        if items:
+            if doc_type == "SRD":
+                self.loader.load_requirements(items)
+                self._requirements.extend(items)
+            elif doc_type in ("PDD", "DDD"):
+                self.loader.load_design_sections(items, doc_type=doc_type)
+            else:
+                self.loader.load_test_cases(items)
+
+            for item in items:
+                for field in EMBEDDING_FIELDS:
+                    item.pop(field, None)
+
+        self._loaded[doc_type] = self._loaded.get(doc_type, 0) + len(items)
+
+        if last:
+            if doc_type == "SRD" and self._requirements:
+                # A batch can cover parents that only arrived in a later batch
+                edges = self.loader.create_covers_relationships(self._requirements)
+                self.loader.update_derivation_closure(edges)
+            if self.on_document_loaded:
+                self.on_document_loaded(doc_type, self._loaded[doc_type])
+
+        return batch
@@ -1,24 +1,65 @@
-"""Text chunking for large sections."""
+"""Text chunking for large sections.
+
+Chunks are spans (character offsets) into the section text. The text is
+segmented once into structural units - headings, tables, list items and
+paragraphs (sentences, for paragraphs longer than a chunk) - each counted
+once with the token counter. Units are then packed greedily into chunks,
+so chunking is linear in the text length, and chunk boundaries always fall
+on unit boundaries: the same text always yields the same chunks.
+
+With the default token counter, chunk_sections output is kept in the parse
+cache, keyed by the input sections and chunk settings.
+"""
+import json
 import re
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional, Tuple
 import logging
 
+from src.ingestion.parse_cache import get_parse_cache, source_fingerprint
+
 logger = logging.getLogger(__name__)
 
+# Counts tokens in a text (e.g. a tiktoken encoder's len(encode(text)))
+TokenCounter = Callable[[str], int]
+
+# (start, end, tokens, kind) - kind is "heading", "table", "list" or "text"
+Unit = Tuple[int, int, int, str]
+
+# Blank-line separated blocks
+_BLOCK_PATTERN = re.compile(r'\S.*?(?=\n[ \t]*\n|\Z)', re.DOTALL)
+_INDENT_PATTERN = re.compile(r'[ \t]*')
+_LIST_ITEM_PATTERN = re.compile(r'(?:[-*+•]|\d+[.)])[ \t]')
+_SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?])\s+')
+_ROW_END_PATTERN = re.compile(r'\n')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def approximate_tokens(text: str) -> int:
+    """Estimate tokens as 1 token ≈ 4 characters (rounded up)."""
+    return (len(text) + 3) // 4
+
 
 class TextChunker:
     """Split long sections into chunks for better vector search."""
 
-    def __init__(self, chunk_size: int = 500, overlap: int = 100):
+    def __init__(
+        self,
+        chunk_size: int = 500,
+        overlap: int = 100,
+        token_counter: Optional[TokenCounter] = None
+    ):
         """
         Initialize chunker.
 
         Args:
-            chunk_size: Target chunk size in tokens (approximate)
-            overlap: Overlap between chunks in tokens
+            chunk_size: Target chunk size in tokens
+            overlap: Overlap between chunks in tokens (whole trailing units)
+            token_counter: Function counting tokens in a text
+                           (default: approximate_tokens, ~4 chars per token)
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.token_counter = token_counter or approximate_tokens
 
     def chunk_sections(self, sections: List[Dict]) -> List[Dict]:
         """
@@ -32,25 +73,65 @@ class TextChunker:
         """
         logger.info(f"Chunking sections (chunk_size={self.chunk_size}, overlap={self.overlap})...")
 
+        # Only the built-in counter is part of the key; custom counters are not cached
+        if self.token_counter is approximate_tokens:
+            identity = f"TextChunker:{source_fingerprint(__name__)}:{self.chunk_size}:{self.overlap}\x00"
+            material = identity + json.dumps(sections, sort_keys=True, ensure_ascii=False, default=str)
+            return get_parse_cache().get_or_compute(
+                "TextChunker",
+                material.encode('utf-8'),
+                lambda: self._chunk_sections(sections)
+            )
+
+        return self._chunk_sections(sections)
+
+    def _chunk_sections(self, sections: List[Dict]) -> List[Dict]:
+        """
+        Chunk sections (uncached).
+
+        Args:
+            sections: List of section dicts
+
+        Returns:
+            List of section/chunk dicts
+        """
         chunked_sections = []
 
         for sec in sections:
             content = sec.get('content', '')
 
-            # Estimate tokens (rough approximation: 1 token ≈ 4 characters)
-            estimated_tokens = len(content) // 4
-
-            if estimated_tokens <= self.chunk_size:
+            if self.token_counter(content) <= self.chunk_size:
                 # Section is small enough, keep as is
                 chunked_sections.append(sec)
             else:
-                # Split into chunks
+                # Split into chunks (whitespace-only content has none; keep as is)
                 chunks = self._split_text(content, sec)
-                chunked_sections.extend(chunks)
+                chunked_sections.extend(chunks or [sec])
 
         logger.info(f"✓ Expanded {len(sections)} sections into {len(chunked_sections)} chunks")
         return chunked_sections
 
+    def split_spans(self, text: str) -> List[Tuple[int, int, int]]:
+        """
+        Compute chunk spans for a text.
+
+        Args:
+            text: Text to split
+
+        Returns:
+            List of (char_start, char_end, token_count) in text order;
+            token_count counts the emitted slice, including the separators
+            between its units
+        """
+        units = self._units(text)
+        spans = []
+
+        for first, last, _ in self._pack(units):
+            char_start, char_end = units[first][0], units[last - 1][1]
+            spans.append((char_start, char_end, self.token_counter(text[char_start:char_end])))
+
+        return spans
+
     def _split_text(self, text: str, section: Dict) -> List[Dict]:
         """
         Split text into overlapping chunks.
@@ -62,67 +143,233 @@ class TextChunker:
         Returns:
             List of chunk dicts
         """
-        chunks = []
+        return [
+            self._create_chunk_dict(section, text, span, chunk_idx)
+            for chunk_idx, span in enumerate(self.split_spans(text))
+        ]
 
-        # Character-based chunking (approx 4 chars = 1 token)
-        char_chunk_size = self.chunk_size * 4
-        char_overlap = self.overlap * 4
+    def _units(self, text: str) -> List[Unit]:
+        """
+        Segment text into structural units.
 
-        # Split by sentences first for cleaner breaks
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        Blocks are separated by blank lines. Within a block, each heading
+        line is a unit, consecutive table rows form one unit, each list item
+        (with its continuation lines) is a unit, and other consecutive lines
+        form a paragraph unit. Units longer than chunk_size are split further.
 
-        current_chunk = ""
-        chunk_idx = 0
+        Args:
+            text: Text to segment
 
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= char_chunk_size:
-                current_chunk += sentence + " "
-            else:
-                # Save current chunk
-                if current_chunk.strip():
-                    chunks.append(self._create_chunk_dict(
-                        section, current_chunk.strip(), chunk_idx
-                    ))
-                    chunk_idx += 1
-
-                # Start new chunk with overlap
-                if char_overlap > 0 and current_chunk:
-                    # Take last N characters as overlap
-                    overlap_text = current_chunk[-char_overlap:]
-                    current_chunk = overlap_text + sentence + " "
-                else:
-                    current_chunk = sentence + " "
-
-        # Save last chunk
-        if current_chunk.strip():
-            chunks.append(self._create_chunk_dict(
-                section, current_chunk.strip(), chunk_idx
-            ))
+        Returns:
+            Units in text order
+        """
+        units: List[Unit] = []
+
+        for block in _BLOCK_PATTERN.finditer(text):
+            block_end = block.end()
+            current: Optional[List] = None  # [start, end, kind]
+            line_start = block.start()
+
+            while line_start < block_end:
+                line_end = text.find('\n', line_start, block_end)
+                if line_end == -1:
+                    line_end = block_end
+
+                first = _INDENT_PATTERN.match(text, line_start, line_end).end()
+                if first < line_end:
+                    if text.startswith('#', first):
+                        kind = "heading"
+                    elif text.startswith('|', first):
+                        kind = "table"
+                    elif _LIST_ITEM_PATTERN.match(text, first, line_end):
+                        kind = "list"
+                    else:
+                        kind = "text"
+
+                    # Table rows and text lines extend the current unit; a text
+                    # line after a list item continues that item
+                    continues = current is not None and (
+                        (kind == "table" and current[2] == "table")
+                        or (kind == "text" and current[2] in ("text", "list"))
+                    )
+
+                    if continues:
+                        current[1] = line_end
+                    else:
+                        if current is not None:
+                            self._add_unit(text, units, *current)
+                        current = [first, line_end, kind]
+
+                line_start = line_end + 1
+
+            if current is not None:
+                self._add_unit(text, units, *current)
+
+        return units
+
+    def _add_unit(self, text: str, units: List[Unit], start: int, end: int, kind: str):
+        """
+        Count a unit (without trailing whitespace) and append it, split if oversized.
+
+        Args:
+            text: Source text
+            units: Unit list to append to
+            start: Unit start offset
+            end: Unit end offset
+            kind: Unit kind
+        """
+        while end > start and text[end - 1].isspace():
+            end -= 1
+
+        tokens = self.token_counter(text[start:end])
+        if tokens <= self.chunk_size:
+            units.append((start, end, tokens, kind))
+            return
+
+        # Tables split between rows, text between sentences
+        boundary = _ROW_END_PATTERN if kind == "table" else _SENTENCE_END_PATTERN
+        piece_start = start
+
+        for match in boundary.finditer(text, start, end):
+            self._add_piece(text, units, piece_start, match.start(), kind)
+            piece_start = match.end()
+
+        self._add_piece(text, units, piece_start, end, kind)
+
+    def _add_piece(self, text: str, units: List[Unit], start: int, end: int, kind: str):
+        """
+        Append one row/sentence of an oversized unit, cutting at whitespace if still too long.
+
+        Args:
+            text: Source text
+            units: Unit list to append to
+            start: Piece start offset
+            end: Piece end offset
+            kind: Kind of the unit the piece came from
+        """
+        if start >= end:
+            return
+
+        tokens = self.token_counter(text[start:end])
+        if tokens <= self.chunk_size:
+            units.append((start, end, tokens, kind))
+            return
+
+        # Characters per chunk at this piece's token density
+        budget = max(1, (end - start) * self.chunk_size // tokens)
+
+        while start < end:
+            cut = min(start + budget, end)
+            if cut < end:
+                # Back off to the last whitespace so words stay whole
+                space = text.rfind(' ', start + 1, cut)
+                if space > start:
+                    cut = space
+            tokens = self.token_counter(text[start:cut])
+            # The density estimate can overshoot (uneven words): back off word by word
+            while tokens > self.chunk_size and cut - start > 1:
+                space = text.rfind(' ', start + 1, cut)
+                cut = space if space > start else start + (cut - start) // 2
+                tokens = self.token_counter(text[start:cut])
+            units.append((start, cut, tokens, kind))
+
+            start = cut
+            whitespace = _WHITESPACE_PATTERN.match(text, start, end)
+            if whitespace:
+                start = whitespace.end()
+
+    def _pack(self, units: List[Unit]) -> List[Tuple[int, int, int]]:
+        """
+        Pack units greedily into chunks of at most chunk_size tokens.
+
+        A chunk that is at least half full ends before a heading, and no
+        chunk ends on a heading unless the heading is its only new unit
+        (heading and following unit together exceed chunk_size). Each following chunk starts with the
+        trailing units of the previous one, up to `overlap` tokens.
+
+        Args:
+            units: Units in text order
+
+        Returns:
+            List of (first_unit, last_unit_exclusive, unit_tokens) where
+            unit_tokens is the sum of the packed units' counts
+        """
+        chunks = []
+        first = 0
+        min_last = 1  # Every chunk takes at least one unit the previous one did not
+
+        while first < len(units):
+            tokens = 0
+            last = first
+
+            while last < len(units):
+                unit_tokens, kind = units[last][2], units[last][3]
+                if last >= min_last and (
+                    tokens + unit_tokens > self.chunk_size
+                    or (kind == "heading" and tokens >= self.chunk_size // 2)
+                ):
+                    break
+                tokens += unit_tokens
+                last += 1
+
+            # A trailing heading belongs with the text after it
+            if last < len(units) and last - 1 >= min_last and units[last - 1][3] == "heading":
+                last -= 1
+                tokens -= units[last][2]
+
+            chunks.append((first, last, tokens))
+            if last >= len(units):
+                break
+
+            # Overlap: carry trailing units, leaving room for the next new unit
+            next_first = last
+            carried = 0
+            while next_first - 1 > first:
+                unit_tokens = units[next_first - 1][2]
+                if carried + unit_tokens > self.overlap or carried + unit_tokens + units[last][2] > self.chunk_size:
+                    break
+                next_first -= 1
+                carried += unit_tokens
+
+            first = next_first
+            min_last = last + 1
 
         return chunks
 
-    def _create_chunk_dict(self, section: Dict, chunk_text: str, chunk_idx: int) -> Dict:
+    def _create_chunk_dict(
+        self,
+        section: Dict,
+        text: str,
+        span: Tuple[int, int, int],
+        chunk_idx: int
+    ) -> Dict:
         """
         Create a chunk dictionary from section.
 
         Args:
             section: Original section dict
-            chunk_text: Chunk content
+            text: Section text the span points into
+            span: (char_start, char_end, token_count)
             chunk_idx: Chunk index
 
         Returns:
-            Chunk dict
+            Chunk dict (with the span as char_start/char_end/token_count)
         """
+        char_start, char_end, token_count = span
+
         return {
             "id": f"{section['id']}_chunk_{chunk_idx}",
             "doc_id": section['doc_id'],
             "number": section.get('number', ''),
             "title": f"{section.get('title', '')} (Part {chunk_idx + 1})",
             "level": section.get('level', 1),
-            "content": chunk_text,
+            "content": text[char_start:char_end],
             "chapter": section.get('chapter', ''),
             "parent_section_id": section['id'],  # Link to original section
-            "chunk_index": chunk_idx
+            "chunk_index": chunk_idx,
+            "char_start": char_start,
+            "char_end": char_end,
+            "token_count": token_count
         }
 
 
@@ -145,10 +392,13 @@ if __name__ == "__main__":
     }
 
     print(f"\nOriginal section length: {len(test_section['content'])} chars")
-    print(f"Estimated tokens: {len(test_section['content']) // 4}")
+    print(f"Estimated tokens: {approximate_tokens(test_section['content'])}")
 
     chunks = chunker._split_text(test_section['content'], test_section)
 
     print(f"\nGenerated {len(chunks)} chunks:")
     for chunk in chunks:
-        print(f"  {chunk['id']}: {len(chunk['content'])} chars ({len(chunk['content']) // 4} tokens)")
+        print(
+            f"  {chunk['id']}: chars {chunk['char_start']}-{chunk['char_end']} "
+            f"({chunk['token_count']} tokens)"
+        )
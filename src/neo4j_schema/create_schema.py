@@ -7,10 +7,72 @@ import logging
 sys.path.insert(0, str(Path(__file__).parents[2]))
 
 from src.utils.neo4j_client import Neo4jClient
+from src.utils.embeddings import COMPACT_EMBEDDING_PROPERTIES, get_search_dimension
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Dimension of the *_small vector indexes in schema.cypher
+SCHEMA_COMPACT_DIMENSION = 256
+
+
+def get_index_dimension(client: Neo4jClient, index_name: str):
+    """
+    Read the configured dimension of a vector index.
+
+    Args:
+        client: Neo4jClient instance
+        index_name: Vector index name
+
+    Returns:
+        Dimension, or None if the index does not exist
+    """
+    rows = client.execute(
+        "SHOW INDEXES YIELD name, options WHERE name = $name RETURN options",
+        name=index_name
+    )
+    if not rows:
+        return None
+    config = (rows[0]["options"] or {}).get("indexConfig") or {}
+    dimension = config.get("vector.dimensions")
+    return int(dimension) if dimension is not None else None
+
+
+def ensure_compact_indexes(client: Neo4jClient, dimension: int):
+    """
+    Make the compact (*_small) vector indexes match a dimension.
+
+    `CREATE VECTOR INDEX ... IF NOT EXISTS` keeps an existing index with a
+    different dimension, leaving vectors of the new size unindexed. Such an
+    index is dropped and recreated.
+
+    Args:
+        client: Neo4jClient instance
+        dimension: Compact search dimension
+    """
+    for label, properties in COMPACT_EMBEDDING_PROPERTIES.items():
+        index_name = properties["index"]
+        current = get_index_dimension(client, index_name)
+        if current == dimension:
+            continue
+
+        if current is not None:
+            logger.warning(f"⚠ {index_name} has {current} dimensions, expected {dimension}; recreating")
+            client.execute(f"DROP INDEX {index_name} IF EXISTS")
+
+        client.execute(f"""
+        CREATE VECTOR INDEX {index_name} IF NOT EXISTS
+        FOR (n:{label}) ON (n.{properties['compact']})
+        OPTIONS {{
+          indexConfig: {{
+            `vector.dimensions`: {dimension},
+            `vector.similarity_function`: 'cosine',
+            `vector.quantization.enabled`: true
+          }}
+        }}
+        """)
+        logger.info(f"✓ Created {index_name} ({dimension} dimensions)")
+
 
 def create_schema():
     """Execute schema.cypher to create constraints and indexes."""
@@ -93,6 +155,15 @@ def create_schema():
                 error_count += 1
                 logger.error(f"✗ [{i}/{len(statements)}] Failed to create {stmt_type}: {e}")
 
+    # schema.cypher creates the compact indexes with 256 dimensions
+    search_dimension = get_search_dimension()
+    if search_dimension and search_dimension != SCHEMA_COMPACT_DIMENSION:
+        try:
+            ensure_compact_indexes(client, search_dimension)
+        except Exception as e:
+            error_count += 1
+            logger.error(f"✗ Failed to create {search_dimension}-d compact indexes: {e}")
+
     logger.info("\n=== Schema Creation Summary ===")
     logger.info(f"✓ Successfully created: {success_count}")
     logger.info(f"⊙ Already existed: {skip_count}")
@@ -35,6 +35,10 @@ FOR (o:Organization) REQUIRE o.name IS UNIQUE;
 CREATE CONSTRAINT unique_scenario_id IF NOT EXISTS
 FOR (s:Scenario) REQUIRE s.id IS UNIQUE;
 
+// Graph Statistics (single materialized counters node)
+CREATE CONSTRAINT unique_graph_statistics_id IF NOT EXISTS
+FOR (gs:GraphStatistics) REQUIRE gs.id IS UNIQUE;
+
 
 // ==========================================
 // INDEXES (Query Performance)
@@ -47,6 +51,10 @@ FOR (r:Requirement) ON (r.level, r.subsystem);
 CREATE INDEX requirement_type IF NOT EXISTS
 FOR (r:Requirement) ON (r.type);
 
+// Verification marker maintained by GraphStatistics (unverified listings)
+CREATE INDEX requirement_stats_verified IF NOT EXISTS
+FOR (r:Requirement) ON (r.stats_verified);
+
 // Components
 CREATE INDEX component_type_name IF NOT EXISTS
 FOR (c:Component) ON (c.type, c.name);
@@ -101,6 +109,31 @@ OPTIONS {
   }
 };
 
+// Compact search embeddings (EMBEDDING_SEARCH_DIMENSION=256, int8-quantized index)
+// First-pass candidates are rescored against the full 3072-d vectors
+// These indexes are tied to 256 dimensions. For another EMBEDDING_SEARCH_DIMENSION,
+// create_schema.py / scripts/migrate_compact_embeddings.py drop and recreate them
+// (IF NOT EXISTS alone would keep the 256-d index and leave the vectors unindexed)
+CREATE VECTOR INDEX section_embeddings_small IF NOT EXISTS
+FOR (s:Section) ON (s.content_embedding_small)
+OPTIONS {
+  indexConfig: {
+    `vector.dimensions`: 256,
+    `vector.similarity_function`: 'cosine',
+    `vector.quantization.enabled`: true
+  }
+};
+
+CREATE VECTOR INDEX requirement_embeddings_small IF NOT EXISTS
+FOR (r:Requirement) ON (r.statement_embedding_small)
+OPTIONS {
+  indexConfig: {
+    `vector.dimensions`: 256,
+    `vector.similarity_function`: 'cosine',
+    `vector.quantization.enabled`: true
+  }
+};
+
 // Text Chunks (Layer 1 - optional, for fine-grained search)
 CREATE VECTOR INDEX chunk_embeddings IF NOT EXISTS
 FOR (c:TextChunk) ON (c.embedding)
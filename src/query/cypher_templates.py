@@ -45,7 +45,48 @@ class CypherTemplates:
         return f"""
         // Main requirement
         MATCH (req:Requirement {{id: '{req_id}'}})
+{CypherTemplates._traceability_projection()}"""
 
+    @staticmethod
+    def get_requirement_traceability_batch() -> str:
+        """
+        Get V-Model traceability for a batch of requirements.
+
+        Same projection as get_requirement_traceability(), used at ingest
+        time to materialize traceability documents. Requires parameter
+        $req_ids (list of requirement IDs).
+
+        Returns:
+            Cypher query string (one row per requirement)
+        """
+        return f"""
+        UNWIND $req_ids AS req_id
+        MATCH (req:Requirement {{id: req_id}})
+{CypherTemplates._traceability_projection()}"""
+
+    @staticmethod
+    def get_materialized_traceability(req_id: str) -> str:
+        """
+        Get the precomputed traceability document for a requirement.
+
+        Single unique-index lookup; the document is written by
+        MOSARGraphLoader.materialize_traceability().
+
+        Args:
+            req_id: Requirement ID
+
+        Returns:
+            Cypher query string returning traceability_doc (JSON string or null)
+        """
+        return f"""
+        MATCH (req:Requirement {{id: '{req_id}'}})
+        RETURN req.traceability_doc AS traceability_doc
+        """
+
+    @staticmethod
+    def _traceability_projection() -> str:
+        """Traceability expansion and projection for a bound `req` variable."""
+        return """
         // Upward traceability: Parent requirements
         OPTIONAL MATCH (req)-[:DERIVES_FROM*1..2]->(parent:Requirement)
 
@@ -80,7 +121,7 @@ class CypherTemplates:
 
         // Aggregate child details
         WITH req, parent_ids, test_case_ids, component_ids, interface_ids,
-             collect(DISTINCT CASE WHEN child_node IS NOT NULL THEN {{
+             collect(DISTINCT CASE WHEN child_node IS NOT NULL THEN {
                  id: child_node.id,
                  type: child_node.type,
                  statement: child_node.statement,
@@ -88,7 +129,7 @@ class CypherTemplates:
                  level: child_node.level,
                  test_cases: child_test_ids,
                  components: child_comp_ids
-             }} ELSE null END) as child_details_raw
+             } ELSE null END) as child_details_raw
 
         RETURN
             req.id AS requirement_id,
@@ -149,7 +190,39 @@ class CypherTemplates:
         OPTIONAL MATCH path = (parent)<-[:DERIVES_FROM*1..2]-(descendant:Requirement)
 
         WITH parent, descendant, length(path) as level
-        ORDER BY level, descendant.id
+{CypherTemplates._decomposition_projection()}"""
+
+    @staticmethod
+    def get_requirement_decomposition_closure(req_id: str, max_depth: int = 2) -> str:
+        """
+        Get decomposition tree from the precomputed DERIVES_FROM closure.
+
+        Same result shape as get_requirement_decomposition_tree(), but reads
+        descendants from DERIVES_FROM_CLOSURE relationships (one hop, O(result))
+        instead of expanding variable-length paths. Each descendant appears once
+        at its shortest depth.
+
+        Args:
+            req_id: Top-level requirement ID (e.g., 'FuncR_S110')
+            max_depth: Maximum decomposition depth
+
+        Returns:
+            Cypher query with complete decomposition structure
+        """
+        return f"""
+        MATCH (parent:Requirement {{id: '{req_id}'}})
+
+        // Get all descendants up to max_depth from the closure
+        OPTIONAL MATCH (parent)<-[closure:DERIVES_FROM_CLOSURE]-(descendant:Requirement)
+        WHERE closure.depth <= {max_depth}
+
+        WITH parent, descendant, closure.depth as level
+{CypherTemplates._decomposition_projection()}"""
+
+    @staticmethod
+    def _decomposition_projection() -> str:
+        """Per-descendant tests/components and projection for bound `parent, descendant, level`."""
+        return """        ORDER BY level, descendant.id
 
         // Get tests and components for each descendant
         OPTIONAL MATCH (descendant)<-[:VERIFIES]-(tc:TestCase)
@@ -166,7 +239,7 @@ class CypherTemplates:
             parent.statement as parent_statement,
             parent.type as parent_type,
             parent.level as parent_level,
-            collect({{
+            collect({
                 id: descendant.id,
                 statement: descendant.statement,
                 type: descendant.type,
@@ -176,7 +249,53 @@ class CypherTemplates:
                 components: components,
                 test_count: size(test_cases),
                 component_count: size(components)
-            }}) as descendants
+            }) as descendants
+        """
+
+    @staticmethod
+    def get_requirement_impact(req_id: str) -> str:
+        """
+        Get change impact of a requirement from the DERIVES_FROM closure.
+
+        Shows:
+        - Ancestor requirements (with depth) the requirement contributes to
+        - All descendant requirements (with depth) derived from it
+        - Test cases and components attached to the requirement or any descendant
+
+        Args:
+            req_id: Requirement ID
+
+        Returns:
+            Cypher query string
+        """
+        return f"""
+        MATCH (req:Requirement {{id: '{req_id}'}})
+
+        // Upward: requirements this one contributes to
+        OPTIONAL MATCH (req)-[up:DERIVES_FROM_CLOSURE]->(ancestor:Requirement)
+        WITH req,
+             collect(DISTINCT CASE WHEN ancestor IS NOT NULL
+                 THEN {{id: ancestor.id, depth: up.depth}} END) as ancestors
+
+        // Downward: all derived requirements
+        OPTIONAL MATCH (req)<-[down:DERIVES_FROM_CLOSURE]-(descendant:Requirement)
+        WITH req, ancestors,
+             collect(DISTINCT CASE WHEN descendant IS NOT NULL
+                 THEN {{id: descendant.id, depth: down.depth, statement: descendant.statement}} END) as descendants,
+             [req] + collect(DISTINCT descendant) as affected_requirements
+
+        // Verification and design artifacts affected by a change
+        UNWIND affected_requirements AS affected
+        OPTIONAL MATCH (affected)<-[:VERIFIES]-(tc:TestCase)
+        OPTIONAL MATCH (affected)-[:RELATES_TO]->(comp:Component)
+
+        RETURN
+            req.id AS requirement_id,
+            req.statement AS requirement_statement,
+            ancestors AS ancestor_requirements,
+            descendants AS descendant_requirements,
+            collect(DISTINCT tc.id) AS affected_test_cases,
+            collect(DISTINCT comp.id) AS affected_components
         """
 
     # ===============================
@@ -304,6 +423,31 @@ class CypherTemplates:
             round(100.0 * verified_requirements / total_requirements, 2) AS coverage_percentage
         """
 
+    @staticmethod
+    def get_coverage_summary() -> str:
+        """
+        Get precomputed coverage statistics (single node lookup).
+
+        Same columns as get_test_coverage(), plus per-type/per-subsystem
+        breakdowns and node counts as JSON strings. Maintained incrementally
+        by the loader (see src/utils/graph_statistics.py).
+
+        Returns:
+            Cypher query with coverage metrics
+        """
+        return """
+        MATCH (s:GraphStatistics {id: 'current'})
+        RETURN
+            s.total_requirements AS total_requirements,
+            s.verified_requirements AS verified_requirements,
+            s.total_requirements - s.verified_requirements AS unverified_requirements,
+            s.coverage_percentage AS coverage_percentage,
+            s.by_type_json AS by_type,
+            s.by_subsystem_json AS by_subsystem,
+            s.node_counts_json AS node_counts,
+            s.graph_version AS graph_version
+        """
+
     @staticmethod
     def get_unverified_requirements(req_type: Optional[str] = None) -> str:
         """
@@ -330,6 +474,36 @@ class CypherTemplates:
         ORDER BY req.type, req.id
         """
 
+    @staticmethod
+    def get_unverified_requirements_materialized(req_type: Optional[str] = None) -> str:
+        """
+        Get requirements without test cases from the statistics markers.
+
+        Same columns as get_unverified_requirements(), filtered on the
+        stats_verified marker kept by GraphStatistics (indexed) instead of
+        checking VERIFIES for every requirement.
+
+        Args:
+            req_type: Optional filter by requirement type (FuncR, SafR, PerfR, IntR)
+
+        Returns:
+            Cypher query string
+        """
+        type_filter = f"AND req.type = '{req_type}'" if req_type else ""
+
+        return f"""
+        MATCH (req:Requirement)
+        WHERE req.stats_verified = false
+        {type_filter}
+        RETURN
+            req.id AS requirement_id,
+            req.type AS requirement_type,
+            req.level_subsystem AS subsystem,
+            req.statement AS requirement_statement,
+            req.verification AS verification_method
+        ORDER BY req.type, req.id
+        """
+
     @staticmethod
     def get_test_case_details(test_case_id: str) -> str:
         """
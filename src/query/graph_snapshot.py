@@ -0,0 +1,446 @@
+"""
+Graph Snapshot - In-memory CSR adjacency for template queries
+
+The MOSAR graph (hundreds of requirements, a few thousand sections) fits in
+RAM. This module loads a read-only snapshot of the nodes and relationships the
+Path A templates traverse into array-backed CSR (compressed sparse row)
+adjacency with ID → index maps, and answers those template shapes natively in
+Python/NumPy instead of round-tripping to Neo4j.
+
+Results have the same columns as the corresponding CypherTemplates query.
+List values produced by collect() are returned sorted (Neo4j gives no order
+guarantee for them).
+
+The snapshot records GraphStatistics.graph_version when it is built;
+get_graph_snapshot() rebuilds it when the loader bumps the version. Without
+a GraphStatistics node the version is unknown: the snapshot is then keyed
+by node/relationship counts and also rebuilt after
+GRAPH_SNAPSHOT_UNVERSIONED_TTL_SECONDS.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple, Callable
+
+import numpy as np
+
+from src.utils.neo4j_client import Neo4jClient
+from src.utils.graph_statistics import read_graph_version
+
+logger = logging.getLogger(__name__)
+
+
+# Node properties kept in the snapshot, by label
+NODE_PROPERTIES = {
+    "Requirement": ["id", "type", "statement", "verification", "level"],
+    "TestCase": ["id", "test_type", "description", "status", "procedure"],
+    "Component": ["id", "name"],
+    "Interface": ["id"],
+    "Section": ["id", "title", "content"],
+    "Document": ["id", "title", "type"],
+}
+
+# (relationship type, source label, target label)
+RELATIONSHIPS = [
+    ("DERIVES_FROM", "Requirement", "Requirement"),
+    ("VERIFIES", "TestCase", "Requirement"),
+    ("RELATES_TO", "Requirement", "Component"),
+    ("HAS_INTERFACE", "Component", "Interface"),
+    ("MENTIONS", "Section", "Component"),
+    ("HAS_SECTION", "Document", "Section"),
+]
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    """Sort key placing nulls last, like Cypher ORDER BY."""
+    return (value is None, value if value is not None else "")
+
+
+class CSRAdjacency:
+    """Compressed sparse row adjacency for one relationship direction."""
+
+    def __init__(self, sources: np.ndarray, targets: np.ndarray, num_sources: int):
+        """
+        Build CSR arrays from edge lists.
+
+        Args:
+            sources: Source node indices (int32)
+            targets: Target node indices (int32)
+            num_sources: Number of nodes with the source label
+        """
+        order = np.argsort(sources, kind="stable")
+        self.indices = targets[order].astype(np.int32)
+        self.indptr = np.zeros(num_sources + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=num_sources), out=self.indptr[1:])
+
+    def neighbors(self, index: int) -> np.ndarray:
+        """Get neighbor indices of one node."""
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def neighbors_of(self, indices: np.ndarray) -> np.ndarray:
+        """Get the distinct neighbors of a set of nodes."""
+        if len(indices) == 0:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([self.neighbors(i) for i in indices]))
+
+
+class GraphSnapshot:
+    """Read-only in-memory snapshot answering CypherTemplates query shapes."""
+
+    def __init__(self):
+        """Initialize empty snapshot (use load())."""
+        self.index: Dict[str, Dict[str, int]] = {}
+        self.nodes: Dict[str, List[Dict[str, Any]]] = {}
+        self.forward: Dict[str, CSRAdjacency] = {}
+        self.reverse: Dict[str, CSRAdjacency] = {}
+        self.graph_version: Optional[int] = None
+        self.loaded_at: float = 0.0
+
+        # Template name -> native implementation
+        self.handlers: Dict[str, Callable[[str], List[Dict[str, Any]]]] = {
+            "get_requirement_traceability": self.requirement_traceability,
+            "get_requirement_dependencies": self.requirement_dependencies,
+            "get_requirement_decomposition_tree": self.requirement_decomposition_tree,
+            "get_component_requirements": self.component_requirements,
+            "get_component_tests": self.component_tests,
+            "get_test_case_details": self.test_case_details,
+            "get_sections_mentioning_component": self.sections_mentioning_component,
+        }
+
+    @classmethod
+    def load(cls, client: Neo4jClient, graph_version: Optional[int] = None) -> "GraphSnapshot":
+        """
+        Load a snapshot from Neo4j.
+
+        Args:
+            client: Neo4jClient instance
+            graph_version: GraphStatistics.graph_version at load time
+
+        Returns:
+            Loaded GraphSnapshot
+        """
+        start_time = time.time()
+        snapshot = cls()
+
+        for label, properties in NODE_PROPERTIES.items():
+            projection = ", ".join(f"n.{prop} AS {prop}" for prop in properties)
+            rows = client.execute(f"MATCH (n:{label}) WHERE n.id IS NOT NULL RETURN {projection} ORDER BY n.id")
+            snapshot.nodes[label] = rows
+            snapshot.index[label] = {row["id"]: i for i, row in enumerate(rows)}
+
+        for rel_type, source_label, target_label in RELATIONSHIPS:
+            rows = client.execute(
+                f"MATCH (a:{source_label})-[:{rel_type}]->(b:{target_label}) RETURN a.id AS source, b.id AS target"
+            )
+            source_index = snapshot.index[source_label]
+            target_index = snapshot.index[target_label]
+
+            pairs = {
+                (source_index[row["source"]], target_index[row["target"]])
+                for row in rows
+                if row["source"] in source_index and row["target"] in target_index
+            }
+            edges = np.array(sorted(pairs), dtype=np.int32).reshape(-1, 2)
+
+            snapshot.forward[rel_type] = CSRAdjacency(edges[:, 0], edges[:, 1], len(snapshot.nodes[source_label]))
+            snapshot.reverse[rel_type] = CSRAdjacency(edges[:, 1], edges[:, 0], len(snapshot.nodes[target_label]))
+
+        snapshot.graph_version = graph_version
+        snapshot.loaded_at = time.time()
+
+        logger.info(
+            f"✓ Graph snapshot loaded: {sum(len(n) for n in snapshot.nodes.values())} nodes, "
+            f"{sum(len(a.indices) for a in snapshot.forward.values())} relationships "
+            f"in {snapshot.loaded_at - start_time:.2f}s (graph_version={graph_version})"
+        )
+        return snapshot
+
+    # ----- helpers -----
+
+    def _ids(self, label: str, indices: np.ndarray) -> List[str]:
+        """Sorted IDs for node indices."""
+        return sorted(self.nodes[label][i]["id"] for i in indices)
+
+    def _within_two_hops(self, adjacency: CSRAdjacency, index: int) -> np.ndarray:
+        """Nodes reachable in 1..2 hops (DERIVES_FROM*1..2)."""
+        first = adjacency.neighbors(index)
+        return np.union1d(first, adjacency.neighbors_of(first)).astype(np.int32)
+
+    def _requirement_details(self, req_index: int) -> Dict[str, Any]:
+        """Child requirement entry used by traceability templates."""
+        req = self.nodes["Requirement"][req_index]
+        return {
+            "id": req["id"],
+            "type": req["type"],
+            "statement": req["statement"],
+            "verification": req["verification"],
+            "level": req["level"],
+            "test_cases": self._ids("TestCase", self.reverse["VERIFIES"].neighbors(req_index)),
+            "components": self._ids("Component", self.forward["RELATES_TO"].neighbors(req_index)),
+        }
+
+    # ----- template implementations -----
+
+    def execute(self, template_name: str, entity_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answer a template query from the snapshot.
+
+        Args:
+            template_name: CypherTemplates method name
+            entity_id: Entity ID passed to the template
+
+        Returns:
+            Results with the template's columns, or None if the template
+            is not supported (caller should use Neo4j)
+        """
+        handler = self.handlers.get(template_name)
+        return handler(entity_id) if handler else None
+
+    def requirement_traceability(self, req_id: str) -> List[Dict[str, Any]]:
+        """Native get_requirement_traceability()."""
+        req_index = self.index["Requirement"].get(req_id)
+        if req_index is None:
+            return []
+
+        req = self.nodes["Requirement"][req_index]
+        components = self.forward["RELATES_TO"].neighbors(req_index)
+        children = self._within_two_hops(self.reverse["DERIVES_FROM"], req_index)
+
+        return [{
+            "requirement_id": req["id"],
+            "requirement_statement": req["statement"],
+            "requirement_type": req["type"],
+            "requirement_level": req["level"],
+            "verification_method": req["verification"],
+            "test_cases": self._ids("TestCase", self.reverse["VERIFIES"].neighbors(req_index)),
+            "related_components": self._ids("Component", components),
+            "related_interfaces": self._ids("Interface", self.forward["HAS_INTERFACE"].neighbors_of(components)),
+            "parent_requirements": self._ids("Requirement", self._within_two_hops(self.forward["DERIVES_FROM"], req_index)),
+            "child_requirements": sorted(
+                (self._requirement_details(i) for i in children), key=lambda c: c["id"]
+            ),
+        }]
+
+    def requirement_dependencies(self, req_id: str) -> List[Dict[str, Any]]:
+        """Native get_requirement_dependencies()."""
+        req_index = self.index["Requirement"].get(req_id)
+        if req_index is None:
+            return []
+
+        req = self.nodes["Requirement"][req_index]
+        return [{
+            "requirement_id": req["id"],
+            "statement": req["statement"],
+            "parent_requirements": self._ids("Requirement", self.forward["DERIVES_FROM"].neighbors(req_index)),
+            "child_requirements": self._ids("Requirement", self.reverse["DERIVES_FROM"].neighbors(req_index)),
+        }]
+
+    def requirement_decomposition_tree(self, req_id: str) -> List[Dict[str, Any]]:
+        """Native get_requirement_decomposition_tree() (one entry per descendant and path length)."""
+        req_index = self.index["Requirement"].get(req_id)
+        if req_index is None:
+            return []
+
+        parent = self.nodes["Requirement"][req_index]
+        children = self.reverse["DERIVES_FROM"]
+        level_one = children.neighbors(req_index)
+        level_two = children.neighbors_of(level_one)
+
+        descendants = []
+        for level, indices in ((1, level_one), (2, level_two)):
+            for i in sorted(indices, key=lambda i: self.nodes["Requirement"][i]["id"]):
+                details = self._requirement_details(i)
+                descendants.append({
+                    "id": details["id"],
+                    "statement": details["statement"],
+                    "type": details["type"],
+                    "level": level,
+                    "verification": details["verification"],
+                    "test_cases": details["test_cases"],
+                    "components": details["components"],
+                    "test_count": len(details["test_cases"]),
+                    "component_count": len(details["components"]),
+                })
+
+        if not descendants:
+            # OPTIONAL MATCH without matches collects one all-null entry
+            descendants.append({
+                "id": None, "statement": None, "type": None, "level": None, "verification": None,
+                "test_cases": [], "components": [], "test_count": 0, "component_count": 0,
+            })
+
+        return [{
+            "parent_id": parent["id"],
+            "parent_statement": parent["statement"],
+            "parent_type": parent["type"],
+            "parent_level": parent["level"],
+            "descendants": descendants,
+        }]
+
+    def component_requirements(self, component_id: str) -> List[Dict[str, Any]]:
+        """Native get_component_requirements() (one row per directly related requirement)."""
+        comp_index = self.index["Component"].get(component_id)
+        if comp_index is None:
+            return []
+
+        rows = []
+        for req_index in self.reverse["RELATES_TO"].neighbors(comp_index):
+            req = self.nodes["Requirement"][req_index]
+            children = self._within_two_hops(self.reverse["DERIVES_FROM"], req_index)
+            test_cases = self._ids("TestCase", self.reverse["VERIFIES"].neighbors(req_index))
+
+            rows.append({
+                "requirement_id": req["id"],
+                "requirement_type": req["type"],
+                "requirement_statement": req["statement"],
+                "verification_method": req["verification"],
+                "requirement_level": req["level"],
+                "parent_requirements": self._ids("Requirement", self._within_two_hops(self.forward["DERIVES_FROM"], req_index)),
+                "child_requirement_ids": self._ids("Requirement", children),
+                "child_requirements": sorted(
+                    (self._requirement_details(i) for i in children), key=lambda c: c["id"]
+                ),
+                "test_case_count": len(test_cases),
+                "test_cases": test_cases,
+            })
+
+        return sorted(rows, key=lambda r: (_sort_key(r["requirement_type"]), r["requirement_id"]))
+
+    def component_tests(self, component_id: str) -> List[Dict[str, Any]]:
+        """Native get_component_tests()."""
+        comp_index = self.index["Component"].get(component_id)
+        if comp_index is None:
+            return []
+
+        verified_by_test: Dict[int, set] = {}
+        for req_index in self.reverse["RELATES_TO"].neighbors(comp_index):
+            for tc_index in self.reverse["VERIFIES"].neighbors(req_index):
+                verified_by_test.setdefault(int(tc_index), set()).add(self.nodes["Requirement"][req_index]["id"])
+
+        rows = []
+        for tc_index, req_ids in verified_by_test.items():
+            tc = self.nodes["TestCase"][tc_index]
+            rows.append({
+                "test_case_id": tc["id"],
+                "test_type": tc["test_type"],
+                "description": tc["description"],
+                "status": tc["status"],
+                "verified_requirements": sorted(req_ids),
+            })
+
+        return sorted(rows, key=lambda r: (_sort_key(r["test_type"]), r["test_case_id"]))
+
+    def test_case_details(self, test_case_id: str) -> List[Dict[str, Any]]:
+        """Native get_test_case_details()."""
+        tc_index = self.index["TestCase"].get(test_case_id)
+        if tc_index is None:
+            return []
+
+        tc = self.nodes["TestCase"][tc_index]
+        requirements = [self.nodes["Requirement"][i] for i in self.forward["VERIFIES"].neighbors(tc_index)]
+
+        return [{
+            "test_case_id": tc["id"],
+            "test_type": tc["test_type"],
+            "description": tc["description"],
+            "status": tc["status"],
+            "procedure": tc["procedure"],
+            "verified_requirements": sorted(r["id"] for r in requirements),
+            "requirement_statements": sorted({r["statement"] for r in requirements if r["statement"] is not None}),
+        }]
+
+    def sections_mentioning_component(self, component_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Native get_sections_mentioning_component()."""
+        comp_index = self.index["Component"].get(component_id)
+        if comp_index is None:
+            return []
+
+        rows = []
+        for section_index in self.reverse["MENTIONS"].neighbors(comp_index):
+            section = self.nodes["Section"][section_index]
+            for doc_index in self.reverse["HAS_SECTION"].neighbors(section_index):
+                doc = self.nodes["Document"][doc_index]
+                rows.append({
+                    "section_id": section["id"],
+                    "section_title": section["title"],
+                    "content": section["content"],
+                    "document": doc["title"],
+                    "doc_type": doc["type"],
+                })
+
+        rows.sort(key=lambda r: (_sort_key(r["doc_type"]), r["section_id"]))
+        return rows[:limit]
+
+
+# ----- process-wide snapshot -----
+
+_snapshot: Optional[GraphSnapshot] = None
+_snapshot_fingerprint: Optional[str] = None
+_snapshot_checked_at: float = 0.0
+_snapshot_lock = threading.Lock()
+
+
+def _graph_fingerprint(client: Neo4jClient) -> Tuple[Optional[int], str]:
+    """
+    Identify the current graph state.
+
+    Args:
+        client: Neo4jClient instance
+
+    Returns:
+        Tuple of (graph_version, fingerprint); without a graph_version the
+        fingerprint falls back to node and relationship counts (count store
+        lookups)
+    """
+    graph_version = read_graph_version(client)
+    if graph_version is not None:
+        return graph_version, f"version:{graph_version}"
+
+    nodes = client.execute("MATCH (n) RETURN count(n) AS count")[0]["count"]
+    relationships = client.execute("MATCH ()-[r]->() RETURN count(r) AS count")[0]["count"]
+    return None, f"counts:{nodes}:{relationships}"
+
+
+def get_graph_snapshot() -> GraphSnapshot:
+    """
+    Get the process-wide snapshot, rebuilding it when the graph version changes.
+
+    The version is checked at most every GRAPH_SNAPSHOT_CHECK_SECONDS (default 30).
+    When GraphStatistics is missing, node/relationship counts stand in for
+    the version and the snapshot is at most
+    GRAPH_SNAPSHOT_UNVERSIONED_TTL_SECONDS (default 300) old.
+
+    Returns:
+        Current GraphSnapshot
+    """
+    global _snapshot, _snapshot_fingerprint, _snapshot_checked_at
+
+    check_interval = float(os.getenv("GRAPH_SNAPSHOT_CHECK_SECONDS", "30"))
+    unversioned_ttl = float(os.getenv("GRAPH_SNAPSHOT_UNVERSIONED_TTL_SECONDS", "300"))
+    if _snapshot is not None and time.time() - _snapshot_checked_at < check_interval:
+        return _snapshot
+
+    with _snapshot_lock:
+        if _snapshot is not None and time.time() - _snapshot_checked_at < check_interval:
+            return _snapshot
+
+        client = Neo4jClient()
+        try:
+            graph_version, fingerprint = _graph_fingerprint(client)
+            expired = (
+                graph_version is None and _snapshot is not None
+                and time.time() - _snapshot.loaded_at >= unversioned_ttl
+            )
+            if _snapshot is None or fingerprint != _snapshot_fingerprint or expired:
+                if _snapshot is not None:
+                    reason = "expired" if fingerprint == _snapshot_fingerprint else "changed"
+                    logger.info(f"Graph {reason} ({_snapshot_fingerprint} → {fingerprint}), reloading snapshot")
+                _snapshot = GraphSnapshot.load(client, graph_version)
+                _snapshot_fingerprint = fingerprint
+            _snapshot_checked_at = time.time()
+        finally:
+            client.close()
+
+    return _snapshot
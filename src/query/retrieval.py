@@ -0,0 +1,340 @@
+"""
+Retrieval Helpers - Fulltext queries, rank fusion and result diversification
+
+Vector search alone misses exact identifiers ("HOTDOCK", "IntR_S102") that
+embed poorly. The fulltext (BM25) indexes in schema.cypher match them exactly;
+reciprocal rank fusion (RRF) combines both rankings without having to
+calibrate their incompatible score scales.
+
+Requirement statements have their own vector index; `merge_normalized_scores`
+interleaves requirement and section results by per-source normalized score.
+
+`adaptive_cutoff` picks how many results to keep from the score
+distribution instead of a fixed k.
+
+TextChunker splits long sections into overlapping `_chunk_N` nodes, so raw
+top-k results often repeat the same section. `collapse_chunks` merges them
+back per parent section and `maximal_marginal_relevance` picks a diverse
+subset of the remaining candidates.
+"""
+
+import re
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Lucene query syntax characters that must be escaped in user input
+_LUCENE_SPECIAL_CHARS = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+# Uppercase boolean operators are interpreted by the Lucene query parser
+_LUCENE_OPERATORS = {"AND", "OR", "NOT", "TO"}
+
+
+def escape_lucene(text: str) -> str:
+    """
+    Escape a user question for db.index.fulltext.queryNodes.
+
+    Special characters are backslash-escaped and boolean operators are
+    lowercased, so the question is parsed as plain OR-ed terms.
+
+    Args:
+        text: Raw user question
+
+    Returns:
+        Lucene-safe query string
+    """
+    escaped = _LUCENE_SPECIAL_CHARS.sub(r'\\\1', text)
+    return " ".join(
+        token.lower() if token in _LUCENE_OPERATORS else token
+        for token in escaped.split()
+    )
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, List[Dict[str, Any]]],
+    weights: Optional[Dict[str, float]] = None,
+    k: int = 60,
+    id_key: str = "section_id",
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked result lists with weighted reciprocal rank fusion.
+
+    fused_score(d) = sum over retrievers r of weight_r / (k + rank_r(d)),
+    with 1-based ranks. Each fused item keeps the fields of its first
+    occurrence, `score` is replaced by the fused score and the original
+    per-retriever ranks/scores are kept for diagnostics.
+
+    Args:
+        rankings: Retriever name -> results ordered best first
+        weights: Retriever name -> weight (default 1.0)
+        k: RRF constant (dampens the influence of top ranks)
+        id_key: Field identifying the same document across retrievers
+        limit: Maximum results to return
+
+    Returns:
+        Fused results ordered by fused score
+    """
+    weights = weights or {}
+    fused: Dict[Any, Dict[str, Any]] = {}
+
+    for retriever, results in rankings.items():
+        weight = weights.get(retriever, 1.0)
+
+        for rank, item in enumerate(results, start=1):
+            doc_id = item[id_key]
+
+            if doc_id not in fused:
+                fused[doc_id] = {
+                    **item,
+                    "score": 0.0,
+                    "retrieval_ranks": {},
+                    "retrieval_scores": {}
+                }
+
+            entry = fused[doc_id]
+            entry["score"] += weight / (k + rank)
+            entry["retrieval_ranks"][retriever] = rank
+            entry["retrieval_scores"][retriever] = item.get("score")
+
+    results = sorted(fused.values(), key=lambda item: item["score"], reverse=True)
+    return results[:limit] if limit else results
+
+
+def merge_normalized_scores(
+    rankings: Dict[str, List[Dict[str, Any]]],
+    weights: Optional[Dict[str, float]] = None,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Merge result lists from different indexes by normalized score.
+
+    Each list's scores are divided by its best score (so every source's top
+    hit scores its weight), which keeps the relative gaps within a source
+    while making sources with different score ranges comparable. The
+    original score is kept as `raw_score` and the source as
+    `retrieval_source`.
+
+    Args:
+        rankings: Source name -> results with a 'score' field
+        weights: Source name -> weight (default 1.0)
+        limit: Maximum results to return
+
+    Returns:
+        Merged results ordered by weighted normalized score
+    """
+    weights = weights or {}
+    merged = []
+
+    for source, results in rankings.items():
+        if not results:
+            continue
+
+        top_score = max(item["score"] for item in results)
+        weight = weights.get(source, 1.0)
+
+        for item in results:
+            merged.append({
+                **item,
+                "score": weight * item["score"] / top_score if top_score > 0 else 0.0,
+                "raw_score": item["score"],
+                "retrieval_source": source
+            })
+
+    merged.sort(key=lambda item: item["score"], reverse=True)
+    return merged[:limit] if limit else merged
+
+
+def adaptive_cutoff(
+    scores: Sequence[float],
+    min_k: int = 3,
+    max_k: int = 20,
+    relative_threshold: float = 0.9,
+    max_gap: float = 0.05
+) -> Tuple[List[int], str]:
+    """
+    Choose which results to keep from a score distribution.
+
+    Scores are divided by the top score first, so the thresholds apply alike
+    to cosine scores and to RRF scores (~0.016). Walking the scores in
+    descending order, the cut is placed before the first score that falls
+    below `relative_threshold`, or that drops more than `max_gap` below its
+    predecessor. The number kept is clamped to [min_k, max_k].
+
+    Args:
+        scores: Candidate scores (in any order, e.g. MMR selection order)
+        min_k: Minimum results to keep
+        max_k: Maximum results to keep
+        relative_threshold: Keep scores >= top score x threshold
+        max_gap: Largest allowed drop between consecutive scores, as a
+                 fraction of the top score
+
+    Returns:
+        Tuple of (indices of the kept scores in descending score order,
+        reason) with reason in 'threshold', 'gap', 'max_k', 'min_k' or 'all'
+    """
+    order = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+    if len(order) <= min_k:
+        return order, "all"
+
+    top_score = scores[order[0]]
+    ordered = [scores[i] / top_score for i in order] if top_score > 0 else [scores[i] for i in order]
+
+    limit = min(len(ordered), max_k)
+    cut, reason = limit, "max_k" if len(ordered) > max_k else "all"
+
+    for index in range(1, limit):
+        if ordered[index] < ordered[0] * relative_threshold:
+            cut, reason = index, "threshold"
+            break
+        if ordered[index - 1] - ordered[index] > max_gap:
+            cut, reason = index, "gap"
+            break
+
+    if cut < min_k:
+        return order[:min_k], "min_k"
+    return order[:cut], reason
+
+
+# Chunk titles are "<section title> (Part N)" (see TextChunker._create_chunk_dict)
+_CHUNK_TITLE_SUFFIX = re.compile(r"\s*\(Part \d+\)$")
+
+# Shortest suffix/prefix match treated as chunker overlap rather than coincidence
+_MIN_CHUNK_OVERLAP_CHARS = 20
+
+
+def _merge_chunk_text(left: str, right: str) -> str:
+    """Join two adjacent chunks, dropping the overlap the chunker duplicated."""
+    for size in range(min(len(left), len(right)), _MIN_CHUNK_OVERLAP_CHARS - 1, -1):
+        if left.endswith(right[:size]):
+            return left + right[size:]
+    return f"{left} {right}"
+
+
+def join_chunk_contents(chunks: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Join chunk texts ordered by `chunk_index`.
+
+    Adjacent chunks are merged with their overlap removed; gaps are marked
+    with "...".
+
+    Args:
+        chunks: Dicts with 'content' and 'chunk_index', ordered by chunk_index
+
+    Returns:
+        Joined text, or None if any chunk has no content loaded (lazy content)
+    """
+    if any(chunk.get("content") is None for chunk in chunks):
+        return None
+
+    content = chunks[0]["content"]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        if (chunk.get("chunk_index") or 0) == (previous.get("chunk_index") or 0) + 1:
+            content = _merge_chunk_text(content, chunk["content"])
+        else:
+            content = f"{content} ... {chunk['content']}"
+    return content
+
+
+def collapse_chunks(sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse chunk results into one result per parent section.
+
+    Chunks of the same parent are ordered by `chunk_index` and their texts
+    joined with `join_chunk_contents` (None while content is not loaded). Each
+    collapsed result keeps the fields of its best-scoring chunk, uses the
+    parent ID and title, and lists the merged `chunk_ids` and their
+    `chunk_hashes`. Results without a `parent_section_id` pass through
+    unchanged.
+
+    Args:
+        sections: Results ordered best first
+
+    Returns:
+        Collapsed results ordered by best chunk score
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+
+    for section in sections:
+        parent_id = section.get("parent_section_id") or section["section_id"]
+        groups.setdefault(parent_id, []).append(section)
+
+    collapsed = []
+    for parent_id, members in groups.items():
+        best = members[0]
+
+        if len(members) == 1 and not best.get("parent_section_id"):
+            collapsed.append(best)
+            continue
+
+        ordered = sorted(members, key=lambda item: item.get("chunk_index") or 0)
+
+        merged = {
+            **best,
+            "section_id": parent_id,
+            "title": _CHUNK_TITLE_SUFFIX.sub("", best["title"] or ""),
+            "content": join_chunk_contents(ordered),
+            "chunk_ids": [chunk["section_id"] for chunk in ordered],
+            "chunk_hashes": [chunk.get("content_hash") for chunk in ordered]
+        }
+        merged.pop("chunk_index", None)
+        merged.pop("content_hash", None)
+        collapsed.append(merged)
+
+    return collapsed
+
+
+def maximal_marginal_relevance(
+    relevance: Sequence[float],
+    embeddings: Sequence[Optional[np.ndarray]],
+    k: int,
+    lambda_mult: float = 0.7
+) -> List[int]:
+    """
+    Select a relevant but diverse subset with maximal marginal relevance.
+
+    At each step picks the candidate maximizing
+    lambda * relevance - (1 - lambda) * max cosine similarity to the selected
+    set. Relevance is min-max normalized so fused (RRF) and cosine scores
+    behave alike; candidates without an embedding are treated as dissimilar
+    to everything.
+
+    Args:
+        relevance: Candidate relevance scores
+        embeddings: Candidate embeddings (None if unavailable)
+        k: Number of candidates to select
+        lambda_mult: Relevance/diversity trade-off (1.0 = relevance only)
+
+    Returns:
+        Selected candidate indices in selection order
+    """
+    count = len(relevance)
+    if count == 0 or k <= 0:
+        return []
+
+    scores = np.asarray(relevance, dtype=np.float32)
+    spread = scores.max() - scores.min()
+    scores = (scores - scores.min()) / spread if spread > 0 else np.ones_like(scores)
+
+    dimension = max((len(e) for e in embeddings if e is not None), default=1)
+    matrix = np.zeros((count, dimension), dtype=np.float32)
+    for row, embedding in enumerate(embeddings):
+        if embedding is not None:
+            matrix[row] = embedding
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+    similarity = matrix @ matrix.T
+
+    selected: List[int] = []
+    max_similarity = np.zeros(count, dtype=np.float32)
+    available = np.ones(count, dtype=bool)
+
+    for _ in range(min(k, count)):
+        marginal = lambda_mult * scores - (1 - lambda_mult) * max_similarity
+        marginal[~available] = -np.inf
+        index = int(np.argmax(marginal))
+        selected.append(index)
+        available[index] = False
+        max_similarity = np.maximum(max_similarity, similarity[index])
+
+    return selected
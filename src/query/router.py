@@ -7,6 +7,7 @@ Determines the optimal query path based on entity detection:
 - Path C: Pure Vector (no entity match, exploratory)
 """
 
+import os
 import re
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
@@ -24,6 +25,43 @@ class QueryPath(str, Enum):
     PURE_VECTOR = "pure_vector"
 
 
+# Coverage/summary questions answered from the GraphStatistics node
+# (checked in order: the first template whose keywords match wins)
+STATISTICS_TEMPLATE_KEYWORDS = [
+    ("get_unverified_requirements", [
+        'unverified', 'untested', 'not verified', 'not tested', 'without test',
+        '미검증', '검증되지 않은', '테스트되지 않은'
+    ]),
+    ("get_requirements_by_type", [
+        'by type', 'per type', 'each type', '유형별', '타입별', '종류별'
+    ]),
+    ("get_database_stats", [
+        'node count', 'how many nodes', 'database statistics', 'database stats', 'graph statistics',
+        '노드 수', '노드 개수', '데이터베이스 통계', '그래프 통계'
+    ]),
+    ("get_test_coverage", [
+        'coverage', 'verification rate', '커버리지', '검증률', '검증 비율'
+    ]),
+]
+
+
+def detect_statistics_template(user_question: str) -> Optional[str]:
+    """
+    Detect coverage/summary questions that need no entity.
+
+    Args:
+        user_question: User's natural language question
+
+    Returns:
+        Name of the matching CypherTemplates method, or None
+    """
+    question_lower = user_question.lower()
+    for template_method, keywords in STATISTICS_TEMPLATE_KEYWORDS:
+        if any(keyword in question_lower for keyword in keywords):
+            return template_method
+    return None
+
+
 class QueryRouter:
     """
     Routes user queries to the optimal execution path based on entity detection.
@@ -79,6 +117,13 @@ class QueryRouter:
         if explicit_entities:
             return self._route_to_pure_cypher(explicit_entities)
 
+        # Step 1b: Coverage/summary questions are answered from materialized statistics
+        if os.getenv("USE_MATERIALIZED_STATISTICS", "false").lower() == "true":
+            statistics_template = detect_statistics_template(user_question)
+            if statistics_template:
+                logger.info(f"Detected statistics question: {statistics_template}")
+                return self._route_to_pure_cypher({})
+
         # Step 2: Use Entity Dictionary for fuzzy matching
         resolved_entities = self.entity_resolver.resolve_entities_in_text(user_question)
 
@@ -0,0 +1,96 @@
+"""
+Retrieval Scope - Document/chapter filters for vector search
+
+Users often scope questions to one document or chapter ("in the DDD",
+"chapter 4 of the PDD", "PDD 4장"). The scope is detected from the question
+(or passed explicitly) and pushed into retrieval as a filter on the
+Section (doc_id, chapter) properties, which are covered by the
+`section_doc_chapter` index.
+"""
+
+import re
+from typing import Dict, List, Optional, Any
+
+# Section.doc_id values and the phrases that refer to them
+DOCUMENT_ALIASES = {
+    "PDD": [r"\bPDD\b", r"preliminary design", r"예비\s*설계"],
+    "DDD": [r"\bDDD\b", r"detailed design", r"상세\s*설계"],
+}
+
+SCOPE_DOCUMENTS = list(DOCUMENT_ALIASES)
+
+# Questions about the SRD or a specific requirement are never section-scoped
+# ("section 3 of the SRD", "chapter 2 ... FuncR_S101")
+_UNSCOPED_PATTERNS = [
+    re.compile(r"\bSRD\b|system requirements? document|요구사항\s*문서", re.IGNORECASE),
+    re.compile(r"(?:FuncR|SafR|PerfR|IntR|ConfR|DesR)_[A-Z]\d{3}", re.IGNORECASE),
+]
+
+# "chapter 4", "ch. 4", "section 4.2" (-> chapter 4), "4장", "4장의" - but not
+# words starting with 장 ("3 장치", "10장비"): only particles may follow 장
+_CHAPTER_PARTICLES = r"(?:의|에서|에|은|는|을|를|과|와|도|까지|부터)?"
+_CHAPTER_PATTERNS = [
+    re.compile(r"\bchapter\s+(\d+)", re.IGNORECASE),
+    re.compile(r"\bch\.?\s*(\d+)\b", re.IGNORECASE),
+    re.compile(r"\bsection\s+(\d+)(?:\.\d+)*\b", re.IGNORECASE),
+    re.compile(r"(\d+)\s*장" + _CHAPTER_PARTICLES + r"(?![가-힣])"),
+]
+
+
+def detect_scope(question: str) -> Optional[Dict[str, Any]]:
+    """
+    Detect a document/chapter scope in a question.
+
+    Args:
+        question: User question
+
+    Returns:
+        Scope dict {'doc_ids': [...], 'chapters': [...] or None,
+        'documents_named': bool}, or None if the question is not scoped
+        (or is about the SRD or a requirement ID)
+    """
+    if any(pattern.search(question) for pattern in _UNSCOPED_PATTERNS):
+        return None
+
+    doc_ids = [
+        doc_id
+        for doc_id, patterns in DOCUMENT_ALIASES.items()
+        if any(re.search(pattern, question, re.IGNORECASE) for pattern in patterns)
+    ]
+
+    chapters: List[str] = []
+    for pattern in _CHAPTER_PATTERNS:
+        for chapter in pattern.findall(question):
+            if chapter not in chapters:
+                chapters.append(chapter)
+
+    if not doc_ids and not chapters:
+        return None
+
+    return normalize_scope({"doc_ids": doc_ids, "chapters": chapters})
+
+
+def normalize_scope(scope: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize an explicit or detected scope.
+
+    Missing documents default to all scoped documents; chapters are
+    compared as strings (Section.chapter is the leading section number).
+    'documents_named' records whether a design document was given, i.e.
+    whether the question is confined to design documents.
+
+    Args:
+        scope: Dict with optional 'doc_ids' and 'chapters'
+
+    Returns:
+        Scope dict with 'doc_ids' (list), 'chapters' (list or None) and
+        'documents_named' (bool)
+    """
+    doc_ids = [str(doc_id).upper() for doc_id in scope.get("doc_ids") or []]
+    chapters = [str(chapter) for chapter in scope.get("chapters") or []]
+
+    return {
+        "doc_ids": doc_ids or list(SCOPE_DOCUMENTS),
+        "chapters": chapters or None,
+        "documents_named": bool(doc_ids)
+    }
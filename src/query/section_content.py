@@ -0,0 +1,188 @@
+"""
+Section Content Hydration - Load section text only where it is consumed
+
+With USE_LAZY_CONTENT=true, vector search returns section IDs, titles and
+scores without `content`. Downstream nodes only use the top few sections
+(NER: 5, synthesis: 3-5), so they call `hydrate_sections` for exactly
+those, which loads the missing text in one batched query and caches it by
+(section ID, content_hash). Search results carry the hash, so a section
+rewritten under the same ID by an incremental load misses the cache.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+from src.query.retrieval import join_chunk_contents
+from src.utils.neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+SECTION_CONTENT_QUERY = """
+UNWIND $section_ids AS section_id
+MATCH (s:Section {id: section_id})
+RETURN s.id AS section_id, s.content AS content, s.chunk_index AS chunk_index,
+       s.content_hash AS content_hash
+"""
+
+# (section ID, content_hash); the hash is None for sections loaded before it existed
+SectionKey = Tuple[str, Optional[str]]
+
+
+def is_lazy_content_enabled() -> bool:
+    """Check whether vector search should omit section content (USE_LAZY_CONTENT)."""
+    return os.getenv("USE_LAZY_CONTENT", "false").lower() == "true"
+
+
+class SectionContentCache:
+    """
+    Thread-safe LRU cache of section content by (section ID, content_hash).
+
+    A rewritten section gets a new content hash, so entries never go stale
+    and do not expire; replaced versions age out through LRU eviction.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of cached sections
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: List[SectionKey]) -> Dict[SectionKey, Dict[str, Any]]:
+        """
+        Get cached entries.
+
+        Args:
+            keys: (section ID, content_hash) pairs
+
+        Returns:
+            Key -> {'content', 'chunk_index'} for cached keys
+        """
+        with self._lock:
+            found = {}
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+            return found
+
+    def set_many(self, entries: Dict[SectionKey, Dict[str, Any]]):
+        """
+        Cache entries, evicting least recently used ones.
+
+        Args:
+            entries: (section ID, content_hash) -> {'content', 'chunk_index'}
+        """
+        with self._lock:
+            for key, entry in entries.items():
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clear all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global instance (singleton)
+_section_content_cache: Optional[SectionContentCache] = None
+
+
+def get_section_content_cache() -> SectionContentCache:
+    """
+    Get the section content cache (singleton).
+
+    Environment Variables:
+        SECTION_CONTENT_CACHE_SIZE: Maximum cached sections (default: 1000)
+
+    Returns:
+        SectionContentCache instance
+    """
+    global _section_content_cache
+
+    if _section_content_cache is None:
+        _section_content_cache = SectionContentCache(
+            max_size=int(os.getenv("SECTION_CONTENT_CACHE_SIZE", "1000"))
+        )
+
+    return _section_content_cache
+
+
+def _section_keys(section: Dict[str, Any]) -> List[SectionKey]:
+    """Cache keys of the nodes holding a section's text (its chunks when collapsed)."""
+    chunk_ids = section.get("chunk_ids")
+    if chunk_ids:
+        hashes = section.get("chunk_hashes") or [None] * len(chunk_ids)
+        return list(zip(chunk_ids, hashes))
+    return [(section["section_id"], section.get("content_hash"))]
+
+
+def hydrate_sections(
+    sections: List[Dict[str, Any]],
+    limit: Optional[int] = None,
+    client: Optional[Neo4jClient] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load `content` for the first `limit` sections that were returned without it.
+
+    Collapsed results (with `chunk_ids`) get their chunk texts joined. The
+    cache is looked up by each section's `content_hash` (`chunk_hashes` for
+    collapsed results); misses are fetched in one query. Sections that
+    already have content (eager mode, requirement hits) cost nothing.
+
+    Args:
+        sections: Vector search results (updated in place)
+        limit: Number of leading sections the caller consumes (default: all)
+        client: Neo4jClient to use (default: a new client, closed on return)
+
+    Returns:
+        The same list, with content filled for the consumed sections
+    """
+    targets = [section for section in sections[:limit] if section.get("content") is None]
+    if not targets:
+        return sections
+
+    keys_by_section = {id(section): _section_keys(section) for section in targets}
+    needed = [key for keys in keys_by_section.values() for key in keys]
+
+    cache = get_section_content_cache()
+    entries = cache.get_many(needed)
+    missing = [key for key in needed if key not in entries]
+
+    if missing:
+        owns_client = client is None
+        client = client or Neo4jClient()
+        try:
+            rows = client.execute(SECTION_CONTENT_QUERY, section_ids=[section_id for section_id, _ in missing])
+        finally:
+            if owns_client:
+                client.close()
+
+        # Cached under the stored hash; if the section changed since the
+        # search, the requested key still resolves to the current text
+        fetched = {
+            row["section_id"]: {"content": row["content"] or "", "chunk_index": row["chunk_index"]}
+            for row in rows
+        }
+        cache.set_many({(row["section_id"], row.get("content_hash")): fetched[row["section_id"]] for row in rows})
+        entries.update({key: fetched[key[0]] for key in missing if key[0] in fetched})
+
+    empty = {"content": "", "chunk_index": None}
+    for section in targets:
+        keys = keys_by_section[id(section)]
+        if section.get("chunk_ids"):
+            section["content"] = join_chunk_contents([entries.get(key, empty) for key in keys])
+        else:
+            section["content"] = entries.get(keys[0], empty)["content"]
+
+    logger.debug(f"Hydrated {len(targets)} sections ({len(missing)} fetched, {len(needed) - len(missing)} cached)")
+    return sections
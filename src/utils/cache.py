@@ -2,14 +2,23 @@
 Query Result Caching for GraphRAG
 
 Implements simple in-memory caching to improve response times for frequently asked questions.
+
+Cypher results are keyed by GraphStatistics.graph_version as well as the
+query, so a graph load makes earlier template results unreachable; cache
+snapshots record the version they were warmed against and are discarded
+when it no longer matches.
 """
 
 import hashlib
+import json
+import os
+import re
 import time
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Generator
 from functools import lru_cache
 from collections import OrderedDict
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +31,7 @@ class QueryCache:
     - Vector search results (by question embedding)
     - Cypher query results (by query string + params)
     - Final answers (by question + query path)
+    - LLM completions (by model + temperature + full prompt hash)
     """
 
     def __init__(self, max_size: int = 100, ttl_seconds: int = 3600):
@@ -35,10 +45,14 @@ class QueryCache:
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
 
+        # GraphStatistics.graph_version the Cypher/answer entries belong to
+        self.graph_version: Optional[int] = None
+
         # Separate caches for different data types
         self._vector_cache: OrderedDict = OrderedDict()
         self._cypher_cache: OrderedDict = OrderedDict()
         self._answer_cache: OrderedDict = OrderedDict()
+        self._completion_cache: OrderedDict = OrderedDict()
 
         # Statistics
         self.stats = {
@@ -91,6 +105,28 @@ class QueryCache:
             cache.popitem(last=False)  # Remove oldest (FIFO)
             self.stats["evictions"] += 1
 
+    def set_graph_version(self, graph_version: Optional[int]) -> bool:
+        """
+        Record the current graph version, dropping graph-derived entries on change.
+
+        Args:
+            graph_version: Current GraphStatistics.graph_version (None if not materialized)
+
+        Returns:
+            True if the version changed
+        """
+        if graph_version == self.graph_version:
+            return False
+
+        logger.info(
+            f"Graph version changed ({self.graph_version} → {graph_version}), "
+            "dropping cached Cypher results and answers"
+        )
+        self.graph_version = graph_version
+        self._cypher_cache.clear()
+        self._answer_cache.clear()
+        return True
+
     def get_vector_results(self, question: str) -> Optional[list]:
         """
         Get cached vector search results.
@@ -154,7 +190,7 @@ class QueryCache:
         Returns:
             Cached results or None
         """
-        cache_key_data = {"query": cypher_query, "params": params or {}}
+        cache_key_data = {"query": cypher_query, "params": params or {}, "graph_version": self.graph_version}
         key = self._make_key(cache_key_data)
 
         if key in self._cypher_cache:
@@ -186,7 +222,7 @@ class QueryCache:
             params: Query parameters
             results: Query results
         """
-        cache_key_data = {"query": cypher_query, "params": params or {}}
+        cache_key_data = {"query": cypher_query, "params": params or {}, "graph_version": self.graph_version}
         key = self._make_key(cache_key_data)
 
         self._evict_lru(self._cypher_cache)
@@ -257,11 +293,170 @@ class QueryCache:
 
         logger.debug(f"Answer cached for: {question[:50]}...")
 
+    def _make_completion_key(
+        self,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]]
+    ) -> str:
+        """
+        Generate cache key for an LLM completion.
+
+        Unlike _make_key(), the full prompt is serialized without reordering,
+        so only byte-identical prompts share a key.
+
+        Args:
+            model: Chat model name
+            temperature: Sampling temperature
+            messages: Chat messages sent to the model
+
+        Returns:
+            SHA-256 hash key
+        """
+        payload = json.dumps(
+            {"model": model, "temperature": temperature, "messages": messages},
+            ensure_ascii=False,
+            separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_completion(
+        self,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]]
+    ) -> Optional[str]:
+        """
+        Get cached LLM completion text.
+
+        Args:
+            model: Chat model name
+            temperature: Sampling temperature
+            messages: Chat messages sent to the model
+
+        Returns:
+            Cached completion text or None
+        """
+        key = self._make_completion_key(model, temperature, messages)
+
+        if key in self._completion_cache:
+            entry = self._completion_cache[key]
+
+            if not self._is_expired(entry):
+                self._completion_cache.move_to_end(key)
+                self.stats["hits"] += 1
+                logger.info(f"Completion cache HIT (model={model})")
+                return entry["data"]
+            else:
+                del self._completion_cache[key]
+
+        self.stats["misses"] += 1
+        logger.debug(f"Completion cache MISS (model={model})")
+        return None
+
+    def set_completion(
+        self,
+        model: str,
+        temperature: float,
+        messages: List[Dict[str, str]],
+        text: str
+    ):
+        """
+        Cache final LLM completion text.
+
+        Args:
+            model: Chat model name
+            temperature: Sampling temperature
+            messages: Chat messages sent to the model
+            text: Final completion text
+        """
+        key = self._make_completion_key(model, temperature, messages)
+
+        self._evict_lru(self._completion_cache)
+
+        self._completion_cache[key] = {
+            "data": text,
+            "timestamp": time.time()
+        }
+
+        logger.debug(f"Completion cached ({len(text)} chars, model={model})")
+
+    def save(self, path: str):
+        """
+        Persist all caches to a JSON snapshot.
+
+        Entries keep their original timestamps, so TTL still applies
+        after the snapshot is loaded by another process. The graph version
+        is recorded so a snapshot of an older graph is not loaded.
+
+        Args:
+            path: Snapshot file path
+        """
+        snapshot = {
+            "graph_version": self.graph_version,
+            "vector": list(self._vector_cache.items()),
+            "cypher": list(self._cypher_cache.items()),
+            "answer": list(self._answer_cache.items()),
+            "completion": list(self._completion_cache.items())
+        }
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path)
+
+        logger.info(f"Cache snapshot saved to {path}")
+
+    def load(self, path: str) -> int:
+        """
+        Load caches from a JSON snapshot written by save().
+
+        Expired entries are skipped. The whole snapshot is discarded if it
+        was saved for another graph version than this cache's (set
+        graph_version first).
+
+        Args:
+            path: Snapshot file path
+
+        Returns:
+            Number of entries loaded
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+
+        if snapshot.get("graph_version") != self.graph_version:
+            logger.warning(
+                f"Discarding cache snapshot {path}: saved for graph_version "
+                f"{snapshot.get('graph_version')}, graph is at {self.graph_version} (re-run scripts/warm_cache.py)"
+            )
+            return 0
+
+        caches = {
+            "vector": self._vector_cache,
+            "cypher": self._cypher_cache,
+            "answer": self._answer_cache,
+            "completion": self._completion_cache
+        }
+
+        loaded = 0
+        for name, cache in caches.items():
+            for key, entry in snapshot.get(name, []):
+                if self._is_expired(entry):
+                    continue
+                self._evict_lru(cache)
+                cache[key] = entry
+                loaded += 1
+
+        logger.info(f"Loaded {loaded} cache entries from {path}")
+        return loaded
+
     def clear(self):
         """Clear all caches."""
         self._vector_cache.clear()
         self._cypher_cache.clear()
         self._answer_cache.clear()
+        self._completion_cache.clear()
         logger.info("All caches cleared")
 
     def get_stats(self) -> Dict[str, Any]:
@@ -282,7 +477,8 @@ class QueryCache:
             "cache_sizes": {
                 "vector": len(self._vector_cache),
                 "cypher": len(self._cypher_cache),
-                "answer": len(self._answer_cache)
+                "answer": len(self._answer_cache),
+                "completion": len(self._completion_cache)
             }
         }
 
@@ -300,11 +496,13 @@ class QueryCache:
         print(f"  Vector: {stats['cache_sizes']['vector']}")
         print(f"  Cypher: {stats['cache_sizes']['cypher']}")
         print(f"  Answer: {stats['cache_sizes']['answer']}")
+        print(f"  Completion: {stats['cache_sizes']['completion']}")
         print("="*50)
 
 
 # Singleton instance
 _query_cache: Optional[QueryCache] = None
+_graph_version_checked_at: float = 0.0
 
 
 def get_query_cache(
@@ -335,6 +533,111 @@ def get_query_cache(
     return _query_cache
 
 
+def get_default_query_cache() -> Optional[QueryCache]:
+    """
+    Get query cache singleton configured from environment.
+
+    Environment:
+        CACHE_ENABLED: Enable caching (default true)
+        CACHE_MAX_SIZE: Maximum entries per cache (default 100)
+        CACHE_TTL_SECONDS: Time-to-live for entries (default 3600)
+        CACHE_PERSIST_PATH: Optional snapshot file loaded on first use
+                            (written by scripts/warm_cache.py)
+        CACHE_GRAPH_VERSION_CHECK_SECONDS: How often GraphStatistics.graph_version
+                            is re-read (default 30)
+
+    Returns:
+        QueryCache instance or None if disabled
+    """
+    global _query_cache, _graph_version_checked_at
+
+    is_new = _query_cache is None
+
+    cache = get_query_cache(
+        enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
+        max_size=int(os.getenv("CACHE_MAX_SIZE", "100")),
+        ttl_seconds=int(os.getenv("CACHE_TTL_SECONDS", "3600"))
+    )
+
+    if cache is None:
+        return None
+
+    check_interval = float(os.getenv("CACHE_GRAPH_VERSION_CHECK_SECONDS", "30"))
+    now = time.time()
+    if is_new or now - _graph_version_checked_at >= check_interval:
+        _graph_version_checked_at = now
+        try:
+            cache.set_graph_version(_read_current_graph_version())
+        except Exception as e:
+            logger.warning(f"Could not read graph version for the query cache: {e}")
+
+    persist_path = os.getenv("CACHE_PERSIST_PATH")
+    if is_new and persist_path and os.path.exists(persist_path):
+        try:
+            cache.load(persist_path)
+        except Exception as e:
+            logger.warning(f"Failed to load cache snapshot {persist_path}: {e}")
+
+    return cache
+
+
+def _read_current_graph_version() -> Optional[int]:
+    """Read GraphStatistics.graph_version with a short-lived client."""
+    from src.utils.graph_statistics import read_graph_version
+    from src.utils.neo4j_client import Neo4jClient
+
+    client = Neo4jClient()
+    try:
+        return read_graph_version(client)
+    finally:
+        client.close()
+
+
+def replay_completion(
+    text: str,
+    chunk_chars: Optional[int] = None,
+    delay_ms: Optional[float] = None
+) -> Generator[str, None, None]:
+    """
+    Replay a cached completion as a stream of text chunks.
+
+    Chunks end on word boundaries so markdown renders cleanly while
+    streaming. Joining all chunks reproduces the original text exactly.
+
+    Args:
+        text: Cached completion text
+        chunk_chars: Approximate characters per chunk
+                     (default: COMPLETION_REPLAY_CHUNK_CHARS or 16)
+        delay_ms: Pause between chunks in milliseconds
+                  (default: COMPLETION_REPLAY_DELAY_MS or 15)
+
+    Yields:
+        Text chunks
+    """
+    if chunk_chars is None:
+        chunk_chars = int(os.getenv("COMPLETION_REPLAY_CHUNK_CHARS", "16"))
+    if delay_ms is None:
+        delay_ms = float(os.getenv("COMPLETION_REPLAY_DELAY_MS", "15"))
+
+    delay = max(delay_ms, 0.0) / 1000.0
+    buffer = ""
+    first = True
+
+    for token in re.findall(r"\s*\S+\s*|\s+", text):
+        buffer += token
+        if len(buffer) >= chunk_chars:
+            if delay and not first:
+                time.sleep(delay)
+            yield buffer
+            buffer = ""
+            first = False
+
+    if buffer:
+        if delay and not first:
+            time.sleep(delay)
+        yield buffer
+
+
 # Embedding cache using functools.lru_cache
 @lru_cache(maxsize=1000)
 def cache_embedding(text: str) -> str:
@@ -0,0 +1,384 @@
+"""
+Cache Warm-up for the Known Query Space
+
+The MOSAR graph has a bounded, enumerable set of high-value questions:
+traceability per Requirement, requirements per Component, details per
+TestCase/Protocol/Scenario, etc. This module executes every parameterized
+template in CypherTemplates for every entity ID (plus the parameterless
+summary templates) and stores the results in the Cypher cache, so that
+first-time PURE_CYPHER queries are cache hits. Canonical questions can
+also be warmed into the vector cache with one batched retrieval per
+batch of questions.
+
+Usage:
+    warmer = CacheWarmer(max_workers=8)
+    report = warmer.warm_templates()
+    warmer.save()
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
+
+from src.graphrag.nodes.cypher_node import ENTITY_TYPE_CONFIG
+from src.query.cypher_templates import CypherTemplates
+from src.utils.cache import QueryCache, get_default_query_cache
+from src.utils.graph_statistics import read_graph_version
+from src.utils.neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+
+# Templates that take a single entity ID, by entity type.
+# The first entry is the template selected by run_template_cypher (ENTITY_TYPE_CONFIG);
+# coverage is reported against it.
+TEMPLATES_BY_ENTITY_TYPE = {
+    "Requirement": [
+        "get_requirement_traceability",
+        "get_requirement_decomposition_tree",
+        "get_requirement_dependencies",
+    ],
+    "Component": [
+        "get_component_requirements",
+        "get_component_tests",
+        "get_sections_mentioning_component",
+    ],
+    "TestCase": ["get_test_case_details"],
+    "Protocol": ["get_protocol_requirements"],
+    "SpacecraftModule": ["get_module_details"],
+    "Scenario": ["get_scenario_details"],
+    "Organization": ["get_organization_projects"],
+}
+
+# Closure-based Requirement templates (selected when USE_DERIVES_FROM_CLOSURE=true)
+CLOSURE_TEMPLATES = [
+    "get_requirement_decomposition_closure",
+    "get_requirement_impact",
+]
+
+# Templates without parameters (summaries and listings)
+GLOBAL_TEMPLATES = [
+    "get_coverage_summary",
+    "get_test_coverage",
+    "get_unverified_requirements",
+    "get_all_protocols",
+    "get_all_modules",
+    "get_all_scenarios",
+    "get_all_organizations",
+    "get_requirements_by_type",
+    "get_requirements_by_subsystem",
+    "get_database_stats",
+]
+
+
+class CacheWarmer:
+    """
+    Pre-populates the query cache by executing Cypher templates.
+
+    Queries run with bounded concurrency on a shared Neo4j driver
+    (each query uses its own session). Results are written to the cache
+    from the calling thread only, since QueryCache is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Neo4jClient] = None,
+        cache: Optional[QueryCache] = None,
+        max_workers: int = 8
+    ):
+        """
+        Initialize warmer.
+
+        Args:
+            client: Neo4jClient instance (created if not provided)
+            cache: QueryCache to populate (default: environment-configured singleton)
+            max_workers: Maximum concurrent Neo4j queries
+        """
+        self.client = client or Neo4jClient()
+        self.cache = cache or get_default_query_cache()
+        self.max_workers = max_workers
+        self.templates = CypherTemplates()
+
+        if self.cache is None:
+            raise ValueError("Query cache is disabled (CACHE_ENABLED=false); nothing to warm")
+
+    def enumerate_entities(self) -> Dict[str, List[str]]:
+        """
+        Enumerate all entity IDs for each configured entity type.
+
+        Returns:
+            Dict mapping entity type to sorted list of IDs
+        """
+        entities = {}
+
+        for entity_type, config in ENTITY_TYPE_CONFIG.items():
+            id_field = config["id_field"]
+            cypher = f"""
+            MATCH (n:{entity_type})
+            WHERE n.{id_field} IS NOT NULL
+            RETURN DISTINCT n.{id_field} AS id
+            ORDER BY id
+            """
+            rows = self.client.execute(cypher)
+            entities[entity_type] = [row["id"] for row in rows]
+            logger.info(f"  {entity_type}: {len(entities[entity_type])} IDs")
+
+        return entities
+
+    def build_jobs(self, entities: Dict[str, List[str]]) -> List[Tuple[str, str, Optional[str], str]]:
+        """
+        Build (entity_type, template, entity_id, cypher) jobs for all templates.
+
+        Args:
+            entities: Output of enumerate_entities()
+
+        Returns:
+            List of job tuples
+        """
+        jobs = []
+
+        for template_name in GLOBAL_TEMPLATES:
+            cypher = getattr(self.templates, template_name)()
+            jobs.append(("global", template_name, None, cypher))
+
+        use_closure = os.getenv("USE_DERIVES_FROM_CLOSURE", "false").lower() == "true"
+
+        for entity_type, entity_ids in entities.items():
+            template_names = list(TEMPLATES_BY_ENTITY_TYPE.get(entity_type, []))
+            if entity_type == "Requirement" and use_closure:
+                template_names += CLOSURE_TEMPLATES
+
+            for template_name in template_names:
+                template_method = getattr(self.templates, template_name)
+                for entity_id in entity_ids:
+                    jobs.append((entity_type, template_name, entity_id, template_method(entity_id)))
+
+        return jobs
+
+    def fit_to_cache(
+        self,
+        jobs: List[Tuple[str, str, Optional[str], str]]
+    ) -> Tuple[List[Tuple[str, str, Optional[str], str]], int]:
+        """
+        Keep only as many jobs as the Cypher cache can hold.
+
+        Warming more queries than max_size would evict the earliest warmed
+        results, so jobs are ranked and the rest skipped: summary templates
+        first, then each entity type's primary template (in ENTITY_TYPE_CONFIG
+        priority order), then the remaining templates.
+
+        Args:
+            jobs: Output of build_jobs()
+
+        Returns:
+            (jobs to run, number of skipped jobs)
+        """
+        if len(jobs) <= self.cache.max_size:
+            return jobs, 0
+
+        def rank(job: Tuple[str, str, Optional[str], str]) -> Tuple[int, int]:
+            entity_type, template_name, _, _ = job
+            if entity_type == "global":
+                return (0, 0)
+            tier = 1 if template_name == TEMPLATES_BY_ENTITY_TYPE.get(entity_type, [None])[0] else 2
+            return (tier, ENTITY_TYPE_CONFIG[entity_type]["priority"])
+
+        ranked = sorted(jobs, key=rank)
+        kept = ranked[:self.cache.max_size]
+        skipped = len(jobs) - len(kept)
+
+        logger.warning(
+            f"{len(jobs)} queries exceed cache max_size={self.cache.max_size}; "
+            f"warming the top {len(kept)} and skipping {skipped} (raise CACHE_MAX_SIZE to warm all)"
+        )
+        return kept, skipped
+
+    def _run_job(self, cypher: str) -> List[Dict[str, Any]]:
+        """Execute one query (worker thread)."""
+        return self.client.execute(cypher)
+
+    def warm_templates(self, clear_existing: bool = True) -> Dict[str, Any]:
+        """
+        Execute every template for every entity ID and cache the results.
+
+        Args:
+            clear_existing: Clear the cache first (results from a previous
+                            graph load would be stale)
+
+        Returns:
+            Report dict with counts, coverage and duration
+        """
+        start_time = time.time()
+
+        if clear_existing:
+            self.cache.clear()
+
+        # Results (and the saved snapshot) belong to the graph as it is now
+        self.cache.set_graph_version(read_graph_version(self.client))
+
+        logger.info("Enumerating entities for cache warm-up...")
+        entities = self.enumerate_entities()
+        jobs, skipped = self.fit_to_cache(self.build_jobs(entities))
+
+        logger.info(f"Warming {len(jobs)} template queries with {self.max_workers} workers...")
+
+        by_template: Dict[str, Dict[str, int]] = {}
+        warmed_primary: Dict[str, int] = {}
+        failed = 0
+        empty = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._run_job, cypher): (entity_type, template_name, entity_id, cypher)
+                for entity_type, template_name, entity_id, cypher in jobs
+            }
+
+            for future in as_completed(futures):
+                entity_type, template_name, entity_id, cypher = futures[future]
+                counts = by_template.setdefault(template_name, {"queries": 0, "empty": 0, "failed": 0})
+                counts["queries"] += 1
+
+                try:
+                    results = future.result()
+                except Exception as e:
+                    failed += 1
+                    counts["failed"] += 1
+                    logger.warning(f"  ✗ {template_name}({entity_id}) failed: {e}")
+                    continue
+
+                self.cache.set_cypher_results(cypher, None, results)
+
+                if not results:
+                    empty += 1
+                    counts["empty"] += 1
+
+                primary = TEMPLATES_BY_ENTITY_TYPE.get(entity_type, [None])[0]
+                if template_name == primary:
+                    warmed_primary[entity_type] = warmed_primary.get(entity_type, 0) + 1
+
+        coverage = {
+            entity_type: {
+                "entities": len(ids),
+                "warmed": warmed_primary.get(entity_type, 0),
+                "coverage_percentage": round(100.0 * warmed_primary.get(entity_type, 0) / len(ids), 2) if ids else 0.0
+            }
+            for entity_type, ids in entities.items()
+        }
+
+        report = {
+            "queries": len(jobs),
+            "cached": len(jobs) - failed,
+            "empty": empty,
+            "failed": failed,
+            "skipped": skipped,
+            "by_template": by_template,
+            "coverage": coverage,
+            "duration_s": round(time.time() - start_time, 2)
+        }
+
+        logger.info(
+            f"✓ Cache warm-up complete: {report['cached']}/{report['queries']} queries cached "
+            f"({failed} failed, {skipped} skipped) in {report['duration_s']}s"
+        )
+        return report
+
+    def warm_vector_results(self, questions: List[str], batch_size: int = 64) -> Dict[str, Any]:
+        """
+        Warm the vector cache for questions using batched retrieval.
+
+        Served by run_vector_search when USE_VECTOR_CACHE=true.
+
+        Args:
+            questions: Natural language questions
+            batch_size: Questions per embeddings call / Neo4j query
+
+        Returns:
+            Report dict with counts and duration
+        """
+        # Imported here: the node module pulls in the OpenAI client
+        from src.graphrag.nodes.vector_search_node import batch_vector_search
+
+        start_time = time.time()
+        results = batch_vector_search(questions, batch_size=batch_size, neo4j_client=self.client)
+
+        cached = 0
+        for question, sections in zip(questions, results):
+            if sections:
+                self.cache.set_vector_results(question, sections)
+                cached += 1
+
+        duration = time.time() - start_time
+        return {
+            "questions": len(questions),
+            "cached": cached,
+            "duration_s": round(duration, 2),
+            "questions_per_s": round(len(questions) / duration, 1) if duration > 0 else None
+        }
+
+    def warm_answers(self, questions: List[str]) -> Dict[str, Any]:
+        """
+        Run the full workflow for canonical questions to warm answer caches.
+
+        Populates the answer cache and, through synthesis, the completion cache.
+        Questions run sequentially to keep LLM usage predictable.
+
+        Args:
+            questions: Natural language questions
+
+        Returns:
+            Report dict with counts and duration
+        """
+        # Imported here: building the workflow loads the router and LangGraph
+        from src.graphrag.workflow import GraphRAGWorkflow
+
+        start_time = time.time()
+        workflow = GraphRAGWorkflow()
+        answered = 0
+        failed = 0
+
+        for question in questions:
+            result = workflow.query(question)
+            metadata = result.get("metadata", {})
+
+            if metadata.get("error"):
+                failed += 1
+                logger.warning(f"  ✗ Answer warm-up failed for: {question[:50]}... ({metadata['error']})")
+                continue
+
+            self.cache.set_answer(
+                question,
+                metadata.get("query_path", "unknown"),
+                {"final_answer": result["answer"], "citations": result.get("citations", [])}
+            )
+            answered += 1
+
+        return {
+            "questions": len(questions),
+            "answered": answered,
+            "failed": failed,
+            "duration_s": round(time.time() - start_time, 2)
+        }
+
+    def save(self, path: Optional[str] = None) -> Optional[str]:
+        """
+        Persist the warmed cache so other processes (Streamlit, CLI) can load it.
+
+        Args:
+            path: Snapshot path (default: CACHE_PERSIST_PATH)
+
+        Returns:
+            Path written, or None if no path configured
+        """
+        path = path or os.getenv("CACHE_PERSIST_PATH")
+        if not path:
+            logger.warning("CACHE_PERSIST_PATH not set; warmed cache lives only in this process")
+            return None
+
+        self.cache.save(path)
+        return path
+
+    def close(self):
+        """Close Neo4j connection."""
+        self.client.close()
@@ -0,0 +1,363 @@
+"""
+Embedding Service - One OpenAI embeddings client for ingestion and queries
+
+Both DocumentEmbedder (ingestion) and vector search (queries) embed through
+this service, so they always use the same model and dimension
+(EMBEDDING_MODEL / EMBEDDING_DIMENSION) as the vector indexes.
+
+Features:
+- One pooled OpenAI client per process (its HTTP connection pool is reused)
+- Micro-batching: concurrent query embeddings from different sessions that
+  arrive within EMBEDDING_BATCH_WINDOW_MS are sent as one API call
+- Shared LRU cache of query embeddings by text; bulk document embedding
+  bypasses it so a load does not evict queries
+- Embeddings are requested base64-encoded and decoded straight into float32
+  arrays (src/utils/embeddings.Embedding), never into lists of Python floats
+
+Usage:
+    service = get_embedding_service()
+    vector = service.embed_query("What hardware handles communication?")
+    vectors = service.embed_documents(texts)
+"""
+
+import base64
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+import numpy as np
+from openai import OpenAI
+
+from src.utils.embeddings import EMBEDDING_DTYPE, Embedding, as_embedding, as_embedding_matrix
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingService:
+    """
+    Shared embedding client with micro-batching and caching.
+
+    Thread-safe: query embeddings may be requested from many threads
+    (Streamlit sessions, hybrid retrieval workers) at once.
+    """
+
+    def __init__(
+        self,
+        client: Optional[OpenAI] = None,
+        model: Optional[str] = None,
+        dimensions: Optional[int] = None,
+        batch_window_ms: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        cache_size: Optional[int] = None
+    ):
+        """
+        Initialize service.
+
+        Args:
+            client: OpenAI client (created on first use if not provided)
+            model: Embedding model (default: EMBEDDING_MODEL)
+            dimensions: Embedding dimension (default: EMBEDDING_DIMENSION)
+            batch_window_ms: How long a query waits for others to batch with
+                             (default: EMBEDDING_BATCH_WINDOW_MS; 0 = no batching)
+            max_batch_size: Maximum queries per coalesced API call
+            cache_size: Maximum cached embeddings (0 = no caching)
+        """
+        self._client = client
+        self.model = model or os.getenv("EMBEDDING_MODEL", "text-embedding-3-large")
+        self.dimensions = dimensions or int(os.getenv("EMBEDDING_DIMENSION", "3072"))
+        self.batch_window_ms = (
+            batch_window_ms if batch_window_ms is not None
+            else float(os.getenv("EMBEDDING_BATCH_WINDOW_MS", "5"))
+        )
+        self.max_batch_size = max_batch_size or int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "64"))
+        self.cache_size = cache_size if cache_size is not None else int(os.getenv("EMBEDDING_CACHE_SIZE", "1000"))
+
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._client_lock = threading.Lock()
+
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+
+        # Statistics
+        self.api_calls = 0
+        self.cache_hits = 0
+
+    @property
+    def client(self) -> OpenAI:
+        """Shared OpenAI client (created on first use)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+        return self._client
+
+    def _zero_vector(self) -> Embedding:
+        """Fallback vector for failed embeddings."""
+        return np.zeros(self.dimensions, dtype=EMBEDDING_DTYPE)
+
+    def _cache_get(self, text: str) -> Optional[Embedding]:
+        """Get a cached embedding (read-only array shared by all callers)."""
+        if not self.cache_size:
+            return None
+
+        with self._cache_lock:
+            vector = self._cache.get(text)
+            if vector is None:
+                return None
+            self._cache.move_to_end(text)
+            self.cache_hits += 1
+            return vector
+
+    def _cache_set(self, texts: List[str], embeddings: np.ndarray):
+        """Cache embeddings as read-only float32 copies (not views of the batch matrix)."""
+        if not self.cache_size:
+            return
+
+        with self._cache_lock:
+            for text, embedding in zip(texts, embeddings):
+                vector = np.array(embedding, dtype=EMBEDDING_DTYPE)
+                vector.flags.writeable = False
+                self._cache[text] = vector
+                self._cache.move_to_end(text)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _create(self, texts: List[str], cache_results: bool = True) -> np.ndarray:
+        """
+        Call the embeddings API once and optionally cache the results.
+
+        Args:
+            texts: Texts to embed (one API call)
+            cache_results: Store the embeddings in the shared cache
+
+        Returns:
+            float32 matrix, one row per text in input order
+
+        Raises:
+            Exception: API errors are propagated to the caller
+        """
+        response = self.client.embeddings.create(
+            model=self.model,
+            input=texts,
+            dimensions=self.dimensions,
+            encoding_format="base64"
+        )
+        self.api_calls += 1
+
+        # The API may return items out of order; each carries its input index
+        data = sorted(response.data, key=lambda item: item.index)
+        embeddings = as_embedding_matrix([_decode_embedding(item.embedding) for item in data])
+        if cache_results:
+            self._cache_set(texts, embeddings)
+        return embeddings
+
+    def embed_queries(self, texts: List[str]) -> List[Embedding]:
+        """
+        Embed several query texts in one API call (cache hits are skipped).
+
+        Failures return zero vectors, like a failed single query.
+
+        Args:
+            texts: Query texts
+
+        Returns:
+            Embeddings in input order
+        """
+        results: List[Optional[Embedding]] = [self._cache_get(text) for text in texts]
+        missing = list(dict.fromkeys(text for text, result in zip(texts, results) if result is None))
+
+        if missing:
+            try:
+                embedded = dict(zip(missing, self._create(missing)))
+            except Exception as e:
+                logger.error(f"Failed to generate {len(missing)} embeddings: {e}")
+                embedded = {text: self._zero_vector() for text in missing}
+
+            results = [result if result is not None else embedded[text] for text, result in zip(texts, results)]
+
+        return results
+
+    def embed_query(self, text: str) -> Embedding:
+        """
+        Embed one query text.
+
+        Concurrent calls within the batch window are coalesced into one API
+        call by a background worker.
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector (zero vector on failure)
+        """
+        cached = self._cache_get(text)
+        if cached is not None:
+            return cached
+
+        if self.batch_window_ms <= 0:
+            return self.embed_queries([text])[0]
+
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((text, future))
+        return future.result()
+
+    def embed_documents(
+        self,
+        texts: List[str],
+        batch_size: int = 100,
+        delay_seconds: float = 0.5,
+        fail_fast: bool = False
+    ) -> np.ndarray:
+        """
+        Embed documents for ingestion in API-sized batches.
+
+        A failed batch is logged and replaced by zero vectors so one error
+        does not abort a load, unless fail_fast is set.
+
+        Args:
+            texts: Document texts
+            batch_size: Max texts per API call
+            delay_seconds: Pause between batches (rate limiting)
+            fail_fast: Re-raise API errors instead of using zero vectors
+
+        Returns:
+            float32 matrix, one row per text in input order
+        """
+        all_embeddings: List[np.ndarray] = []
+        total_batches = (len(texts) + batch_size - 1) // batch_size
+
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
+            batch_num = (i // batch_size) + 1
+
+            try:
+                logger.info(f"  Processing batch {batch_num}/{total_batches} ({len(batch)} texts)")
+                all_embeddings.append(self._create(batch, cache_results=False))
+                logger.info(f"  ✓ Batch {batch_num}/{total_batches} complete")
+
+                if batch_num < total_batches and delay_seconds > 0:
+                    time.sleep(delay_seconds)
+
+            except Exception as e:
+                logger.error(f"  ✗ Batch {batch_num}/{total_batches} failed: {e}")
+                if fail_fast:
+                    raise
+                logger.warning(f"  Using zero vectors for batch {batch_num}")
+                all_embeddings.append(np.zeros((len(batch), self.dimensions), dtype=EMBEDDING_DTYPE))
+
+        if not all_embeddings:
+            return np.zeros((0, self.dimensions), dtype=EMBEDDING_DTYPE)
+        return np.concatenate(all_embeddings)
+
+    def _ensure_worker(self):
+        """Start the micro-batching worker thread if needed."""
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run_batcher,
+                    name="embedding-batcher",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _run_batcher(self):
+        """Collect queued queries for up to the batch window, then embed them together."""
+        window_seconds = self.batch_window_ms / 1000
+
+        while True:
+            pending = [self._queue.get()]
+            deadline = time.monotonic() + window_seconds
+
+            while len(pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            texts = [text for text, _ in pending]
+            try:
+                embeddings = self.embed_queries(texts)
+            except Exception as e:
+                # embed_queries already falls back to zero vectors; this guards the worker
+                logger.error(f"Embedding batch failed: {e}")
+                embeddings = [self._zero_vector() for _ in texts]
+
+            if len(pending) > 1:
+                logger.debug(f"Coalesced {len(pending)} query embeddings into one call")
+
+            for (_, future), embedding in zip(pending, embeddings):
+                future.set_result(embedding)
+
+    def get_stats(self) -> dict:
+        """
+        Get service statistics.
+
+        Returns:
+            Dict with model, dimension, API calls, cache hits and cache size
+        """
+        return {
+            "model": self.model,
+            "dimensions": self.dimensions,
+            "api_calls": self.api_calls,
+            "cache_hits": self.cache_hits,
+            "cache_size": len(self._cache)
+        }
+
+
+def _decode_embedding(data) -> Embedding:
+    """
+    Decode one embedding from an API response.
+
+    Args:
+        data: base64 string of little-endian float32 values (or a float list)
+
+    Returns:
+        float32 array
+    """
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype="<f4").astype(EMBEDDING_DTYPE, copy=False)
+    return as_embedding(data)
+
+
+# Global instance (singleton)
+_embedding_service: Optional[EmbeddingService] = None
+_embedding_service_lock = threading.Lock()
+
+
+def get_embedding_service() -> EmbeddingService:
+    """
+    Get the process-wide embedding service (singleton).
+
+    Environment Variables:
+        EMBEDDING_MODEL: Embedding model (default: text-embedding-3-large)
+        EMBEDDING_DIMENSION: Embedding dimension (default: 3072)
+        EMBEDDING_BATCH_WINDOW_MS: Micro-batching window (default: 5, 0 = off)
+        EMBEDDING_MAX_BATCH_SIZE: Max queries per coalesced call (default: 64)
+        EMBEDDING_CACHE_SIZE: Max cached embeddings (default: 1000, 0 = off)
+
+    Returns:
+        EmbeddingService instance
+    """
+    global _embedding_service
+
+    if _embedding_service is None:
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
+                logger.info(
+                    f"✓ Embedding service initialized "
+                    f"({_embedding_service.model}, {_embedding_service.dimensions} dimensions)"
+                )
+
+    return _embedding_service
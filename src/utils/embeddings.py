@@ -0,0 +1,139 @@
+"""
+Embedding utilities - float32 embedding type and Matryoshka truncation
+
+Embeddings are NumPy float32 arrays (`Embedding`, or a 2-D matrix for a
+batch) from the OpenAI response to the Neo4j driver: 4 bytes per component
+instead of a ~32-byte Python float object plus list slot. They are turned
+into Python lists only at the driver boundary (`to_driver_value`, applied by
+Neo4jClient) and back into arrays when read for client-side scoring.
+
+text-embedding-3 models are trained so that a prefix of the embedding is
+itself a usable embedding once re-normalized. Compact prefixes (e.g. 256-d)
+are stored alongside the full vectors and indexed with int8 quantization
+for the first-pass search; candidates are rescored against the full vectors.
+"""
+
+import os
+from typing import Any, Sequence
+
+import numpy as np
+
+EMBEDDING_DTYPE = np.float32
+
+# One embedding: 1-D float32 array
+Embedding = np.ndarray
+
+# Compact vector properties and indexes, by node label
+COMPACT_EMBEDDING_PROPERTIES = {
+    "Section": {
+        "full": "content_embedding",
+        "compact": "content_embedding_small",
+        "index": "section_embeddings_small"
+    },
+    "Requirement": {
+        "full": "statement_embedding",
+        "compact": "statement_embedding_small",
+        "index": "requirement_embeddings_small"
+    }
+}
+
+
+def get_search_dimension() -> int:
+    """
+    Get the compact search dimension.
+
+    Environment Variables:
+        EMBEDDING_SEARCH_DIMENSION: Truncated dimension for first-pass search
+                                    (0 or unset = compact mode disabled)
+
+    Returns:
+        Dimension, or 0 if disabled
+    """
+    return int(os.getenv("EMBEDDING_SEARCH_DIMENSION", "0") or 0)
+
+
+def as_embedding(values: Sequence[float]) -> Embedding:
+    """
+    Convert a vector (list, array or driver result) to an Embedding.
+
+    Args:
+        values: Embedding components
+
+    Returns:
+        1-D float32 array (no copy if already one)
+    """
+    return np.asarray(values, dtype=EMBEDDING_DTYPE)
+
+
+def as_embedding_matrix(embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+    """
+    Stack embeddings into one float32 matrix (one row per embedding).
+
+    Args:
+        embeddings: Embeddings (lists, arrays or an existing matrix)
+
+    Returns:
+        2-D float32 array; shape (0, 0) for no embeddings
+    """
+    if len(embeddings) == 0:
+        return np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+    return np.asarray(embeddings, dtype=EMBEDDING_DTYPE)
+
+
+def to_driver_value(value: Any) -> Any:
+    """
+    Convert embeddings inside query parameters to lists for the Neo4j driver.
+
+    Arrays become lists of Python floats; dicts and lists of containers are
+    converted recursively (lists of scalars are passed through unchanged).
+
+    Args:
+        value: Parameter value
+
+    Returns:
+        Driver-compatible value
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict):
+        return {key: to_driver_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)) and value and isinstance(value[0], (dict, list, tuple, np.ndarray)):
+        return [to_driver_value(item) for item in value]
+    return value
+
+
+def truncate_embeddings(embeddings: Sequence[Sequence[float]], dimensions: int) -> np.ndarray:
+    """
+    Truncate embeddings to their first `dimensions` components and L2-normalize.
+
+    Zero vectors (embedding failures) stay zero.
+
+    Args:
+        embeddings: Full-precision embeddings (or an embedding matrix)
+        dimensions: Target dimension
+
+    Returns:
+        Truncated, normalized float32 matrix (one row per embedding)
+    """
+    if len(embeddings) == 0:
+        return np.zeros((0, dimensions), dtype=EMBEDDING_DTYPE)
+
+    matrix = as_embedding_matrix(embeddings)[:, :dimensions]
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def truncate_embedding(embedding: Sequence[float], dimensions: int) -> Embedding:
+    """
+    Truncate a single embedding and L2-normalize it.
+
+    Args:
+        embedding: Full-precision embedding
+        dimensions: Target dimension
+
+    Returns:
+        Truncated, normalized embedding
+    """
+    return truncate_embeddings([embedding], dimensions)[0]
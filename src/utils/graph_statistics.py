@@ -0,0 +1,296 @@
+"""
+Graph Statistics - Incrementally maintained coverage counters
+
+Coverage queries (get_test_coverage, get_requirements_by_type, ...) scan every
+Requirement and its VERIFIES relationships. This module keeps the same numbers
+on a single (:GraphStatistics {id: 'current'}) node, updated by the loader as it
+writes Requirement/TestCase/VERIFIES data, so summaries are one node lookup.
+
+Incremental updates: each Requirement remembers the facets it was last counted
+under (stats_type, stats_subsystem, stats_verified). When requirements are
+touched, their old contribution is subtracted and the new one added.
+
+Node counts per label come from the Neo4j count store (constant time) and are
+refreshed on every update. Every update also increments `graph_version`, which
+lets readers detect that the graph changed.
+"""
+
+import json
+import logging
+from typing import Dict, List, Any, Optional, Iterable
+
+from src.utils.neo4j_client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+STATISTICS_NODE_ID = "current"
+
+# Labels counted in node_counts (count store lookups)
+COUNTED_LABELS = [
+    "Requirement", "TestCase", "Component", "Section", "Document",
+    "Protocol", "Scenario", "Organization", "SpacecraftModule"
+]
+
+# Single-node read behind get_summary()
+STATISTICS_QUERY = """
+MATCH (s:GraphStatistics {id: $id})
+RETURN s.total_requirements AS total_requirements,
+       s.verified_requirements AS verified_requirements,
+       s.by_type_json AS by_type_json,
+       s.by_subsystem_json AS by_subsystem_json,
+       s.node_counts_json AS node_counts_json,
+       s.graph_version AS graph_version,
+       toString(s.updated_at) AS updated_at
+"""
+
+
+def _empty_statistics() -> Dict[str, Any]:
+    """Statistics before anything has been counted."""
+    return {
+        "total_requirements": 0,
+        "verified_requirements": 0,
+        "by_type": {},
+        "by_subsystem": {},
+        "node_counts": {},
+        "graph_version": 0
+    }
+
+
+def _apply_delta(stats: Dict[str, Any], req_type: Optional[str], subsystem: Optional[str], verified: bool, sign: int):
+    """Add (sign=1) or remove (sign=-1) one requirement's contribution."""
+    stats["total_requirements"] += sign
+    stats["verified_requirements"] += sign if verified else 0
+
+    for facet, value in (("by_type", req_type), ("by_subsystem", subsystem)):
+        key = value or "unknown"
+        bucket = stats[facet].setdefault(key, {"total": 0, "verified": 0})
+        bucket["total"] += sign
+        bucket["verified"] += sign if verified else 0
+
+        if bucket["total"] <= 0:
+            del stats[facet][key]
+
+
+def read_graph_version(client: Neo4jClient) -> Optional[int]:
+    """Read GraphStatistics.graph_version (None if statistics not materialized)."""
+    rows = client.execute(
+        "MATCH (s:GraphStatistics {id: $id}) RETURN s.graph_version AS graph_version",
+        id=STATISTICS_NODE_ID
+    )
+    return rows[0]["graph_version"] if rows else None
+
+
+def coverage_percentage(total: int, verified: int) -> float:
+    """Coverage percentage rounded like get_test_coverage()."""
+    return round(100.0 * verified / total, 2) if total else 0.0
+
+
+class GraphStatistics:
+    """Reads and incrementally maintains the GraphStatistics node."""
+
+    def __init__(self, client: Optional[Neo4jClient] = None):
+        """
+        Initialize statistics manager.
+
+        Args:
+            client: Neo4jClient instance (created if not provided)
+        """
+        self.client = client or Neo4jClient()
+
+    def _read(self) -> Dict[str, Any]:
+        """Read raw statistics from the GraphStatistics node."""
+        rows = self.client.execute(STATISTICS_QUERY, id=STATISTICS_NODE_ID)
+
+        if not rows:
+            return _empty_statistics()
+
+        row = rows[0]
+        return {
+            "total_requirements": row["total_requirements"] or 0,
+            "verified_requirements": row["verified_requirements"] or 0,
+            "by_type": json.loads(row["by_type_json"] or "{}"),
+            "by_subsystem": json.loads(row["by_subsystem_json"] or "{}"),
+            "node_counts": json.loads(row["node_counts_json"] or "{}"),
+            "graph_version": row["graph_version"] or 0,
+            "updated_at": row["updated_at"]
+        }
+
+    def _write(self, stats: Dict[str, Any]):
+        """Write statistics and bump graph_version."""
+        self.client.execute(
+            """
+            MERGE (s:GraphStatistics {id: $id})
+            SET s.total_requirements = $total_requirements,
+                s.verified_requirements = $verified_requirements,
+                s.coverage_percentage = $coverage_percentage,
+                s.by_type_json = $by_type_json,
+                s.by_subsystem_json = $by_subsystem_json,
+                s.node_counts_json = $node_counts_json,
+                s.graph_version = coalesce(s.graph_version, 0) + 1,
+                s.updated_at = datetime()
+            """,
+            id=STATISTICS_NODE_ID,
+            total_requirements=stats["total_requirements"],
+            verified_requirements=stats["verified_requirements"],
+            coverage_percentage=coverage_percentage(stats["total_requirements"], stats["verified_requirements"]),
+            by_type_json=json.dumps(stats["by_type"], sort_keys=True),
+            by_subsystem_json=json.dumps(stats["by_subsystem"], sort_keys=True),
+            node_counts_json=json.dumps(stats["node_counts"], sort_keys=True)
+        )
+
+    def _count_nodes(self) -> Dict[str, int]:
+        """Per-label node counts (served by the count store)."""
+        return {label: self.client.count_nodes(label) for label in COUNTED_LABELS}
+
+    def update_requirements(self, req_ids: Iterable[str]):
+        """
+        Recount the given requirements and apply the difference.
+
+        Call after writing Requirement nodes or VERIFIES relationships.
+
+        Args:
+            req_ids: IDs of touched requirements
+        """
+        req_ids = sorted(set(req_ids))
+        stats = self._read()
+
+        if req_ids:
+            rows = self.client.execute(
+                """
+                UNWIND $req_ids AS req_id
+                MATCH (r:Requirement {id: req_id})
+                RETURN r.id AS id,
+                       r.type AS type,
+                       r.subsystem AS subsystem,
+                       EXISTS { (r)<-[:VERIFIES]-(:TestCase) } AS verified,
+                       r.stats_counted AS counted,
+                       r.stats_type AS old_type,
+                       r.stats_subsystem AS old_subsystem,
+                       r.stats_verified AS old_verified
+                """,
+                req_ids=req_ids
+            )
+
+            markers = []
+            for row in rows:
+                if row["counted"]:
+                    _apply_delta(stats, row["old_type"], row["old_subsystem"], bool(row["old_verified"]), -1)
+                _apply_delta(stats, row["type"], row["subsystem"], row["verified"], 1)
+                markers.append({
+                    "id": row["id"],
+                    "type": row["type"],
+                    "subsystem": row["subsystem"],
+                    "verified": row["verified"]
+                })
+
+            self.client.execute(
+                """
+                UNWIND $markers AS m
+                MATCH (r:Requirement {id: m.id})
+                SET r.stats_counted = true,
+                    r.stats_type = m.type,
+                    r.stats_subsystem = m.subsystem,
+                    r.stats_verified = m.verified
+                """,
+                markers=markers
+            )
+
+        stats["node_counts"] = self._count_nodes()
+        self._write(stats)
+
+        logger.info(
+            f"  ✓ Statistics updated for {len(req_ids)} requirements "
+            f"({stats['verified_requirements']}/{stats['total_requirements']} verified)"
+        )
+
+    def remove_requirements(self, req_ids: Iterable[str]):
+        """
+        Subtract the counted contribution of requirements about to be deleted.
+
+        Call before deleting Requirement nodes.
+
+        Args:
+            req_ids: IDs of requirements being deleted
+        """
+        req_ids = sorted(set(req_ids))
+        if not req_ids:
+            return
+
+        stats = self._read()
+        rows = self.client.execute(
+            """
+            UNWIND $req_ids AS req_id
+            MATCH (r:Requirement {id: req_id})
+            WHERE r.stats_counted
+            RETURN r.stats_type AS old_type,
+                   r.stats_subsystem AS old_subsystem,
+                   r.stats_verified AS old_verified
+            """,
+            req_ids=req_ids
+        )
+
+        for row in rows:
+            _apply_delta(stats, row["old_type"], row["old_subsystem"], bool(row["old_verified"]), -1)
+
+        self._write(stats)
+        logger.info(f"  ✓ Statistics: removed {len(rows)} requirements")
+
+    def refresh_counts(self):
+        """Refresh node counts only (after loading sections or documents)."""
+        stats = self._read()
+        stats["node_counts"] = self._count_nodes()
+        self._write(stats)
+
+    def rebuild(self):
+        """Recount every requirement from scratch (backfill or repair)."""
+        logger.info("Rebuilding graph statistics...")
+
+        self.client.execute("MATCH (s:GraphStatistics {id: $id}) DETACH DELETE s", id=STATISTICS_NODE_ID)
+        self.client.execute("MATCH (r:Requirement) REMOVE r.stats_counted, r.stats_type, r.stats_subsystem, r.stats_verified")
+
+        rows = self.client.execute("MATCH (r:Requirement) RETURN r.id AS id")
+        self.update_requirements(row["id"] for row in rows)
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get coverage summary (single node lookup).
+
+        Returns:
+            Dict with overall, per-type and per-subsystem coverage, node counts
+            and graph_version
+        """
+        stats = self._read()
+        total = stats["total_requirements"]
+        verified = stats["verified_requirements"]
+
+        def facet_rows(facet: Dict[str, Dict[str, int]]) -> List[Dict[str, Any]]:
+            return sorted(
+                (
+                    {
+                        "name": name,
+                        "total": bucket["total"],
+                        "verified": bucket["verified"],
+                        "coverage_percentage": coverage_percentage(bucket["total"], bucket["verified"])
+                    }
+                    for name, bucket in facet.items()
+                ),
+                key=lambda row: row["total"],
+                reverse=True
+            )
+
+        return {
+            "total_requirements": total,
+            "verified_requirements": verified,
+            "unverified_requirements": total - verified,
+            "total_test_cases": stats["node_counts"].get("TestCase", 0),
+            "coverage_percentage": coverage_percentage(total, verified),
+            "by_type": facet_rows(stats["by_type"]),
+            "by_subsystem": facet_rows(stats["by_subsystem"]),
+            "node_counts": stats["node_counts"],
+            "graph_version": stats["graph_version"],
+            "updated_at": stats.get("updated_at")
+        }
+
+    def close(self):
+        """Close Neo4j connection."""
+        self.client.close()
@@ -1,16 +1,80 @@
 """Neo4j database client."""
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
+import numpy as np
 from neo4j import GraphDatabase
 from dotenv import load_dotenv
 import logging
 
+from src.utils.embeddings import to_driver_value
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
 
+def estimate_param_bytes(value: Any) -> int:
+    """
+    Estimate the Bolt (PackStream) size of a query parameter value.
+
+    Floats and ints are counted at their 9-byte worst case, so a 3072-d
+    embedding counts ~27.6 KB.
+
+    Args:
+        value: Parameter value (nested dicts/lists of scalars)
+
+    Returns:
+        Estimated encoded size in bytes
+    """
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float, np.generic)):
+        return 9
+    if isinstance(value, str):
+        return len(value.encode("utf-8")) + 5
+    if isinstance(value, np.ndarray):
+        return 5 + 9 * value.size
+    if isinstance(value, dict):
+        return 5 + sum(estimate_param_bytes(k) + estimate_param_bytes(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], float):
+            return 5 + 9 * len(value)
+        return 5 + sum(estimate_param_bytes(v) for v in value)
+    return len(str(value)) + 5
+
+
+def split_by_bytes(items: List[Any], max_bytes: int) -> List[List[Any]]:
+    """
+    Split items into consecutive batches of at most max_bytes estimated size.
+
+    An item larger than max_bytes forms a batch of its own.
+
+    Args:
+        items: Parameter items (e.g. requirement dicts)
+        max_bytes: Batch size bound
+
+    Returns:
+        Batches in item order
+    """
+    batches: List[List[Any]] = []
+    batch: List[Any] = []
+    batch_bytes = 0
+
+    for item in items:
+        size = estimate_param_bytes(item)
+        if batch and batch_bytes + size > max_bytes:
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += size
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 class Neo4jClient:
     """Neo4j database connection and query execution."""
 
@@ -20,6 +84,8 @@ class Neo4jClient:
         self.user = os.getenv("NEO4J_USER", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "password")
         self.database = os.getenv("NEO4J_DATABASE", "neo4j")
+        self.write_batch_bytes = int(os.getenv("NEO4J_WRITE_BATCH_BYTES", str(4 * 1024 * 1024)))
+        self.write_concurrency = int(os.getenv("NEO4J_WRITE_CONCURRENCY", "1"))
 
         try:
             self.driver = GraphDatabase.driver(
@@ -45,13 +111,13 @@ class Neo4jClient:
 
         Args:
             cypher: Cypher query string
-            **params: Query parameters
+            **params: Query parameters (embedding arrays are sent as lists)
 
         Returns:
             List of result dictionaries
         """
         with self.driver.session(database=self.database) as session:
-            result = session.run(cypher, **params)
+            result = session.run(cypher, **to_driver_value(params))
             return [record.data() for record in result]
 
     def query(self, cypher: str, **params) -> List[Dict[str, Any]]:
@@ -80,10 +146,61 @@ class Neo4jClient:
         """
         with self.driver.session(database=self.database) as session:
             result = session.execute_write(
-                lambda tx: list(tx.run(cypher, **params))
+                lambda tx: list(tx.run(cypher, **to_driver_value(params)))
             )
             return [record.data() for record in result]
 
+    def execute_write_batches(
+        self,
+        cypher: str,
+        param: str,
+        items: List[Any],
+        max_bytes: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        **params
+    ) -> List[Dict[str, Any]]:
+        """
+        Run an UNWIND write in transactions bounded by estimated payload size.
+
+        Each batch runs in a managed write transaction (`execute_write`), which
+        the driver retries on transient errors (deadlocks, leader changes).
+        With concurrency > 1, batches run in parallel sessions, so the query
+        must tolerate concurrent batches (e.g. MERGE on distinct IDs).
+
+        Args:
+            cypher: Cypher query reading the batch from `$<param>`
+            param: Name of the list parameter
+            items: Items to write
+            max_bytes: Batch size bound (default: NEO4J_WRITE_BATCH_BYTES, 4 MB)
+            concurrency: Parallel transactions (default: NEO4J_WRITE_CONCURRENCY, 1)
+            **params: Other query parameters (sent with every batch)
+
+        Returns:
+            Result rows of all batches, in batch order
+        """
+        batches = split_by_bytes(items, max_bytes or self.write_batch_bytes)
+        workers = min(concurrency or self.write_concurrency, len(batches))
+        params = to_driver_value(params)
+
+        def write(batch: List[Any]) -> List[Dict[str, Any]]:
+            # Embedding arrays become lists per batch, so only one batch is expanded at a time
+            batch_params = {param: to_driver_value(batch), **params}
+            with self.driver.session(database=self.database) as session:
+                return session.execute_write(
+                    lambda tx: [record.data() for record in tx.run(cypher, **batch_params)]
+                )
+
+        if workers <= 1:
+            results = [write(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(write, batches))
+
+        if len(batches) > 1:
+            logger.debug(f"Wrote {len(items)} {param} in {len(batches)} transactions ({workers} concurrent)")
+
+        return [row for rows in results for row in rows]
+
     def verify_connection(self) -> bool:
         """
         Verify database connection is working.
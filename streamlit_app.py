@@ -36,6 +36,7 @@ except (FileNotFoundError, AttributeError):
 
 from src.graphrag.workflow import GraphRAGWorkflow
 from src.graphrag.hitl import HITLManager
+from src.utils.graph_statistics import GraphStatistics
 
 # Page config
 st.set_page_config(
@@ -117,6 +118,16 @@ def render_header():
     st.markdown("---")
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def load_graph_statistics() -> Dict[str, Any]:
+    """Load precomputed coverage statistics (single node lookup, cached for 60s)."""
+    statistics = GraphStatistics()
+    try:
+        return statistics.get_summary()
+    finally:
+        statistics.close()
+
+
 def render_sidebar():
     """Render sidebar with settings and stats."""
     with st.sidebar:
@@ -138,6 +149,39 @@ def render_sidebar():
 
         st.markdown("---")
 
+        # Graph coverage (maintained by the loader)
+        st.header("🧪 Verification Coverage")
+
+        try:
+            graph_stats = load_graph_statistics()
+
+            if graph_stats["total_requirements"]:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Coverage", f"{graph_stats['coverage_percentage']:.1f}%")
+                with col2:
+                    st.metric("Unverified", graph_stats["unverified_requirements"])
+
+                st.caption(
+                    f"{graph_stats['verified_requirements']}/{graph_stats['total_requirements']} requirements, "
+                    f"{graph_stats['total_test_cases']} test cases"
+                )
+
+                with st.expander("By requirement type"):
+                    for row in graph_stats["by_type"]:
+                        st.write(f"- {row['name']}: {row['verified']}/{row['total']} ({row['coverage_percentage']:.0f}%)")
+
+                with st.expander("By subsystem"):
+                    for row in graph_stats["by_subsystem"]:
+                        st.write(f"- {row['name']}: {row['verified']}/{row['total']} ({row['coverage_percentage']:.0f}%)")
+            else:
+                st.info("No statistics yet (run scripts/load_documents.py)")
+
+        except Exception as e:
+            st.warning(f"Coverage statistics unavailable: {e}")
+
+        st.markdown("---")
+
         # Statistics
         st.header("📊 Session Statistics")
 
@@ -0,0 +1,139 @@
+"""
+Unit tests for the neo4j-admin CSV export
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.ingestion.bulk_export import (
+    ARRAY_DELIMITER,
+    MANIFEST_NAME,
+    BulkExporter,
+    _COVERS_PART_PATTERN,
+    _REQUIREMENT_ID_PATTERN,
+    covered_parent_ids,
+    format_value
+)
+from src.ingestion.neo4j_loader import MOSARGraphLoader
+
+REQUIREMENTS = [
+    {"id": "FuncR_S101", "title": "Repair", "statement": "The system shall repair.", "covers": None},
+    {"id": "FuncR_A101", "title": "Walk", "statement": "Line one\nLine \"two\"", "covers": "FuncR_S101"},
+    {"id": "FuncR_B101", "title": "Grip", "statement": "", "covers": "FuncR_A101, FuncR_X999"},
+]
+
+
+@pytest.fixture
+def exporter(tmp_path):
+    """Exporter without entity resolution."""
+    resolver = MagicMock()
+    resolver.resolve.return_value = {}
+    return BulkExporter(tmp_path / "csv", entity_resolver=resolver)
+
+
+class TestCoveredParentIds:
+    """Test COVERS parsing matches the loader's Cypher."""
+
+    @pytest.mark.parametrize("covers,expected", [
+        (None, []),
+        ("", []),
+        ("N/A", []),
+        ("FuncR_S101", ["FuncR_S101"]),
+        ("FuncR_S101, SafR_S201", ["FuncR_S101", "SafR_S201"]),
+        ("partially FuncR_S101", ["FuncR_S101"]),
+        ("FuncR_S101 FuncR_S102", ["FuncR_S101"]),
+        ("FuncR_S101.", []),
+        ("funcr_s101", []),
+        (" FuncR_S101 ,, DesR_A001 ", ["FuncR_S101", "DesR_A001"]),
+    ])
+    def test_parents(self, covers, expected):
+        """Test the first requirement ID of each comma-separated part is taken."""
+        assert covered_parent_ids(covers) == expected
+
+    def test_patterns_match_loader_cypher(self):
+        """Test the regexes are the ones in MOSARGraphLoader.create_covers_relationships."""
+        client = MagicMock()
+        client.execute.return_value = []
+        with patch('src.ingestion.neo4j_loader.Neo4jClient', return_value=client), \
+             patch('src.ingestion.neo4j_loader.EntityResolver'):
+            MOSARGraphLoader().create_covers_relationships(REQUIREMENTS)
+
+        cypher = client.execute.call_args.args[0]
+        assert f"part_trimmed =~ '{_COVERS_PART_PATTERN.pattern}'" in cypher
+        assert f"x =~ '{_REQUIREMENT_ID_PATTERN.pattern}'" in cypher
+        assert "split(covers_str, ',')" in cypher
+        assert "split(part_trimmed, ' ')" in cypher
+
+
+class TestFormatValue:
+    """Test CSV field formatting for neo4j-admin."""
+
+    @pytest.mark.parametrize("value,value_type,expected", [
+        (None, "string", ""),
+        ("", "string", '""'),
+        ("plain", "string", '"plain"'),
+        ('say "hi"', "string", '"say ""hi"""'),
+        ("a,b\nc", "string", '"a,b\nc"'),
+        (3, "string", '"3"'),
+        (None, "long", ""),
+        (0, "long", "0"),
+        (12, "long", "12"),
+        ([0.5, 1, -2.25], "double[]", f"0.5{ARRAY_DELIMITER}1.0{ARRAY_DELIMITER}-2.25"),
+        ([], "double[]", ""),
+        (None, "double[]", ""),
+    ])
+    def test_format(self, value, value_type, expected):
+        """Test quoting, None vs empty string, numbers and arrays."""
+        assert format_value(value, value_type) == expected
+
+
+class TestExport:
+    """Test exported files, manifest and import command."""
+
+    def test_requirement_rows_and_relationships(self, exporter):
+        """Test nodes keep multi-line text and only existing parents become DERIVES_FROM."""
+        counts = exporter.export([dict(req) for req in REQUIREMENTS], {}, [])
+
+        assert counts["Requirement"] == 3
+        assert counts["DERIVES_FROM"] == 2
+        assert counts["DERIVES_FROM_CLOSURE"] == 3
+
+        nodes = (exporter.out_dir / "nodes_requirement.csv").read_text(encoding="utf-8")
+        assert nodes.startswith("id:ID(Requirement),title:string,statement:string")
+        assert '"Line one\nLine ""two"""' in nodes
+
+        closure = (exporter.out_dir / "rels_derives_from_closure_requirement_requirement.csv").read_text(
+            encoding="utf-8"
+        ).splitlines()
+        assert closure[0] == ":START_ID(Requirement),:END_ID(Requirement),depth:long"
+        assert '"FuncR_B101","FuncR_S101",2' in closure
+
+    def test_manifest_lists_every_file(self, exporter):
+        """Test the manifest names each written file once, and nothing stale survives."""
+        (exporter.out_dir).mkdir(parents=True)
+        (exporter.out_dir / "nodes_stale.csv").write_text("old", encoding="utf-8")
+
+        exporter.export([dict(req) for req in REQUIREMENTS], {"PDD": []}, [])
+
+        manifest = json.loads((exporter.out_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        files = [entry["file"] for entry in manifest["nodes"] + manifest["relationships"]]
+        assert len(files) == len(set(files))
+        assert sorted(files) == sorted(path.name for path in exporter.out_dir.glob("*.csv"))
+        assert {entry["label"] for entry in manifest["nodes"]} >= {"Requirement", "Section", "Document", "TestCase"}
+
+    def test_import_command_from_manifest(self, exporter):
+        """Test a new exporter rebuilds the command from the manifest on disk."""
+        exporter.export([dict(req) for req in REQUIREMENTS], {}, [])
+
+        command = BulkExporter(exporter.out_dir, entity_resolver=MagicMock()).import_command(
+            database="mosar", csv_dir="/import"
+        )
+
+        assert command[:5] == ["neo4j-admin", "database", "import", "full", "mosar"]
+        assert f"--array-delimiter={ARRAY_DELIMITER}" in command
+        assert "--multiline-fields=true" in command
+        assert "--nodes=Requirement=/import/nodes_requirement.csv" in command
+        assert "--relationships=DERIVES_FROM=/import/rels_derives_from_requirement_requirement.csv" in command
+        assert command == exporter.import_command(database="mosar", csv_dir="/import")
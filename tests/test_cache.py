@@ -0,0 +1,109 @@
+"""
+Unit tests for graph-version aware query caching
+"""
+
+import pytest
+from unittest.mock import patch
+
+import src.utils.cache as cache_module
+from src.utils.cache import QueryCache
+
+QUERY = "MATCH (r:Requirement) RETURN count(r) AS count"
+
+
+def _saved_snapshot(tmp_path, graph_version):
+    """Snapshot file written by a cache at graph_version."""
+    cache = QueryCache()
+    cache.set_graph_version(graph_version)
+    cache.set_cypher_results(QUERY, None, [{"count": 1}])
+    cache.set_answer("question", "pure_cypher", {"answer": "old"})
+    path = tmp_path / "cache.json"
+    cache.save(str(path))
+    return path
+
+
+class TestGraphVersion:
+    """Test cached graph results expire when the graph changes."""
+
+    def test_version_change_drops_cypher_and_answers(self):
+        """Test results cached for an older graph are no longer served."""
+        cache = QueryCache()
+        cache.set_graph_version(1)
+        cache.set_cypher_results(QUERY, None, [{"count": 1}])
+        cache.set_answer("question", "pure_cypher", {"answer": "old"})
+
+        assert cache.set_graph_version(1) is False
+        assert cache.get_cypher_results(QUERY) == [{"count": 1}]
+
+        assert cache.set_graph_version(2) is True
+        assert cache.get_cypher_results(QUERY) is None
+        assert cache.get_answer("question", "pure_cypher") is None
+
+    def test_version_is_part_of_cypher_key(self):
+        """Test the same query under another version is a different entry."""
+        cache = QueryCache()
+        cache.set_cypher_results(QUERY, None, [{"count": 1}])
+        cache.graph_version = 3
+
+        assert cache.get_cypher_results(QUERY) is None
+
+    def test_snapshot_loaded_for_same_version(self, tmp_path):
+        """Test a snapshot of the current graph is loaded."""
+        path = _saved_snapshot(tmp_path, graph_version=4)
+        cache = QueryCache()
+        cache.set_graph_version(4)
+
+        assert cache.load(str(path)) == 2
+        assert cache.get_cypher_results(QUERY) == [{"count": 1}]
+
+    @pytest.mark.parametrize("current", [5, None])
+    def test_snapshot_of_other_version_discarded(self, tmp_path, current):
+        """Test a snapshot warmed before the last load is not served."""
+        path = _saved_snapshot(tmp_path, graph_version=4)
+        cache = QueryCache()
+        cache.set_graph_version(current)
+
+        assert cache.load(str(path)) == 0
+        assert cache.get_cypher_results(QUERY) is None
+
+
+class TestDefaultCache:
+    """Test the environment-configured singleton tracks the graph version."""
+
+    @pytest.fixture
+    def fresh_singleton(self, monkeypatch):
+        monkeypatch.setattr(cache_module, "_query_cache", None)
+        monkeypatch.setattr(cache_module, "_graph_version_checked_at", 0.0)
+        monkeypatch.setenv("CACHE_ENABLED", "true")
+        monkeypatch.setenv("CACHE_GRAPH_VERSION_CHECK_SECONDS", "0")
+
+    def test_persisted_snapshot_checked_against_graph(self, fresh_singleton, tmp_path, monkeypatch):
+        """Test a stale snapshot is discarded on first use."""
+        path = _saved_snapshot(tmp_path, graph_version=4)
+        monkeypatch.setenv("CACHE_PERSIST_PATH", str(path))
+
+        with patch.object(cache_module, "_read_current_graph_version", return_value=5):
+            cache = cache_module.get_default_query_cache()
+
+        assert cache.graph_version == 5
+        assert cache.get_cypher_results(QUERY) is None
+
+    def test_running_cache_follows_graph_loads(self, fresh_singleton, monkeypatch):
+        """Test in-process entries expire once a load bumps the graph version."""
+        monkeypatch.delenv("CACHE_PERSIST_PATH", raising=False)
+
+        with patch.object(cache_module, "_read_current_graph_version", side_effect=[1, 1, 2]):
+            cache = cache_module.get_default_query_cache()
+            cache.set_cypher_results(QUERY, None, [{"count": 1}])
+            assert cache_module.get_default_query_cache().get_cypher_results(QUERY) == [{"count": 1}]
+            assert cache_module.get_default_query_cache().get_cypher_results(QUERY) is None
+
+    def test_unreachable_graph_keeps_cache(self, fresh_singleton, monkeypatch):
+        """Test a failed version read leaves the cache as it is."""
+        monkeypatch.delenv("CACHE_PERSIST_PATH", raising=False)
+
+        with patch.object(cache_module, "_read_current_graph_version", side_effect=[1, Exception("down")]):
+            cache = cache_module.get_default_query_cache()
+            cache.set_cypher_results(QUERY, None, [{"count": 1}])
+
+            assert cache_module.get_default_query_cache().get_cypher_results(QUERY) == [{"count": 1}]
@@ -0,0 +1,93 @@
+"""
+Unit tests for cache warm-up
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.utils.cache import QueryCache
+from src.utils.cache_warmup import GLOBAL_TEMPLATES, CacheWarmer
+
+ENTITY_IDS = {
+    "Requirement": ["FuncR_S101", "FuncR_S102", "SafR_S201"],
+    "Component": ["R-ICU", "WM"],
+    "TestCase": ["IT1"],
+}
+
+
+def _client() -> MagicMock:
+    """Neo4j client enumerating ENTITY_IDS and answering every template with one row."""
+    def execute(cypher, **params):
+        if "GraphStatistics" in cypher:
+            return [{"graph_version": 7}]
+        if "RETURN DISTINCT" in cypher:
+            label = cypher.split("MATCH (n:")[1].split(")")[0]
+            return [{"id": entity_id} for entity_id in ENTITY_IDS.get(label, [])]
+        return [{"row": cypher[:20]}]
+
+    client = MagicMock()
+    client.execute.side_effect = execute
+    return client
+
+
+def _warmer(max_size: int) -> CacheWarmer:
+    return CacheWarmer(client=_client(), cache=QueryCache(max_size=max_size), max_workers=2)
+
+
+class TestWarmTemplates:
+    """Test template warm-up against the cache size."""
+
+    def test_all_jobs_warmed_when_cache_fits(self):
+        """Test every template is warmed and retrievable when the cache is large enough."""
+        warmer = _warmer(max_size=1000)
+        jobs = warmer.build_jobs(warmer.enumerate_entities())
+
+        report = warmer.warm_templates()
+
+        assert report["queries"] == len(jobs)
+        assert report["skipped"] == 0
+        assert all(warmer.cache.get_cypher_results(cypher) is not None for _, _, _, cypher in jobs)
+
+    @pytest.mark.parametrize("max_size", [len(GLOBAL_TEMPLATES) + 4, len(GLOBAL_TEMPLATES) + 7])
+    def test_warmed_entries_survive_small_cache(self, max_size):
+        """Test warm-up never evicts what it warmed when the query space exceeds max_size."""
+        warmer = _warmer(max_size=max_size)
+        jobs = warmer.build_jobs(warmer.enumerate_entities())
+        assert len(jobs) > max_size
+
+        report = warmer.warm_templates()
+
+        kept, skipped = warmer.fit_to_cache(jobs)
+        assert report["queries"] == max_size
+        assert report["skipped"] == skipped == len(jobs) - max_size
+        assert warmer.cache.get_stats()["evictions"] == 0
+        assert all(warmer.cache.get_cypher_results(cypher) is not None for _, _, _, cypher in kept)
+
+    def test_priority_order_when_capped(self):
+        """Test summary templates come first, then primary templates by entity priority."""
+        warmer = _warmer(max_size=len(GLOBAL_TEMPLATES) + 4)
+        jobs = warmer.build_jobs(warmer.enumerate_entities())
+
+        kept, _ = warmer.fit_to_cache(jobs)
+
+        assert [template for _, template, _, _ in kept[:len(GLOBAL_TEMPLATES)]] == GLOBAL_TEMPLATES
+        assert [(entity_type, template) for entity_type, template, _, _ in kept[len(GLOBAL_TEMPLATES):]] == [
+            ("Requirement", "get_requirement_traceability"),
+            ("Requirement", "get_requirement_traceability"),
+            ("Requirement", "get_requirement_traceability"),
+            ("Component", "get_component_requirements"),
+        ]
+
+    def test_warm_up_records_graph_version(self, tmp_path):
+        """Test warmed results and the saved snapshot carry the graph version."""
+        warmer = _warmer(max_size=1000)
+        warmer.warm_templates()
+        path = tmp_path / "cache.json"
+        warmer.cache.save(str(path))
+
+        assert warmer.cache.graph_version == 7
+
+        reader = QueryCache(max_size=1000)
+        reader.set_graph_version(7)
+        assert reader.load(str(path)) > 0
+        assert reader.get_cypher_results(warmer.templates.get_test_coverage()) is not None
@@ -0,0 +1,132 @@
+"""
+Unit tests for resumable load checkpoints
+"""
+
+import json
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from src.ingestion.checkpoint import LoadCheckpoint, embedding_batch_key
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Two source documents."""
+    srd = tmp_path / "srd.md"
+    pdd = tmp_path / "pdd.md"
+    srd.write_text("SRD v1", encoding="utf-8")
+    pdd.write_text("PDD v1", encoding="utf-8")
+    return {"SRD": srd, "PDD": pdd}
+
+
+@pytest.fixture
+def work_dir(tmp_path):
+    """Checkpoint directory."""
+    return tmp_path / "work"
+
+
+def _populate(work_dir, sources) -> str:
+    """Write a checkpoint with a stage, parsed items and an embedding batch."""
+    checkpoint = LoadCheckpoint(work_dir, sources)
+    checkpoint.save_parsed("SRD", [{"id": "R1"}])
+    checkpoint.mark_done("parse:SRD", chunks=1)
+    key = embedding_batch_key("model:3072", ["text"])
+    checkpoint.save_embeddings(key, np.ones((1, 4), dtype=np.float32))
+    return key
+
+
+class TestResume:
+    """Test resuming and discarding checkpoints."""
+
+    def test_resume_keeps_progress(self, work_dir, sources):
+        """Test a resumed checkpoint reports completed stages, parsed items and embeddings."""
+        key = _populate(work_dir, sources)
+
+        checkpoint = LoadCheckpoint(work_dir, sources, resume=True)
+
+        assert checkpoint.resumed
+        assert checkpoint.is_done("parse:SRD")
+        assert checkpoint.stage_details("parse:SRD")["chunks"] == 1
+        assert checkpoint.load_parsed("SRD") == [{"id": "R1"}]
+        embeddings = checkpoint.load_embeddings(key)
+        assert embeddings.dtype == np.float32
+        assert np.array_equal(embeddings, np.ones((1, 4)))
+
+    def test_without_resume_starts_over(self, work_dir, sources):
+        """Test a normal run discards the previous checkpoint."""
+        key = _populate(work_dir, sources)
+
+        checkpoint = LoadCheckpoint(work_dir, sources)
+
+        assert not checkpoint.resumed
+        assert checkpoint.completed_stages() == []
+        assert checkpoint.load_embeddings(key) is None
+        assert not (work_dir / "parsed").exists()
+        assert not (work_dir / "embeddings").exists()
+
+    def test_changed_source_invalidates(self, work_dir, sources):
+        """Test a changed source document discards the checkpoint even with resume."""
+        _populate(work_dir, sources)
+        sources["PDD"].write_text("PDD v2", encoding="utf-8")
+
+        checkpoint = LoadCheckpoint(work_dir, sources, resume=True)
+
+        assert not checkpoint.resumed
+        assert not checkpoint.is_done("parse:SRD")
+
+    def test_unreadable_manifest_starts_over(self, work_dir, sources):
+        """Test a corrupt manifest is treated as no checkpoint."""
+        _populate(work_dir, sources)
+        (work_dir / "manifest.json").write_text("{not json", encoding="utf-8")
+
+        checkpoint = LoadCheckpoint(work_dir, sources, resume=True)
+
+        assert not checkpoint.resumed
+        assert json.loads((work_dir / "manifest.json").read_text(encoding="utf-8"))["stages"] == {}
+
+    def test_foreign_files_survive_reset(self, work_dir, sources):
+        """Test only the checkpoint's own entries are deleted from a shared work directory."""
+        work_dir.mkdir()
+        (work_dir / "notes.txt").write_text("keep me", encoding="utf-8")
+        (work_dir / "data").mkdir()
+        (work_dir / "data" / "keep.csv").write_text("a,b", encoding="utf-8")
+        _populate(work_dir, sources)
+
+        LoadCheckpoint(work_dir, sources)
+
+        assert (work_dir / "notes.txt").read_text(encoding="utf-8") == "keep me"
+        assert (work_dir / "data" / "keep.csv").exists()
+
+
+class TestAtomicWrites:
+    """Test interrupted writes never leave partial checkpoint files."""
+
+    def test_failed_rename_keeps_previous_manifest(self, work_dir, sources):
+        """Test a crash before the rename leaves the last complete manifest in place."""
+        _populate(work_dir, sources)
+        checkpoint = LoadCheckpoint(work_dir, sources, resume=True)
+
+        with patch('src.ingestion.checkpoint.os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                checkpoint.mark_done("write:SRD", count=1)
+
+        manifest = json.loads((work_dir / "manifest.json").read_text(encoding="utf-8"))
+        assert "parse:SRD" in manifest["stages"]
+        assert "write:SRD" not in manifest["stages"]
+
+    def test_no_temporary_files_left(self, work_dir, sources):
+        """Test completed writes leave no temporary files behind."""
+        _populate(work_dir, sources)
+
+        assert not [path for path in work_dir.rglob("*") if ".tmp" in path.name]
+
+    def test_float64_batches_cast_on_load(self, work_dir, sources):
+        """Test batches written as float64 by older versions load as float32."""
+        checkpoint = LoadCheckpoint(work_dir, sources)
+        key = embedding_batch_key("model:3072", ["text"])
+        checkpoint.save_embeddings(key, np.ones((1, 4)))
+        np.save(work_dir / "embeddings" / f"{key}.npy", np.ones((1, 4), dtype=np.float64))
+
+        assert checkpoint.load_embeddings(key).dtype == np.float32
@@ -0,0 +1,67 @@
+"""
+Unit tests for compact vector index management
+"""
+
+from unittest.mock import MagicMock
+
+from src.neo4j_schema.create_schema import ensure_compact_indexes, get_index_dimension
+
+
+def _client(dimensions: dict) -> MagicMock:
+    """Client whose SHOW INDEXES reports the given index -> dimension map."""
+    client = MagicMock()
+
+    def execute(cypher, **params):
+        if cypher.startswith("SHOW INDEXES"):
+            if params["name"] not in dimensions:
+                return []
+            return [{"options": {"indexConfig": {"vector.dimensions": dimensions[params["name"]]}}}]
+        return []
+
+    client.execute.side_effect = execute
+    return client
+
+
+def _statements(client: MagicMock) -> list:
+    """Executed statements other than SHOW INDEXES."""
+    return [c.args[0].strip() for c in client.execute.call_args_list if not c.args[0].startswith("SHOW")]
+
+
+class TestCompactIndexes:
+    """Test compact index dimension checks."""
+
+    def test_get_index_dimension(self):
+        """Test the dimension is read from the index options."""
+        client = _client({"section_embeddings_small": 256})
+        assert get_index_dimension(client, "section_embeddings_small") == 256
+        assert get_index_dimension(client, "missing") is None
+
+    def test_matching_indexes_kept(self):
+        """Test indexes with the configured dimension are left alone."""
+        client = _client({"section_embeddings_small": 512, "requirement_embeddings_small": 512})
+
+        ensure_compact_indexes(client, 512)
+
+        assert _statements(client) == []
+
+    def test_mismatched_index_recreated(self):
+        """Test a 256-d index is dropped and recreated for a 512-d configuration."""
+        client = _client({"section_embeddings_small": 256, "requirement_embeddings_small": 512})
+
+        ensure_compact_indexes(client, 512)
+
+        statements = _statements(client)
+        assert statements[0] == "DROP INDEX section_embeddings_small IF EXISTS"
+        assert "CREATE VECTOR INDEX section_embeddings_small" in statements[1]
+        assert "`vector.dimensions`: 512" in statements[1]
+        assert len(statements) == 2
+
+    def test_missing_index_created(self):
+        """Test missing indexes are created without a drop."""
+        client = _client({})
+
+        ensure_compact_indexes(client, 128)
+
+        statements = _statements(client)
+        assert len(statements) == 2
+        assert all(s.startswith("CREATE VECTOR INDEX") for s in statements)
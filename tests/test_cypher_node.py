@@ -12,6 +12,7 @@ from src.graphrag.nodes.cypher_node import (
 )
 from src.graphrag.state import GraphRAGState
 from src.query.router import QueryPath
+from src.utils.graph_statistics import STATISTICS_QUERY
 
 
 class TestBuildContextualQuery:
@@ -208,6 +209,300 @@ class TestRunTemplateCypher:
             assert result_state["graph_results"] == []
             assert "Cypher execution error" in result_state["error"]
 
+    def test_run_template_repeat_served_from_cache(self, env_setup, sample_graph_rag_state, sample_graph_results):
+        """Test repeated template query is served from the Cypher cache."""
+        from src.utils.cache import QueryCache
+
+        state = sample_graph_rag_state.copy()
+        state["matched_entities"] = {"requirements": ["FuncR_S110"]}
+
+        with patch('src.graphrag.nodes.cypher_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.cypher_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = sample_graph_results
+            mock_neo4j.return_value = neo4j_instance
+
+            first_state = run_template_cypher(state.copy())
+            second_state = run_template_cypher(state.copy())
+
+            assert first_state["graph_results"] == sample_graph_results
+            assert second_state["graph_results"] == sample_graph_results
+            assert neo4j_instance.execute.call_count == 1
+
+    def test_run_template_uses_materialized_traceability(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test traceability is read from the precomputed document when enabled."""
+        import json
+        from src.utils.cache import QueryCache
+
+        monkeypatch.setenv("USE_MATERIALIZED_TRACEABILITY", "true")
+        state = sample_graph_rag_state.copy()
+        state["matched_entities"] = {"requirements": ["FuncR_S110"]}
+        doc = {"requirement_id": "FuncR_S110", "test_cases": ["IT1"], "child_requirements": []}
+
+        with patch('src.graphrag.nodes.cypher_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.cypher_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = [{"traceability_doc": json.dumps(doc)}]
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_template_cypher(state)
+
+            assert result_state["graph_results"] == [doc]
+            assert result_state["query_generation_method"] == "template:get_materialized_traceability"
+            executed_query = neo4j_instance.execute.call_args[0][0]
+            assert "traceability_doc" in executed_query
+            assert "DERIVES_FROM" not in executed_query
+
+    def test_missing_materialized_traceability_not_cached(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test a missing or null document is looked up again instead of served from the cache."""
+        import json
+        from src.utils.cache import QueryCache
+
+        monkeypatch.setenv("USE_MATERIALIZED_TRACEABILITY", "true")
+        state = sample_graph_rag_state.copy()
+        state["matched_entities"] = {"requirements": ["FuncR_S110"]}
+        doc = {"requirement_id": "FuncR_S110", "test_cases": [], "child_requirements": []}
+        live_results = [{"requirement_id": "FuncR_S110", "live": True}]
+        documents = [[], [{"traceability_doc": None}], [{"traceability_doc": json.dumps(doc)}]]
+
+        def fake_execute(cypher, **params):
+            if "traceability_doc" in cypher:
+                return documents.pop(0) if len(documents) > 1 else documents[0]
+            return live_results
+
+        with patch('src.graphrag.nodes.cypher_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.cypher_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.side_effect = fake_execute
+            mock_neo4j.return_value = neo4j_instance
+
+            assert run_template_cypher(state.copy())["graph_results"] == live_results
+            assert run_template_cypher(state.copy())["graph_results"] == live_results
+            assert run_template_cypher(state.copy())["graph_results"] == [doc]
+
+            # Found documents are cached
+            lookups = sum("traceability_doc" in c.args[0] for c in neo4j_instance.execute.call_args_list)
+            assert run_template_cypher(state.copy())["graph_results"] == [doc]
+            assert sum("traceability_doc" in c.args[0] for c in neo4j_instance.execute.call_args_list) == lookups
+
+    @pytest.mark.parametrize("question,expected_template", [
+        ("Show the decomposition tree of FuncR_S110", "get_requirement_decomposition_closure"),
+        ("What is the impact of changing FuncR_S110?", "get_requirement_impact"),
+    ])
+    def test_run_template_uses_closure_templates(self, env_setup, monkeypatch, sample_graph_rag_state,
+                                                 question, expected_template):
+        """Test decomposition/impact queries use DERIVES_FROM_CLOSURE when enabled."""
+        from src.utils.cache import QueryCache
+
+        monkeypatch.setenv("USE_DERIVES_FROM_CLOSURE", "true")
+        state = sample_graph_rag_state.copy()
+        state["user_question"] = question
+        state["matched_entities"] = {"requirements": ["FuncR_S110"]}
+
+        with patch('src.graphrag.nodes.cypher_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.cypher_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = [{"parent_id": "FuncR_S110"}]
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_template_cypher(state)
+
+            assert result_state["query_generation_method"] == f"template:{expected_template}"
+            executed_query = neo4j_instance.execute.call_args[0][0]
+            assert "DERIVES_FROM_CLOSURE" in executed_query
+            assert "DERIVES_FROM*" not in executed_query
+
+    def test_run_template_served_from_graph_snapshot(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test supported templates are answered from the in-memory graph snapshot."""
+        from src.query.graph_snapshot import GraphSnapshot
+
+        def fake_execute(cypher, **params):
+            if "MATCH (n:Requirement)" in cypher:
+                return [
+                    {"id": "FuncR_S110", "type": "FuncR", "statement": "Parent", "verification": "T", "level": "System"},
+                    {"id": "FuncR_C104", "type": "FuncR", "statement": "Child", "verification": "T", "level": "Component"},
+                ]
+            if "MATCH (n:TestCase)" in cypher:
+                return [{"id": "IT1", "test_type": None, "description": None, "status": None, "procedure": None}]
+            if "MATCH (n:Component)" in cypher:
+                return [{"id": "R-ICU", "name": "Reduced ICU"}]
+            if "[:DERIVES_FROM]" in cypher:
+                return [{"source": "FuncR_C104", "target": "FuncR_S110"}]
+            if "[:VERIFIES]" in cypher:
+                return [{"source": "IT1", "target": "FuncR_C104"}]
+            if "[:RELATES_TO]" in cypher:
+                return [{"source": "FuncR_C104", "target": "R-ICU"}]
+            return []
+
+        snapshot_client = MagicMock()
+        snapshot_client.execute.side_effect = fake_execute
+        snapshot = GraphSnapshot.load(snapshot_client, graph_version=1)
+
+        monkeypatch.setenv("USE_GRAPH_SNAPSHOT", "true")
+        state = sample_graph_rag_state.copy()
+        state["matched_entities"] = {"requirements": ["FuncR_S110"]}
+
+        with patch('src.graphrag.nodes.cypher_node.get_graph_snapshot', return_value=snapshot), \
+             patch('src.graphrag.nodes.cypher_node.Neo4jClient') as mock_neo4j:
+
+            result_state = run_template_cypher(state)
+
+            mock_neo4j.assert_not_called()
+            result = result_state["graph_results"][0]
+            assert result["requirement_id"] == "FuncR_S110"
+            assert result["parent_requirements"] == []
+            assert result["child_requirements"][0]["id"] == "FuncR_C104"
+            assert result["child_requirements"][0]["test_cases"] == ["IT1"]
+            assert result["child_requirements"][0]["components"] == ["R-ICU"]
+
+
+class TestStatisticsTemplates:
+    """Test coverage/summary questions served from materialized statistics."""
+
+    SUMMARY = {
+        "total_requirements": 4,
+        "verified_requirements": 3,
+        "unverified_requirements": 1,
+        "total_test_cases": 7,
+        "coverage_percentage": 75.0,
+        "by_type": [
+            {"name": "FuncR", "total": 3, "verified": 3, "coverage_percentage": 100.0},
+            {"name": "SafR", "total": 1, "verified": 0, "coverage_percentage": 0.0},
+        ],
+        "by_subsystem": [],
+        "node_counts": {},
+        "graph_version": 5,
+        "updated_at": None
+    }
+
+    def _run(self, monkeypatch, state, question, summary):
+        """Run the node for an entity-free question with GraphStatistics.get_summary mocked."""
+        from src.utils.cache import QueryCache
+
+        monkeypatch.setenv("USE_MATERIALIZED_STATISTICS", "true")
+        state = state.copy()
+        state["user_question"] = question
+        state["matched_entities"] = {}
+
+        neo4j_instance = MagicMock()
+        neo4j_instance.execute.return_value = [{"requirement_id": "SafR_S201"}]
+
+        with patch('src.graphrag.nodes.cypher_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.cypher_node.Neo4jClient', return_value=neo4j_instance), \
+             patch('src.graphrag.nodes.cypher_node.GraphStatistics') as mock_statistics:
+
+            mock_statistics.return_value.get_summary.return_value = summary
+            return run_template_cypher(state), neo4j_instance
+
+    def test_coverage_from_statistics(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test coverage questions read the statistics node instead of scanning requirements."""
+        result_state, neo4j_instance = self._run(
+            monkeypatch, sample_graph_rag_state, "What is the overall test coverage?", self.SUMMARY
+        )
+
+        assert result_state["graph_results"] == [{
+            "total_requirements": 4,
+            "verified_requirements": 3,
+            "unverified_requirements": 1,
+            "total_test_cases": 7,
+            "coverage_percentage": 75.0
+        }]
+        assert result_state["query_generation_method"] == "template:get_test_coverage"
+        neo4j_instance.execute.assert_not_called()
+
+    def test_requirements_by_type_from_statistics(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test per-type counts come from the by_type breakdown."""
+        result_state, neo4j_instance = self._run(
+            monkeypatch, sample_graph_rag_state, "How many requirements are there by type?", self.SUMMARY
+        )
+
+        assert result_state["graph_results"] == [
+            {"requirement_type": "FuncR", "count": 3},
+            {"requirement_type": "SafR", "count": 1},
+        ]
+        assert result_state["cypher_query"] == STATISTICS_QUERY
+        neo4j_instance.execute.assert_not_called()
+
+    def test_database_stats_from_node_counts(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test node counts per label come from the statistics node instead of a label scan."""
+        summary = dict(self.SUMMARY, node_counts={"Requirement": 4, "Section": 12, "Protocol": 0})
+
+        result_state, neo4j_instance = self._run(
+            monkeypatch, sample_graph_rag_state, "Show the database statistics", summary
+        )
+
+        assert result_state["graph_results"] == [
+            {"node_type": "Section", "node_count": 12},
+            {"node_type": "Requirement", "node_count": 4},
+        ]
+        assert result_state["query_generation_method"] == "template:get_database_stats"
+        assert result_state["cypher_query"] == STATISTICS_QUERY
+        neo4j_instance.execute.assert_not_called()
+
+    def test_unverified_uses_marker_query(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test unverified listings filter on the stats_verified marker for the named type."""
+        result_state, neo4j_instance = self._run(
+            monkeypatch, sample_graph_rag_state, "List unverified safr requirements", self.SUMMARY
+        )
+
+        assert result_state["graph_results"] == [{"requirement_id": "SafR_S201"}]
+        executed_query = neo4j_instance.execute.call_args[0][0]
+        assert "req.stats_verified = false" in executed_query
+        assert "req.type = 'SafR'" in executed_query
+        assert "VERIFIES" not in executed_query
+        assert result_state["cypher_query"] == executed_query
+
+    def test_fully_verified_type_skips_query(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test no query runs when the counters show nothing is unverified."""
+        result_state, neo4j_instance = self._run(
+            monkeypatch, sample_graph_rag_state, "Which FuncR requirements are untested?", self.SUMMARY
+        )
+
+        assert result_state["graph_results"] == []
+        neo4j_instance.execute.assert_not_called()
+
+    def test_missing_statistics_falls_back_to_live_query(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test the scanning template runs when no statistics node exists."""
+        empty = dict(self.SUMMARY, graph_version=0)
+
+        result_state, neo4j_instance = self._run(
+            monkeypatch, sample_graph_rag_state, "What is the overall test coverage?", empty
+        )
+
+        executed_query = neo4j_instance.execute.call_args[0][0]
+        assert "OPTIONAL MATCH (req)<-[:VERIFIES]-(tc:TestCase)" in executed_query
+        assert result_state["query_generation_method"] == "template:get_test_coverage"
+
+    def test_disabled_by_default(self, env_setup, sample_graph_rag_state):
+        """Test entity-free questions are not answered without the flag."""
+        state = sample_graph_rag_state.copy()
+        state["user_question"] = "What is the overall test coverage?"
+        state["matched_entities"] = {}
+
+        result_state = run_template_cypher(state)
+
+        assert result_state["graph_results"] == []
+        assert result_state.get("query_generation_method") != "template:get_test_coverage"
+
+    def test_router_sends_statistics_questions_to_path_a(self, monkeypatch):
+        """Test coverage questions are routed to Pure Cypher when enabled."""
+        from src.query.router import QueryRouter, detect_statistics_template
+
+        assert detect_statistics_template("요구사항 커버리지는?") == "get_test_coverage"
+        assert detect_statistics_template("그래프 통계를 보여줘") == "get_database_stats"
+        assert detect_statistics_template("Describe the gripper") is None
+
+        monkeypatch.setenv("USE_MATERIALIZED_STATISTICS", "true")
+        with patch('src.query.router.EntityResolver'):
+            query_path, routing_info = QueryRouter().route("What is the test coverage?")
+
+        assert query_path == QueryPath.PURE_CYPHER
+        assert routing_info["matched_entities"] == {}
+
 
 class TestRunContextualCypher:
     """Test contextual Cypher execution node."""
@@ -0,0 +1,85 @@
+"""
+Unit tests for the DERIVES_FROM transitive closure
+"""
+
+import pytest
+
+from src.ingestion.derivation_closure import DerivationClosure
+
+# L3 -> L2 -> L1 -> L0 chain plus a side branch S -> L1
+CHAIN = [("L3", "L2"), ("L2", "L1"), ("L1", "L0"), ("S", "L1")]
+
+
+class TestAddEdge:
+    """Test incremental closure maintenance."""
+
+    def test_chain_depths(self):
+        """Test every ancestor is recorded with its path length."""
+        closure = DerivationClosure.from_edges(CHAIN)
+
+        assert closure.get_ancestors("L3") == {"L2": 1, "L1": 2, "L0": 3}
+        assert closure.get_descendants("L1") == {"L2": 1, "L3": 2, "S": 1}
+
+    @pytest.mark.parametrize("edges", [CHAIN, list(reversed(CHAIN))])
+    def test_edge_order_does_not_matter(self, edges):
+        """Test adding edges top-down or bottom-up yields the same closure."""
+        assert sorted(DerivationClosure.from_edges(edges).pairs()) == sorted(
+            DerivationClosure.from_edges(CHAIN).pairs()
+        )
+
+    def test_shortcut_shortens_depth(self):
+        """Test a new direct edge shortens existing pairs and reports only those."""
+        closure = DerivationClosure.from_edges(CHAIN)
+
+        changed = closure.add_edge("L3", "L0")
+
+        assert changed == [("L3", "L0", 1)]
+        assert closure.get_ancestors("L3")["L0"] == 1
+        assert closure.get_descendants("L0")["L3"] == 1
+
+    def test_longer_path_keeps_shorter_depth(self):
+        """Test a second, longer path to an existing ancestor changes nothing."""
+        closure = DerivationClosure.from_edges([("A", "C"), ("A", "B")])
+
+        changed = closure.add_edge("B", "C")
+
+        assert changed == [("B", "C", 1)]
+        assert closure.get_ancestors("A") == {"B": 1, "C": 1}
+
+    def test_repeated_edge_changes_nothing(self):
+        """Test re-adding a known edge reports no changes."""
+        closure = DerivationClosure.from_edges(CHAIN)
+
+        assert closure.add_edge("L2", "L1") == []
+
+    def test_cycle_never_makes_a_requirement_its_own_ancestor(self):
+        """Test a COVERS cycle connects both sides without self pairs."""
+        closure = DerivationClosure.from_edges([("A", "B"), ("B", "C")])
+
+        closure.add_edge("C", "A")
+
+        assert all(descendant != ancestor for descendant, ancestor, _ in closure.pairs())
+        assert closure.get_ancestors("A") == {"B": 1, "C": 2}
+        assert closure.get_ancestors("C") == {"A": 1, "B": 2}
+
+
+class TestPairs:
+    """Test restoring a closure from stored pairs."""
+
+    def test_from_pairs_round_trip(self):
+        """Test pairs() output restores an identical closure."""
+        closure = DerivationClosure.from_edges(CHAIN)
+
+        restored = DerivationClosure.from_pairs(closure.pairs())
+
+        assert restored.ancestors == closure.ancestors
+        assert restored.descendants == closure.descendants
+
+    def test_restored_closure_continues_incrementally(self):
+        """Test edges added to a restored closure match a closure built from all edges."""
+        restored = DerivationClosure.from_pairs(DerivationClosure.from_edges(CHAIN[:2]).pairs())
+
+        for child, parent in CHAIN[2:]:
+            restored.add_edge(child, parent)
+
+        assert sorted(restored.pairs()) == sorted(DerivationClosure.from_edges(CHAIN).pairs())
@@ -0,0 +1,151 @@
+"""
+Unit tests for the shared embedding service
+"""
+
+import base64
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.graphrag.nodes.vector_search_node import get_embedding
+from src.utils.embedding_service import EmbeddingService
+
+DIMENSIONS = 8
+
+
+def _encode(vector) -> str:
+    """Base64 payload as returned for encoding_format="base64"."""
+    return base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode()
+
+
+def fake_openai_client(reverse: bool = False) -> MagicMock:
+    """
+    OpenAI client whose embedding for input i is a vector filled with i.
+
+    Args:
+        reverse: Return the response items in reverse input order
+
+    Returns:
+        Mock client
+    """
+    def create(model, input, dimensions, encoding_format):
+        response = MagicMock()
+        response.data = [
+            MagicMock(index=i, embedding=_encode(np.full(dimensions, i)))
+            for i in range(len(input))
+        ]
+        if reverse:
+            response.data.reverse()
+        return response
+
+    client = MagicMock()
+    client.embeddings.create.side_effect = create
+    return client
+
+
+def _service(client, **kwargs) -> EmbeddingService:
+    """Service over a fake client."""
+    options = {"model": "text-embedding-3-large", "dimensions": DIMENSIONS, "batch_window_ms": 0}
+    options.update(kwargs)
+    return EmbeddingService(client=client, **options)
+
+
+class TestEmbeddingService:
+    """Test query and document embeddings through the shared embedding service."""
+
+    def test_base64_decoded_to_float32(self):
+        """Test embeddings are requested as base64 and decoded into float32 arrays."""
+        client = fake_openai_client()
+
+        embedding = _service(client).embed_query("q")
+
+        assert client.embeddings.create.call_args.kwargs["encoding_format"] == "base64"
+        assert embedding.dtype == np.float32
+        assert embedding.shape == (DIMENSIONS,)
+
+    def test_out_of_order_response_restored_to_input_order(self):
+        """Test items are matched to inputs by their index, not response position."""
+        service = _service(fake_openai_client(reverse=True))
+
+        embeddings = service.embed_queries(["a", "b", "c"])
+        documents = service.embed_documents(["a", "b", "c"], delay_seconds=0)
+
+        assert [float(e[0]) for e in embeddings] == [0.0, 1.0, 2.0]
+        assert documents[:, 0].tolist() == [0.0, 1.0, 2.0]
+
+    def test_cache_hits_skip_api(self):
+        """Test repeated and duplicate queries are embedded once."""
+        client = fake_openai_client()
+        service = _service(client)
+
+        service.embed_queries(["a", "a", "b"])
+        service.embed_queries(["b", "a"])
+
+        client.embeddings.create.assert_called_once()
+        assert client.embeddings.create.call_args.kwargs["input"] == ["a", "b"]
+        assert service.cache_hits == 2
+
+    def test_cached_vectors_are_read_only(self):
+        """Test callers cannot corrupt the shared cache."""
+        service = _service(fake_openai_client())
+        service.embed_query("a")
+
+        with pytest.raises(ValueError):
+            service.embed_query("a")[0] = 5.0
+
+    def test_failure_returns_zero_vectors(self):
+        """Test API errors degrade to zero vectors for queries."""
+        client = MagicMock()
+        client.embeddings.create.side_effect = Exception("API Error")
+
+        embeddings = _service(client).embed_queries(["a", "b"])
+
+        assert all(not e.any() for e in embeddings)
+
+    def test_failed_document_batch_zero_filled(self):
+        """Test a failed document batch becomes zero rows unless fail_fast is set."""
+        client = fake_openai_client()
+        original = client.embeddings.create.side_effect
+        calls = []
+
+        def flaky(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 2:
+                raise Exception("rate limited")
+            return original(**kwargs)
+
+        client.embeddings.create.side_effect = flaky
+        service = _service(client)
+
+        matrix = service.embed_documents(["a", "b", "c"], batch_size=2, delay_seconds=0)
+
+        assert matrix.shape == (3, DIMENSIONS)
+        assert matrix.dtype == np.float32
+        assert not matrix[2].any()
+
+        calls.clear()
+        with pytest.raises(Exception, match="rate limited"):
+            service.embed_documents(["a", "b", "c"], batch_size=2, delay_seconds=0, fail_fast=True)
+
+    def test_concurrent_queries_coalesced_into_one_call(self, env_setup):
+        """Test concurrent get_embedding calls share one API call and the cache."""
+        questions = [f"question {i}" for i in range(4)]
+        client = fake_openai_client()
+        service = EmbeddingService(client=client, model="text-embedding-3-large", dimensions=3072, batch_window_ms=200)
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding_service', return_value=service):
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                embeddings = list(executor.map(get_embedding, questions))
+
+            assert all(len(e) == 3072 for e in embeddings)
+            client.embeddings.create.assert_called_once()
+            kwargs = client.embeddings.create.call_args.kwargs
+            assert sorted(kwargs["input"]) == questions
+            assert kwargs["dimensions"] == 3072
+            assert kwargs["encoding_format"] == "base64"
+
+            # Repeat is a cache hit
+            assert np.array_equal(get_embedding("question 0"), embeddings[0])
+            assert client.embeddings.create.call_count == 1
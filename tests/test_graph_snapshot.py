@@ -0,0 +1,97 @@
+"""
+Unit tests for graph snapshot reloading
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+import src.query.graph_snapshot as graph_snapshot
+
+
+class FakeGraph:
+    """Neo4j client answering the snapshot's version and count queries."""
+
+    def __init__(self, graph_version=None, nodes=10, relationships=20):
+        self.graph_version = graph_version
+        self.nodes = nodes
+        self.relationships = relationships
+
+    def execute(self, cypher, **params):
+        if "GraphStatistics" in cypher:
+            return [{"graph_version": self.graph_version}] if self.graph_version is not None else []
+        if "MATCH (n)" in cypher:
+            return [{"count": self.nodes}]
+        return [{"count": self.relationships}]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    """Fresh process-wide snapshot state over a fake graph; loads are counted."""
+    monkeypatch.setattr(graph_snapshot, "_snapshot", None)
+    monkeypatch.setattr(graph_snapshot, "_snapshot_fingerprint", None)
+    monkeypatch.setenv("GRAPH_SNAPSHOT_CHECK_SECONDS", "0")
+
+    fake = FakeGraph()
+    fake.loads = []
+
+    def load(client, graph_version=None):
+        snapshot = MagicMock(graph_version=graph_version, loaded_at=graph_snapshot.time.time())
+        fake.loads.append(graph_version)
+        return snapshot
+
+    with patch.object(graph_snapshot, "Neo4jClient", return_value=fake), \
+         patch.object(graph_snapshot.GraphSnapshot, "load", side_effect=load):
+        yield fake
+
+
+class TestSnapshotReload:
+    """Test when the process-wide snapshot is rebuilt."""
+
+    def test_version_change_reloads(self, graph):
+        """Test a bumped graph_version rebuilds the snapshot."""
+        graph.graph_version = 1
+        graph_snapshot.get_graph_snapshot()
+        graph_snapshot.get_graph_snapshot()
+        graph.graph_version = 2
+        graph_snapshot.get_graph_snapshot()
+
+        assert graph.loads == [1, 2]
+
+    def test_missing_statistics_uses_counts(self, graph):
+        """Test an unknown version is not treated as 'unchanged' when the graph was reloaded."""
+        graph_snapshot.get_graph_snapshot()
+        graph_snapshot.get_graph_snapshot()
+        graph.nodes = 11
+        graph_snapshot.get_graph_snapshot()
+
+        assert graph.loads == [None, None]
+
+    def test_missing_statistics_expires(self, graph, monkeypatch):
+        """Test an unversioned snapshot is rebuilt after the TTL even with equal counts."""
+        monkeypatch.setenv("GRAPH_SNAPSHOT_UNVERSIONED_TTL_SECONDS", "0")
+
+        graph_snapshot.get_graph_snapshot()
+        graph_snapshot.get_graph_snapshot()
+
+        assert len(graph.loads) == 2
+
+    def test_versioned_snapshot_does_not_expire(self, graph, monkeypatch):
+        """Test the TTL only applies while the version is unknown."""
+        monkeypatch.setenv("GRAPH_SNAPSHOT_UNVERSIONED_TTL_SECONDS", "0")
+        graph.graph_version = 3
+
+        graph_snapshot.get_graph_snapshot()
+        graph_snapshot.get_graph_snapshot()
+
+        assert graph.loads == [3]
+
+    def test_statistics_created_after_load(self, graph):
+        """Test materializing GraphStatistics later switches to version tracking."""
+        graph_snapshot.get_graph_snapshot()
+        graph.graph_version = 1
+        graph_snapshot.get_graph_snapshot()
+
+        assert graph.loads == [None, 1]
@@ -0,0 +1,223 @@
+"""
+Unit tests for incrementally maintained graph statistics
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.utils.graph_statistics import (
+    STATISTICS_QUERY,
+    GraphStatistics,
+    _apply_delta,
+    _empty_statistics,
+    coverage_percentage
+)
+
+
+class FakeGraph:
+    """
+    Neo4j client over in-memory requirements and one GraphStatistics node.
+
+    Requirements are dicts with type, subsystem, verified and the stats_*
+    markers written by GraphStatistics.
+    """
+
+    def __init__(self, requirements):
+        self.requirements = requirements
+        self.node = None
+        self.writes = 0
+
+    def execute(self, cypher, **params):
+        if cypher == STATISTICS_QUERY:
+            return [dict(self.node)] if self.node else []
+
+        if "MERGE (s:GraphStatistics" in cypher:
+            self.writes += 1
+            self.node = {
+                "total_requirements": params["total_requirements"],
+                "verified_requirements": params["verified_requirements"],
+                "by_type_json": params["by_type_json"],
+                "by_subsystem_json": params["by_subsystem_json"],
+                "node_counts_json": params["node_counts_json"],
+                "graph_version": (self.node or {}).get("graph_version", 0) + 1,
+                "updated_at": None
+            }
+            return []
+
+        if "SET r.stats_counted" in cypher:
+            for marker in params["markers"]:
+                self.requirements[marker["id"]].update(
+                    stats_counted=True,
+                    stats_type=marker["type"],
+                    stats_subsystem=marker["subsystem"],
+                    stats_verified=marker["verified"]
+                )
+            return []
+
+        if "WHERE r.stats_counted" in cypher:
+            return [
+                {
+                    "old_type": self.requirements[req_id]["stats_type"],
+                    "old_subsystem": self.requirements[req_id]["stats_subsystem"],
+                    "old_verified": self.requirements[req_id]["stats_verified"]
+                }
+                for req_id in params["req_ids"]
+                if self.requirements.get(req_id, {}).get("stats_counted")
+            ]
+
+        if "UNWIND $req_ids" in cypher:
+            return [
+                {
+                    "id": req_id,
+                    "type": req["type"],
+                    "subsystem": req["subsystem"],
+                    "verified": req["verified"],
+                    "counted": req.get("stats_counted"),
+                    "old_type": req.get("stats_type"),
+                    "old_subsystem": req.get("stats_subsystem"),
+                    "old_verified": req.get("stats_verified")
+                }
+                for req_id in params["req_ids"]
+                for req in [self.requirements.get(req_id)]
+                if req is not None
+            ]
+
+        return []
+
+    def count_nodes(self, label):
+        return len(self.requirements) if label == "Requirement" else 0
+
+
+def _requirement(req_type, subsystem, verified):
+    return {"type": req_type, "subsystem": subsystem, "verified": verified}
+
+
+@pytest.fixture
+def graph():
+    """Three requirements, one of them verified."""
+    return FakeGraph({
+        "FuncR_S101": _requirement("FuncR", "System", True),
+        "FuncR_S102": _requirement("FuncR", "System", False),
+        "SafR_S201": _requirement("SafR", None, False),
+    })
+
+
+class TestApplyDelta:
+    """Test adding and removing one requirement's contribution."""
+
+    def test_add_and_remove_round_trip(self):
+        """Test removing what was added restores empty statistics."""
+        stats = _empty_statistics()
+
+        _apply_delta(stats, "FuncR", "System", True, 1)
+        _apply_delta(stats, "FuncR", "System", False, 1)
+
+        assert stats["total_requirements"] == 2
+        assert stats["verified_requirements"] == 1
+        assert stats["by_type"] == {"FuncR": {"total": 2, "verified": 1}}
+
+        _apply_delta(stats, "FuncR", "System", True, -1)
+        _apply_delta(stats, "FuncR", "System", False, -1)
+
+        assert stats == _empty_statistics()
+
+    def test_missing_facets_counted_as_unknown(self):
+        """Test requirements without type or subsystem land in an 'unknown' bucket."""
+        stats = _empty_statistics()
+
+        _apply_delta(stats, None, None, False, 1)
+
+        assert stats["by_type"] == {"unknown": {"total": 1, "verified": 0}}
+        assert stats["by_subsystem"] == {"unknown": {"total": 1, "verified": 0}}
+
+    def test_empty_bucket_deleted(self):
+        """Test a facet value disappears once its last requirement is removed."""
+        stats = _empty_statistics()
+        _apply_delta(stats, "FuncR", "System", False, 1)
+        _apply_delta(stats, "SafR", "System", False, 1)
+
+        _apply_delta(stats, "SafR", "System", False, -1)
+
+        assert "SafR" not in stats["by_type"]
+        assert stats["by_subsystem"]["System"]["total"] == 1
+
+    def test_coverage_percentage(self):
+        """Test coverage is rounded to two decimals and zero for no requirements."""
+        assert coverage_percentage(3, 1) == 33.33
+        assert coverage_percentage(0, 0) == 0.0
+
+
+class TestIncrementalUpdates:
+    """Test update_requirements and remove_requirements keep counters exact."""
+
+    def test_first_count(self, graph):
+        """Test touched requirements are counted and marked."""
+        GraphStatistics(graph).update_requirements(graph.requirements)
+
+        summary = GraphStatistics(graph).get_summary()
+        assert summary["total_requirements"] == 3
+        assert summary["verified_requirements"] == 1
+        assert summary["coverage_percentage"] == 33.33
+        assert {row["name"]: row["total"] for row in summary["by_type"]} == {"FuncR": 2, "SafR": 1}
+        assert summary["node_counts"]["Requirement"] == 3
+        assert all(req["stats_counted"] for req in graph.requirements.values())
+
+    def test_recount_replaces_old_facets(self, graph):
+        """Test updating a counted requirement subtracts its previous contribution."""
+        statistics = GraphStatistics(graph)
+        statistics.update_requirements(graph.requirements)
+
+        graph.requirements["FuncR_S102"].update(verified=True, subsystem="Component")
+        statistics.update_requirements(["FuncR_S102", "FuncR_S102"])
+
+        summary = statistics.get_summary()
+        assert summary["total_requirements"] == 3
+        assert summary["verified_requirements"] == 2
+        by_subsystem = json.loads(graph.node["by_subsystem_json"])
+        assert by_subsystem["System"] == {"total": 1, "verified": 1}
+        assert by_subsystem["Component"] == {"total": 1, "verified": 1}
+
+    def test_repeated_update_is_idempotent(self, graph):
+        """Test recounting unchanged requirements leaves the counters as they were."""
+        statistics = GraphStatistics(graph)
+        statistics.update_requirements(graph.requirements)
+        before = dict(graph.node)
+
+        statistics.update_requirements(graph.requirements)
+
+        for column in ("total_requirements", "verified_requirements", "by_type_json", "by_subsystem_json"):
+            assert graph.node[column] == before[column]
+        assert graph.node["graph_version"] == before["graph_version"] + 1
+
+    def test_remove_requirements(self, graph):
+        """Test removed requirements are subtracted under the facets they were counted with."""
+        statistics = GraphStatistics(graph)
+        statistics.update_requirements(graph.requirements)
+
+        # Facets changed after counting: removal uses the stored markers
+        graph.requirements["FuncR_S101"]["type"] = "PerfR"
+        statistics.remove_requirements(["FuncR_S101", "SafR_S201"])
+
+        summary = statistics.get_summary()
+        assert summary["total_requirements"] == 1
+        assert summary["verified_requirements"] == 0
+        assert json.loads(graph.node["by_type_json"]) == {"FuncR": {"total": 1, "verified": 0}}
+
+    def test_remove_uncounted_requirement(self, graph):
+        """Test requirements that were never counted do not change the totals."""
+        statistics = GraphStatistics(graph)
+        statistics.update_requirements(["FuncR_S101"])
+
+        statistics.remove_requirements(["SafR_S201"])
+
+        assert statistics.get_summary()["total_requirements"] == 1
+
+    def test_remove_nothing_skips_write(self):
+        """Test an empty removal does not touch the statistics node."""
+        client = MagicMock()
+
+        GraphStatistics(client).remove_requirements([])
+
+        client.execute.assert_not_called()
@@ -0,0 +1,169 @@
+"""
+Unit tests for incremental ingestion
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.ingestion.incremental import (
+    IncrementalLoader,
+    compute_delta,
+    content_hash,
+    stamp_content_hashes
+)
+from src.ingestion.text_chunker import TextChunker
+
+
+def _section(section_id: str, content: str) -> dict:
+    """Parsed PDD section."""
+    return {"id": section_id, "doc_id": "PDD", "number": section_id, "title": "Title", "level": 2, "content": content}
+
+
+class TestContentHash:
+    """Test content hashing of parsed items."""
+
+    def test_stable_and_field_order_independent(self):
+        """Test equal content gives equal hashes regardless of dict order."""
+        a = {"title": "T", "statement": "S", "id": "R1"}
+        b = {"id": "R1", "statement": "S", "title": "T"}
+        assert content_hash(a, "Requirement") == content_hash(b, "Requirement")
+
+    def test_content_field_change(self):
+        """Test a change in a hashed field changes the hash."""
+        base = {"title": "T", "statement": "S"}
+        assert content_hash(base, "Requirement") != content_hash({**base, "statement": "S2"}, "Requirement")
+
+    def test_unhashed_fields_ignored(self):
+        """Test embeddings and other derived fields do not affect the hash."""
+        base = {"title": "T", "statement": "S"}
+        with_embedding = {**base, "statement_embedding": [0.1, 0.2], "content_hash": "x"}
+        assert content_hash(base, "Requirement") == content_hash(with_embedding, "Requirement")
+
+    def test_salt(self):
+        """Test the salt (embedding settings) is part of the hash."""
+        item = {"title": "T"}
+        assert content_hash(item, "Requirement", salt="a") != content_hash(item, "Requirement", salt="b")
+
+
+class TestStampContentHashes:
+    """Test hash stamping."""
+
+    def test_embedded_labels_salted_with_embedding_signature(self):
+        """Test embedded labels use the embedding signature as salt; test cases do not."""
+        with patch('src.ingestion.incremental.embedding_signature', return_value="model:3072:0"):
+            requirements = stamp_content_hashes([{"id": "R1", "title": "T"}], "Requirement")
+            test_cases = stamp_content_hashes([{"id": "TC1", "name": "N"}], "TestCase")
+
+        assert requirements[0]["content_hash"] == content_hash({"title": "T"}, "Requirement", "model:3072:0")
+        assert test_cases[0]["content_hash"] == content_hash({"name": "N"}, "TestCase")
+
+    def test_existing_hash_kept(self):
+        """Test items that already carry a hash are not re-hashed."""
+        with patch('src.ingestion.incremental.embedding_signature', return_value="sig"):
+            items = stamp_content_hashes([{"id": "R1", "content_hash": "kept"}], "Requirement")
+        assert items[0]["content_hash"] == "kept"
+
+
+class TestComputeDelta:
+    """Test diffing parsed items against stored hashes."""
+
+    def test_inserts_updates_unchanged_deletes(self):
+        """Test every item lands in exactly one bucket."""
+        items = [
+            {"id": "A", "content_hash": "a"},
+            {"id": "B", "content_hash": "b2"},
+            {"id": "C", "content_hash": "c"},
+        ]
+        existing = {"A": "a", "B": "b1", "D": "d", "E": "e"}
+
+        delta = compute_delta(items, existing)
+
+        assert [item["id"] for item in delta["inserts"]] == ["C"]
+        assert [item["id"] for item in delta["updates"]] == ["B"]
+        assert delta["unchanged"] == ["A"]
+        assert delta["deletes"] == ["D", "E"]
+
+    def test_unhashed_nodes_count_as_updated(self):
+        """Test nodes stored before hashing existed are updated, not skipped."""
+        delta = compute_delta([{"id": "A", "content_hash": "a"}], {"A": None})
+        assert [item["id"] for item in delta["updates"]] == ["A"]
+
+    def test_empty_graph(self):
+        """Test a first load inserts everything."""
+        delta = compute_delta([{"id": "A", "content_hash": "a"}], {})
+        assert len(delta["inserts"]) == 1
+        assert delta["deletes"] == []
+
+
+@pytest.fixture
+def sync():
+    """IncrementalLoader over mocked loader, embedder and client."""
+    loader = MagicMock()
+    embedder = MagicMock()
+    embedder.embed_sections.side_effect = lambda sections: sections
+    with patch('src.ingestion.incremental.embedding_signature', return_value="sig"):
+        yield IncrementalLoader(loader, embedder)
+
+
+class TestSyncSections:
+    """Test incremental section sync against chunked graphs."""
+
+    def test_refuses_chunked_graph_without_chunker(self, sync):
+        """Test whole sections are not diffed against stored chunk nodes."""
+        sync.client.execute.return_value = [{"chunked": True}]
+
+        with pytest.raises(ValueError, match="TextChunker"):
+            sync.sync_sections([_section("PDD-1", "text")], doc_type="PDD")
+
+        sync.loader.load_design_sections.assert_not_called()
+
+    def test_chunks_before_diffing(self, sync):
+        """Test sections are chunked with the configured chunker, so stored chunks stay unchanged."""
+        chunker = TextChunker(chunk_size=20, overlap=5)
+        sync.chunker = chunker
+        sections = [_section("PDD-1", ("Sentence number one is here. " * 20).strip())]
+
+        with patch('src.ingestion.text_chunker.get_parse_cache') as get_cache:
+            get_cache.return_value.get_or_compute.side_effect = lambda namespace, material, compute: compute()
+            stored = stamp_content_hashes(chunker.chunk_sections([dict(s) for s in sections]), "Section")
+
+            sync.client.execute.return_value = [
+                {"id": chunk["id"], "content_hash": chunk["content_hash"]} for chunk in stored
+            ]
+            delta = sync.sync_sections([dict(s) for s in sections], doc_type="PDD")
+
+        assert len(stored) > 1
+        assert all("_chunk_" in chunk["id"] for chunk in stored)
+        assert delta == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": len(stored)}
+        sync.loader.load_design_sections.assert_not_called()
+
+
+class TestSyncTraceability:
+    """Test incremental syncs refresh materialized traceability."""
+
+    def test_test_case_update_refreshes_previously_verified(self, sync):
+        """Test requirements losing VERIFIES get their documents refreshed."""
+        old = stamp_content_hashes([{"id": "IT1", "name": "old", "covered_requirements": ["FuncR_S101"]}], "TestCase")
+
+        def execute(cypher, **params):
+            if "content_hash" in cypher:
+                return [{"id": "IT1", "content_hash": old[0]["content_hash"]}]
+            if "VERIFIES" in cypher:
+                return [{"req_id": "FuncR_S101"}]
+            return []
+
+        sync.client.execute.side_effect = execute
+        sync.sync_test_cases([{"id": "IT1", "name": "new", "covered_requirements": []}])
+
+        sync.loader.refresh_traceability.assert_called_once_with(["FuncR_S101"])
+
+    def test_requirement_delete_refreshes_neighbors(self, sync):
+        """Test documents around a deleted requirement are collected before its edges go."""
+        stored = stamp_content_hashes([{"id": "FuncR_S102", "statement": "gone"}], "Requirement")
+        sync.client.execute.return_value = [{"id": "FuncR_S102", "content_hash": stored[0]["content_hash"]}]
+        sync.loader.traceability_neighborhood.return_value = ["FuncR_S101"]
+
+        sync.sync_requirements([])
+
+        sync.loader.traceability_neighborhood.assert_called_once_with(["FuncR_S102"])
+        sync.loader.refresh_traceability.assert_called_once_with(["FuncR_S101"])
@@ -0,0 +1,145 @@
+"""
+Unit tests for Neo4j client write batching
+"""
+
+import threading
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.utils.neo4j_client import Neo4jClient, estimate_param_bytes, split_by_bytes
+
+
+def _item(item_id: str, dimensions: int = 100) -> dict:
+    """Requirement-like item with an embedding."""
+    return {"id": item_id, "statement_embedding": [0.5] * dimensions}
+
+
+class TestEstimateParamBytes:
+    """Test Bolt payload size estimation."""
+
+    def test_scalars(self):
+        """Test scalar sizes."""
+        assert estimate_param_bytes(None) == 1
+        assert estimate_param_bytes(True) == 1
+        assert estimate_param_bytes(3) == 9
+        assert estimate_param_bytes(0.5) == 9
+        assert estimate_param_bytes(np.float32(0.5)) == 9
+        assert estimate_param_bytes("abc") == 8
+        assert estimate_param_bytes("é") == 7
+
+    def test_float_list_and_array_match(self):
+        """Test a float list and a float32 array of the same length are estimated alike."""
+        assert estimate_param_bytes([0.1] * 3072) == 5 + 9 * 3072
+        assert estimate_param_bytes(np.zeros(3072, dtype=np.float32)) == 5 + 9 * 3072
+
+    def test_nested(self):
+        """Test dicts and lists are summed recursively."""
+        value = {"id": "R1", "tags": ["a", "b"]}
+        expected = 5 + (7 + 7) + (9 + (5 + 6 + 6))
+        assert estimate_param_bytes(value) == expected
+
+
+class TestSplitByBytes:
+    """Test size-bounded batching."""
+
+    def test_preserves_order(self):
+        """Test batches are consecutive and keep item order."""
+        items = [_item(f"R{i}") for i in range(10)]
+        size = estimate_param_bytes(items[0])
+
+        batches = split_by_bytes(items, 3 * size)
+
+        assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+        assert [item["id"] for batch in batches for item in batch] == [f"R{i}" for i in range(10)]
+
+    def test_oversized_item_gets_own_batch(self):
+        """Test an item above the bound is written alone, not dropped."""
+        items = [_item("R0"), _item("BIG", dimensions=10000), _item("R2")]
+        bound = 2 * estimate_param_bytes(items[0])
+
+        batches = split_by_bytes(items, bound)
+
+        assert [[item["id"] for item in batch] for batch in batches] == [["R0"], ["BIG"], ["R2"]]
+
+    def test_empty(self):
+        """Test no items give no batches."""
+        assert split_by_bytes([], 1000) == []
+
+
+@pytest.fixture
+def client():
+    """Neo4jClient with a mocked driver recording each write transaction's batch."""
+    with patch('src.utils.neo4j_client.GraphDatabase') as graph_database:
+        driver = MagicMock()
+        graph_database.driver.return_value = driver
+        client = Neo4jClient()
+
+    client.written = []
+    client.threads = set()
+    lock = threading.Lock()
+
+    def execute_write(work):
+        tx = MagicMock()
+
+        def run(cypher, **params):
+            with lock:
+                client.written.append(params)
+                client.threads.add(threading.get_ident())
+            return [MagicMock(data=lambda batch=params["items"]: {"created_count": len(batch)})]
+
+        tx.run.side_effect = run
+        return work(tx)
+
+    session = driver.session.return_value.__enter__.return_value
+    session.execute_write.side_effect = execute_write
+    return client
+
+
+class TestExecuteWriteBatches:
+    """Test size-bounded managed write transactions."""
+
+    def test_batches_in_order(self, client):
+        """Test each batch runs in its own transaction and results keep batch order."""
+        items = [_item(f"R{i}") for i in range(7)]
+        bound = 2 * estimate_param_bytes(items[0])
+
+        rows = client.execute_write_batches("UNWIND $items AS i", "items", items, max_bytes=bound, doc_id="SRD")
+
+        assert [row["created_count"] for row in rows] == [2, 2, 2, 1]
+        assert [i["id"] for params in client.written for i in params["items"]] == [f"R{i}" for i in range(7)]
+        assert all(params["doc_id"] == "SRD" for params in client.written)
+
+    def test_arrays_converted_per_batch(self, client):
+        """Test embedding arrays reach the driver as float lists."""
+        items = [{"id": "R1", "statement_embedding": np.ones(4, dtype=np.float32)}]
+
+        client.execute_write_batches("UNWIND $items AS i", "items", items)
+
+        sent = client.written[0]["items"][0]["statement_embedding"]
+        assert sent == [1.0, 1.0, 1.0, 1.0]
+        assert all(type(value) is float for value in sent)
+
+    def test_oversized_item(self, client):
+        """Test an item larger than the bound is still written."""
+        items = [_item("R0"), _item("BIG", dimensions=10000)]
+
+        rows = client.execute_write_batches("UNWIND $items AS i", "items", items, max_bytes=2000)
+
+        assert len(client.written) == 2
+        assert sum(row["created_count"] for row in rows) == 2
+
+    def test_concurrent_batches(self, client):
+        """Test concurrency > 1 writes every batch once and returns rows in batch order."""
+        items = [_item(f"R{i}") for i in range(20)]
+        bound = estimate_param_bytes(items[0])
+
+        rows = client.execute_write_batches("UNWIND $items AS i", "items", items, max_bytes=bound, concurrency=4)
+
+        assert len(rows) == 20
+        assert sorted(i["id"] for params in client.written for i in params["items"]) == sorted(i["id"] for i in items)
+
+    def test_empty(self, client):
+        """Test no items run no transactions."""
+        assert client.execute_write_batches("UNWIND $items AS i", "items", []) == []
+        assert client.written == []
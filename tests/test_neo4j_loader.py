@@ -0,0 +1,136 @@
+"""
+Unit tests for keeping materialized traceability in step with loads
+"""
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.ingestion.neo4j_loader import MOSARGraphLoader
+
+
+class FakeClient:
+    """Neo4j client recording traceability writes; `documented` IDs already have a document."""
+
+    def __init__(self, documented):
+        self.documented = documented
+        self.written = []
+
+    def execute(self, cypher, **params):
+        if "traceability_doc IS NOT NULL" in cypher:
+            return [{"id": req_id} for req_id in sorted(self.documented)]
+        if "UNWIND $req_ids AS req_id" in cypher:
+            return [{"requirement_id": req_id, "test_cases": ["IT1"]} for req_id in params["req_ids"]]
+        if "SET r.traceability_doc" in cypher:
+            self.written.extend(json.loads(doc["json"])["requirement_id"] for doc in params["docs"])
+            return [{"written_count": len(params["docs"])}]
+        return []
+
+    def execute_write_batches(self, cypher, param, items, **params):
+        return [{"created_count": len(items)}]
+
+
+def _loader(client) -> MOSARGraphLoader:
+    with patch('src.ingestion.neo4j_loader.Neo4jClient', return_value=client), \
+         patch('src.ingestion.neo4j_loader.EntityResolver'):
+        loader = MOSARGraphLoader()
+    loader.statistics = MagicMock()
+    return loader
+
+
+class TestRefreshTraceability:
+    """Test loads re-materialize the documents they make stale."""
+
+    def test_test_case_load_refreshes_verified_requirements(self):
+        """Test new VERIFIES edges update the documents around the verified requirements."""
+        client = FakeClient(documented={"FuncR_S101", "FuncR_A001"})
+        loader = _loader(client)
+
+        loader.load_test_cases([{"id": "IT1", "name": "n", "covered_requirements": ["FuncR_S101"]}])
+
+        assert client.written == ["FuncR_A001", "FuncR_S101"]
+        loader.statistics.update_requirements.assert_called_once_with(["FuncR_S101"])
+
+    def test_nothing_written_before_first_materialization(self):
+        """Test loads do not materialize documents when none exist yet."""
+        client = FakeClient(documented=set())
+        loader = _loader(client)
+
+        loader.load_test_cases([{"id": "IT1", "name": "n", "covered_requirements": ["FuncR_S101"]}])
+
+        assert client.written == []
+
+    def test_neighborhood_query_covers_two_hops_both_ways(self):
+        """Test parents and children within two DERIVES_FROM hops are considered."""
+        client = MagicMock()
+        client.execute.return_value = []
+        loader = _loader(client)
+
+        assert loader.traceability_neighborhood(["FuncR_S101", "FuncR_S101"]) == []
+
+        cypher = client.execute.call_args.args[0]
+        assert "(r)-[:DERIVES_FROM*1..2]->(ancestor:Requirement)" in cypher
+        assert "(r)<-[:DERIVES_FROM*1..2]-(descendant:Requirement)" in cypher
+        assert client.execute.call_args.kwargs["req_ids"] == ["FuncR_S101"]
+
+    def test_empty_input_skips_queries(self):
+        """Test no query runs without touched requirements."""
+        client = MagicMock()
+        loader = _loader(client)
+
+        assert loader.refresh_traceability([]) == 0
+        client.execute.assert_not_called()
+
+
+class ClosureClient:
+    """Neo4j client holding DERIVES_FROM_CLOSURE pairs in memory."""
+
+    def __init__(self, pairs):
+        self.closure = {(d, a): depth for d, a, depth in pairs}
+        self.rows_read = 0
+
+    def execute(self, cypher, **params):
+        if "UNION" in cypher:
+            rows = [
+                {"descendant": d, "ancestor": a, "depth": depth}
+                for (d, a), depth in self.closure.items()
+                if a in params["children"] or d in params["parents"]
+            ]
+            self.rows_read += len(rows)
+            return rows
+        if "MERGE (d)-[c:DERIVES_FROM_CLOSURE]->(a)" in cypher:
+            for pair in params["pairs"]:
+                key = (pair["descendant"], pair["ancestor"])
+                self.closure[key] = min(pair["depth"], self.closure.get(key, pair["depth"]))
+        return []
+
+
+class TestUpdateDerivationClosure:
+    """Test incremental closure updates read only the affected pairs."""
+
+    def test_matches_full_rebuild_with_scoped_read(self):
+        """Test new edges give the same closure as a rebuild without reading unrelated pairs."""
+        from src.ingestion.derivation_closure import DerivationClosure
+
+        stored = [("L3", "L2"), ("L2", "L1"), ("X2", "X1"), ("X3", "X2"), ("L2", "L0"), ("L1", "L0")]
+        new = [("L4", "L3"), ("L3", "L0")]
+        client = ClosureClient(DerivationClosure.from_edges(stored).pairs())
+        loader = _loader(client)
+
+        loader.update_derivation_closure(new)
+
+        assert client.closure == {
+            (d, a): depth for d, a, depth in DerivationClosure.from_edges(stored + new).pairs()
+        }
+        assert client.rows_read == 3
+
+    def test_write_never_lengthens_stored_depth(self):
+        """Test a pair already stored with a shorter depth keeps it."""
+        client = ClosureClient([("A", "C", 1), ("A", "B", 1)])
+        loader = _loader(client)
+
+        loader.update_derivation_closure([("B", "C")])
+
+        assert client.closure[("A", "C")] == 1
+        assert client.closure[("B", "C")] == 1
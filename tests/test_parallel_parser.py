@@ -0,0 +1,73 @@
+"""
+Unit tests for page-split parallel parsing
+"""
+
+from pathlib import Path
+
+import pytest
+from unittest.mock import patch
+
+from src.ingestion.parallel_parser import (
+    PAGE_SEPARATOR,
+    ParallelDocumentParser,
+    _make_parser,
+    split_at_pages
+)
+from src.ingestion.parse_cache import ParseCache
+
+DOCUMENTS_DIR = Path(__file__).parents[1] / "Documents"
+
+DOCUMENTS = {
+    "SRD": DOCUMENTS_DIR / "SRD" / "System Requirements Document_MOSAR.md",
+    "PDD": DOCUMENTS_DIR / "PDD" / "MOSAR-WP2-D2.4-SA_1.1.0-Preliminary-Design-Document.md",
+    "DDD": DOCUMENTS_DIR / "DDD" / "MOSAR-WP3-D3.6-SA_1.2.0-Detailed-Design-Document.md"
+}
+
+
+class TestSplitAtPages:
+    """Test page-separator splitting."""
+
+    @pytest.mark.parametrize("content,parts", [
+        ("{{", 4),
+        ("{", 2),
+        ("", 3),
+        ("{a{b{c", 10),
+        ("no separators here", 4),
+        ("ab{cd{ef{gh", 2),
+    ])
+    def test_round_trip(self, content, parts):
+        """Test chunks concatenate to the input, even for texts shorter than `parts`."""
+        chunks = split_at_pages(content, parts)
+
+        assert "".join(chunks) == content
+        assert 1 <= len(chunks) <= max(parts, 1)
+        assert all(chunk.startswith(PAGE_SEPARATOR) for chunk in chunks[1:])
+
+    def test_similar_sizes(self):
+        """Test pages are grouped into similarly sized chunks."""
+        content = "".join(f"{PAGE_SEPARATOR}page {i} " + "x" * 100 for i in range(40))
+
+        chunks = split_at_pages(content, 4)
+
+        assert len(chunks) == 4
+        assert max(len(chunk) for chunk in chunks) < 2 * len(content) / 4
+
+    def test_single_part(self):
+        """Test one part returns the whole text."""
+        assert split_at_pages("{a{b", 1) == ["{a{b"]
+
+
+@pytest.mark.parametrize("doc_type", ["SRD", "PDD", "DDD"])
+def test_split_parse_matches_sequential_parse(doc_type):
+    """Test parsing page chunks and merging them equals parsing the whole document."""
+    path = DOCUMENTS[doc_type]
+    if not path.exists():
+        pytest.skip(f"{path.name} not available")
+
+    expected = _make_parser(doc_type).parse_content(path.read_text(encoding="utf-8"))
+
+    with patch('src.ingestion.parallel_parser.get_parse_cache', return_value=ParseCache(enabled=False)):
+        result = ParallelDocumentParser(max_workers=1, split_parts=4).parse_all({doc_type: path})[doc_type]
+
+    assert result["chunks"] > 1
+    assert result["items"] == expected
@@ -0,0 +1,178 @@
+"""
+Unit tests for the on-disk parse cache
+"""
+
+import os
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.ingestion.parse_cache import ParseCache, source_fingerprint
+from src.ingestion.srd_parser import SRDParser
+
+SRD_TABLE = """| FuncR_S101 | Satellite repair | Mandatory |
+|---|---|---|
+| STATEMENT | The system shall repair satellites. | |
+| VERIFICATION | T | |
+"""
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty cache in a temporary directory."""
+    return ParseCache(cache_dir=tmp_path / "cache")
+
+
+@pytest.fixture
+def srd_file(tmp_path):
+    """Small SRD markdown file."""
+    path = tmp_path / "srd.md"
+    path.write_text(SRD_TABLE, encoding="utf-8")
+    return path
+
+
+class TestGetOrCompute:
+    """Test hits, misses and copies."""
+
+    def test_hit_skips_compute(self, cache):
+        """Test the second lookup for the same input is served from disk."""
+        compute = MagicMock(return_value=[{"id": "R1"}])
+
+        first = cache.get_or_compute("Parser", b"identity\x00data", compute)
+        second = cache.get_or_compute("Parser", b"identity\x00data", compute)
+
+        assert first == second == [{"id": "R1"}]
+        compute.assert_called_once()
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_hits_are_independent_copies(self, cache):
+        """Test mutating a returned value does not change the cached entry."""
+        cache.get_or_compute("Parser", b"data", lambda: [{"id": "R1"}])
+
+        cache.get_or_compute("Parser", b"data", lambda: None)[0]["embedding"] = [1.0]
+
+        assert cache.get_or_compute("Parser", b"data", lambda: None) == [{"id": "R1"}]
+
+    def test_changed_input_misses(self, cache):
+        """Test different input bytes or namespaces are separate entries."""
+        compute = MagicMock(return_value=[])
+
+        cache.get_or_compute("Parser", b"v1", compute)
+        cache.get_or_compute("Parser", b"v2", compute)
+        cache.get_or_compute("Other", b"v1", compute)
+
+        assert compute.call_count == 3
+        assert cache.hits == 0
+
+    def test_unreadable_entry_recomputed(self, cache):
+        """Test a corrupt entry is discarded and recomputed."""
+        cache.get_or_compute("Parser", b"data", lambda: [1])
+        path = cache._path("Parser", cache.key(b"data"))
+        path.write_bytes(b"not zlib")
+
+        assert cache.get_or_compute("Parser", b"data", lambda: [2]) == [2]
+        assert cache.get("Parser", cache.key(b"data")) == [2]
+
+    def test_disabled_always_computes(self, cache):
+        """Test a disabled cache computes every time and writes nothing."""
+        cache.enabled = False
+        compute = MagicMock(return_value=[])
+
+        cache.get_or_compute("Parser", b"data", compute)
+        cache.get_or_compute("Parser", b"data", compute)
+
+        assert compute.call_count == 2
+        assert not cache.cache_dir.exists()
+
+
+class TestInvalidation:
+    """Test parser code changes invalidate cached output."""
+
+    def test_source_fingerprint_tracks_file_content(self, tmp_path, monkeypatch):
+        """Test the fingerprint changes when the module source changes."""
+        module = tmp_path / "fingerprinted_parser.py"
+        module.write_text("VALUE = 1\n", encoding="utf-8")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        before = source_fingerprint("fingerprinted_parser")
+        module.write_text("VALUE = 2\n", encoding="utf-8")
+        source_fingerprint.cache_clear()
+        after = source_fingerprint("fingerprinted_parser")
+
+        assert before != after
+        assert source_fingerprint("fingerprinted_parser") == after
+
+    def test_parser_identity_includes_source(self):
+        """Test parser identities embed their module's source fingerprint and options."""
+        identity = SRDParser(single_pass=True).cache_identity()
+
+        assert source_fingerprint("src.ingestion.srd_parser").encode("utf-8") in identity
+        assert identity != SRDParser(single_pass=False).cache_identity()
+
+    def test_parser_edit_misses(self, cache, srd_file):
+        """Test an edited parser module parses again instead of reusing old output."""
+        with patch('src.ingestion.srd_parser.get_parse_cache', return_value=cache):
+            first = SRDParser().parse(srd_file)
+            SRDParser().parse(srd_file)
+            assert (cache.hits, cache.misses) == (1, 1)
+
+            with patch('src.ingestion.srd_parser.source_fingerprint', return_value="edited"):
+                assert SRDParser().parse(srd_file) == first
+
+        assert cache.misses == 2
+        assert first[0]["id"] == "FuncR_S101"
+
+
+class TestPruning:
+    """Test each namespace is capped at max_entries, least recently used first."""
+
+    def _age(self, cache, namespace, material, age):
+        path = cache._path(namespace, cache.key(material))
+        os.utime(path, (time.time() - age, time.time() - age))
+
+    def test_oldest_entries_deleted_beyond_cap(self, tmp_path):
+        """Test writing past the cap deletes the least recently used entries."""
+        cache = ParseCache(cache_dir=tmp_path / "cache", max_entries=3)
+        for i in range(3):
+            cache.get_or_compute("TextChunker", f"batch{i}".encode(), lambda: [i])
+            self._age(cache, "TextChunker", f"batch{i}".encode(), 100 - i)
+
+        cache.get_or_compute("TextChunker", b"batch3", lambda: [3])
+
+        assert len(list((cache.cache_dir / "TextChunker").glob("*.pkl.z"))) == 3
+        assert cache.get("TextChunker", cache.key(b"batch0")) is None
+        assert cache.get("TextChunker", cache.key(b"batch3")) == [3]
+        assert cache.get_stats()["pruned"] == 1
+
+    def test_hit_refreshes_entry(self, tmp_path):
+        """Test a recently read entry survives pruning although it was written first."""
+        cache = ParseCache(cache_dir=tmp_path / "cache", max_entries=2)
+        cache.get_or_compute("SRDParser", b"old", lambda: ["old"])
+        cache.get_or_compute("SRDParser", b"new", lambda: ["new"])
+        self._age(cache, "SRDParser", b"old", 100)
+        self._age(cache, "SRDParser", b"new", 50)
+
+        cache.get_or_compute("SRDParser", b"old", lambda: None)
+        cache.get_or_compute("SRDParser", b"newest", lambda: ["newest"])
+
+        assert cache.get("SRDParser", cache.key(b"old")) == ["old"]
+        assert cache.get("SRDParser", cache.key(b"new")) is None
+
+    def test_namespaces_pruned_separately(self, tmp_path):
+        """Test one producer's entries never evict another's."""
+        cache = ParseCache(cache_dir=tmp_path / "cache", max_entries=1)
+
+        cache.get_or_compute("DesignDocParser", b"pdd", lambda: ["pdd"])
+        cache.get_or_compute("TextChunker", b"batch", lambda: ["chunk"])
+
+        assert cache.get("DesignDocParser", cache.key(b"pdd")) == ["pdd"]
+
+    def test_unlimited(self, tmp_path):
+        """Test max_entries=0 keeps every entry."""
+        cache = ParseCache(cache_dir=tmp_path / "cache", max_entries=0)
+
+        for i in range(5):
+            cache.get_or_compute("Parser", f"v{i}".encode(), lambda: [i])
+
+        assert len(list((cache.cache_dir / "Parser").glob("*.pkl.z"))) == 5
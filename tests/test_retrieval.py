@@ -0,0 +1,258 @@
+"""
+Unit tests for retrieval helpers (fulltext escaping, fusion, chunk collapsing, MMR)
+"""
+
+import numpy as np
+import pytest
+
+from src.query.retrieval import (
+    collapse_chunks,
+    escape_lucene,
+    join_chunk_contents,
+    maximal_marginal_relevance,
+    merge_normalized_scores,
+    reciprocal_rank_fusion
+)
+
+
+def _hit(doc_id: str, score: float = 0.5, **fields):
+    return {"section_id": doc_id, "score": score, **fields}
+
+
+class TestEscapeLucene:
+    """Test user questions become plain fulltext terms."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("HOTDOCK", "HOTDOCK"),
+        ("IntR_S102?", "IntR_S102\\?"),
+        ("R-ICU", "R\\-ICU"),
+        ("power AND data", "power and data"),
+        ("a OR (b)", "a or \\(b\\)"),
+        ("NOT TO", "not to"),
+        ("NOTE not", "NOTE not"),
+        ('say "hi"', 'say \\"hi\\"'),
+        ("path/to:x", "path\\/to\\:x"),
+        ("x+y^2 ~ [z] {w} !q *", "x\\+y\\^2 \\~ \\[z\\] \\{w\\} \\!q \\*"),
+        ("a && b || c", "a \\&\\& b \\|\\| c"),
+        ("back\\slash", "back\\\\slash"),
+        ("  spaced   out ", "spaced out"),
+        ("", ""),
+    ])
+    def test_escape(self, text, expected):
+        """Test special characters are escaped and boolean operators lowercased."""
+        assert escape_lucene(text) == expected
+
+
+class TestReciprocalRankFusion:
+    """Test weighted RRF scores, ties and limits."""
+
+    @pytest.mark.parametrize("rankings,weights,expected_order", [
+        # Found by both retrievers beats first place in one
+        ({"vector": ["a", "b", "c"], "fulltext": ["b", "d"]}, None, ["b", "a", "d", "c"]),
+        # Equal scores keep first-seen order: earlier retriever first
+        ({"vector": ["a"], "fulltext": ["b"]}, None, ["a", "b"]),
+        ({"fulltext": ["b"], "vector": ["a"]}, None, ["b", "a"]),
+        # A heavier retriever wins the tie
+        ({"vector": ["a"], "fulltext": ["b"]}, {"fulltext": 2.0}, ["b", "a"]),
+        # Weight 0 keeps the item but adds nothing
+        ({"vector": ["a", "b"], "fulltext": ["c"]}, {"fulltext": 0.0}, ["a", "b", "c"]),
+        ({}, None, []),
+    ])
+    def test_order(self, rankings, weights, expected_order):
+        """Test fused order for overlapping rankings, ties and weights."""
+        fused = reciprocal_rank_fusion(
+            {name: [_hit(doc_id) for doc_id in ids] for name, ids in rankings.items()},
+            weights=weights
+        )
+
+        assert [item["section_id"] for item in fused] == expected_order
+
+    def test_scores_and_diagnostics(self):
+        """Test fused scores follow weight / (k + rank) and original ranks/scores are kept."""
+        fused = reciprocal_rank_fusion(
+            {
+                "vector": [_hit("a", 0.9, title="vector title"), _hit("b", 0.8)],
+                "fulltext": [_hit("b", 7.5, title="fulltext title")],
+            },
+            weights={"vector": 1.0, "fulltext": 0.5},
+            k=10
+        )
+        by_id = {item["section_id"]: item for item in fused}
+
+        assert by_id["a"]["score"] == pytest.approx(1 / 11)
+        assert by_id["b"]["score"] == pytest.approx(1 / 12 + 0.5 / 11)
+        assert by_id["b"]["retrieval_ranks"] == {"vector": 2, "fulltext": 1}
+        assert by_id["b"]["retrieval_scores"] == {"vector": 0.8, "fulltext": 7.5}
+        assert "title" not in by_id["b"]
+        assert by_id["a"]["title"] == "vector title"
+
+    @pytest.mark.parametrize("limit,expected", [(None, 3), (2, 2), (10, 3)])
+    def test_limit(self, limit, expected):
+        """Test limit truncates the fused list."""
+        fused = reciprocal_rank_fusion({"vector": [_hit("a"), _hit("b"), _hit("c")]}, limit=limit)
+
+        assert len(fused) == expected
+
+    def test_custom_id_key(self):
+        """Test results are joined on the given ID field."""
+        fused = reciprocal_rank_fusion(
+            {"vector": [{"requirement_id": "R1"}], "fulltext": [{"requirement_id": "R1"}]},
+            id_key="requirement_id"
+        )
+
+        assert len(fused) == 1
+        assert fused[0]["retrieval_ranks"] == {"vector": 1, "fulltext": 1}
+
+
+class TestMergeNormalizedScores:
+    """Test per-source normalization of section and requirement hits."""
+
+    SECTIONS = [_hit("s1", 0.8), _hit("s2", 0.4)]
+    REQUIREMENTS = [_hit("r1", 0.5), _hit("r2", 0.45)]
+
+    @pytest.mark.parametrize("weights,expected_order,expected_scores", [
+        (None, ["s1", "r1", "r2", "s2"], [1.0, 1.0, 0.9, 0.5]),
+        ({"requirements": 0.8}, ["s1", "r1", "r2", "s2"], [1.0, 0.8, 0.72, 0.5]),
+        ({"requirements": 0.4}, ["s1", "s2", "r1", "r2"], [1.0, 0.5, 0.4, 0.36]),
+    ])
+    def test_order_and_scores(self, weights, expected_order, expected_scores):
+        """Test each source's top hit scores its weight and ties keep source order."""
+        merged = merge_normalized_scores(
+            {"sections": self.SECTIONS, "requirements": self.REQUIREMENTS}, weights=weights
+        )
+
+        assert [item["section_id"] for item in merged] == expected_order
+        assert [item["score"] for item in merged] == pytest.approx(expected_scores)
+
+    def test_raw_score_and_source_kept(self):
+        """Test the original score and source are recorded without changing the input."""
+        merged = merge_normalized_scores({"sections": self.SECTIONS, "requirements": self.REQUIREMENTS}, limit=2)
+
+        assert [(item["raw_score"], item["retrieval_source"]) for item in merged] == [
+            (0.8, "sections"), (0.5, "requirements")
+        ]
+        assert self.SECTIONS[0]["score"] == 0.8
+
+    @pytest.mark.parametrize("rankings,expected", [
+        ({"sections": [], "requirements": [_hit("r1", 0.5)]}, [("r1", 1.0)]),
+        ({"sections": [_hit("s1", 0.0), _hit("s2", 0.0)]}, [("s1", 0.0), ("s2", 0.0)]),
+        ({}, []),
+    ])
+    def test_empty_and_zero_scores(self, rankings, expected):
+        """Test empty sources are skipped and all-zero sources do not divide by zero."""
+        merged = merge_normalized_scores(rankings)
+
+        assert [(item["section_id"], item["score"]) for item in merged] == expected
+
+
+# Two chunks the chunker cut with a 24-character overlap
+CHUNK_0 = "Alpha beta gamma delta epsilon zeta"
+CHUNK_1 = "gamma delta epsilon zeta eta theta"
+
+
+class TestJoinChunkContents:
+    """Test chunk texts are joined without duplicated overlap."""
+
+    @pytest.mark.parametrize("chunks,expected", [
+        ([(CHUNK_0, 0)], CHUNK_0),
+        ([(CHUNK_0, 0), (CHUNK_1, 1)], "Alpha beta gamma delta epsilon zeta eta theta"),
+        # Not adjacent: marked as a gap, overlap kept
+        ([(CHUNK_0, 0), (CHUNK_1, 2)], f"{CHUNK_0} ... {CHUNK_1}"),
+        # Shared text shorter than the minimum overlap is coincidence
+        ([("abc def", 0), ("def ghi", 1)], "abc def def ghi"),
+        ([("first", 0), ("second", 1), ("fourth", 3)], "first second ... fourth"),
+        ([(CHUNK_0, 0), (None, 1)], None),
+    ])
+    def test_join(self, chunks, expected):
+        """Test adjacent chunks merge on their overlap and gaps are marked."""
+        assert join_chunk_contents(
+            [{"content": content, "chunk_index": index} for content, index in chunks]
+        ) == expected
+
+
+class TestCollapseChunks:
+    """Test chunk hits collapse into one result per parent section."""
+
+    def _chunk(self, index: int, score: float, content=None):
+        return _hit(
+            f"PDD-3_chunk_{index}", score,
+            title=f"System Architecture (Part {index + 1})",
+            content=content,
+            parent_section_id="PDD-3",
+            chunk_index=index,
+            content_hash=f"h{index}"
+        )
+
+    def test_overlapping_chunks_merged(self):
+        """Test chunks are ordered by index, their overlap dropped and the best score kept."""
+        sections = [
+            self._chunk(1, 0.9, CHUNK_1),
+            _hit("DDD-2", 0.85, title="Gripper", content="Gripper text"),
+            self._chunk(0, 0.8, CHUNK_0),
+        ]
+
+        collapsed = collapse_chunks(sections)
+
+        assert [item["section_id"] for item in collapsed] == ["PDD-3", "DDD-2"]
+        merged = collapsed[0]
+        assert merged["title"] == "System Architecture"
+        assert merged["content"] == "Alpha beta gamma delta epsilon zeta eta theta"
+        assert merged["chunk_ids"] == ["PDD-3_chunk_0", "PDD-3_chunk_1"]
+        assert merged["chunk_hashes"] == ["h0", "h1"]
+        assert merged["score"] == 0.9
+        assert "chunk_index" not in merged
+        assert collapsed[1] is sections[1]
+
+    def test_single_chunk_still_collapsed(self):
+        """Test a lone chunk reports its parent, so hydration and citations use the section."""
+        collapsed = collapse_chunks([self._chunk(2, 0.7)])
+
+        assert collapsed[0]["section_id"] == "PDD-3"
+        assert collapsed[0]["chunk_ids"] == ["PDD-3_chunk_2"]
+        assert collapsed[0]["content"] is None
+
+    def test_parent_and_chunk_hits_grouped(self):
+        """Test a hit on the parent section itself joins its chunks' group."""
+        collapsed = collapse_chunks([_hit("PDD-3", 0.95, title="System Architecture", content="Intro"),
+                                     self._chunk(0, 0.6, CHUNK_0)])
+
+        assert len(collapsed) == 1
+        assert collapsed[0]["score"] == 0.95
+
+
+class TestMaximalMarginalRelevance:
+    """Test the relevance/diversity trade-off."""
+
+    # e1 nearly duplicates e0; e2 is orthogonal to both
+    EMBEDDINGS = [np.array([1.0, 0.0]), np.array([1.0, 0.01]), np.array([0.0, 1.0])]
+    RELEVANCE = [0.9, 0.85, 0.1]
+
+    @pytest.mark.parametrize("lambda_mult,expected", [
+        (1.0, [0, 1, 2]),   # relevance only
+        (0.0, [0, 2, 1]),   # diversity only (first pick: first candidate)
+        (0.5, [0, 2, 1]),   # near duplicate loses to a less relevant but new candidate
+    ])
+    def test_lambda(self, lambda_mult, expected):
+        """Test λ=1 ranks by relevance and λ=0 by dissimilarity to the selection."""
+        assert maximal_marginal_relevance(self.RELEVANCE, self.EMBEDDINGS, k=3, lambda_mult=lambda_mult) == expected
+
+    @pytest.mark.parametrize("k,expected", [(0, []), (1, [0]), (5, [0, 2, 1])])
+    def test_k(self, k, expected):
+        """Test k limits the selection and never exceeds the candidates."""
+        assert maximal_marginal_relevance(self.RELEVANCE, self.EMBEDDINGS, k=k, lambda_mult=0.5) == expected
+
+    def test_missing_embeddings_treated_as_dissimilar(self):
+        """Test candidates without an embedding are never penalized as duplicates."""
+        embeddings = [self.EMBEDDINGS[0], self.EMBEDDINGS[1], None]
+
+        assert maximal_marginal_relevance(self.RELEVANCE, embeddings, k=3, lambda_mult=0.5) == [0, 2, 1]
+
+    def test_equal_relevance(self):
+        """Test equal scores do not divide by zero and diversity decides."""
+        selected = maximal_marginal_relevance([0.5, 0.5, 0.5], self.EMBEDDINGS, k=2, lambda_mult=0.5)
+
+        assert selected == [0, 2]
+
+    def test_no_candidates(self):
+        """Test an empty candidate list selects nothing."""
+        assert maximal_marginal_relevance([], [], k=3) == []
@@ -0,0 +1,63 @@
+"""
+Unit tests for retrieval scope detection
+"""
+
+import pytest
+
+from src.query.scope import detect_scope, normalize_scope
+
+
+class TestDetectScope:
+    """Test document/chapter scope detection in questions."""
+
+    @pytest.mark.parametrize("question,doc_ids,chapters", [
+        ("4장의 내용을 요약해줘", ["PDD", "DDD"], ["4"]),
+        ("PDD 4 장에서 설명하는 인터페이스는?", ["PDD"], ["4"]),
+        ("What does chapter 4 of the PDD say about power?", ["PDD"], ["4"]),
+        ("Summarize DDD section 4.2", ["DDD"], ["4"]),
+        ("ch. 5 of the detailed design", ["DDD"], ["5"]),
+        ("What is in the preliminary design?", ["PDD"], None),
+    ])
+    def test_scoped_questions(self, question, doc_ids, chapters):
+        """Test supported document and chapter phrasings."""
+        scope = detect_scope(question)
+
+        assert scope["doc_ids"] == doc_ids
+        assert scope["chapters"] == chapters
+
+    @pytest.mark.parametrize("question", [
+        "List the 3 장치 used by the servicer",
+        "10장비 목록을 보여줘",
+        "What are the 2 장점 of HOTDOCK?",
+        "How does the walking manipulator move?",
+    ])
+    def test_unscoped_questions(self, question):
+        """Test Korean words starting with 장 and plain questions are not scoped."""
+        assert detect_scope(question) is None
+
+    @pytest.mark.parametrize("question", [
+        "What does section 3 of the SRD require for FuncR_S101?",
+        "What does chapter 2 say about FuncR_S101?",
+        "System Requirements Document chapter 4 summary",
+    ])
+    def test_srd_and_requirement_questions_unscoped(self, question):
+        """Test questions about the SRD or a requirement ID search everything."""
+        assert detect_scope(question) is None
+
+    def test_documents_named(self):
+        """Test whether a design document was named is recorded."""
+        assert detect_scope("chapter 3 overview")["documents_named"] is False
+        assert detect_scope("chapter 3 of the DDD")["documents_named"] is True
+
+
+class TestNormalizeScope:
+    """Test explicit scope normalization."""
+
+    def test_defaults_and_types(self):
+        """Test doc IDs are upper-cased, chapters stringified and missing documents defaulted."""
+        assert normalize_scope({"doc_ids": ["pdd"], "chapters": [9]}) == {
+            "doc_ids": ["PDD"], "chapters": ["9"], "documents_named": True
+        }
+        assert normalize_scope({"chapters": [2]}) == {
+            "doc_ids": ["PDD", "DDD"], "chapters": ["2"], "documents_named": False
+        }
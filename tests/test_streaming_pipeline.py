@@ -0,0 +1,197 @@
+"""
+Unit tests for the streaming ingestion pipeline
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.ingestion.streaming_pipeline import EMBEDDING_FIELDS, StreamingIngestionPipeline
+
+
+class FakeEmbedder:
+    """Embedder setting a one-element vector; optionally slow or failing on a batch."""
+
+    def __init__(self, delay: float = 0.0, fail_on_batch: int = None):
+        self.delay = delay
+        self.fail_on_batch = fail_on_batch
+        self.batches = 0
+
+    def _embed(self, items, field):
+        self.batches += 1
+        if self.batches == self.fail_on_batch:
+            raise RuntimeError("embedding API down")
+        time.sleep(self.delay)
+        for item in items:
+            item[field] = [0.1]
+
+    def embed_requirements(self, items):
+        self._embed(items, "statement_embedding")
+
+    def embed_sections(self, items):
+        self._embed(items, "content_embedding")
+
+
+class FakeLoader:
+    """Loader recording written batches in order; optionally slow."""
+
+    def __init__(self, delay: float = 0.0, on_write=None):
+        self.delay = delay
+        self.on_write = on_write
+        self.writes = []
+        self.covers_calls = []
+
+    def _write(self, doc_type, items):
+        time.sleep(self.delay)
+        self.writes.append((doc_type, [item["id"] for item in items]))
+        if self.on_write:
+            self.on_write()
+
+    def load_requirements(self, items):
+        assert all("statement_embedding" in item for item in items)
+        self._write("SRD", items)
+
+    def load_design_sections(self, items, doc_type):
+        assert all("content_embedding" in item for item in items)
+        self._write(doc_type, items)
+
+    def load_test_cases(self, items):
+        self._write("Demo", items)
+
+    def create_covers_relationships(self, requirements):
+        self.covers_calls.append([req["id"] for req in requirements])
+        return []
+
+    def update_derivation_closure(self, edges):
+        pass
+
+
+def _items(prefix: str, count: int):
+    return lambda: [{"id": f"{prefix}{i}"} for i in range(count)]
+
+
+def _run_with_timeout(pipeline, documents, timeout: float = 10.0):
+    """Run the pipeline in a thread; fail the test instead of hanging."""
+    outcome = {}
+
+    def target():
+        try:
+            outcome["result"] = pipeline.run(documents)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "pipeline did not finish"
+    return outcome
+
+
+class TestOrdering:
+    """Test documents and batches are written in the order given."""
+
+    def test_written_in_document_and_batch_order(self):
+        """Test every batch is written once, documents in order, embeddings released."""
+        loader = FakeLoader()
+        loaded = []
+        pipeline = StreamingIngestionPipeline(
+            FakeEmbedder(), loader, batch_size=3, queue_size=1,
+            on_document_loaded=lambda doc_type, count: loaded.append((doc_type, count))
+        )
+        requirements = [{"id": f"R{i}"} for i in range(7)]
+
+        outcome = _run_with_timeout(pipeline, [
+            ("SRD", lambda: requirements), ("PDD", _items("S", 4)), ("Demo", _items("T", 2))
+        ])
+
+        assert "error" not in outcome
+        assert loader.writes == [
+            ("SRD", ["R0", "R1", "R2"]), ("SRD", ["R3", "R4", "R5"]), ("SRD", ["R6"]),
+            ("PDD", ["S0", "S1", "S2"]), ("PDD", ["S3"]),
+            ("Demo", ["T0", "T1"]),
+        ]
+        assert loaded == [("SRD", 7), ("PDD", 4), ("Demo", 2)]
+        assert loader.covers_calls == [[f"R{i}" for i in range(7)]]
+        assert all(field not in req for req in requirements for field in EMBEDDING_FIELDS)
+
+    def test_empty_document_still_reported(self):
+        """Test a document without items passes through as one empty last batch."""
+        loader = FakeLoader()
+        loaded = []
+        pipeline = StreamingIngestionPipeline(
+            FakeEmbedder(), loader, on_document_loaded=lambda doc_type, count: loaded.append((doc_type, count))
+        )
+
+        outcome = _run_with_timeout(pipeline, [("PDD", _items("S", 0)), ("Demo", _items("T", 1))])
+
+        assert "error" not in outcome
+        assert loader.writes == [("Demo", ["T0"])]
+        assert loaded == [("PDD", 0), ("Demo", 1)]
+
+
+class TestBackpressure:
+    """Test bounded queues limit the work in flight."""
+
+    @pytest.mark.parametrize("queue_size", [1, 2])
+    def test_queue_depth_bounded_by_queue_size(self, queue_size):
+        """Test a slow loader blocks the parser instead of letting batches pile up."""
+        pipeline = None
+        in_flight = []
+
+        def record():
+            parsed = pipeline.metrics["parse"]["batches"]
+            in_flight.append(parsed - len(loader.writes))
+
+        loader = FakeLoader(delay=0.02, on_write=record)
+        pipeline = StreamingIngestionPipeline(FakeEmbedder(), loader, batch_size=1, queue_size=queue_size)
+
+        outcome = _run_with_timeout(pipeline, [("Demo", _items("T", 20))])
+
+        assert "error" not in outcome
+        stages = outcome["result"]["stages"]
+        assert all(stages[stage]["peak_queue"] <= queue_size for stage in stages)
+        assert stages["parse"]["blocked_s"] > 0
+        # Queued between the three stage pairs, plus one batch held by parse, chunk and embed
+        assert max(in_flight) <= 3 * queue_size + 3
+        assert len(loader.writes) == 20
+
+
+class TestFailures:
+    """Test a failing stage stops the pipeline and re-raises."""
+
+    def test_embed_failure_reraised(self):
+        """Test an embedding error surfaces from run() and later batches are not written."""
+        loader = FakeLoader()
+        pipeline = StreamingIngestionPipeline(FakeEmbedder(fail_on_batch=2), loader, batch_size=2, queue_size=1)
+
+        outcome = _run_with_timeout(pipeline, [("SRD", _items("R", 20))])
+
+        assert isinstance(outcome["error"], RuntimeError)
+        assert str(outcome["error"]) == "embedding API down"
+        assert loader.writes in ([], [("SRD", ["R0", "R1"])])
+
+    def test_parse_failure_reraised(self):
+        """Test a parser error stops the downstream stages waiting for input."""
+        def parse():
+            raise ValueError("bad table")
+
+        loader = FakeLoader()
+        pipeline = StreamingIngestionPipeline(FakeEmbedder(), loader)
+
+        outcome = _run_with_timeout(pipeline, [("Demo", _items("T", 2)), ("SRD", parse)])
+
+        assert isinstance(outcome["error"], ValueError)
+
+    def test_load_failure_unblocks_parser(self):
+        """Test a load error releases stages blocked on full queues."""
+        def fail():
+            raise ConnectionError("Neo4j unavailable")
+
+        loader = FakeLoader(on_write=fail)
+        pipeline = StreamingIngestionPipeline(FakeEmbedder(), loader, batch_size=1, queue_size=1)
+
+        outcome = _run_with_timeout(pipeline, [("Demo", _items("T", 50))])
+
+        assert isinstance(outcome["error"], ConnectionError)
+        assert len(loader.writes) == 1
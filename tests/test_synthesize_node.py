@@ -270,3 +270,54 @@ class TestSynthesizeResponse:
             assert result_state["user_question"] == state["user_question"]
             assert result_state["query_path"] == state["query_path"]
             assert result_state["graph_results"] == state["graph_results"]
+
+
+class TestCompletionCache:
+    """Test completion caching for repeated syntheses."""
+
+    def test_identical_prompt_served_from_cache(self, env_setup, sample_graph_rag_state, sample_graph_results, mock_gpt4_response):
+        """Test that a byte-identical prompt does not call GPT-4 twice."""
+        from src.utils.cache import QueryCache
+
+        state = sample_graph_rag_state.copy()
+        state["graph_results"] = sample_graph_results
+
+        with patch('src.graphrag.nodes.synthesize_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.synthesize_node.OpenAI') as mock_openai:
+            client_instance = MagicMock()
+            client_instance.chat.completions.create.return_value = mock_gpt4_response
+            mock_openai.return_value = client_instance
+
+            first = _synthesize_from_graph(state, "en")
+            second = _synthesize_from_graph(state, "en")
+
+            assert client_instance.chat.completions.create.call_count == 1
+            assert first["cache_hit"] is False
+            assert second["cache_hit"] is True
+            assert second["answer"] == first["answer"]
+
+    def test_stream_replays_cached_completion(self, env_setup, sample_graph_results):
+        """Test that streaming synthesis replays a cached answer as chunks."""
+        from src.graphrag.nodes.synthesize_streaming_node import stream_synthesis
+        from src.utils.cache import QueryCache
+
+        context = {"graph_results": sample_graph_results, "vector_results": []}
+        stream_chunks = [
+            MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+            for text in ["R-ICU handles ", "network ", "communication."]
+        ]
+
+        with patch('src.graphrag.nodes.synthesize_streaming_node.get_default_query_cache', return_value=QueryCache()), \
+             patch('src.graphrag.nodes.synthesize_streaming_node.OpenAI') as mock_openai:
+            client_instance = MagicMock()
+            client_instance.chat.completions.create.return_value = iter(stream_chunks)
+            mock_openai.return_value = client_instance
+
+            first = [c for c in stream_synthesis("Q?", context, "en", "pure_cypher") if isinstance(c, str)]
+
+            with patch.dict('os.environ', {"COMPLETION_REPLAY_DELAY_MS": "0", "COMPLETION_REPLAY_CHUNK_CHARS": "4"}):
+                second = [c for c in stream_synthesis("Q?", context, "en", "pure_cypher") if isinstance(c, str)]
+
+            assert client_instance.chat.completions.create.call_count == 1
+            assert "".join(second) == "".join(first)
+            assert len(second) > 1
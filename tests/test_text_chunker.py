@@ -0,0 +1,193 @@
+"""
+Unit tests for structural text chunking
+"""
+
+import pytest
+
+from src.ingestion.text_chunker import TextChunker, approximate_tokens
+
+
+def count_words(text: str) -> int:
+    """Token counter: one token per whitespace-separated word."""
+    return len(text.split())
+
+
+DOCUMENT = """# 3 System Architecture
+
+The servicer spacecraft hosts the walking manipulator. It carries the modules to the client.
+Each module provides power and data through its HOTDOCK interface.
+
+| Module | Mass |
+|--------|------|
+| SM1    | 12kg |
+| SM2    | 15kg |
+
+- R-ICU handles the communication bus
+  and the power distribution.
+- OBC-S runs the mission software.
+
+## 3.1 Walking Manipulator
+
+The manipulator moves between HOTDOCK interfaces. It is symmetric.
+"""
+
+SECTION = {"id": "PDD-3", "doc_id": "PDD", "number": "3", "title": "System Architecture", "level": 1}
+
+
+def _chunks(text: str, chunk_size: int, overlap: int):
+    chunker = TextChunker(chunk_size=chunk_size, overlap=overlap, token_counter=count_words)
+    return chunker._split_text(text, dict(SECTION, content=text))
+
+
+class TestUnits:
+    """Test segmentation into structural units."""
+
+    def test_unit_kinds(self):
+        """Test headings, tables, list items and paragraphs become separate units."""
+        chunker = TextChunker(chunk_size=500, token_counter=count_words)
+
+        units = chunker._units(DOCUMENT)
+        texts = [(DOCUMENT[start:end], kind) for start, end, _, kind in units]
+
+        assert texts[0] == ("# 3 System Architecture", "heading")
+        assert texts[1][1] == "text"
+        assert texts[1][0].startswith("The servicer") and texts[1][0].endswith("HOTDOCK interface.")
+        assert texts[2][1] == "table" and texts[2][0].count("\n") == 3
+        assert texts[3] == ("- R-ICU handles the communication bus\n  and the power distribution.", "list")
+        assert texts[4] == ("- OBC-S runs the mission software.", "list")
+        assert texts[5] == ("## 3.1 Walking Manipulator", "heading")
+        assert [kind for _, kind in texts] == ["heading", "text", "table", "list", "list", "heading", "text"]
+
+    def test_unit_tokens_counted_on_unit_text(self):
+        """Test each unit carries the token count of its own text, without trailing whitespace."""
+        chunker = TextChunker(chunk_size=500, token_counter=count_words)
+
+        for start, end, tokens, _ in chunker._units(DOCUMENT):
+            assert tokens == count_words(DOCUMENT[start:end])
+            assert not DOCUMENT[end - 1].isspace()
+
+    def test_oversized_paragraph_split_at_sentences(self):
+        """Test a paragraph longer than a chunk is split between sentences."""
+        text = " ".join(f"Sentence number {i} ends here." for i in range(10))
+        chunker = TextChunker(chunk_size=12, token_counter=count_words)
+
+        units = chunker._units(text)
+
+        assert len(units) == 10
+        assert all(text[start:end].endswith("ends here.") for start, end, _, _ in units)
+
+    def test_oversized_sentence_split_at_whitespace(self):
+        """Test a sentence longer than a chunk is cut at whitespace into pieces that fit."""
+        text = " ".join(f"word{i}" for i in range(50))
+        chunker = TextChunker(chunk_size=8, token_counter=count_words)
+
+        units = chunker._units(text)
+
+        assert len(units) > 1
+        assert all(tokens <= 8 for _, _, tokens, _ in units)
+        assert " ".join(text[start:end] for start, end, _, _ in units) == text
+
+    def test_oversized_table_split_between_rows(self):
+        """Test a table longer than a chunk is split into rows."""
+        text = "\n".join(f"| row {i} | value {i} |" for i in range(6))
+        chunker = TextChunker(chunk_size=10, token_counter=count_words)
+
+        units = chunker._units(text)
+
+        assert [text[start:end] for start, end, _, _ in units] == text.split("\n")
+        assert all(kind == "table" for _, _, _, kind in units)
+
+
+class TestPack:
+    """Test packing units into chunks."""
+
+    @pytest.mark.parametrize("chunk_size,overlap", [(12, 0), (20, 5), (30, 10), (60, 20)])
+    def test_span_round_trip(self, chunk_size, overlap):
+        """Test chunk content is exactly the text at its span and every word is covered."""
+        chunks = _chunks(DOCUMENT, chunk_size, overlap)
+
+        covered = set()
+        for chunk in chunks:
+            assert chunk["content"] == DOCUMENT[chunk["char_start"]:chunk["char_end"]]
+            covered.update(range(chunk["char_start"], chunk["char_end"]))
+
+        assert all(i in covered for i, c in enumerate(DOCUMENT) if not c.isspace())
+
+    @pytest.mark.parametrize("chunk_size,overlap", [(12, 0), (20, 5), (30, 10)])
+    def test_token_count_is_slice_count(self, chunk_size, overlap):
+        """Test token_count counts the emitted content, not the sum of unit counts."""
+        chunker = TextChunker(chunk_size=chunk_size, overlap=overlap, token_counter=approximate_tokens)
+
+        for chunk in chunker._split_text(DOCUMENT, dict(SECTION, content=DOCUMENT)):
+            assert chunk["token_count"] == approximate_tokens(chunk["content"])
+
+    def test_overlap_is_exact_suffix_and_prefix(self):
+        """Test consecutive chunks share whole trailing units of at most `overlap` tokens."""
+        chunker = TextChunker(chunk_size=20, overlap=8, token_counter=count_words)
+        units = chunker._units(DOCUMENT)
+        unit_starts = {start for start, _, _, _ in units}
+        chunks = _chunks(DOCUMENT, 20, 8)
+
+        overlaps = 0
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current["char_start"] > previous["char_start"]
+            assert current["char_end"] > previous["char_end"]
+            assert current["char_start"] in unit_starts
+
+            if current["char_start"] < previous["char_end"]:
+                overlaps += 1
+                shared = DOCUMENT[current["char_start"]:previous["char_end"]]
+                assert previous["content"].endswith(shared)
+                assert current["content"].startswith(shared)
+                assert count_words(shared) <= 8
+
+        assert overlaps > 0
+
+    def test_no_overlap(self):
+        """Test overlap=0 yields disjoint chunks."""
+        chunks = _chunks(DOCUMENT, 20, 0)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert current["char_start"] >= previous["char_end"]
+
+    @pytest.mark.parametrize("chunk_size", [8, 12, 20, 30])
+    def test_chunks_never_end_on_heading(self, chunk_size):
+        """Test a heading is kept with the text that follows it unless it cannot fit with it."""
+        units = TextChunker(chunk_size=chunk_size, token_counter=count_words)._units(DOCUMENT)
+        next_unit = {start: units[i + 1] for i, (start, _, _, _) in enumerate(units[:-1])}
+
+        for chunk in _chunks(DOCUMENT, chunk_size, 0)[:-1]:
+            lines = chunk["content"].split("\n")
+            if lines[-1].startswith("#"):
+                assert len(lines) == 1
+                assert count_words(chunk["content"]) + next_unit[chunk["char_start"]][2] > chunk_size
+
+    def test_heading_alone_when_next_unit_does_not_fit(self):
+        """Test the heading is emitted alone rather than merged into an oversized chunk."""
+        chunks = _chunks(DOCUMENT, 8, 0)
+
+        assert chunks[0]["content"] == "# 3 System Architecture"
+        assert chunks[1]["content"].startswith("The servicer")
+
+    def test_half_full_chunk_ends_before_heading(self):
+        """Test a chunk at least half full starts a new chunk at the next heading."""
+        chunks = _chunks(DOCUMENT, 60, 0)
+
+        assert len(chunks) == 2
+        assert chunks[1]["content"].startswith("## 3.1 Walking Manipulator")
+
+    def test_table_and_list_boundaries(self):
+        """Test chunks only start at unit boundaries, never inside a table or list item."""
+        for chunk in _chunks(DOCUMENT, 12, 4):
+            first_line = chunk["content"].split("\n")[0]
+            assert not first_line.startswith("|----")
+            assert not first_line.startswith("  and the power")
+
+    def test_chunks_within_size_for_fitting_units(self):
+        """Test packed unit tokens never exceed chunk_size."""
+        chunker = TextChunker(chunk_size=20, overlap=5, token_counter=count_words)
+        units = chunker._units(DOCUMENT)
+
+        for first, last, tokens in chunker._pack(units):
+            assert tokens == sum(unit[2] for unit in units[first:last])
+            assert tokens <= 20 or last - first == 1
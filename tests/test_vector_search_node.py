@@ -2,12 +2,14 @@
 Unit tests for Vector Search Node
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
-from src.graphrag.nodes.vector_search_node import run_vector_search, get_embedding
+from src.graphrag.nodes.vector_search_node import run_vector_search, get_embedding, batch_vector_search
 from src.graphrag.state import GraphRAGState
 from src.query.router import QueryPath
+from src.utils.embedding_service import EmbeddingService
 
 
 class TestGetEmbedding:
@@ -15,24 +17,24 @@ class TestGetEmbedding:
 
     def test_get_embedding_success(self, env_setup, mock_embedding_response):
         """Test successful embedding generation."""
-        with patch('openai.OpenAI') as mock_openai:
-            client_instance = MagicMock()
-            client_instance.embeddings.create.return_value = mock_embedding_response
-            mock_openai.return_value = client_instance
+        client_instance = MagicMock()
+        client_instance.embeddings.create.return_value = mock_embedding_response
+        service = EmbeddingService(client=client_instance, batch_window_ms=0)
 
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding_service', return_value=service):
             embedding = get_embedding("test query")
 
-            assert len(embedding) == 3072
-            assert all(isinstance(x, float) for x in embedding)
+            assert embedding.dtype == np.float32
+            assert embedding.shape == (3072,)
             client_instance.embeddings.create.assert_called_once()
 
     def test_get_embedding_failure(self, env_setup):
         """Test embedding generation with API failure."""
-        with patch('openai.OpenAI') as mock_openai:
-            client_instance = MagicMock()
-            client_instance.embeddings.create.side_effect = Exception("API Error")
-            mock_openai.return_value = client_instance
+        client_instance = MagicMock()
+        client_instance.embeddings.create.side_effect = Exception("API Error")
+        service = EmbeddingService(client=client_instance, batch_window_ms=0)
 
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding_service', return_value=service):
             embedding = get_embedding("test query")
 
             # Should return zero vector on failure
@@ -144,3 +146,522 @@ class TestVectorSearchNode:
             assert result_state["user_question"] == sample_graph_rag_state["user_question"]
             assert result_state["language"] == sample_graph_rag_state["language"]
             assert result_state["query_path"] == sample_graph_rag_state["query_path"]
+
+
+class TestHybridRetrieval:
+    """Test hybrid fulltext + vector retrieval with reciprocal rank fusion."""
+
+    def test_hybrid_search_fuses_fulltext_and_vector(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test exact-identifier fulltext hits are fused with vector results."""
+        monkeypatch.setenv("RETRIEVAL_MODE", "hybrid")
+
+        fulltext_results = [
+            {
+                "section_id": "SRD-1.5",
+                "title": "Communication Requirements",
+                "content": "IntR_S102 specifies redundant communication paths.",
+                "document": "SRD",
+                "doc_type": "requirements",
+                "score": 7.4
+            },
+            {
+                "section_id": "DDD-5.1",
+                "title": "HOTDOCK Interface",
+                "content": "HOTDOCK provides mechanical, power and data coupling.",
+                "document": "DDD",
+                "doc_type": "detailed_design",
+                "score": 6.1
+            }
+        ]
+
+        def fake_execute(cypher, **params):
+            if "db.index.fulltext.queryNodes" in cypher:
+                return fulltext_results
+            return sample_vector_results
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.side_effect = fake_execute
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+            section_ids = [s["section_id"] for s in result_state["top_k_sections"]]
+
+            # Found by both retrievers -> ranked first; fulltext-only hit is included
+            assert section_ids[0] == "SRD-1.5"
+            assert "DDD-5.1" in section_ids
+            assert len(section_ids) == 4
+            assert result_state["top_k_sections"][0]["retrieval_ranks"] == {"vector": 3, "fulltext": 1}
+
+            metadata = result_state["retrieval_metadata"]
+            assert metadata["mode"] == "hybrid"
+            assert metadata["weights"] == {"vector": 1.0, "fulltext": 1.0}
+            assert set(metadata["timings_ms"]) == {"vector", "fulltext", "fusion"}
+            assert metadata["result_counts"] == {"vector": 3, "fulltext": 2, "fused": 4}
+
+
+class TestCompactEmbeddingSearch:
+    """Test truncated first-pass search with full-precision rescoring."""
+
+    def test_compact_search_rescores_with_full_vector(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test compact mode queries the small index and passes both vectors."""
+        monkeypatch.setenv("EMBEDDING_SEARCH_DIMENSION", "256")
+        monkeypatch.setenv("EMBEDDING_RESCORE_MULTIPLIER", "4")
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = sample_vector_results
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+            cypher, = neo4j_instance.execute.call_args.args
+            params = neo4j_instance.execute.call_args.kwargs
+
+            assert "section_embeddings_small" in cypher
+            assert "vector.similarity.cosine" in cypher
+            assert len(params["embedding"]) == 3072
+            assert len(params["embedding_small"]) == 256
+            assert params["candidates"] == params["k"] * 4
+            assert len(result_state["top_k_sections"]) == 3
+            assert result_state["retrieval_metadata"]["search_dimension"] == 256
+
+
+class TestResultDiversification:
+    """Test chunk collapsing and MMR diversification of search results."""
+
+    def test_chunks_collapsed_and_near_duplicates_dropped(self, env_setup, monkeypatch, sample_graph_rag_state):
+        """Test chunks of one section merge and MMR skips a near-duplicate section."""
+        monkeypatch.setenv("USE_RESULT_DIVERSIFICATION", "true")
+        monkeypatch.setenv("MMR_LAMBDA", "0.5")
+
+        def section(section_id, score, content, parent=None, chunk_index=None):
+            return {
+                "section_id": section_id,
+                "title": f"{parent} (Part {chunk_index + 1})" if parent else section_id,
+                "content": content,
+                "document": "DDD",
+                "doc_type": "detailed_design",
+                "parent_section_id": parent,
+                "chunk_index": chunk_index,
+                "score": score
+            }
+
+        overlap = "the R-ICU routes CAN bus traffic between modules."
+        candidates = [
+            section("DDD-3.2_chunk_0", 0.95, f"Network architecture overview: {overlap}", "DDD-3.2", 0),
+            section("DDD-3.2_chunk_1", 0.93, f"{overlap} Ethernet carries payload data.", "DDD-3.2", 1)
+        ] + [
+            section(f"DDD-4.{i}", 0.9 - i * 0.01, f"Near-duplicate power section {i}")
+            for i in range(10)
+        ] + [section("SRD-1.5", 0.7, "Communication requirements")]
+
+        embeddings = {c["section_id"]: [1.0, 0.0, 0.0] for c in candidates}
+        embeddings["DDD-3.2_chunk_0"] = embeddings["DDD-3.2_chunk_1"] = [0.0, 1.0, 0.0]
+        embeddings["SRD-1.5"] = [0.0, 0.0, 1.0]
+
+        def fake_execute(cypher, **params):
+            if "UNWIND $section_ids" in cypher:
+                return [{"section_id": i, "embedding": embeddings[i]} for i in params["section_ids"]]
+            assert params["k"] == 30
+            return candidates
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.side_effect = fake_execute
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+            sections = result_state["top_k_sections"]
+            section_ids = [s["section_id"] for s in sections]
+
+            assert len(sections) == 10
+            assert section_ids[0] == "DDD-3.2"
+            assert sections[0]["title"] == "DDD-3.2"
+            assert sections[0]["chunk_ids"] == ["DDD-3.2_chunk_0", "DDD-3.2_chunk_1"]
+            assert sections[0]["content"].count(overlap) == 1
+            # Dissimilar lower-scored section beats the redundant ones
+            assert "SRD-1.5" in section_ids[:3]
+
+            metadata = result_state["retrieval_metadata"]["diversification"]
+            assert metadata["candidates"] == 13
+            assert metadata["collapsed"] == 12
+            assert metadata["selected"] == 10
+
+
+class TestBatchVectorSearch:
+    """Test batched multi-question vector search."""
+
+    def test_batch_search_single_round_trip(self, env_setup, sample_vector_results):
+        """Test questions are embedded together and searched in one query."""
+        questions = ["What hardware handles networking?", "Which requirements cover power?"]
+        rows = [
+            {**sample_vector_results[0], "query_index": 0},
+            {**sample_vector_results[1], "query_index": 0},
+            {**sample_vector_results[2], "query_index": 1}
+        ]
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embeddings',
+                   return_value=[[0.1] * 3072, [0.2] * 3072]) as mock_embeddings:
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = rows
+
+            results = batch_vector_search(questions, k=5, neo4j_client=neo4j_instance)
+
+            mock_embeddings.assert_called_once_with(questions)
+            neo4j_instance.execute.assert_called_once()
+            cypher = neo4j_instance.execute.call_args.args[0]
+            params = neo4j_instance.execute.call_args.kwargs
+            assert "UNWIND $queries" in cypher
+            assert [q["index"] for q in params["queries"]] == [0, 1]
+
+            assert [[s["section_id"] for s in r] for r in results] == [["DDD-3.2", "PDD-2.1"], ["SRD-1.5"]]
+            # Caller-owned client is not closed
+            neo4j_instance.close.assert_not_called()
+
+
+class TestRequirementRetrieval:
+    """Test unified section + requirement retrieval."""
+
+    def test_requirements_merged_by_normalized_score(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test requirement hits are interleaved with sections and embedded once."""
+        monkeypatch.setenv("USE_REQUIREMENT_RETRIEVAL", "true")
+
+        requirement_results = [
+            {
+                "requirement_id": "FuncR_S110",
+                "title": "Network redundancy",
+                "statement": "The R-ICU shall provide redundant network interfaces.",
+                "requirement_type": "Functional",
+                "score": 0.60
+            },
+            {
+                "requirement_id": "IntR_S102",
+                "title": "Communication paths",
+                "statement": "Critical components shall support redundant communication paths.",
+                "requirement_type": "Interface",
+                "score": 0.30
+            }
+        ]
+
+        def fake_execute(cypher, **params):
+            if "requirement_embeddings" in cypher:
+                return requirement_results
+            return sample_vector_results
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072) as mock_embedding, \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.side_effect = fake_execute
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+            mock_embedding.assert_called_once()
+            results = result_state["top_k_sections"]
+
+            # Top hit of each source normalizes to 1.0; lower hits keep their relative gap
+            assert {r["section_id"] for r in results[:2]} == {"DDD-3.2", "FuncR_S110"}
+            requirement = next(r for r in results if r["section_id"] == "FuncR_S110")
+            assert requirement["retrieval_source"] == "requirement"
+            assert requirement["raw_score"] == 0.60
+            assert requirement["content"] == requirement_results[0]["statement"]
+            assert results[-1]["section_id"] == "IntR_S102"
+            assert len(results) == 5
+
+            metadata = result_state["retrieval_metadata"]["requirements"]
+            assert metadata["retrieved"] == 2
+            assert metadata["selected"] == 2
+
+
+class TestScopedRetrieval:
+    """Test document/chapter scoped vector search."""
+
+    def test_detected_scope_filters_by_doc_and_chapter(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test a chapter-scoped question runs the filtered query only."""
+        monkeypatch.setenv("USE_SCOPED_RETRIEVAL", "true")
+        state = sample_graph_rag_state.copy()
+        state["user_question"] = "What does chapter 3 of the DDD say about networking?"
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = sample_vector_results[:1]
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(state)
+
+            neo4j_instance.execute.assert_called_once()
+            cypher = neo4j_instance.execute.call_args.args[0]
+            params = neo4j_instance.execute.call_args.kwargs
+            assert "node.chapter IN $chapters" in cypher
+            assert params["doc_ids"] == ["DDD"]
+            assert params["chapters"] == ["3"]
+
+            assert [s["section_id"] for s in result_state["top_k_sections"]] == ["DDD-3.2"]
+            metadata = result_state["retrieval_metadata"]
+            assert metadata["scope"]["source"] == "detected"
+            assert metadata["scope_fallback"] is False
+
+    def test_empty_explicit_scope_falls_back_to_all_documents(self, env_setup, sample_graph_rag_state, sample_vector_results):
+        """Test an explicit scope without matches re-searches the whole index."""
+        state = sample_graph_rag_state.copy()
+        state["retrieval_scope"] = {"doc_ids": ["pdd"], "chapters": [9]}
+
+        def fake_execute(cypher, **params):
+            return [] if "doc_ids" in params else sample_vector_results
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072) as mock_embedding, \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.side_effect = fake_execute
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(state)
+
+            mock_embedding.assert_called_once()
+            assert neo4j_instance.execute.call_count == 2
+            assert neo4j_instance.execute.call_args_list[0].kwargs["doc_ids"] == ["PDD"]
+            assert len(result_state["top_k_sections"]) == 3
+            assert result_state["retrieval_metadata"]["scope_fallback"] is True
+
+    @pytest.mark.parametrize("question,requirements_searched", [
+        ("What does chapter 3 say about networking?", True),
+        ("What does chapter 3 of the DDD say about networking?", False),
+    ])
+    def test_requirements_excluded_only_for_named_documents(self, env_setup, monkeypatch, sample_graph_rag_state,
+                                                            sample_vector_results, question, requirements_searched):
+        """Test a chapter without a named design document keeps the requirement index."""
+        monkeypatch.setenv("USE_SCOPED_RETRIEVAL", "true")
+        monkeypatch.setenv("USE_REQUIREMENT_RETRIEVAL", "true")
+        state = sample_graph_rag_state.copy()
+        state["user_question"] = question
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node._retrieve_sections',
+                   return_value={"sections": sample_vector_results[:1], "metadata": {}}), \
+             patch('src.graphrag.nodes.vector_search_node._timed_requirement_search',
+                   return_value={"results": [], "time_ms": 1.0}) as mock_requirements, \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient'):
+            run_vector_search(state)
+
+        assert mock_requirements.called is requirements_searched
+
+
+class TestLazyContent:
+    """Test lazy section-content hydration."""
+
+    def test_content_omitted_then_hydrated_once(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test search skips content and hydration fetches only consumed sections."""
+        from src.query.section_content import SectionContentCache, hydrate_sections
+
+        monkeypatch.setenv("USE_LAZY_CONTENT", "true")
+        lazy_results = [{**rec, "content": None} for rec in sample_vector_results]
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j:
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.return_value = lazy_results
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+            assert neo4j_instance.execute.call_args.kwargs["include_content"] is False
+
+        sections = result_state["top_k_sections"]
+        assert all(s["content"] is None for s in sections)
+
+        client = MagicMock()
+        client.execute.return_value = [
+            {"section_id": rec["section_id"], "content": rec["content"], "chunk_index": None}
+            for rec in sample_vector_results[:2]
+        ]
+
+        with patch('src.query.section_content.get_section_content_cache', return_value=SectionContentCache()):
+            hydrate_sections(sections, limit=2, client=client)
+            hydrate_sections(sections, limit=2, client=client)
+
+        client.execute.assert_called_once()
+        assert client.execute.call_args.kwargs["section_ids"] == ["DDD-3.2", "PDD-2.1"]
+        assert sections[0]["content"] == sample_vector_results[0]["content"]
+        assert sections[2]["content"] is None
+
+    def test_rewritten_section_not_served_from_cache(self):
+        """Test a section rewritten under the same ID is fetched again by its new content hash."""
+        from src.query.section_content import SectionContentCache, hydrate_sections
+
+        stored = {"content": "old text", "content_hash": "h1"}
+
+        def fake_execute(cypher, **params):
+            return [{"section_id": "PDD-2.1", "content": stored["content"],
+                     "chunk_index": None, "content_hash": stored["content_hash"]}]
+
+        client = MagicMock()
+        client.execute.side_effect = fake_execute
+
+        with patch('src.query.section_content.get_section_content_cache', return_value=SectionContentCache()):
+            first = hydrate_sections([{"section_id": "PDD-2.1", "content": None, "content_hash": "h1"}], client=client)
+            cached = hydrate_sections([{"section_id": "PDD-2.1", "content": None, "content_hash": "h1"}], client=client)
+            assert client.execute.call_count == 1
+
+            stored.update(content="new text", content_hash="h2")
+            rewritten = hydrate_sections([{"section_id": "PDD-2.1", "content": None, "content_hash": "h2"}], client=client)
+
+        assert first[0]["content"] == cached[0]["content"] == "old text"
+        assert rewritten[0]["content"] == "new text"
+        assert client.execute.call_count == 2
+
+    def test_collapsed_chunks_keyed_by_chunk_hashes(self):
+        """Test collapsed results carry their chunks' hashes and hydrate through them."""
+        from src.query.retrieval import collapse_chunks
+        from src.query.section_content import SectionContentCache, hydrate_sections
+
+        chunks = [
+            {"section_id": f"PDD-2.1_chunk_{i}", "title": f"Overview (Part {i + 1})", "content": None,
+             "parent_section_id": "PDD-2.1", "chunk_index": i, "content_hash": f"h{i}", "score": 0.9 - i / 10}
+            for i in range(2)
+        ]
+        collapsed = collapse_chunks(chunks)
+        assert collapsed[0]["chunk_hashes"] == ["h0", "h1"]
+        assert "content_hash" not in collapsed[0]
+
+        cache = SectionContentCache()
+        cache.set_many({
+            ("PDD-2.1_chunk_0", "h0"): {"content": "first part", "chunk_index": 0},
+            ("PDD-2.1_chunk_1", "h1"): {"content": "second part", "chunk_index": 1},
+        })
+        client = MagicMock()
+
+        with patch('src.query.section_content.get_section_content_cache', return_value=cache):
+            hydrate_sections(collapsed, client=client)
+
+        client.execute.assert_not_called()
+        assert collapsed[0]["content"] == "first part second part"
+
+
+class TestAdaptiveTopK:
+    """Test score-distribution driven top-k."""
+
+    def test_focused_question_cut_at_score_gap(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test candidates are fetched without content, cut at the gap, then hydrated."""
+        from src.query.section_content import SectionContentCache
+
+        monkeypatch.setenv("USE_ADAPTIVE_K", "true")
+        monkeypatch.setenv("ADAPTIVE_K_MIN", "2")
+        monkeypatch.setenv("ADAPTIVE_K_RELATIVE_THRESHOLD", "0.8")
+
+        scores = [0.91, 0.90, 0.89, 0.80, 0.79, 0.78]
+        candidates = [
+            {**sample_vector_results[0], "section_id": f"DDD-3.{i}", "content": None, "score": score}
+            for i, score in enumerate(scores)
+        ]
+
+        def fake_execute(cypher, **params):
+            if "UNWIND $section_ids" in cypher:
+                return [{"section_id": i, "content": f"text of {i}", "chunk_index": None} for i in params["section_ids"]]
+            assert params["k"] == 20
+            assert params["include_content"] is False
+            return candidates
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient') as mock_neo4j, \
+             patch('src.query.section_content.get_section_content_cache', return_value=SectionContentCache()):
+
+            neo4j_instance = MagicMock()
+            neo4j_instance.execute.side_effect = fake_execute
+            mock_neo4j.return_value = neo4j_instance
+
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+            sections = result_state["top_k_sections"]
+            assert [s["section_id"] for s in sections] == ["DDD-3.0", "DDD-3.1", "DDD-3.2"]
+            assert sections[0]["content"] == "text of DDD-3.0"
+
+            metadata = result_state["retrieval_metadata"]["adaptive_k"]
+            assert metadata["k"] == 3
+            assert metadata["candidates"] == 6
+            assert metadata["cut_reason"] == "gap"
+
+    def test_cutoff_on_rrf_scale(self):
+        """Test the gap rule fires on fused RRF scores (~0.016), not only cosine scores."""
+        from src.query.retrieval import adaptive_cutoff
+
+        # Found by both retrievers (2/61, 2/62) vs. by one of them only
+        scores = [2 / 61, 2 / 62, 1 / 61, 1 / 62, 1 / 63, 1 / 64]
+
+        kept, reason = adaptive_cutoff(scores, min_k=1, max_k=20, relative_threshold=0.5)
+
+        assert kept == [0, 1]
+        assert reason == "gap"
+
+    def test_cutoff_returns_indices_of_highest_scores(self):
+        """Test kept indices follow score order even when the input is not sorted."""
+        from src.query.retrieval import adaptive_cutoff
+
+        kept, reason = adaptive_cutoff([0.70, 0.91, 0.50, 0.90], min_k=1, max_k=20)
+
+        assert kept == [1, 3]
+        assert reason == "threshold"
+
+    def test_cut_applied_to_mmr_order(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test the cut keeps the highest-scoring sections when MMR reordered them."""
+        monkeypatch.setenv("USE_ADAPTIVE_K", "true")
+        monkeypatch.setenv("USE_LAZY_CONTENT", "true")
+        monkeypatch.setenv("ADAPTIVE_K_MIN", "1")
+
+        # MMR order puts the low-scoring section second
+        diversified = [
+            {**sample_vector_results[0], "section_id": "A", "score": 0.91},
+            {**sample_vector_results[0], "section_id": "LOW", "score": 0.60},
+            {**sample_vector_results[0], "section_id": "B", "score": 0.90},
+        ]
+
+        with patch('src.graphrag.nodes.vector_search_node._retrieve_sections',
+                   return_value={"sections": list(diversified), "metadata": {}}), \
+             patch('src.graphrag.nodes.vector_search_node._diversify_sections',
+                   return_value={"sections": diversified, "metadata": {"candidates": 3}}), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient'):
+            monkeypatch.setenv("USE_RESULT_DIVERSIFICATION", "true")
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+        assert [s["section_id"] for s in result_state["top_k_sections"]] == ["A", "B"]
+
+    def test_merge_limit_not_narrowed_by_cut(self, env_setup, monkeypatch, sample_graph_rag_state, sample_vector_results):
+        """Test requirements are merged up to ADAPTIVE_K_MAX instead of crowding out the kept sections."""
+        monkeypatch.setenv("USE_ADAPTIVE_K", "true")
+        monkeypatch.setenv("USE_LAZY_CONTENT", "true")
+        monkeypatch.setenv("USE_REQUIREMENT_RETRIEVAL", "true")
+        monkeypatch.setenv("ADAPTIVE_K_MIN", "1")
+
+        sections = [
+            {**sample_vector_results[0], "section_id": f"S{i}", "score": score}
+            for i, score in enumerate([0.91, 0.90, 0.50])
+        ]
+        requirements = [
+            {"requirement_id": f"FuncR_S10{i}", "title": "t", "statement": "s", "requirement_type": "Functional", "score": score}
+            for i, score in enumerate([0.95, 0.94])
+        ]
+
+        with patch('src.graphrag.nodes.vector_search_node.get_embedding', return_value=[0.1] * 3072), \
+             patch('src.graphrag.nodes.vector_search_node._retrieve_sections',
+                   return_value={"sections": sections, "metadata": {}}), \
+             patch('src.graphrag.nodes.vector_search_node._timed_requirement_search',
+                   return_value={"results": requirements, "time_ms": 1.0}), \
+             patch('src.graphrag.nodes.vector_search_node.Neo4jClient'):
+            result_state = run_vector_search(sample_graph_rag_state.copy())
+
+        ids = [s["section_id"] for s in result_state["top_k_sections"]]
+        assert result_state["retrieval_metadata"]["adaptive_k"]["k"] == 2
+        assert sorted(ids) == ["FuncR_S100", "FuncR_S101", "S0", "S1"]